@@ -10,13 +10,18 @@ Usage:
     python3 scripts/generate_skill_docs.py --overwrite          # regenerate all
     python3 scripts/generate_skill_docs.py --add-buttons        # add buttons to hand-written pages
     python3 scripts/generate_skill_docs.py --validate           # validate docs pages
+    python3 scripts/generate_skill_docs.py --overwrite --incremental --jobs 4
+                                                                # regenerate changed skills only
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # ---------------------------------------------------------------------------
@@ -29,6 +34,10 @@ DEFAULT_DOCS_DIR = PROJECT_ROOT / "docs"
 
 GITHUB_REPO_URL = "https://github.com/takusaotome/claude-skills-library"
 
+# Build manifest (under docs dir; dotfiles are ignored by Jekyll).
+MANIFEST_NAME = ".skill_docs_manifest.json"
+MANIFEST_VERSION = 1
+
 # Category slug -> (EN parent title, JA parent title)
 CATEGORY_PARENTS = {
     "dev": ("Software Development", "ソフトウェア開発"),
@@ -1122,6 +1131,108 @@ def _get_category(skill_name: str) -> str:
     return PRIMARY_CATEGORY.get(skill_name, "meta")
 
 
+# ---------------------------------------------------------------------------
+# Build manifest (--incremental)
+# ---------------------------------------------------------------------------
+
+_GENERATOR_DIGEST: str | None = None
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _file_digest(path: Path) -> str | None:
+    """SHA-256 of a file, or None if it cannot be read."""
+    try:
+        return _sha256(path.read_bytes())
+    except OSError:
+        return None
+
+
+def _generator_digest() -> str:
+    """Hash of this script, so generator changes invalidate every manifest entry."""
+    global _GENERATOR_DIGEST
+    if _GENERATOR_DIGEST is None:
+        _GENERATOR_DIGEST = _sha256(Path(__file__).read_bytes())
+    return _GENERATOR_DIGEST
+
+
+def load_manifest(docs_dir: Path) -> dict:
+    """Load the build manifest.  Returns an empty manifest if missing or outdated."""
+    try:
+        data = json.loads((docs_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        data = {}
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        data = {}
+    data["version"] = MANIFEST_VERSION
+    data.setdefault("skills", {})
+    data.setdefault("validate", {})
+    return data
+
+
+def save_manifest(docs_dir: Path, manifest: dict) -> None:
+    """Write the build manifest next to the generated pages."""
+    path = docs_dir / MANIFEST_NAME
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def skill_input_hash(
+    skill_dir: Path,
+    category: str,
+    nav_order: int,
+    mode: str,
+    skill_packages_dir: Path | None,
+) -> str:
+    """Hash every input that affects a skill's generated EN/JA pages.
+
+    Covers SKILL.md, the resource file lists, category/nav_order, generation
+    mode, .skill package presence and the generator script itself.
+    """
+    resources = _list_skill_resources(skill_dir)
+    has_package = skill_packages_dir is not None and (skill_packages_dir / f"{skill_dir.name}.skill").exists()
+    meta = {
+        "category": category,
+        "nav_order": nav_order,
+        "mode": mode,
+        "has_package": has_package,
+        "resources": {key: sorted(files) for key, files in resources.items()},
+    }
+    h = hashlib.sha256()
+    h.update(_generator_digest().encode())
+    h.update((skill_dir / "SKILL.md").read_bytes())
+    h.update(json.dumps(meta, sort_keys=True).encode())
+    return h.hexdigest()
+
+
+def _pages_match_manifest(entry: dict, docs_dir: Path) -> bool:
+    """True when every recorded output page still exists with its recorded content."""
+    pages = entry.get("pages", {})
+    return bool(pages) and all(_file_digest(docs_dir / rel) == digest for rel, digest in pages.items())
+
+
+def render_skill_pages(
+    skill_dir: Path,
+    category: str,
+    nav_order: int,
+    mode: str,
+    skill_packages_dir: Path | None,
+) -> tuple[str, str]:
+    """Render (EN, JA) page content for one skill.  Module-level so it can run in a process pool."""
+    name = skill_dir.name
+    skill_data = parse_skill_md(skill_dir / "SKILL.md")
+    resources = _list_skill_resources(skill_dir)
+    if mode == "full":
+        generate_en, generate_ja = generate_en_full_page, generate_ja_full_page
+    else:
+        generate_en, generate_ja = generate_en_page, generate_ja_page
+    en_content = generate_en(name, skill_data, nav_order, resources, category, skill_packages_dir=skill_packages_dir)
+    ja_content = generate_ja(name, skill_data, nav_order, resources, category, skill_packages_dir=skill_packages_dir)
+    return en_content, ja_content
+
+
 # ---------------------------------------------------------------------------
 # Index page update
 # ---------------------------------------------------------------------------
@@ -1246,12 +1357,54 @@ def add_buttons_to_hand_written(
 # ---------------------------------------------------------------------------
 
 
+def _page_facts(text: str) -> dict:
+    """Extract everything validate_docs needs from a page's text."""
+    parts = text.split("---", 2)
+    if len(parts) < 3:
+        return {"has_frontmatter": False}
+
+    fm_text = parts[1]
+    peer_match = re.search(r"lang_peer:\s*(/\w+/skills/\w+/[\w-]+/)", fm_text)
+    perm_match = re.search(r"permalink:\s*(/[\w/-]+/)", fm_text)
+    return {
+        "has_frontmatter": True,
+        "lang_peer": peer_match.group(1) if peer_match else None,
+        "permalink": perm_match.group(1) if perm_match else None,
+        "has_pkg_button": "Download Skill Package" in text or "スキルパッケージをダウンロード" in text,
+        "has_src_button": "View Source on GitHub" in text or "GitHubでソースを見る" in text,
+        "has_todo": "<!-- TODO:" in text,
+        "untranslated": "This page has not yet been translated into Japanese" in text,
+    }
+
+
+def _cached_page_facts(md_file: Path, docs_dir: Path, manifest: dict | None) -> dict:
+    """Return page facts, re-reading the page only if its size/mtime changed."""
+    if manifest is None:
+        return _page_facts(md_file.read_text(encoding="utf-8"))
+
+    st = md_file.stat()
+    key = [st.st_size, st.st_mtime_ns]
+    rel = md_file.relative_to(docs_dir).as_posix()
+    cached = manifest["validate"].get(rel)
+    if cached and cached.get("stat") == key:
+        return cached["facts"]
+
+    facts = _page_facts(md_file.read_text(encoding="utf-8"))
+    manifest["validate"][rel] = {"stat": key, "facts": facts}
+    return facts
+
+
 def validate_docs(
     docs_dir: Path,
     skills_dir: Path,
     skill_packages_dir: Path | None,
+    manifest: dict | None = None,
 ) -> int:
-    """Validate docs pages.  Returns number of errors."""
+    """Validate docs pages.  Returns number of errors.
+
+    When a build manifest is passed, page text is only re-read for pages whose
+    size or mtime changed since the last validation; filesystem checks always run.
+    """
     errors = 0
 
     for lang in ("en", "ja"):
@@ -1265,21 +1418,16 @@ def validate_docs(
                     continue
 
                 skill_name = md_file.stem
-                text = md_file.read_text(encoding="utf-8")
+                facts = _cached_page_facts(md_file, docs_dir, manifest)
 
-                # Parse frontmatter
-                parts = text.split("---", 2)
-                if len(parts) < 3:
+                if not facts["has_frontmatter"]:
                     print(f"  ERROR: No frontmatter: {md_file}")
                     errors += 1
                     continue
 
-                fm_text = parts[1]
-
                 # Check lang_peer points to existing file
-                peer_match = re.search(r"lang_peer:\s*(/\w+/skills/\w+/[\w-]+/)", fm_text)
-                if peer_match:
-                    peer_url = peer_match.group(1)
+                peer_url = facts["lang_peer"]
+                if peer_url:
                     # Convert permalink to file path
                     # e.g., /en/skills/dev/tdd-developer/ -> docs/en/skills/dev/tdd-developer.md
                     peer_parts = peer_url.strip("/").split("/")
@@ -1290,9 +1438,8 @@ def validate_docs(
                             errors += 1
 
                 # Check permalink matches file path
-                perm_match = re.search(r"permalink:\s*(/[\w/-]+/)", fm_text)
-                if perm_match:
-                    perm_url = perm_match.group(1)
+                perm_url = facts["permalink"]
+                if perm_url:
                     expected = f"/{lang}/skills/{cat_slug}/{skill_name}/"
                     if perm_url != expected:
                         print(f"  ERROR: permalink mismatch: {md_file} has {perm_url}, expected {expected}")
@@ -1304,18 +1451,17 @@ def validate_docs(
                     print(f"  ERROR: skill dir missing: {skill_dir}")
                     errors += 1
 
-                has_pkg_button = "Download Skill Package" in text or "スキルパッケージをダウンロード" in text
-                has_src_button = "View Source on GitHub" in text or "GitHubでソースを見る" in text
+                has_pkg_button = facts["has_pkg_button"]
 
-                if not has_src_button:
+                if not facts["has_src_button"]:
                     print(f"  ERROR: missing GitHub source button: {md_file}")
                     errors += 1
 
-                if "<!-- TODO:" in text:
+                if facts["has_todo"]:
                     print(f"  ERROR: unfinished TODO marker remains: {md_file}")
                     errors += 1
 
-                if "This page has not yet been translated into Japanese" in text:
+                if facts["untranslated"]:
                     print(f"  ERROR: untranslated JA note remains: {md_file}")
                     errors += 1
 
@@ -1344,6 +1490,11 @@ def validate_docs(
                 print(f"  ERROR: missing .skill package: {skill_file}")
                 errors += 1
 
+    if manifest is not None:
+        for rel in list(manifest["validate"]):
+            if not (docs_dir / rel).exists():
+                del manifest["validate"][rel]
+
     if errors == 0:
         print("  Validation passed: no errors found.")
     else:
@@ -1384,6 +1535,17 @@ def main(argv: list[str] | None = None) -> int:
         action="store_true",
         help="Validate docs pages for consistency",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=f"Use the build manifest ({MANIFEST_NAME}) to skip skills and pages whose inputs are unchanged",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Render skills in N worker processes (default: 1)",
+    )
     args = parser.parse_args(argv)
 
     # Resolve skill-packages-dir (None if it doesn't exist)
@@ -1391,7 +1553,10 @@ def main(argv: list[str] | None = None) -> int:
 
     # --validate mode
     if args.validate:
-        errors = validate_docs(args.docs_dir, args.skills_dir, skill_packages_dir)
+        manifest = load_manifest(args.docs_dir) if args.incremental else None
+        errors = validate_docs(args.docs_dir, args.skills_dir, skill_packages_dir, manifest=manifest)
+        if manifest is not None:
+            save_manifest(args.docs_dir, manifest)
         return 1 if errors > 0 else 0
 
     # --add-buttons mode
@@ -1428,6 +1593,9 @@ def main(argv: list[str] | None = None) -> int:
     generated_en = 0
     generated_ja = 0
     skipped = 0
+    unchanged = 0
+    manifest = load_manifest(args.docs_dir)
+    pending: list[tuple[Path, str, int, Path, Path]] = []
 
     for d in skill_dirs:
         if not d.is_dir() or not (d / "SKILL.md").exists():
@@ -1447,59 +1615,61 @@ def main(argv: list[str] | None = None) -> int:
 
         en_path = en_dir / f"{name}.md"
         ja_path = ja_dir / f"{name}.md"
+        nav_order = nav_orders.get(name, nav_counters.get(category, 99) + 1)
+
+        # Pages recorded in the manifest and untouched since are ours to refresh.
+        owned = False
+        if args.incremental:
+            entry = manifest["skills"].get(name)
+            owned = entry is not None and _pages_match_manifest(entry, args.docs_dir)
+            input_hash = skill_input_hash(d, category, nav_order, args.mode, skill_packages_dir)
+            if owned and entry.get("inputs") == input_hash:
+                unchanged += 1
+                continue
 
-        if en_path.exists() and not args.overwrite:
+        if en_path.exists() and not args.overwrite and not owned:
             skipped += 1
             continue
 
-        skill_data = parse_skill_md(d / "SKILL.md")
-        nav_order = nav_orders.get(name, nav_counters.get(category, 99) + 1)
-        resources = _list_skill_resources(d)
-
-        if args.mode == "full":
-            en_content = generate_en_full_page(
-                name,
-                skill_data,
-                nav_order,
-                resources,
-                category,
-                skill_packages_dir=skill_packages_dir,
-            )
-            ja_content = generate_ja_full_page(
-                name,
-                skill_data,
-                nav_order,
-                resources,
-                category,
-                skill_packages_dir=skill_packages_dir,
-            )
-        else:
-            en_content = generate_en_page(
-                name,
-                skill_data,
-                nav_order,
-                resources,
-                category,
-                skill_packages_dir=skill_packages_dir,
-            )
-            ja_content = generate_ja_page(
-                name,
-                skill_data,
-                nav_order,
-                resources,
-                category,
-                skill_packages_dir=skill_packages_dir,
-            )
+        pending.append((d, category, nav_order, en_path, ja_path))
 
+    if args.jobs > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            futures = [
+                pool.submit(render_skill_pages, d, category, nav_order, args.mode, skill_packages_dir)
+                for d, category, nav_order, _, _ in pending
+            ]
+            rendered = [future.result() for future in futures]
+    else:
+        rendered = [
+            render_skill_pages(d, category, nav_order, args.mode, skill_packages_dir)
+            for d, category, nav_order, _, _ in pending
+        ]
+
+    for (d, category, nav_order, en_path, ja_path), (en_content, ja_content) in zip(pending, rendered):
         en_path.write_text(en_content, encoding="utf-8")
         generated_en += 1
 
         ja_path.write_text(ja_content, encoding="utf-8")
         generated_ja += 1
 
-        print(f"  Generated: {name} -> {category}/ (EN + JA, mode={args.mode})")
-
-    print(f"\nDone: {generated_en} EN + {generated_ja} JA generated, {skipped} skipped")
+        manifest["skills"][d.name] = {
+            "inputs": skill_input_hash(d, category, nav_order, args.mode, skill_packages_dir),
+            "pages": {path.relative_to(args.docs_dir).as_posix(): _file_digest(path) for path in (en_path, ja_path)},
+        }
+        print(f"  Generated: {d.name} -> {category}/ (EN + JA, mode={args.mode})")
+
+    if not args.skill:
+        for name in list(manifest["skills"]):
+            if not (args.skills_dir / name / "SKILL.md").exists():
+                del manifest["skills"][name]
+    if args.incremental:
+        save_manifest(args.docs_dir, manifest)
+
+    summary = f"\nDone: {generated_en} EN + {generated_ja} JA generated, {skipped} skipped"
+    if args.incremental:
+        summary += f", {unchanged} unchanged"
+    print(summary)
 
     # Update index pages with links to newly generated pages
     update_index_pages(args.skills_dir, args.docs_dir)
@@ -9,12 +9,14 @@ and opens a PR when the score is below threshold.
 from __future__ import annotations
 
 import argparse
+import importlib.util
 import json
 import logging
 import os
 import shutil
 import subprocess
 import sys
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -217,6 +219,33 @@ def _build_reviewer_cmd(project_root: Path) -> list[str]:
     return [sys.executable, str(project_root / REVIEWER_SCRIPT)]
 
 
+_reviewer_modules: dict[Path, object | None] = {}
+
+
+def _load_reviewer(project_root: Path):
+    """Import the reviewer script once per process. Returns None if unavailable."""
+    script = (project_root / REVIEWER_SCRIPT).resolve()
+    if script in _reviewer_modules:
+        return _reviewer_modules[script]
+
+    module = None
+    spec = importlib.util.spec_from_file_location("run_dual_axis_review", script) if script.exists() else None
+    if spec is not None and spec.loader is not None:
+        try:
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[spec.name] = module
+            spec.loader.exec_module(module)
+        except Exception as e:  # e.g. pyyaml missing outside `uv run`
+            logger.warning("Cannot import reviewer in-process (%s); using subprocess.", e)
+            sys.modules.pop(spec.name, None)
+            module = None
+    if module is not None and not hasattr(module, "run_review"):
+        module = None
+
+    _reviewer_modules[script] = module
+    return module
+
+
 def run_auto_score(
     project_root: Path,
     skill_name: str,
@@ -224,7 +253,45 @@ def run_auto_score(
     skip_tests: bool = True,
     llm_review_json: str | None = None,
 ) -> dict | None:
-    """Run the auto reviewer and return its JSON report."""
+    """Run the auto reviewer and return its JSON report.
+
+    The reviewer is imported and called in-process when possible, which avoids
+    an interpreter (and `uv run`) startup per call. Falls back to spawning the
+    reviewer script when it cannot be imported.
+    """
+    reviewer = _load_reviewer(project_root)
+    if reviewer is not None:
+        started = time.perf_counter()
+        try:
+            report = reviewer.run_review(
+                project_root,
+                skill_name,
+                output_dir="reports",
+                skip_tests=skip_tests,
+                emit_llm_prompt=emit_prompt,
+                llm_review_json=llm_review_json,
+            )
+        except Exception as e:
+            logger.warning("In-process review failed for %s (%s); falling back to subprocess.", skill_name, e)
+        else:
+            logger.info("Auto review for %s ran in-process in %.2fs.", skill_name, time.perf_counter() - started)
+            if not report:
+                logger.error("Auto score failed for %s.", skill_name)
+                return None
+            return report
+
+    return _run_auto_score_subprocess(project_root, skill_name, emit_prompt, skip_tests, llm_review_json)
+
+
+def _run_auto_score_subprocess(
+    project_root: Path,
+    skill_name: str,
+    emit_prompt: bool,
+    skip_tests: bool,
+    llm_review_json: str | None,
+) -> dict | None:
+    """Run the reviewer script in a child process and read back its report file."""
+    started = time.perf_counter()
     script = str(project_root / REVIEWER_SCRIPT)
     extra_args: list[str] = [
         "--project-root",
@@ -254,6 +321,7 @@ def run_auto_score(
     if result.returncode != 0:
         logger.error("Auto score failed for %s: %s", skill_name, result.stderr.strip())
         return None
+    logger.info("Auto review for %s ran as subprocess in %.2fs.", skill_name, time.perf_counter() - started)
 
     report_files = sorted((project_root / "reports").glob(f"skill_review_{skill_name}_*.json"), reverse=True)
     if not report_files:
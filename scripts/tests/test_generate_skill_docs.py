@@ -0,0 +1,109 @@
+"""Tests for incremental docs generation in generate_skill_docs.py."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def docs_module():
+    """Load generate_skill_docs.py as a module."""
+    script_path = Path(__file__).resolve().parents[1] / "generate_skill_docs.py"
+    spec = importlib.util.spec_from_file_location("generate_skill_docs", script_path)
+    if spec is None or spec.loader is None:
+        raise RuntimeError("Failed to load generate_skill_docs.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _make_skill(skills_dir: Path, name: str, description: str = "test") -> Path:
+    skill_dir = skills_dir / name
+    (skill_dir / "references").mkdir(parents=True, exist_ok=True)
+    (skill_dir / "SKILL.md").write_text(
+        f"---\nname: {name}\ndescription: {description}\n---\n# {name}\n\n## When to Use\n\n- x\n",
+        encoding="utf-8",
+    )
+    return skill_dir
+
+
+def _run(docs_module, tmp_path: Path, *extra: str) -> int:
+    return docs_module.main(
+        [
+            "--skills-dir",
+            str(tmp_path / "skills"),
+            "--docs-dir",
+            str(tmp_path / "docs"),
+            "--skill-packages-dir",
+            str(tmp_path / "skill-packages"),
+            *extra,
+        ]
+    )
+
+
+def test_incremental_skips_unchanged_skills(docs_module, tmp_path: Path, capsys):
+    _make_skill(tmp_path / "skills", "alpha-skill")
+    _make_skill(tmp_path / "skills", "beta-skill")
+
+    assert _run(docs_module, tmp_path, "--overwrite", "--incremental") == 0
+    assert "2 EN + 2 JA generated" in capsys.readouterr().out
+    assert (tmp_path / "docs" / docs_module.MANIFEST_NAME).exists()
+
+    assert _run(docs_module, tmp_path, "--overwrite", "--incremental") == 0
+    assert "0 EN + 0 JA generated, 0 skipped, 2 unchanged" in capsys.readouterr().out
+
+    _make_skill(tmp_path / "skills", "beta-skill", description="changed")
+    (tmp_path / "skills" / "alpha-skill" / "references" / "new.md").write_text("# new\n", encoding="utf-8")
+    assert _run(docs_module, tmp_path, "--overwrite", "--incremental") == 0
+    assert "2 EN + 2 JA generated, 0 skipped, 0 unchanged" in capsys.readouterr().out
+
+
+def test_incremental_regenerates_deleted_or_edited_page(docs_module, tmp_path: Path, capsys):
+    _make_skill(tmp_path / "skills", "alpha-skill")
+    assert _run(docs_module, tmp_path, "--incremental") == 0
+    capsys.readouterr()
+
+    page = tmp_path / "docs" / "ja" / "skills" / "meta" / "alpha-skill.md"
+    page.unlink()
+    assert _run(docs_module, tmp_path, "--overwrite", "--incremental") == 0
+    assert "1 EN + 1 JA generated" in capsys.readouterr().out
+    assert page.exists()
+
+
+def test_parallel_jobs_match_serial_output(docs_module, tmp_path: Path):
+    for name in ("alpha-skill", "beta-skill", "gamma-skill"):
+        _make_skill(tmp_path / "skills", name)
+
+    assert _run(docs_module, tmp_path, "--overwrite") == 0
+    serial = {p.name: p.read_text(encoding="utf-8") for p in (tmp_path / "docs").rglob("*.md")}
+    assert _run(docs_module, tmp_path, "--overwrite", "--jobs", "2") == 0
+    parallel = {p.name: p.read_text(encoding="utf-8") for p in (tmp_path / "docs").rglob("*.md")}
+    assert serial == parallel
+
+
+def test_manifest_only_written_with_incremental(docs_module, tmp_path: Path):
+    _make_skill(tmp_path / "skills", "alpha-skill")
+    manifest_path = tmp_path / "docs" / docs_module.MANIFEST_NAME
+
+    assert _run(docs_module, tmp_path, "--overwrite") == 0
+    assert not manifest_path.exists()
+    assert _run(docs_module, tmp_path, "--overwrite", "--incremental") == 0
+    assert manifest_path.exists()
+
+
+def test_validate_incremental_caches_page_facts(docs_module, tmp_path: Path):
+    _make_skill(tmp_path / "skills", "alpha-skill")
+    assert _run(docs_module, tmp_path) == 0
+    assert _run(docs_module, tmp_path, "--validate", "--incremental") == 0
+
+    manifest = docs_module.load_manifest(tmp_path / "docs")
+    assert "en/skills/meta/alpha-skill.md" in manifest["validate"]
+
+    page = tmp_path / "docs" / "en" / "skills" / "meta" / "alpha-skill.md"
+    page.write_text(page.read_text(encoding="utf-8") + "\n<!-- TODO: fill -->\n", encoding="utf-8")
+    assert _run(docs_module, tmp_path, "--validate", "--incremental") == 1
@@ -932,6 +932,26 @@ def test_update_backlog_status_atomic_with_attempted_at(pipeline_module, tmp_pat
     assert idea["retry_count"] == 1
 
 
+def test_run_auto_score_in_process_returns_report(pipeline_module, tmp_path: Path):
+    """An importable reviewer is called directly instead of via subprocess."""
+    reviewer = tmp_path / pipeline_module.REVIEWER_SCRIPT
+    reviewer.parent.mkdir(parents=True, exist_ok=True)
+    reviewer.write_text(
+        "def run_review(project_root, skill, **kwargs):\n"
+        "    return {'skill_name': skill, 'auto_review': {'score': 91}, 'options': kwargs}\n",
+        encoding="utf-8",
+    )
+
+    def fake_run(cmd, **kwargs):
+        raise AssertionError(f"unexpected subprocess: {cmd}")
+
+    with patch.object(pipeline_module.subprocess, "run", fake_run):
+        result = pipeline_module.run_auto_score(tmp_path, "test-skill", skip_tests=False)
+
+    assert result["auto_review"]["score"] == 91
+    assert result["options"]["skip_tests"] is False
+
+
 # -- Daily flow: review_and_improve tests --
 
 
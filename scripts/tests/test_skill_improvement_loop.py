@@ -512,6 +512,28 @@ def test_run_auto_score_fallback_on_uv_failure(loop_module, tmp_path: Path, monk
     assert call_log[1][0] == sys.executable
 
 
+def test_run_auto_score_in_process_skips_subprocess(loop_module, tmp_path: Path, monkeypatch):
+    """An importable reviewer is called in-process; no subprocess is spawned."""
+    reviewer = tmp_path / loop_module.REVIEWER_SCRIPT
+    reviewer.parent.mkdir(parents=True, exist_ok=True)
+    reviewer.write_text(
+        "def run_review(project_root, skill, **kwargs):\n"
+        "    return {'skill_name': skill, 'auto_review': {'score': 88}, 'options': kwargs}\n",
+        encoding="utf-8",
+    )
+
+    def fake_run(cmd, **kwargs):
+        raise AssertionError(f"unexpected subprocess: {cmd}")
+
+    monkeypatch.setattr(loop_module.subprocess, "run", fake_run)
+
+    result = loop_module.run_auto_score(tmp_path, "test-skill", emit_prompt=True)
+
+    assert result["auto_review"]["score"] == 88
+    assert result["options"]["emit_llm_prompt"] is True
+    assert result["options"]["skip_tests"] is True
+
+
 # ── CalledProcessError and pre-commit integration tests ──
 
 
@@ -2,11 +2,21 @@
 """AI Text Pattern Detector - Detect AI-generated text patterns and calculate AI-smell score."""
 
 import argparse
+import bisect
 import json
+import os
 import re
 import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+DEFAULT_BATCH_JOBS = os.cpu_count() or 1
+BATCH_CHUNK_SIZE = 32  # documents per worker task
+BATCH_SUFFIXES = {".txt", ".md"}
 
 
 @dataclass
@@ -45,6 +55,204 @@ class AnalysisResult:
     pattern_results: list = field(default_factory=list)
 
 
+def _compile_any(patterns) -> re.Pattern:
+    """Compile a list of regex sources into one alternation, used to skip lines that match none of them."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns))
+
+
+def _compile_words(words) -> re.Pattern:
+    return re.compile("|".join(re.escape(w) for w in words))
+
+
+# Regexes shared by every detector call, compiled once at import.
+# Lists keep their original order because matches are reported in that order; the *_ANY
+# alternations are prefilters only (a line that fails them cannot match any list entry).
+SENTENCE_SPLIT_RE = re.compile(r"[。！？\n]")
+TABLE_RE = re.compile(r"^\|.*\|$", re.M)
+HEADING_LINE_RE = re.compile(r"^#{1,6}\s", re.M)
+STRUCTURED_KEYWORD_RE = re.compile(r"(見積書|提案書|報告書|仕様書|設計書|README|readme|要件定義|設計資料)")
+EMAIL_SUBJECT_RE = re.compile(r"^件名[:：]", re.M)
+
+# Pattern 1
+BOLD_RE = re.compile(r"\*\*[^*]+\*\*")
+HEADING_RE = re.compile(r"^#{1,6}\s")
+EM_DASH_RE = re.compile(r"—")
+FULLWIDTH_SLASH_RE = re.compile(r"／")
+PAREN_RE = re.compile(r"（[^）]+）")
+NESTED_QUOTE_RE = re.compile(r"「[^」]*『[^』]*』[^」]*」")
+BULLET_RE = re.compile(r"^\s*[-•]\s")
+
+# Pattern 2
+CONJUNCTION_RE = re.compile(
+    r"^(また|さらに|そして|しかし|一方で|一方|加えて|つまり|なお|ただし|しかしながら|したがって|このように|それゆえ|このため)[、，]"
+)
+NOT_A_BUT_B_SOURCES = [r"単に.+だけでなく.+も", r".+ではなく.+", r"だけでなく.+も重要"]
+NOT_A_BUT_B = [re.compile(p) for p in NOT_A_BUT_B_SOURCES]
+NOT_A_BUT_B_ANY = _compile_words(["だけでなく", "ではなく"])
+CLOSING_SOURCES = [r"と言えるでしょう", r"ではないでしょうか", r"が求められます", r"が期待されます", r"が不可欠です"]
+CLOSING = [re.compile(p) for p in CLOSING_SOURCES]
+CLOSING_ANY = _compile_any(CLOSING_SOURCES)
+
+# Pattern 3
+STRUCTURE_SOURCES = [
+    r"以下では.+について",
+    r"本稿では.+を",
+    r"ここでは.+を見ていき",
+    r"について解説します",
+    r"について説明します",
+    r"について考察します",
+    r"を紹介します",
+]
+STRUCTURE = [re.compile(p) for p in STRUCTURE_SOURCES]
+STRUCTURE_ANY = _compile_any(STRUCTURE_SOURCES)
+PREAMBLE_INDICATORS = ["近年", "昨今", "現代社会", "多くの企業", "急速に", "注目を集めて"]
+STEP_SOURCES = [
+    r"ステップ[0-9０-９]",
+    r"第[一二三四五六七八九十]に",
+    r"[0-9０-９]+つ目は",
+    r"まず[、，].+次に[、，].+最後に",
+]
+STEP = [re.compile(p) for p in STEP_SOURCES]
+STEP_ANY = _compile_any(STEP_SOURCES)
+LISTING_RE = re.compile(r"[^、。\n]+[、，][^、。\n]+[、，][^、。\n]+")
+WEAK_CONCLUSION = [
+    re.compile(p)
+    for p in (
+        r"が重要です",
+        r"が求められています",
+        r"ではないでしょうか",
+        r"が期待されます",
+        r"を目指していきましょう",
+        r"が鍵となるでしょう",
+    )
+]
+
+# Pattern 4
+HEDGE_SOURCES = [
+    r"かもしれません",
+    r"の可能性があります",
+    r"とも考えられます",
+    r"一概には言えません",
+    r"と思われます",
+    r"と推測されます",
+]
+HEDGES = [(re.compile(p), "ヘッジ語") for p in HEDGE_SOURCES]
+HEDGE_ANY = _compile_any(HEDGE_SOURCES)
+NEUTRAL = [re.compile(p) for p in (r"一方で", r"他方では", r"という見方もあります", r"という意見もあります")]
+WEAK_NEGATION_SOURCES = [r"必ずしも.+ではない", r"とは限りません"]
+WEAK_NEGATION = [re.compile(p) for p in WEAK_NEGATION_SOURCES]
+WEAK_NEGATION_ANY = _compile_any(WEAK_NEGATION_SOURCES)
+AVOIDANCE_SOURCES = [
+    (r"傾向にあります", "断定回避"),
+    (r"ことが多いです", "断定回避"),
+    (r"一般的に", "断定回避"),
+    (r"個人の見解であり", "免責表現"),
+    (r"ケースバイケースで", "免責表現"),
+    (r"状況によって異なり", "免責表現"),
+]
+AVOIDANCE = [(re.compile(p), name) for p, name in AVOIDANCE_SOURCES]
+AVOIDANCE_ANY = _compile_any(p for p, _ in AVOIDANCE_SOURCES)
+BOTH_SIDES_RE = re.compile(r"メリットとデメリット|長所と短所|利点と欠点")
+
+# Pattern 5
+ABSTRACT_WORDS = [
+    "本質的",
+    "包括的",
+    "体系的",
+    "戦略的",
+    "革新的",
+    "持続可能な",
+    "多角的",
+    "総合的",
+    "抜本的",
+    "画期的",
+]
+ABSTRACT_ANY = _compile_words(ABSTRACT_WORDS)
+STRONG_EVAL_SOURCES = [r"非常に重要", r"極めて効果的", r"大きな成果", r"飛躍的な向上", r"劇的な改善", r"目覚ましい成長"]
+STRONG_EVAL = [(re.compile(p), p) for p in STRONG_EVAL_SOURCES]
+STRONG_EVAL_ANY = _compile_any(STRONG_EVAL_SOURCES)
+HOLLOW_NOUNS = ["フレームワーク", "アプローチ", "ソリューション", "エコシステム", "パラダイム", "メソドロジー"]
+HOLLOW_NOUNS_ANY = _compile_words(HOLLOW_NOUNS)
+SPINNING_MODIFIERS = ["適切な", "効果的な", "最適な", "理想的な", "有効な"]
+SPINNING_ANY = _compile_words(SPINNING_MODIFIERS)
+BUZZWORDS = ["シナジー", "レバレッジ", "スケーラブル", "アジャイル", "イニシアチブ", "コンセンサス", "プロアクティブ"]
+BUZZWORDS_ANY = _compile_words(BUZZWORDS)
+
+# Pattern 6: (sources, label) per weight
+METAPHOR_SOURCES = [
+    (
+        4.0,
+        [
+            (r"羅針盤", "羅針盤"),
+            (r"(?:道の)?地図(?:を描く|となる)", "地図"),
+            # Treat "設計書" as a stock metaphor only in metaphorical contexts.
+            # Literal document titles like "在庫連携バッチ 設計書" should not be flagged.
+            (r"青写真", "設計書/青写真"),
+            (
+                r"(?:[^\s。、「」『』()（）]+の)?設計書(?:として機能(?:し|する|します)?|となる|となります|になる|になります)",
+                "設計書/青写真",
+            ),
+            (r"(?:企業|組織|チーム)の?DNA", "DNA"),
+            (r"車の両輪", "車の両輪"),
+            (r"潤滑油", "潤滑油"),
+        ],
+    ),
+    (
+        3.0,
+        [
+            (r"(?:の|大きな|重要な)柱", "柱"),
+            (r"(?:成長|変革|イノベーション)の?エンジン", "エンジン"),
+            (r"(?:隠し味|秘訣|成功)の?スパイス", "スパイス"),
+            (r"(?:成功|成長)の?レシピ", "レシピ"),
+            (r"架け橋|かけ橋|懸け橋", "架け橋"),
+        ],
+    ),
+    (
+        2.0,
+        [
+            (r"(?:成功|発展|成長|繁栄)の礎", "礎"),
+            (r"(?:成功|発展|成長)の土台", "土台"),
+        ],
+    ),
+]
+METAPHORS = [(weight, [(re.compile(p), name) for p, name in entries]) for weight, entries in METAPHOR_SOURCES]
+# Every metaphor regex contains one of these literals; cheaper than the alternation of the full regexes
+METAPHOR_ANY = _compile_words(
+    [
+        "羅針盤",
+        "地図",
+        "青写真",
+        "設計書",
+        "DNA",
+        "両輪",
+        "潤滑油",
+        "柱",
+        "エンジン",
+        "スパイス",
+        "レシピ",
+        "橋",
+        "礎",
+        "土台",
+    ]
+)
+
+
+@dataclass
+class TextTokens:
+    """A text split once into the lines, sentences and paragraphs every detector reads."""
+
+    text: str
+    lines: list
+    sentences: list
+    paragraphs: list  # stripped, non-empty
+    endings: list
+    line_starts: list  # offset of each line in text
+
+    def line_number_at(self, pos: int) -> int:
+        """1-based line number of a character offset in text."""
+        return bisect.bisect_right(self.line_starts, pos)
+
+
 class TextAnalyzer:
     """Utility for basic text statistics."""
 
@@ -59,7 +267,7 @@ class TextAnalyzer:
 
     @staticmethod
     def split_sentences(text: str) -> list:
-        sentences = re.split(r"[。！？\n]", text)
+        sentences = SENTENCE_SPLIT_RE.split(text)
         return [s.strip() for s in sentences if s.strip()]
 
     @staticmethod
@@ -74,15 +282,15 @@ class TextAnalyzer:
                 endings.append("shita")
             elif s.endswith("ません"):
                 endings.append("masen")
-            elif re.search(r"である$", s):
+            elif s.endswith("である"):
                 endings.append("dearu")
-            elif re.search(r"だ$", s):
+            elif s.endswith("だ"):
                 endings.append("da")
-            elif re.search(r"る$", s):
+            elif s.endswith("る"):
                 endings.append("ru")
-            elif re.search(r"た$", s):
+            elif s.endswith("た"):
                 endings.append("ta")
-            elif re.search(r"い$", s):
+            elif s.endswith("い"):
                 endings.append("i")
             else:
                 endings.append("other")
@@ -102,6 +310,25 @@ class TextAnalyzer:
                 current = 1
         return max_consecutive
 
+    @classmethod
+    def tokenize(cls, text: str) -> TextTokens:
+        """Split text once into the units shared by all pattern detectors."""
+        lines = text.split("\n")
+        line_starts = []
+        offset = 0
+        for line in lines:
+            line_starts.append(offset)
+            offset += len(line) + 1
+        sentences = cls.split_sentences(text)
+        return TextTokens(
+            text=text,
+            lines=lines,
+            sentences=sentences,
+            paragraphs=[p.strip() for p in text.split("\n\n") if p.strip()],
+            endings=cls.get_sentence_endings(sentences),
+            line_starts=line_starts,
+        )
+
 
 class AIPatternDetector:
     """Detect 6 AI writing patterns and calculate AI-smell score."""
@@ -137,13 +364,11 @@ class AIPatternDetector:
         if self.doc_type != "auto":
             return self.doc_type
 
-        has_table = bool(re.search(r"^\|.*\|$", text, flags=re.M))
+        has_table = bool(TABLE_RE.search(text))
         has_code_fence = "```" in text
-        has_heading = bool(re.search(r"^#{1,6}\s", text, flags=re.M))
-        has_structured_keyword = bool(
-            re.search(r"(見積書|提案書|報告書|仕様書|設計書|README|readme|要件定義|設計資料)", text)
-        )
-        has_email_marker = bool(re.search(r"^件名[:：]", text, flags=re.M)) or "お疲れ様です" in text
+        has_heading = bool(HEADING_LINE_RE.search(text))
+        has_structured_keyword = bool(STRUCTURED_KEYWORD_RE.search(text))
+        has_email_marker = bool(EMAIL_SUBJECT_RE.search(text)) or "お疲れ様です" in text
 
         if has_table or has_code_fence or has_structured_keyword:
             return "structured"
@@ -157,20 +382,36 @@ class AIPatternDetector:
     def _allows_structural_markdown(resolved_doc_type: str) -> bool:
         return resolved_doc_type in {"blog", "structured"}
 
-    def detect_all(self, text: str) -> AnalysisResult:
-        resolved_doc_type = self._resolve_doc_type(text)
-        sentences = self.analyzer.split_sentences(text)
-        lines = text.split("\n")
+    def detect_all(self, text: str, timings: Optional[dict] = None) -> AnalysisResult:
+        """
+        Tokenize text once and run the six pattern detectors over the shared tokens.
 
-        results = [
-            self._detect_pattern1(text, lines, resolved_doc_type),
-            self._detect_pattern2(text, sentences),
-            self._detect_pattern3(text, lines, sentences),
-            self._detect_pattern4(text, sentences, lines),
-            self._detect_pattern5(text, lines),
-            self._detect_pattern6(text, lines),
+        If a ``timings`` dict is given, the seconds spent tokenizing ("tokenize") and in each
+        pattern detector (keyed by pattern id) are added to it.
+        """
+        clock = time.perf_counter
+        start = clock()
+        resolved_doc_type = self._resolve_doc_type(text)
+        tokens = self.analyzer.tokenize(text)
+        detectors = [
+            (1, lambda: self._detect_pattern1(tokens, resolved_doc_type)),
+            (2, lambda: self._detect_pattern2(tokens)),
+            (3, lambda: self._detect_pattern3(tokens)),
+            (4, lambda: self._detect_pattern4(tokens)),
+            (5, lambda: self._detect_pattern5(tokens)),
+            (6, lambda: self._detect_pattern6(tokens)),
         ]
 
+        results = []
+        if timings is None:
+            results = [detect() for _, detect in detectors]
+        else:
+            timings["tokenize"] = timings.get("tokenize", 0.0) + clock() - start
+            for pattern_id, detect in detectors:
+                start = clock()
+                results.append(detect())
+                timings[pattern_id] = timings.get(pattern_id, 0.0) + clock() - start
+
         total = sum(r.score for r in results)
         level = self._interpret_score(total)
 
@@ -179,8 +420,8 @@ class AIPatternDetector:
             level=level,
             doc_type=resolved_doc_type,
             char_count=self.analyzer.count_chars(text),
-            paragraph_count=self.analyzer.count_paragraphs(text),
-            sentence_count=len(sentences),
+            paragraph_count=len(tokens.paragraphs),
+            sentence_count=len(tokens.sentences),
             pattern_results=results,
         )
 
@@ -194,90 +435,77 @@ class AIPatternDetector:
         else:
             return "Strongly AI"
 
-    def _detect_pattern1(self, text: str, lines: list, resolved_doc_type: str) -> PatternResult:
+    def _result(self, pattern_id: int, score: float, matches: list) -> PatternResult:
+        max_score = self.PATTERN_MAX_SCORES[pattern_id]
+        return PatternResult(
+            pattern_id=pattern_id,
+            pattern_name=self.PATTERN_NAMES[pattern_id],
+            score=min(float(score), max_score),
+            max_score=max_score,
+            matches=matches,
+            details=self._summarize_matches(matches),
+        )
+
+    def _detect_pattern1(self, tokens: TextTokens, resolved_doc_type: str) -> PatternResult:
         """Pattern 1: Visual Marker Residue."""
-        matches = []
-        score = 0.0
+        lines = tokens.lines
         allow_structural_markdown = self._allows_structural_markdown(resolved_doc_type)
+        # One bucket per check so matches keep the check-by-check order of the report
+        bold, headings, dashes, slashes, nested = [], [], [], [], []
+        bullet_lines = 0
 
-        # Bold markers
         for i, line in enumerate(lines):
-            for m in re.finditer(r"\*\*[^*]+\*\*", line):
-                matches.append(PatternMatch(1, "太字マーカー", m.group(), i + 1, 3.0))
-                score += 3.0
-
-        # Heading markers
-        if not allow_structural_markdown:
-            for i, line in enumerate(lines):
-                if re.match(r"^#{1,6}\s", line):
-                    matches.append(PatternMatch(1, "見出しマーカー", line.strip()[:50], i + 1, 3.0))
-                    score += 3.0
-
-        # Em dash
-        for i, line in enumerate(lines):
-            for m in re.finditer(r"—", line):
-                matches.append(
-                    PatternMatch(1, "エムダッシュ", f"...{line[max(0, m.start() - 10) : m.end() + 10]}...", i + 1, 2.0)
-                )
-                score += 2.0
-
-        # Full-width slash
-        for i, line in enumerate(lines):
-            for m in re.finditer(r"／", line):
-                matches.append(
-                    PatternMatch(
-                        1, "全角スラッシュ", f"...{line[max(0, m.start() - 10) : m.end() + 10]}...", i + 1, 2.0
-                    )
-                )
-                score += 2.0
+            if "**" in line:
+                for m in BOLD_RE.finditer(line):
+                    bold.append(PatternMatch(1, "太字マーカー", m.group(), i + 1, 3.0))
+            if not allow_structural_markdown:
+                if HEADING_RE.match(line):
+                    headings.append(PatternMatch(1, "見出しマーカー", line.strip()[:50], i + 1, 3.0))
+                if BULLET_RE.match(line):
+                    bullet_lines += 1
+            if "—" in line:
+                for m in EM_DASH_RE.finditer(line):
+                    snippet = f"...{line[max(0, m.start() - 10) : m.end() + 10]}..."
+                    dashes.append(PatternMatch(1, "エムダッシュ", snippet, i + 1, 2.0))
+            if "／" in line:
+                for m in FULLWIDTH_SLASH_RE.finditer(line):
+                    snippet = f"...{line[max(0, m.start() - 10) : m.end() + 10]}..."
+                    slashes.append(PatternMatch(1, "全角スラッシュ", snippet, i + 1, 2.0))
+            if "『" in line:
+                for m in NESTED_QUOTE_RE.finditer(line):
+                    nested.append(PatternMatch(1, "入れ子引用符", m.group()[:40], i + 1, 3.0))
 
         # Excessive parentheses per paragraph
-        paragraphs = [p for p in text.split("\n\n") if p.strip()]
-        for p in paragraphs:
-            paren_count = len(re.findall(r"（[^）]+）", p))
+        parens = []
+        for p in tokens.paragraphs:
+            paren_count = len(PAREN_RE.findall(p)) if "（" in p else 0
             if paren_count >= 3:
-                matches.append(PatternMatch(1, "括弧過多", f"段落内に{paren_count}個の（）", 0, 5.0))
-                score += 5.0
-
-        # Nested quotation marks
-        for i, line in enumerate(lines):
-            for m in re.finditer(r"「[^」]*『[^』]*』[^」]*」", line):
-                matches.append(PatternMatch(1, "入れ子引用符", m.group()[:40], i + 1, 3.0))
-                score += 3.0
+                parens.append(PatternMatch(1, "括弧過多", f"段落内に{paren_count}個の（）", 0, 5.0))
 
         # Bullet points ratio
-        if not allow_structural_markdown:
-            bullet_lines = sum(1 for line in lines if re.match(r"^\s*[-•]\s", line))
-            if lines and bullet_lines / len(lines) > 0.3:
-                matches.append(
-                    PatternMatch(
-                        1,
-                        "箇条書き過多",
-                        f"箇条書き{bullet_lines}/{len(lines)}行 ({bullet_lines / len(lines) * 100:.0f}%)",
-                        0,
-                        5.0,
-                    )
+        bullets = []
+        if not allow_structural_markdown and lines and bullet_lines / len(lines) > 0.3:
+            bullets.append(
+                PatternMatch(
+                    1,
+                    "箇条書き過多",
+                    f"箇条書き{bullet_lines}/{len(lines)}行 ({bullet_lines / len(lines) * 100:.0f}%)",
+                    0,
+                    5.0,
                 )
-                score += 5.0
+            )
 
-        max_score = self.PATTERN_MAX_SCORES[1]
-        return PatternResult(
-            pattern_id=1,
-            pattern_name=self.PATTERN_NAMES[1],
-            score=min(score, max_score),
-            max_score=max_score,
-            matches=matches,
-            details=self._summarize_matches(matches),
-        )
+        matches = bold + headings + dashes + slashes + parens + nested + bullets
+        return self._result(1, sum(m.weight for m in matches), matches)
 
-    def _detect_pattern2(self, text: str, sentences: list) -> PatternResult:
+    def _detect_pattern2(self, tokens: TextTokens) -> PatternResult:
         """Pattern 2: Monotonous Rhythm."""
+        text, lines, sentences = tokens.text, tokens.lines, tokens.sentences
         matches = []
         score = 0.0
 
         # Consecutive same endings
-        endings = self.analyzer.get_sentence_endings(sentences)
-        max_consec = self.analyzer.count_consecutive_same_endings(endings)
+        max_consec = self.analyzer.count_consecutive_same_endings(tokens.endings)
         if max_consec >= 4:
             matches.append(PatternMatch(2, "文末連続", f"同一文末{max_consec}連続", 0, 8.0))
             score += 8.0
@@ -286,14 +514,12 @@ class AIPatternDetector:
             score += 5.0
 
         # Excessive conjunctions (sentence-based to catch mid-line conjunctions)
-        lines = text.split("\n")
-        conj_pattern = r"^(また|さらに|そして|しかし|一方で|一方|加えて|つまり|なお|ただし|しかしながら|したがって|このように|それゆえ|このため)[、，]"
         conj_count = 0
         for sent in sentences:
-            if re.match(conj_pattern, sent):
+            if CONJUNCTION_RE.match(sent):
                 conj_count += 1
                 pos = text.find(sent)
-                line_num = text[:pos].count("\n") + 1 if pos >= 0 else 0
+                line_num = tokens.line_number_at(pos) if pos >= 0 else 0
                 matches.append(PatternMatch(2, "接続詞開始", sent[:30], line_num, 0))
 
         if sentences:
@@ -303,13 +529,19 @@ class AIPatternDetector:
             elif conj_ratio > 0.2:
                 score += 5.0
 
-        # not A but B pattern
-        nab_patterns = [r"単に.+だけでなく.+も", r".+ではなく.+", r"だけでなく.+も重要"]
+        # not A but B pattern, then mechanical closing (line scans gated by their prefilters)
+        nab, closing = [], []
         for i, line in enumerate(lines):
-            for pat in nab_patterns:
-                for m in re.finditer(pat, line):
-                    matches.append(PatternMatch(2, "not A but B", m.group()[:40], i + 1, 3.0))
-                    score += 3.0
+            if NOT_A_BUT_B_ANY.search(line):
+                for pat in NOT_A_BUT_B:
+                    for m in pat.finditer(line):
+                        nab.append(PatternMatch(2, "not A but B", m.group()[:40], i + 1, 3.0))
+            if CLOSING_ANY.search(line):
+                for pat in CLOSING:
+                    if pat.search(line):
+                        closing.append(PatternMatch(2, "機械的閉じ方", line.strip()[-30:], i + 1, 3.0))
+        matches.extend(nab)
+        score += 3.0 * len(nab)
 
         # Uniform sentence length
         if len(sentences) >= 5:
@@ -322,101 +554,54 @@ class AIPatternDetector:
                     score += 5.0
 
         # Mechanical closing
-        closing_patterns = [
-            r"と言えるでしょう",
-            r"ではないでしょうか",
-            r"が求められます",
-            r"が期待されます",
-            r"が不可欠です",
-        ]
-        for i, line in enumerate(lines):
-            for pat in closing_patterns:
-                if re.search(pat, line):
-                    matches.append(PatternMatch(2, "機械的閉じ方", line.strip()[-30:], i + 1, 3.0))
-                    score += 3.0
+        matches.extend(closing)
+        score += 3.0 * len(closing)
 
-        max_score = self.PATTERN_MAX_SCORES[2]
-        return PatternResult(
-            pattern_id=2,
-            pattern_name=self.PATTERN_NAMES[2],
-            score=min(score, max_score),
-            max_score=max_score,
-            matches=matches,
-            details=self._summarize_matches(matches),
-        )
+        return self._result(2, score, matches)
 
-    def _detect_pattern3(self, text: str, lines: list, sentences: list) -> PatternResult:
+    def _detect_pattern3(self, tokens: TextTokens) -> PatternResult:
         """Pattern 3: Manual-like Structure."""
-        matches = []
-        score = 0.0
+        lines, paragraphs = tokens.lines, tokens.paragraphs
+        structure, steps = [], []
+        listing_count = 0
 
-        # Structure declaration
-        struct_patterns = [
-            r"以下では.+について",
-            r"本稿では.+を",
-            r"ここでは.+を見ていき",
-            r"について解説します",
-            r"について説明します",
-            r"について考察します",
-            r"を紹介します",
-        ]
+        # Structure declaration, step notation and exhaustive listing in one line scan
         for i, line in enumerate(lines):
-            for pat in struct_patterns:
-                if re.search(pat, line):
-                    matches.append(PatternMatch(3, "構成宣言", line.strip()[:50], i + 1, 5.0))
-                    score += 5.0
-                    break
+            if STRUCTURE_ANY.search(line):
+                for pat in STRUCTURE:
+                    if pat.search(line):
+                        structure.append(PatternMatch(3, "構成宣言", line.strip()[:50], i + 1, 5.0))
+                        break
+            if STEP_ANY.search(line):
+                for pat in STEP:
+                    if pat.search(line):
+                        steps.append(PatternMatch(3, "ステップ表記", line.strip()[:40], i + 1, 3.0))
+            if line.count("、") + line.count("，") >= 2 and LISTING_RE.search(line):
+                listing_count += 1
+
+        matches = list(structure)
 
         # Long preamble (first paragraph > 100 chars without getting to the point)
-        paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
         if paragraphs and len(paragraphs[0]) > 100:
             first_para = paragraphs[0]
-            preamble_indicators = ["近年", "昨今", "現代社会", "多くの企業", "急速に", "注目を集めて"]
-            if any(ind in first_para for ind in preamble_indicators):
+            if any(ind in first_para for ind in PREAMBLE_INDICATORS):
                 matches.append(PatternMatch(3, "長い前置き", first_para[:50] + "...", 1, 5.0))
-                score += 5.0
 
-        # Step notation
-        step_patterns = [
-            r"ステップ[0-9０-９]",
-            r"第[一二三四五六七八九十]に",
-            r"[0-9０-９]+つ目は",
-            r"まず[、，].+次に[、，].+最後に",
-        ]
-        for i, line in enumerate(lines):
-            for pat in step_patterns:
-                if re.search(pat, line):
-                    matches.append(PatternMatch(3, "ステップ表記", line.strip()[:40], i + 1, 3.0))
-                    score += 3.0
+        matches.extend(steps)
 
         # Exhaustive listing (3+ comma-separated items, 2+ occurrences)
-        listing_pattern = r"[^、。\n]+[、，][^、。\n]+[、，][^、。\n]+"
-        listing_count = 0
-        for i, line in enumerate(lines):
-            if re.search(listing_pattern, line):
-                listing_count += 1
         if listing_count >= 2:
             matches.append(PatternMatch(3, "網羅的列挙", "3項目以上の並列列挙が%d回" % listing_count, 0, 5.0))
-            score += 5.0
 
         # Weak conclusion
         if lines:
-            weak_patterns = [
-                r"が重要です",
-                r"が求められています",
-                r"ではないでしょうか",
-                r"が期待されます",
-                r"を目指していきましょう",
-                r"が鍵となるでしょう",
-            ]
             tail = lines[-5:]
-            for pat in weak_patterns:
+            for pat in WEAK_CONCLUSION:
                 for tail_index, line in enumerate(tail):
-                    if re.search(pat, line):
+                    if pat.search(line):
                         line_number = len(lines) - len(tail) + tail_index + 1
                         snippet = line.strip()[-60:]
                         matches.append(PatternMatch(3, "薄い結論", snippet, line_number, 5.0))
-                        score += 5.0
                         break
                 else:
                     continue
@@ -430,243 +615,85 @@ class AIPatternDetector:
                 all_within = all(abs(l - avg_len) / avg_len < 0.15 for l in para_lengths)
                 if all_within:
                     matches.append(PatternMatch(3, "セクション均等", "段落長の偏差15%以内", 0, 3.0))
-                    score += 3.0
 
-        max_score = self.PATTERN_MAX_SCORES[3]
-        return PatternResult(
-            pattern_id=3,
-            pattern_name=self.PATTERN_NAMES[3],
-            score=min(score, max_score),
-            max_score=max_score,
-            matches=matches,
-            details=self._summarize_matches(matches),
-        )
+        return self._result(3, sum(m.weight for m in matches), matches)
 
-    def _detect_pattern4(self, text: str, sentences: list, lines: list) -> PatternResult:
+    def _detect_pattern4(self, tokens: TextTokens) -> PatternResult:
         """Pattern 4: Non-committal Stance."""
-        matches = []
-        score = 0.0
+        text, lines = tokens.text, tokens.lines
+        hedges, weak_negations, avoidance, both_sides = [], [], [], []
 
-        # Hedge words
-        hedge_patterns = [
-            (r"かもしれません", "ヘッジ語"),
-            (r"の可能性があります", "ヘッジ語"),
-            (r"とも考えられます", "ヘッジ語"),
-            (r"一概には言えません", "ヘッジ語"),
-            (r"と思われます", "ヘッジ語"),
-            (r"と推測されます", "ヘッジ語"),
-        ]
+        # Hedge words, weak negation, assertion avoidance and both-sides presentation in one line scan
         for i, line in enumerate(lines):
-            for pat, name in hedge_patterns:
-                for m in re.finditer(pat, line):
-                    matches.append(PatternMatch(4, name, f"...{line[max(0, m.start() - 15) : m.end()]}...", i + 1, 3.0))
-                    score += 3.0
+            if HEDGE_ANY.search(line):
+                for pat, name in HEDGES:
+                    for m in pat.finditer(line):
+                        snippet = f"...{line[max(0, m.start() - 15) : m.end()]}..."
+                        hedges.append(PatternMatch(4, name, snippet, i + 1, 3.0))
+            if WEAK_NEGATION_ANY.search(line):
+                for pat in WEAK_NEGATION:
+                    if pat.search(line):
+                        weak_negations.append(PatternMatch(4, "弱い否定", line.strip()[:40], i + 1, 2.0))
+            if AVOIDANCE_ANY.search(line):
+                for pat, name in AVOIDANCE:
+                    if pat.search(line):
+                        avoidance.append(PatternMatch(4, name, line.strip()[:40], i + 1, 2.0))
+            if BOTH_SIDES_RE.search(line):
+                both_sides.append(PatternMatch(4, "両論併記", line.strip()[:40], i + 1, 3.0))  # 1行1回のみカウント
 
         # Forced neutrality (paragraph-based, counting occurrences not unique patterns)
-        neutral_patterns = [
-            r"一方で",
-            r"他方では",
-            r"という見方もあります",
-            r"という意見もあります",
-        ]
-        paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
-        for para in paragraphs:
-            neutral_count = sum(len(re.findall(pat, para)) for pat in neutral_patterns)
+        neutral = []
+        for para in tokens.paragraphs:
+            neutral_count = sum(len(pat.findall(para)) for pat in NEUTRAL)
             if neutral_count >= 2:
                 para_pos = text.find(para)
-                line_num = text[:para_pos].count("\n") + 1 if para_pos >= 0 else 0
-                matches.append(PatternMatch(4, "強制中立", para[:50], line_num, 5.0))
-                score += 5.0
-
-        # Weak negation
-        weak_neg_patterns = [
-            r"必ずしも.+ではない",
-            r"とは限りません",
-        ]
-        for i, line in enumerate(lines):
-            for pat in weak_neg_patterns:
-                if re.search(pat, line):
-                    matches.append(PatternMatch(4, "弱い否定", line.strip()[:40], i + 1, 2.0))
-                    score += 2.0
-
-        # Assertion avoidance
-        avoid_patterns = [
-            (r"傾向にあります", "断定回避"),
-            (r"ことが多いです", "断定回避"),
-            (r"一般的に", "断定回避"),
-            (r"個人の見解であり", "免責表現"),
-            (r"ケースバイケースで", "免責表現"),
-            (r"状況によって異なり", "免責表現"),
-        ]
-        for i, line in enumerate(lines):
-            for pat, name in avoid_patterns:
-                if re.search(pat, line):
-                    matches.append(PatternMatch(4, name, line.strip()[:40], i + 1, 2.0))
-                    score += 2.0
+                line_num = tokens.line_number_at(para_pos) if para_pos >= 0 else 0
+                neutral.append(PatternMatch(4, "強制中立", para[:50], line_num, 5.0))
 
-        # Both-sides presentation
-        both_patterns = [r"メリットとデメリット", r"長所と短所", r"利点と欠点"]
-        for i, line in enumerate(lines):
-            for pat in both_patterns:
-                if re.search(pat, line):
-                    matches.append(PatternMatch(4, "両論併記", line.strip()[:40], i + 1, 3.0))
-                    score += 3.0
-                    break  # 1行1回のみカウント
-
-        max_score = self.PATTERN_MAX_SCORES[4]
-        return PatternResult(
-            pattern_id=4,
-            pattern_name=self.PATTERN_NAMES[4],
-            score=min(score, max_score),
-            max_score=max_score,
-            matches=matches,
-            details=self._summarize_matches(matches),
-        )
+        matches = hedges + neutral + weak_negations + avoidance + both_sides
+        return self._result(4, sum(m.weight for m in matches), matches)
 
-    def _detect_pattern5(self, text: str, lines: list) -> PatternResult:
+    def _detect_pattern5(self, tokens: TextTokens) -> PatternResult:
         """Pattern 5: Abstract Word Overuse."""
-        matches = []
-        score = 0.0
-
-        # Hollow abstract words
-        abstract_words = [
-            "本質的",
-            "包括的",
-            "体系的",
-            "戦略的",
-            "革新的",
-            "持続可能な",
-            "多角的",
-            "総合的",
-            "抜本的",
-            "画期的",
-        ]
-        for i, line in enumerate(lines):
-            for word in abstract_words:
-                if word in line:
-                    matches.append(PatternMatch(5, "空疎な抽象語", word, i + 1, 2.0))
-                    score += 2.0
-
-        # Unsupported strong evaluation
-        strong_eval_patterns = [
-            r"非常に重要",
-            r"極めて効果的",
-            r"大きな成果",
-            r"飛躍的な向上",
-            r"劇的な改善",
-            r"目覚ましい成長",
-        ]
-        for i, line in enumerate(lines):
-            for pat in strong_eval_patterns:
-                if re.search(pat, line):
-                    matches.append(PatternMatch(5, "根拠なき強評価", pat.replace(r"\\", ""), i + 1, 3.0))
-                    score += 3.0
-
-        # Substanceless nouns
-        hollow_nouns = [
-            "フレームワーク",
-            "アプローチ",
-            "ソリューション",
-            "エコシステム",
-            "パラダイム",
-            "メソドロジー",
-        ]
-        for i, line in enumerate(lines):
-            for noun in hollow_nouns:
-                if noun in line:
-                    matches.append(PatternMatch(5, "実体なき名詞", noun, i + 1, 2.0))
-                    score += 2.0
-
-        # Spinning modifiers
-        spinning_mods = ["適切な", "効果的な", "最適な", "理想的な", "有効な"]
-        for i, line in enumerate(lines):
-            for mod in spinning_mods:
-                if mod in line:
-                    matches.append(PatternMatch(5, "修飾語の空転", mod, i + 1, 1.5))
-                    score += 1.5
-
-        # Buzzwords
-        buzzwords = [
-            "シナジー",
-            "レバレッジ",
-            "スケーラブル",
-            "アジャイル",
-            "イニシアチブ",
-            "コンセンサス",
-            "プロアクティブ",
-        ]
-        for i, line in enumerate(lines):
-            for word in buzzwords:
-                if word in line:
-                    matches.append(PatternMatch(5, "バズワード", word, i + 1, 1.5))
-                    score += 1.5
+        abstract, strong, nouns, modifiers, buzz = [], [], [], [], []
+
+        for i, line in enumerate(tokens.lines):
+            # Hollow abstract words
+            if ABSTRACT_ANY.search(line):
+                abstract.extend(PatternMatch(5, "空疎な抽象語", w, i + 1, 2.0) for w in ABSTRACT_WORDS if w in line)
+            # Unsupported strong evaluation
+            if STRONG_EVAL_ANY.search(line):
+                strong.extend(
+                    PatternMatch(5, "根拠なき強評価", src, i + 1, 3.0) for pat, src in STRONG_EVAL if pat.search(line)
+                )
+            # Substanceless nouns
+            if HOLLOW_NOUNS_ANY.search(line):
+                nouns.extend(PatternMatch(5, "実体なき名詞", n, i + 1, 2.0) for n in HOLLOW_NOUNS if n in line)
+            # Spinning modifiers
+            if SPINNING_ANY.search(line):
+                modifiers.extend(
+                    PatternMatch(5, "修飾語の空転", m, i + 1, 1.5) for m in SPINNING_MODIFIERS if m in line
+                )
+            # Buzzwords
+            if BUZZWORDS_ANY.search(line):
+                buzz.extend(PatternMatch(5, "バズワード", w, i + 1, 1.5) for w in BUZZWORDS if w in line)
 
-        max_score = self.PATTERN_MAX_SCORES[5]
-        return PatternResult(
-            pattern_id=5,
-            pattern_name=self.PATTERN_NAMES[5],
-            score=min(score, max_score),
-            max_score=max_score,
-            matches=matches,
-            details=self._summarize_matches(matches),
-        )
+        matches = abstract + strong + nouns + modifiers + buzz
+        return self._result(5, sum(m.weight for m in matches), matches)
 
-    def _detect_pattern6(self, text: str, lines: list) -> PatternResult:
+    def _detect_pattern6(self, tokens: TextTokens) -> PatternResult:
         """Pattern 6: Stock Metaphors."""
         matches = []
-        score = 0.0
 
-        high_metaphors = [
-            (r"羅針盤", "羅針盤"),
-            (r"(?:道の)?地図(?:を描く|となる)", "地図"),
-            # Treat "設計書" as a stock metaphor only in metaphorical contexts.
-            # Literal document titles like "在庫連携バッチ 設計書" should not be flagged.
-            (r"青写真", "設計書/青写真"),
-            (
-                r"(?:[^\s。、「」『』()（）]+の)?設計書(?:として機能(?:し|する|します)?|となる|となります|になる|になります)",
-                "設計書/青写真",
-            ),
-            (r"(?:企業|組織|チーム)の?DNA", "DNA"),
-            (r"車の両輪", "車の両輪"),
-            (r"潤滑油", "潤滑油"),
-        ]
-        medium_metaphors = [
-            (r"(?:の|大きな|重要な)柱", "柱"),
-            (r"(?:成長|変革|イノベーション)の?エンジン", "エンジン"),
-            (r"(?:隠し味|秘訣|成功)の?スパイス", "スパイス"),
-            (r"(?:成功|成長)の?レシピ", "レシピ"),
-            (r"架け橋|かけ橋|懸け橋", "架け橋"),
-        ]
-        low_metaphors = [
-            (r"(?:成功|発展|成長|繁栄)の礎", "礎"),
-            (r"(?:成功|発展|成長)の土台", "土台"),
-        ]
+        for i, line in enumerate(tokens.lines):
+            if not METAPHOR_ANY.search(line):
+                continue
+            for weight, entries in METAPHORS:
+                for pat, name in entries:
+                    for m in pat.finditer(line):
+                        matches.append(PatternMatch(6, name, m.group(), i + 1, weight))
 
-        for i, line in enumerate(lines):
-            for pat, name in high_metaphors:
-                for m in re.finditer(pat, line):
-                    matches.append(PatternMatch(6, name, m.group(), i + 1, 4.0))
-                    score += 4.0
-
-            for pat, name in medium_metaphors:
-                for m in re.finditer(pat, line):
-                    matches.append(PatternMatch(6, name, m.group(), i + 1, 3.0))
-                    score += 3.0
-
-            for pat, name in low_metaphors:
-                for m in re.finditer(pat, line):
-                    matches.append(PatternMatch(6, name, m.group(), i + 1, 2.0))
-                    score += 2.0
-
-        max_score = self.PATTERN_MAX_SCORES[6]
-        return PatternResult(
-            pattern_id=6,
-            pattern_name=self.PATTERN_NAMES[6],
-            score=min(score, max_score),
-            max_score=max_score,
-            matches=matches,
-            details=self._summarize_matches(matches),
-        )
+        return self._result(6, sum(m.weight for m in matches), matches)
 
     @staticmethod
     def _summarize_matches(matches: list) -> str:
@@ -776,9 +803,199 @@ def format_json(result: AnalysisResult) -> str:
     return json.dumps(data, ensure_ascii=False, indent=2)
 
 
+def normalize_text(text: str) -> str:
+    """Strip a BOM and normalize line endings to \\n."""
+    return text.lstrip("\ufeff").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def iter_batch_documents(
+    source: Path, encoding: str = "utf-8", id_field: str = "id", text_field: str = "text"
+) -> Iterator[tuple]:
+    """
+    Yield (doc_id, text, error) for every document in a directory or JSONL file.
+
+    Directories are searched recursively for .txt/.md files (id = relative path). JSONL files
+    hold one JSON object per line with the document id and text in ``id_field``/``text_field``.
+    Unreadable documents are yielded with text None and an error message.
+    """
+    if source.is_dir():
+        for path in sorted(p for p in source.rglob("*") if p.suffix.lower() in BATCH_SUFFIXES and p.is_file()):
+            doc_id = path.relative_to(source).as_posix()
+            try:
+                yield doc_id, path.read_text(encoding=encoding), None
+            except (OSError, UnicodeDecodeError) as e:
+                yield doc_id, None, str(e)
+        return
+
+    with open(source, "r", encoding=encoding) as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield f"line-{line_number}", None, f"invalid JSON: {e}"
+                continue
+            if not isinstance(item, dict):
+                yield f"line-{line_number}", None, "not a JSON object"
+                continue
+            doc_id = str(item.get(id_field, f"line-{line_number}"))
+            text = item.get(text_field)
+            if not isinstance(text, str):
+                yield doc_id, None, f"missing text field '{text_field}'"
+            else:
+                yield doc_id, text, None
+
+
+def score_record(detector: AIPatternDetector, doc_id: str, text: str, timings: Optional[dict] = None) -> dict:
+    """Score one document and return the compact JSONL record used by batch mode."""
+    result = detector.detect_all(text, timings=timings)
+    return {
+        "id": doc_id,
+        "total_score": result.total_score,
+        "level": result.level,
+        "doc_type": result.doc_type,
+        "char_count": result.char_count,
+        "paragraph_count": result.paragraph_count,
+        "sentence_count": result.sentence_count,
+        "patterns": [
+            {"id": pr.pattern_id, "score": pr.score, "match_count": len(pr.matches)} for pr in result.pattern_results
+        ],
+    }
+
+
+_worker_detectors = {}
+
+
+def _score_chunk(chunk: list, doc_type: str) -> tuple:
+    """Score a list of (doc_id, text, error); returns (records, timings, chars). Runs in worker processes."""
+    detector = _worker_detectors.get(doc_type)
+    if detector is None:
+        detector = _worker_detectors[doc_type] = AIPatternDetector(doc_type=doc_type)
+
+    records = []
+    timings = {}
+    chars = 0
+    for doc_id, text, error in chunk:
+        if error is None:
+            text = normalize_text(text)
+            if not text.strip():
+                error = "empty text"
+        if error is not None:
+            records.append({"id": doc_id, "error": error})
+            continue
+        chars += len(text)
+        try:
+            records.append(score_record(detector, doc_id, text, timings))
+        except Exception as e:
+            records.append({"id": doc_id, "error": f"detection failed: {e}"})
+    return records, timings, chars
+
+
+def score_documents(
+    documents: Iterable[tuple], doc_type: str = "auto", jobs: int = DEFAULT_BATCH_JOBS, stats: Optional[dict] = None
+) -> Iterator[dict]:
+    """
+    Score (doc_id, text, error) documents in a process pool and yield records in input order.
+
+    Documents are sent to workers in chunks of BATCH_CHUNK_SIZE with at most ``jobs * 2``
+    chunks in flight, so memory stays bounded for large exports. If ``stats`` is given,
+    "chars" and per-pattern detector seconds (see AIPatternDetector.detect_all) are added to it.
+    """
+
+    def merge(result):
+        records, timings, chars = result
+        if stats is not None:
+            stats["chars"] = stats.get("chars", 0) + chars
+            seconds = stats.setdefault("seconds", {})
+            for key, value in timings.items():
+                seconds[key] = seconds.get(key, 0.0) + value
+        return records
+
+    def chunks():
+        chunk = []
+        for document in documents:
+            chunk.append(document)
+            if len(chunk) >= BATCH_CHUNK_SIZE:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    if jobs <= 1:
+        for chunk in chunks():
+            yield from merge(_score_chunk(chunk, doc_type))
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending = deque()
+        for chunk in chunks():
+            pending.append(pool.submit(_score_chunk, chunk, doc_type))
+            if len(pending) >= jobs * 2:
+                yield from merge(pending.popleft().result())
+        while pending:
+            yield from merge(pending.popleft().result())
+
+
+def format_throughput(stats: dict) -> str:
+    """Format per-pattern throughput (characters per second of detector time) for batch mode."""
+    chars = stats.get("chars", 0)
+    seconds = stats.get("seconds", {})
+    lines = ["Per-pattern throughput (chars/sec, single process):"]
+    labels = [("tokenize", "tokenize")] + [
+        (pid, f"{pid} {name}") for pid, name in AIPatternDetector.PATTERN_NAMES.items()
+    ]
+    for key, label in labels:
+        elapsed = seconds.get(key, 0.0)
+        rate = f"{chars / elapsed:,.0f}" if elapsed > 0 else "-"
+        lines.append(f"  {label}: {rate}")
+    total = sum(seconds.values())
+    if total > 0:
+        lines.append(f"  all patterns: {chars / total:,.0f}")
+    return "\n".join(lines)
+
+
+def run_batch(args) -> int:
+    """Batch CLI entry point. Writes one JSONL record per document; exit code 1 if any document failed."""
+    if args.format == "json":
+        print("Error: --batch writes JSON Lines (one record per document); drop -f json", file=sys.stderr)
+        return 1
+    source = Path(args.input_file)
+    documents = iter_batch_documents(source, args.encoding, args.id_field, args.text_field)
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    stats = {}
+    counts = {"scored": 0, "error": 0}
+    levels = {}
+    start = time.perf_counter()
+    try:
+        for record in score_documents(documents, doc_type=args.doc_type, jobs=args.jobs, stats=stats):
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            if "error" in record:
+                counts["error"] += 1
+            else:
+                counts["scored"] += 1
+                levels[record["level"]] = levels.get(record["level"], 0) + 1
+    finally:
+        if args.output:
+            out.close()
+    elapsed = time.perf_counter() - start
+
+    chars = stats.get("chars", 0)
+    print(
+        f"Scored {counts['scored']} documents ({counts['error']} errors), {chars:,} chars in {elapsed:.1f}s "
+        f"({chars / elapsed if elapsed > 0 else 0:,.0f} chars/sec, {args.jobs} jobs)",
+        file=sys.stderr,
+    )
+    print(f"Levels: {json.dumps(levels, ensure_ascii=False)}", file=sys.stderr)
+    print(format_throughput(stats), file=sys.stderr)
+    if args.output:
+        print(f"Scores written to: {args.output}", file=sys.stderr)
+    return 1 if counts["error"] else 0
+
+
 def main():
     parser = argparse.ArgumentParser(description="Detect AI writing patterns and calculate AI-smell score (0-100)")
-    parser.add_argument("input_file", help="Input text file path")
+    parser.add_argument("input_file", help="Input text file path (with --batch: a directory or JSONL file)")
     parser.add_argument(
         "--output",
         "-o",
@@ -804,6 +1021,20 @@ def main():
         default="auto",
         help="Document type for markdown-aware detection (default: auto)",
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Score every .txt/.md file in a directory, or every record of a JSONL file, writing JSONL scores",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=DEFAULT_BATCH_JOBS,
+        help=f"Worker processes for --batch (default: {DEFAULT_BATCH_JOBS})",
+    )
+    parser.add_argument("--id-field", default="id", help="JSONL field holding the document id (default: id)")
+    parser.add_argument("--text-field", default="text", help="JSONL field holding the document text (default: text)")
     args = parser.parse_args()
 
     input_path = Path(args.input_file)
@@ -811,6 +1042,9 @@ def main():
         print(f"Error: File not found: {args.input_file}", file=sys.stderr)
         sys.exit(1)
 
+    if args.batch:
+        sys.exit(run_batch(args))
+
     try:
         text = input_path.read_text(encoding=args.encoding)
     except LookupError:
@@ -827,7 +1061,7 @@ def main():
         print(f"Error: Cannot read file {args.input_file}: {e}", file=sys.stderr)
         sys.exit(1)
 
-    text = text.lstrip("\ufeff").replace("\r\n", "\n").replace("\r", "\n")
+    text = normalize_text(text)
     if not text.strip():
         print("Error: Input file is empty", file=sys.stderr)
         sys.exit(1)
@@ -1,13 +1,17 @@
 #!/usr/bin/env python3
 """Tests for AI pattern detector — TDD RED/GREEN approach."""
 
+import json
 import os
 import sys
+import tempfile
 import unittest
+from argparse import Namespace
+from pathlib import Path
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from detect_ai_patterns import AIPatternDetector, TextAnalyzer
+from detect_ai_patterns import AIPatternDetector, TextAnalyzer, iter_batch_documents, run_batch, score_documents
 
 
 class TestTextAnalyzer(unittest.TestCase):
@@ -282,5 +286,84 @@ class TestPattern4SamePatternTwice(unittest.TestCase):
         )
 
 
+class TestSharedTokenization(unittest.TestCase):
+    """Tokenization is shared by all detectors; per-pattern timings are optional."""
+
+    def test_line_numbers_from_offsets(self):
+        text = "一行目です。\n\nまた、二行目です。"
+        tokens = TextAnalyzer.tokenize(text)
+        self.assertEqual(tokens.line_number_at(text.find("また")), 3)
+        result = AIPatternDetector().detect_all(text)
+        conj = [m for m in result.pattern_results[1].matches if m.pattern_name == "接続詞開始"]
+        self.assertEqual(conj[0].line_number, 3)
+
+    def test_timings_collected_per_pattern(self):
+        timings = {}
+        AIPatternDetector().detect_all("これはテストです。", timings=timings)
+        self.assertEqual(set(timings), {"tokenize", 1, 2, 3, 4, 5, 6})
+
+
+class TestBatchMode(unittest.TestCase):
+    """Batch scoring of directories and JSONL exports."""
+
+    def test_directory_and_jsonl_documents(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "sub").mkdir()
+            (root / "a.txt").write_text("本質的なアプローチです。", encoding="utf-8")
+            (root / "sub" / "b.md").write_text("普通の文です。", encoding="utf-8")
+            (root / "skip.json").write_text("{}", encoding="utf-8")
+            self.assertEqual([d[0] for d in iter_batch_documents(root)], ["a.txt", "sub/b.md"])
+
+            export = root / "export.jsonl"
+            export.write_text(
+                json.dumps({"article": 7, "body": "文です。"})
+                + "\n\n"
+                + "broken\n"
+                + json.dumps({"article": 8})
+                + "\n",
+                encoding="utf-8",
+            )
+            docs = list(iter_batch_documents(export, id_field="article", text_field="body"))
+            self.assertEqual([(d[0], d[2] is None) for d in docs], [("7", True), ("line-3", False), ("8", False)])
+
+    def test_jsonl_non_object_lines_are_errors(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            export = Path(tmp) / "export.jsonl"
+            export.write_text(
+                '[1, 2]\n"x"\n5\n' + json.dumps({"id": "ok", "text": "文です。"}) + "\n", encoding="utf-8"
+            )
+            docs = list(iter_batch_documents(export))
+        self.assertEqual(
+            [(d[0], d[2]) for d in docs],
+            [
+                ("line-1", "not a JSON object"),
+                ("line-2", "not a JSON object"),
+                ("line-3", "not a JSON object"),
+                ("ok", None),
+            ],
+        )
+
+    def test_batch_rejects_json_format(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp) / "scores.json"
+            args = Namespace(input_file=tmp, format="json", output=str(out))
+            self.assertEqual(run_batch(args), 1)
+            self.assertFalse(out.exists())
+
+    def test_score_documents_keeps_order_and_counts_chars(self):
+        docs = [(str(i), "戦略的なソリューションが求められます。" * (i + 1), None) for i in range(40)]
+        docs.insert(5, ("empty", "  \n", None))
+        stats = {}
+        records = list(score_documents(docs, jobs=1, stats=stats))
+
+        self.assertEqual([r["id"] for r in records], [d[0] for d in docs])
+        self.assertEqual(records[5], {"id": "empty", "error": "empty text"})
+        self.assertEqual(stats["chars"], sum(len(d[1]) for d in docs if d[0] != "empty"))
+        expected = AIPatternDetector().detect_all(docs[0][1]).total_score
+        self.assertEqual(records[0]["total_score"], expected)
+        self.assertEqual(len(records[0]["patterns"]), 6)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -7,14 +7,17 @@ and architectural patterns. Generates comprehensive CLAUDE.md documentation.
 """
 
 import argparse
+import heapq
+import itertools
 import json
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 
 @dataclass
@@ -56,6 +59,200 @@ class ProjectAnalysis:
         return result
 
 
+def _gitignore_to_regex(pattern: str) -> str:
+    """Translate a single .gitignore glob body to a regex (without anchors)."""
+    regex = ""
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            regex += "(?:.*/)?"
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            regex += ".*"
+            i += 2
+            continue
+        ch = pattern[i]
+        if ch == "*":
+            regex += "[^/]*"
+        elif ch == "?":
+            regex += "[^/]"
+        elif ch == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                regex += re.escape(ch)
+            else:
+                body = pattern[i + 1 : end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                regex += f"[{body}]"
+                i = end
+        elif ch == "\\" and i + 1 < len(pattern):
+            i += 1
+            regex += re.escape(pattern[i])
+        else:
+            regex += re.escape(ch)
+        i += 1
+    return regex
+
+
+def parse_gitignore(text: str, base: str = "") -> list[tuple[re.Pattern, bool, bool]]:
+    """Parse .gitignore text into (regex, negate, dir_only) rules.
+
+    ``base`` is the POSIX path (relative to the scan root) of the directory that
+    holds the .gitignore; rules only match paths below it.
+    """
+    rules: list[tuple[re.Pattern, bool, bool]] = []
+    prefix = re.escape(base + "/") if base else ""
+    for raw in text.splitlines():
+        line = raw.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:]
+        elif line.startswith("\\"):
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            continue
+        if "/" in line:
+            # Anchored to the .gitignore's directory
+            regex = prefix + _gitignore_to_regex(line.lstrip("/"))
+        else:
+            # Matches the name at any depth below the .gitignore's directory
+            regex = prefix + "(?:.*/)?" + _gitignore_to_regex(line)
+        rules.append((re.compile(regex + r"\Z"), negate, dir_only))
+    return rules
+
+
+def _is_ignored(rel: str, is_dir: bool, rules: list[tuple[re.Pattern, bool, bool]]) -> bool:
+    """Apply gitignore rules in order; the last matching rule wins."""
+    ignored = False
+    for regex, negate, dir_only in rules:
+        if dir_only and not is_dir:
+            continue
+        if regex.match(rel):
+            ignored = not negate
+    return ignored
+
+
+class FileIndex:
+    """Single ``os.scandir`` walk of a project, shared by every analysis step.
+
+    Excluded and hidden directories are pruned, ``.gitignore`` files (root and
+    nested) are honoured, and file contents are read lazily and cached. Files
+    are kept in depth-first walk order, so each directory's subtree is a
+    contiguous slice and can be served as a workspace view without rescanning.
+    """
+
+    def __init__(
+        self,
+        root: Optional[Path],
+        excluded_dirs: frozenset = frozenset(),
+        respect_gitignore: bool = True,
+    ):
+        self.root = root
+        self.files: list[str] = []
+        self.dirs: list[str] = []
+        self.children: dict[str, list[tuple[str, bool]]] = {}
+        self._spans: dict[str, tuple[int, int]] = {}
+        self._text_cache: dict[Path, Optional[str]] = {}
+        if root is not None:
+            self._excluded_dirs = excluded_dirs
+            self._respect_gitignore = respect_gitignore
+            self._scan("", [])
+            self._build_suffix_index()
+
+    def _scan(self, rel_dir: str, rules: list) -> None:
+        """Depth-first scan of one directory (recursion depth = tree depth)."""
+        abs_dir = self.root / rel_dir if rel_dir else self.root
+        try:
+            with os.scandir(abs_dir) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            return
+
+        prefix = f"{rel_dir}/" if rel_dir else ""
+        if self._respect_gitignore and any(e.name == ".gitignore" for e in entries):
+            try:
+                rules = rules + parse_gitignore((abs_dir / ".gitignore").read_text(errors="replace"), rel_dir)
+            except OSError:
+                pass
+
+        start = len(self.files)
+        self._spans[rel_dir] = (start, start)
+        listing: list[tuple[str, bool]] = []
+        subdirs: list[str] = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+            rel = prefix + entry.name
+            if rules and _is_ignored(rel, is_dir, rules):
+                continue
+            listing.append((entry.name, is_dir))
+            if is_dir:
+                if entry.name in self._excluded_dirs or entry.name.startswith(".") or entry.is_symlink():
+                    continue
+                subdirs.append(rel)
+            else:
+                self.files.append(rel)
+        self.children[rel_dir] = listing
+
+        for sub in subdirs:
+            self.dirs.append(sub)
+            self._scan(sub, rules)
+        self._spans[rel_dir] = (start, len(self.files))
+
+    def _build_suffix_index(self) -> None:
+        self._by_suffix: dict[str, list[int]] = {}
+        for i, rel in enumerate(self.files):
+            suffix = os.path.splitext(rel)[1]
+            if suffix:
+                self._by_suffix.setdefault(suffix, []).append(i)
+
+    def view(self, rel_dir: str) -> "FileIndex":
+        """Index for a subdirectory, sliced from this one without rescanning."""
+        sub = FileIndex(None)
+        sub.root = self.root / rel_dir
+        prefix = f"{rel_dir}/"
+        cut = len(prefix)
+        start, end = self._spans.get(rel_dir, (0, 0))
+        sub.files = [rel[cut:] for rel in self.files[start:end]]
+        sub.dirs = [d[cut:] for d in self.dirs if d.startswith(prefix)]
+        sub.children = {
+            ("" if d == rel_dir else d[cut:]): listing
+            for d, listing in self.children.items()
+            if d == rel_dir or d.startswith(prefix)
+        }
+        sub._spans = {
+            ("" if d == rel_dir else d[cut:]): (s - start, e - start)
+            for d, (s, e) in self._spans.items()
+            if d == rel_dir or d.startswith(prefix)
+        }
+        sub._text_cache = self._text_cache
+        sub._build_suffix_index()
+        return sub
+
+    def iter_files(self, extensions: list[str], limit: int) -> list[Path]:
+        """Files with the given suffixes in walk order, at most ``limit``."""
+        streams = [self._by_suffix.get(ext, []) for ext in set(extensions)]
+        return [self.root / self.files[i] for i in itertools.islice(heapq.merge(*streams), limit)]
+
+    def text(self, path) -> Optional[str]:
+        """Cached UTF-8 content of a file (relative or absolute path); None if unreadable."""
+        abs_path = path if isinstance(path, Path) and path.is_absolute() else self.root / path
+        if abs_path not in self._text_cache:
+            try:
+                self._text_cache[abs_path] = abs_path.read_bytes().decode("utf-8")
+            except (OSError, UnicodeDecodeError):
+                self._text_cache[abs_path] = None
+        return self._text_cache[abs_path]
+
+
 class CodebaseAnalyzer:
     """Analyzes a codebase to extract structure and patterns."""
 
@@ -155,28 +352,39 @@ class CodebaseAnalyzer:
         "Rocket": ["rocket"],
     }
 
-    def __init__(self, root_path: Path):
+    def __init__(
+        self,
+        root_path: Path,
+        respect_gitignore: bool = True,
+        workspaces: bool = False,
+        max_workers: Optional[int] = None,
+        index: Optional[FileIndex] = None,
+    ):
         self.root_path = root_path.resolve()
+        self.respect_gitignore = respect_gitignore
+        self.workspaces = workspaces
+        self.max_workers = max_workers
+        self._index = index
         self.analysis = ProjectAnalysis(
             project_name=self.root_path.name,
             project_type="unknown",
             root_path=self.root_path,
         )
 
+    @property
+    def index(self) -> FileIndex:
+        """Shared file index, built by a single scan on first use."""
+        if self._index is None:
+            self._index = FileIndex(self.root_path, self.EXCLUDED_DIRS, self.respect_gitignore)
+        return self._index
+
     def _iter_source_files(self, extensions: list[str], limit: int) -> list[Path]:
-        """Walk source files excluding known non-source directories, stop after limit."""
-        result: list[Path] = []
-        ext_set = set(extensions)
-        for dirpath, dirnames, filenames in os.walk(self.root_path):
-            # Prune excluded directories in-place
-            dirnames[:] = [d for d in dirnames if d not in self.EXCLUDED_DIRS and not d.startswith(".")]
-            for filename in filenames:
-                p = Path(dirpath) / filename
-                if p.suffix in ext_set:
-                    result.append(p)
-                    if len(result) >= limit:
-                        return result
-        return result
+        """Source files (excluding non-source and ignored directories) in walk order, up to limit."""
+        return self.index.iter_files(extensions, limit)
+
+    def _read(self, filename: str) -> str:
+        """Cached content of a project file, or "" if missing or unreadable."""
+        return self.index.text(filename) or ""
 
     def analyze(self) -> ProjectAnalysis:
         """Run full codebase analysis."""
@@ -194,8 +402,9 @@ class CodebaseAnalyzer:
         for project_type, patterns in self.PROJECT_PATTERNS.items():
             for pattern in patterns:
                 if "*" in pattern:
-                    # Glob pattern
-                    if list(self.root_path.glob(pattern)):
+                    # Glob pattern (root level only)
+                    root_names = (name for name, is_dir in self.index.children.get("", []) if not is_dir)
+                    if any(Path(name).match(pattern) for name in root_names):
                         self.analysis.project_type = project_type
                         return
                 else:
@@ -206,28 +415,30 @@ class CodebaseAnalyzer:
 
     def _analyze_structure(self) -> None:
         """Analyze directory structure."""
-        # Get root files
+        # Get root files (gitignored files are left out)
         self.analysis.root_files = sorted(
-            [f.name for f in self.root_path.iterdir() if f.is_file() and not f.name.startswith(".")]
+            name for name in self.index.files if "/" not in name and not name.startswith(".")
         )
 
-        # Get directories with descriptions
-        for item in sorted(self.root_path.iterdir()):
-            if item.is_dir() and not item.name.startswith(".") and item.name not in self.EXCLUDED_DIRS:
-                name = item.name.lower()
-                description = self.DIRECTORY_DESCRIPTIONS.get(name, self._infer_directory_description(item))
-                self.analysis.directories[item.name] = description
+        # Get directories with descriptions (hidden, excluded and gitignored dirs are pruned by the index)
+        for name in sorted(d for d in self.index.dirs if "/" not in d):
+            description = self.DIRECTORY_DESCRIPTIONS.get(
+                name.lower(), self._infer_directory_description(self.root_path / name)
+            )
+            self.analysis.directories[name] = description
 
     def _infer_directory_description(self, directory: Path) -> str:
         """Infer directory description from contents."""
-        files = list(directory.glob("*"))
-        if not files:
+        rel = directory.relative_to(self.root_path).as_posix()
+        entries = self.index.children.get(rel, [])
+        if not entries:
             return "Empty directory"
 
         extensions = set()
-        for f in files[:20]:  # Sample first 20 files
-            if f.is_file() and f.suffix:
-                extensions.add(f.suffix)
+        for name, is_dir in entries[:20]:  # Sample first 20 entries
+            suffix = os.path.splitext(name)[1]
+            if not is_dir and suffix:
+                extensions.add(suffix)
 
         if ".py" in extensions:
             return "Python modules"
@@ -291,7 +502,7 @@ class CodebaseAnalyzer:
         # Check for pyproject.toml
         pyproject = self.root_path / "pyproject.toml"
         if pyproject.exists():
-            content = pyproject.read_text()
+            content = self._read("pyproject.toml")
 
             # Detect package manager
             if "[tool.poetry]" in content:
@@ -334,7 +545,7 @@ class CodebaseAnalyzer:
         package_json = self.root_path / "package.json"
         if package_json.exists():
             try:
-                data = json.loads(package_json.read_text())
+                data = json.loads(self._read("package.json"))
                 scripts = data.get("scripts", {})
 
                 # Map npm scripts to command categories
@@ -422,7 +633,7 @@ class CodebaseAnalyzer:
         if not makefile.exists():
             return commands
 
-        content = makefile.read_text()
+        content = self._read("Makefile")
 
         # Look for common targets
         target_mapping = {
@@ -461,17 +672,13 @@ class CodebaseAnalyzer:
 
         combined_content = ""
         for filename in files_to_check:
-            filepath = self.root_path / filename
-            if filepath.exists():
-                combined_content += filepath.read_text()
+            if (self.root_path / filename).exists():
+                combined_content += self._read(filename)
 
         # Sample source files per-extension to avoid one language dominating
         for ext in [".py", ".js", ".ts", ".tsx", ".jsx", ".go", ".rs", ".java"]:
             for filepath in self._iter_source_files([ext], limit=10):
-                try:
-                    combined_content += filepath.read_text()
-                except (UnicodeDecodeError, PermissionError):
-                    continue
+                combined_content += self.index.text(filepath) or ""
 
         for framework, patterns in self.FRAMEWORK_PATTERNS.items():
             for pattern in patterns:
@@ -530,7 +737,7 @@ class CodebaseAnalyzer:
         for env_file in [".env.example", ".env.sample", ".env.template"]:
             filepath = self.root_path / env_file
             if filepath.exists():
-                content = filepath.read_text()
+                content = self._read(env_file)
                 # Extract variable names
                 for match in re.finditer(r"^([A-Z][A-Z0-9_]*)\s*=", content, re.MULTILINE):
                     env_vars.add(match.group(1))
@@ -545,13 +752,12 @@ class CodebaseAnalyzer:
         ]
 
         for filepath in self._iter_source_files([".py", ".js", ".ts", ".go", ".rs"], limit=50):
-            try:
-                content = filepath.read_text()
-                for pattern in patterns:
-                    for match in re.finditer(pattern, content):
-                        env_vars.add(match.group(1))
-            except (UnicodeDecodeError, PermissionError):
+            content = self.index.text(filepath)
+            if content is None:
                 continue
+            for pattern in patterns:
+                for match in re.finditer(pattern, content):
+                    env_vars.add(match.group(1))
 
         self.analysis.env_vars = sorted(env_vars)
 
@@ -563,7 +769,7 @@ class CodebaseAnalyzer:
         package_json = self.root_path / "package.json"
         if package_json.exists():
             try:
-                data = json.loads(package_json.read_text())
+                data = json.loads(self._read("package.json"))
                 if "workspaces" in data:
                     tools.append("npm/yarn workspaces")
             except json.JSONDecodeError:
@@ -588,15 +794,92 @@ class CodebaseAnalyzer:
         # Cargo workspaces
         cargo_toml = self.root_path / "Cargo.toml"
         if cargo_toml.exists():
-            try:
-                content = cargo_toml.read_text()
-                if "[workspace]" in content:
-                    tools.append("Cargo workspaces")
-            except (UnicodeDecodeError, PermissionError):
-                pass
+            if "[workspace]" in self._read("Cargo.toml"):
+                tools.append("Cargo workspaces")
 
         if tools:
             self.analysis.monorepo = {"detected": True, "tools": tools}
+            if self.workspaces:
+                self.analysis.monorepo["workspaces"] = self._analyze_workspaces()
+
+    def _workspace_patterns(self) -> list[str]:
+        """Collect workspace globs declared by npm/yarn, pnpm, Lerna and Cargo."""
+        patterns: list[str] = []
+
+        try:
+            data = json.loads(self._read("package.json") or "{}")
+        except json.JSONDecodeError:
+            data = {}
+        workspaces = data.get("workspaces", []) if isinstance(data, dict) else []
+        if isinstance(workspaces, dict):
+            workspaces = workspaces.get("packages", [])
+        patterns.extend(w for w in workspaces if isinstance(w, str))
+
+        # pnpm-workspace.yaml: "packages:" followed by "- 'glob'" items
+        in_packages = False
+        for line in self._read("pnpm-workspace.yaml").splitlines():
+            if re.match(r"^packages\s*:", line):
+                in_packages = True
+                continue
+            item = re.match(r"^\s+-\s*['\"]?([^'\"#]+?)['\"]?\s*$", line)
+            if in_packages and item:
+                patterns.append(item.group(1))
+            elif line.strip() and not line.startswith((" ", "\t")):
+                in_packages = False
+
+        try:
+            lerna = json.loads(self._read("lerna.json") or "{}")
+        except json.JSONDecodeError:
+            lerna = {}
+        if isinstance(lerna, dict):
+            patterns.extend(p for p in lerna.get("packages", []) if isinstance(p, str))
+
+        members = re.search(r"^members\s*=\s*\[(.*?)\]", self._read("Cargo.toml"), re.MULTILINE | re.DOTALL)
+        if members:
+            patterns.extend(re.findall(r"[\"']([^\"']+)[\"']", members.group(1)))
+
+        return patterns
+
+    def _workspace_dirs(self) -> list[str]:
+        """Resolve workspace globs against indexed directories."""
+        included: list[re.Pattern] = []
+        excluded: list[re.Pattern] = []
+        for pattern in self._workspace_patterns():
+            negate = pattern.startswith("!")
+            pattern = pattern.lstrip("!").strip().removeprefix("./").strip("/")
+            if not pattern:
+                continue
+            regex = re.compile(_gitignore_to_regex(pattern) + r"\Z")
+            (excluded if negate else included).append(regex)
+        return [
+            d for d in self.index.dirs if any(r.match(d) for r in included) and not any(r.match(d) for r in excluded)
+        ]
+
+    def _analyze_workspace(self, rel_dir: str) -> dict:
+        """Analyze one workspace using a slice of the shared index."""
+        sub = CodebaseAnalyzer(
+            self.root_path / rel_dir,
+            respect_gitignore=self.respect_gitignore,
+            index=self.index.view(rel_dir),
+        )
+        analysis = sub.analyze()
+        return {
+            "path": rel_dir,
+            "project_name": analysis.project_name,
+            "project_type": analysis.project_type,
+            "frameworks": analysis.frameworks,
+            "commands": analysis.commands,
+            "conventions": analysis.conventions,
+            "env_vars": analysis.env_vars,
+        }
+
+    def _analyze_workspaces(self) -> list[dict]:
+        """Analyze every declared workspace in parallel threads."""
+        dirs = self._workspace_dirs()
+        if not dirs:
+            return []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return list(pool.map(self._analyze_workspace, dirs))
 
 
 class ClaudeMdGenerator:
@@ -633,7 +916,19 @@ class ClaudeMdGenerator:
         tools = self.analysis.monorepo.get("tools", [])
         lines = ["## Monorepo Structure\n"]
         lines.append(f"This project is a monorepo using: {', '.join(tools)}.\n")
-        lines.append("<!-- TODO: Document workspace/package structure and inter-package dependencies -->")
+
+        workspaces = self.analysis.monorepo.get("workspaces", [])
+        if workspaces:
+            lines.append("| Workspace | Type | Frameworks | Test |")
+            lines.append("|-----------|------|------------|------|")
+            for ws in workspaces:
+                frameworks = ", ".join(ws["frameworks"]) or "-"
+                test_cmd = ws["commands"].get("test", ["-"])[0]
+                lines.append(f"| `{ws['path']}` | {ws['project_type']} | {frameworks} | `{test_cmd}` |")
+            lines.append("")
+            lines.append("<!-- TODO: Document inter-package dependencies -->")
+        else:
+            lines.append("<!-- TODO: Document workspace/package structure and inter-package dependencies -->")
         return "\n".join(lines)
 
     def _generate_overview(self) -> str:
@@ -770,6 +1065,9 @@ Examples:
 
   # Analyze current directory
   python3 analyze_codebase.py
+
+  # Monorepo: also analyze every declared workspace (in parallel)
+  python3 analyze_codebase.py --path /path/to/monorepo --workspaces --jobs 8
         """,
     )
     parser.add_argument(
@@ -798,6 +1096,23 @@ Examples:
         default="json",
         help="Output format (default: json)",
     )
+    parser.add_argument(
+        "--workspaces",
+        action="store_true",
+        help="For detected monorepos, also analyze each declared workspace",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="Worker threads for workspace analysis (default: Python's ThreadPoolExecutor default)",
+    )
+    parser.add_argument(
+        "--no-gitignore",
+        action="store_true",
+        help="Do not honour .gitignore files when scanning",
+    )
 
     args = parser.parse_args()
 
@@ -811,7 +1126,12 @@ Examples:
         sys.exit(1)
 
     # Run analysis
-    analyzer = CodebaseAnalyzer(args.path)
+    analyzer = CodebaseAnalyzer(
+        args.path,
+        respect_gitignore=not args.no_gitignore,
+        workspaces=args.workspaces,
+        max_workers=args.jobs,
+    )
     analysis = analyzer.analyze()
 
     # Generate output
@@ -9,7 +9,7 @@ import json
 from pathlib import Path
 
 import pytest
-from analyze_codebase import ClaudeMdGenerator, CodebaseAnalyzer, ProjectAnalysis
+from analyze_codebase import ClaudeMdGenerator, CodebaseAnalyzer, FileIndex, ProjectAnalysis
 
 
 class TestCodebaseAnalyzer:
@@ -526,3 +526,115 @@ name = "my-workspace"
         output = generator.generate()
 
         assert "## Monorepo" not in output
+
+
+class TestFileIndex:
+    """Tests for the shared single-scan file index."""
+
+    def test_honours_root_and_nested_gitignore(self, tmp_path: Path):
+        """Ignored files/dirs are skipped; negation re-includes files."""
+        (tmp_path / ".gitignore").write_text("generated/\n*.log\n!keep.log\n")
+        (tmp_path / "generated").mkdir()
+        (tmp_path / "generated" / "out.py").write_text("import os")
+        (tmp_path / "app.log").write_text("x")
+        (tmp_path / "keep.log").write_text("x")
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / ".gitignore").write_text("/local.py\n")
+        (tmp_path / "pkg" / "local.py").write_text("x = 1")
+        (tmp_path / "pkg" / "main.py").write_text("x = 1")
+
+        index = FileIndex(tmp_path, CodebaseAnalyzer.EXCLUDED_DIRS)
+
+        assert "pkg/main.py" in index.files
+        assert "keep.log" in index.files
+        assert "app.log" not in index.files
+        assert "pkg/local.py" not in index.files
+        assert not any(f.startswith("generated/") for f in index.files)
+
+        analysis = CodebaseAnalyzer(tmp_path).analyze()
+        assert "generated" not in analysis.directories
+        assert "generated" in CodebaseAnalyzer(tmp_path, respect_gitignore=False).analyze().directories
+
+    def test_ignored_entries_not_used_for_directory_descriptions(self, tmp_path: Path):
+        """A directory holding only ignored build output is not described by that output."""
+        (tmp_path / ".gitignore").write_text("*.py[cod]\nbuild/\n")
+        (tmp_path / "lib").mkdir()
+        (tmp_path / "lib" / "cache.pyc").write_text("x")
+        (tmp_path / "lib" / "build").mkdir()
+        (tmp_path / "lib" / "notes.md").write_text("# notes")
+        (tmp_path / "out").mkdir()
+        (tmp_path / "out" / "main.pyc").write_text("x")
+
+        index = FileIndex(tmp_path, CodebaseAnalyzer.EXCLUDED_DIRS)
+        assert index.children["lib"] == [("notes.md", False)]
+        assert index.children["out"] == []
+
+        directories = CodebaseAnalyzer(tmp_path).analyze().directories
+        assert directories["out"] == "Empty directory"
+
+    def test_file_contents_read_once(self, tmp_path: Path, monkeypatch):
+        """Frameworks and env var detection share cached file reads."""
+        (tmp_path / "app.py").write_text("import os\nfrom fastapi import FastAPI\nos.getenv('TOKEN')\n")
+        reads = []
+        original = Path.read_bytes
+
+        def counting_read_bytes(self):
+            reads.append(self.name)
+            return original(self)
+
+        monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+        analysis = CodebaseAnalyzer(tmp_path).analyze()
+
+        assert "FastAPI" in analysis.frameworks
+        assert "TOKEN" in analysis.env_vars
+        assert reads.count("app.py") == 1
+
+    def test_workspace_view_matches_direct_scan(self, tmp_path: Path):
+        """A sliced view of a subdirectory lists the same files as scanning it."""
+        (tmp_path / "packages" / "a" / "src").mkdir(parents=True)
+        (tmp_path / "packages" / "a" / "src" / "index.ts").write_text("x")
+        (tmp_path / "packages" / "a" / "package.json").write_text("{}")
+        (tmp_path / "packages" / "b").mkdir(parents=True)
+        (tmp_path / "packages" / "b" / "main.go").write_text("x")
+
+        index = FileIndex(tmp_path, CodebaseAnalyzer.EXCLUDED_DIRS)
+        view = index.view("packages/a")
+
+        assert view.files == FileIndex(tmp_path / "packages" / "a").files
+        assert [p.name for p in view.iter_files([".ts"], limit=10)] == ["index.ts"]
+
+
+class TestWorkspaceAnalysis:
+    """Tests for per-workspace analysis of monorepos."""
+
+    def test_analyzes_each_workspace(self, tmp_path: Path):
+        """Declared workspaces are resolved and analyzed individually."""
+        (tmp_path / "package.json").write_text(json.dumps({"name": "mono", "workspaces": ["packages/*"]}))
+        (tmp_path / "pnpm-workspace.yaml").write_text("packages:\n  - 'tools/*'\n")
+        for name in ("web", "api"):
+            (tmp_path / "packages" / name).mkdir(parents=True)
+            (tmp_path / "packages" / name / "package.json").write_text(
+                json.dumps({"name": name, "scripts": {"test": "jest"}})
+            )
+        (tmp_path / "packages" / "web" / "App.tsx").write_text("import React from 'react';")
+        (tmp_path / "tools" / "cli").mkdir(parents=True)
+        (tmp_path / "tools" / "cli" / "pyproject.toml").write_text("[project]\nname='cli'")
+
+        analysis = CodebaseAnalyzer(tmp_path, workspaces=True, max_workers=2).analyze()
+        workspaces = {ws["path"]: ws for ws in analysis.monorepo["workspaces"]}
+
+        assert set(workspaces) == {"packages/api", "packages/web", "tools/cli"}
+        assert workspaces["packages/web"]["frameworks"] == ["React"]
+        assert workspaces["tools/cli"]["project_type"] == "python"
+
+        output = ClaudeMdGenerator(analysis).generate()
+        assert "| `packages/web` | node | React | `npm run test` |" in output
+
+    def test_workspaces_off_by_default(self, tmp_path: Path):
+        """Without the option, monorepo output is detection only."""
+        (tmp_path / "package.json").write_text(json.dumps({"workspaces": ["packages/*"]}))
+        (tmp_path / "packages" / "app").mkdir(parents=True)
+
+        analysis = CodebaseAnalyzer(tmp_path).analyze()
+
+        assert "workspaces" not in analysis.monorepo
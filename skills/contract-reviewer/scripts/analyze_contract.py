@@ -13,22 +13,35 @@ Usage:
     python analyze_contract.py contract.txt --output report.md
     python analyze_contract.py contract.pdf --type nda --output nda_report.md
     python analyze_contract.py contract.txt --party-name "Acme Corp" --verbose
+    python analyze_contract.py contracts/ --batch --jobs 8 --output results.jsonl
 """
 
 import argparse
+import json
+import os
 import re
 import sys
+import time
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 # Constants for context extraction and limits (MN-003)
 CONTEXT_CHARS_BEFORE = 100
 CONTEXT_CHARS_AFTER = 100
 MAX_RECOMMENDATIONS = 5
 
+# Batch mode
+DEFAULT_BATCH_JOBS = os.cpu_count() or 1
+BATCH_CHUNK_SIZE = 16  # contracts per worker task
+BATCH_SUFFIXES = {".txt", ".md", ".pdf"}
+
 # Import pattern definitions
+from doc_text_cache import ExtractionCache, extract_pdf_pages, open_cache
 from pattern_definitions import CLAUSE_PATTERNS, CONTRACT_TYPE_PATTERNS, RED_FLAG_PATTERNS
 
 # Optional PDF support
@@ -40,6 +53,54 @@ except ImportError:
     PDF_SUPPORT = False
 
 
+@dataclass(frozen=True)
+class CompiledRedFlagPattern:
+    """A RED_FLAG_PATTERNS entry with its regexes compiled once at import time."""
+
+    info: dict
+    regex: re.Pattern
+    prerequisite: Optional[re.Pattern] = None
+
+    @property
+    def pattern_id(self) -> str:
+        return self.info["id"]
+
+    @property
+    def detection_mode(self) -> str:
+        return self.info.get("detection_mode", "regex")
+
+
+def compile_red_flag_patterns(patterns: Iterable[dict]) -> list[CompiledRedFlagPattern]:
+    """Compile red flag pattern definitions (IGNORECASE | DOTALL, as matched against the lowered text)."""
+    flags = re.IGNORECASE | re.DOTALL
+    compiled = []
+    for info in patterns:
+        prerequisite = info.get("prerequisite_pattern")
+        compiled.append(
+            CompiledRedFlagPattern(
+                info=info,
+                regex=re.compile(info["pattern"], flags),
+                prerequisite=re.compile(prerequisite, flags) if prerequisite else None,
+            )
+        )
+    return compiled
+
+
+COMPILED_RED_FLAG_PATTERNS = compile_red_flag_patterns(RED_FLAG_PATTERNS)
+
+
+class LineIndex:
+    """Line-start offsets of a text, for O(log n) offset -> line number lookups."""
+
+    def __init__(self, text: str):
+        self.starts = [0]
+        self.starts.extend(m.end() for m in re.finditer("\n", text))
+
+    def line_number(self, offset: int) -> int:
+        """Return the 1-based line number containing character offset `offset`."""
+        return bisect_right(self.starts, offset)
+
+
 @dataclass
 class RedFlag:
     """Represents a detected red flag in the contract."""
@@ -80,9 +141,12 @@ class AnalysisResult:
     recommendations: list[dict[str, str]] = field(default_factory=list)
 
 
-def read_file(filepath: Path) -> str:
+def read_file(filepath: Path, cache: Optional[ExtractionCache] = None) -> str:
     """Read content from file (supports .txt, .md, .pdf).
 
+    PDF text is read through `cache` when given, so unchanged documents are
+    not re-extracted (see doc_text_cache.py).
+
     Raises:
         ImportError: If PDF support is not available
         ValueError: If PDF is encrypted or contains no extractable text
@@ -92,23 +156,8 @@ def read_file(filepath: Path) -> str:
         if not PDF_SUPPORT:
             raise ImportError("PyPDF2 not installed. Install with: pip install PyPDF2")
 
-        text_content = []
         try:
-            with open(filepath, "rb") as f:
-                reader = PyPDF2.PdfReader(f)
-
-                if reader.is_encrypted:
-                    raise ValueError("PDF is encrypted. Cannot analyze encrypted documents.")
-
-                total_pages = len(reader.pages)
-                for i, page in enumerate(reader.pages, 1):
-                    try:
-                        text = page.extract_text()
-                        if text:
-                            text_content.append(text)
-                    except Exception as e:
-                        print(f"Warning: Failed to extract page {i}/{total_pages}: {e}")
-
+            text_content = [text for text in extract_pdf_pages(filepath, cache) if text]
         except (ValueError, ImportError):
             raise
         except Exception as e:
@@ -223,56 +272,63 @@ def extract_contract_info(text: str) -> ContractInfo:
     return info
 
 
-def detect_red_flags(text: str) -> list:
+def detect_red_flags(
+    text: str, patterns: Optional[list[CompiledRedFlagPattern]] = None, timings: Optional[dict] = None
+) -> list:
     """Detect red flag patterns in the contract.
 
     Supports two detection modes per pattern:
     - "regex" (default): Each regex match generates one red flag.
     - "absence": If prerequisite_pattern matches (topic exists) but pattern
       (positive/protective language) is NOT found, generate exactly one red flag.
+
+    Args:
+        text: Contract text
+        patterns: Compiled patterns (default: COMPILED_RED_FLAG_PATTERNS)
+        timings: If given, seconds spent on each pattern are added under its id
     """
+    if patterns is None:
+        patterns = COMPILED_RED_FLAG_PATTERNS
     red_flags = []
     text_lower = text.lower()
+    line_index = None
 
-    for pattern_info in RED_FLAG_PATTERNS:
-        detection_mode = pattern_info.get("detection_mode", "regex")
-
-        if detection_mode == "absence":
-            # Stage 1: Check if the prerequisite topic exists in the contract
-            prerequisite = pattern_info.get("prerequisite_pattern", "")
-            if not prerequisite:
-                continue
-            if not re.search(prerequisite, text_lower, re.IGNORECASE | re.DOTALL):
-                continue  # Topic not present in contract → skip
-
-            # Stage 2: Check if protective/positive language exists
-            if re.search(pattern_info["pattern"], text_lower, re.IGNORECASE | re.DOTALL):
-                continue  # Protection found → no flag
+    for compiled in patterns:
+        pattern_info = compiled.info
+        started = time.perf_counter()
 
+        if compiled.detection_mode == "absence":
+            # Stage 1: Check if the prerequisite topic exists in the contract.
+            # Stage 2: Check if protective/positive language exists.
             # No protection found → generate exactly 1 flag
-            red_flag = RedFlag(
-                pattern_id=pattern_info["id"],
-                title=pattern_info["title"],
-                severity=pattern_info["severity"],
-                category=pattern_info["category"],
-                clause_text="[Document-wide check: expected pattern not found]",
-                location="N/A (document-wide check)",
-                description=pattern_info["description"],
-                recommendation=pattern_info["recommendation"],
-            )
-            red_flags.append(red_flag)
+            if (
+                compiled.prerequisite is not None
+                and compiled.prerequisite.search(text_lower)
+                and not compiled.regex.search(text_lower)
+            ):
+                red_flag = RedFlag(
+                    pattern_id=pattern_info["id"],
+                    title=pattern_info["title"],
+                    severity=pattern_info["severity"],
+                    category=pattern_info["category"],
+                    clause_text="[Document-wide check: expected pattern not found]",
+                    location="N/A (document-wide check)",
+                    description=pattern_info["description"],
+                    recommendation=pattern_info["recommendation"],
+                )
+                red_flags.append(red_flag)
         else:
             # Default regex mode: each match generates one red flag
-            matches = list(re.finditer(pattern_info["pattern"], text_lower, re.IGNORECASE | re.DOTALL))
-            for match in matches:
+            for match in compiled.regex.finditer(text_lower):
                 # Extract surrounding context
-                start = max(0, match.start() - 100)
-                end = min(len(text), match.end() + 100)
+                start = max(0, match.start() - CONTEXT_CHARS_BEFORE)
+                end = min(len(text), match.end() + CONTEXT_CHARS_AFTER)
                 context = text[start:end].strip()
 
                 # Find approximate location
-                lines_before = text[: match.start()].count("\n") + 1
-                location = f"Approx. line {lines_before}"
+                if line_index is None:
+                    line_index = LineIndex(text)
+                location = f"Approx. line {line_index.line_number(match.start())}"
 
                 red_flag = RedFlag(
                     pattern_id=pattern_info["id"],
@@ -286,6 +342,9 @@ def detect_red_flags(text: str) -> list:
                 )
                 red_flags.append(red_flag)
 
+        if timings is not None:
+            timings[compiled.pattern_id] = timings.get(compiled.pattern_id, 0.0) + time.perf_counter() - started
+
     return red_flags
 
 
@@ -477,17 +536,28 @@ workflow is recommended. Consult qualified legal counsel for binding decisions.
 
 
 def analyze_contract(
-    filepath: Path, contract_type: Optional[str] = None, party_name: str = "", verbose: bool = False
+    filepath: Path,
+    contract_type: Optional[str] = None,
+    party_name: str = "",
+    verbose: bool = False,
+    cache: Optional[ExtractionCache] = None,
 ) -> AnalysisResult:
     """Main analysis function."""
     if verbose:
         print(f"Reading file: {filepath}")
 
-    text = read_file(filepath)
+    text = read_file(filepath, cache)
 
     if verbose:
         print(f"Document length: {len(text)} characters")
 
+    return analyze_text(text, contract_type=contract_type, verbose=verbose)
+
+
+def analyze_text(
+    text: str, contract_type: Optional[str] = None, verbose: bool = False, timings: Optional[dict] = None
+) -> AnalysisResult:
+    """Analyze already extracted contract text (see detect_red_flags for `timings`)."""
     # Extract info
     if verbose:
         print("Extracting contract information...")
@@ -502,7 +572,7 @@ def analyze_contract(
     # Detect red flags
     if verbose:
         print("Scanning for red flags...")
-    red_flags = detect_red_flags(text)
+    red_flags = detect_red_flags(text, timings=timings)
 
     if verbose:
         print(f"Found {len(red_flags)} red flags")
@@ -531,6 +601,149 @@ def analyze_contract(
     )
 
 
+def iter_contract_files(directory: Path) -> Iterator[Path]:
+    """Yield contract files (.txt, .md, .pdf) under `directory` recursively, in sorted order."""
+    for path in sorted(directory.rglob("*")):
+        if path.suffix.lower() in BATCH_SUFFIXES and path.is_file():
+            yield path
+
+
+def batch_record(result: AnalysisResult, name: str) -> dict:
+    """Return the compact JSONL record written for one contract in batch mode."""
+    return {
+        "file": name,
+        "contract_type": result.contract_info.contract_type,
+        "risk_score": result.risk_score,
+        "risk_level": result.risk_level,
+        "red_flag_count": len(result.red_flags),
+        "red_flags": [
+            {"id": rf.pattern_id, "severity": rf.severity, "location": rf.location} for rf in result.red_flags
+        ],
+        "missing_clauses": [clause for clause, present in result.clause_coverage.items() if not present],
+    }
+
+
+def _analyze_chunk(chunk: list, contract_type: Optional[str], cache: Optional[ExtractionCache]) -> tuple:
+    """Analyze a list of (name, path); returns (records, timings, chars, cache_hits). Runs in worker processes."""
+    records = []
+    timings: dict[str, float] = {}
+    chars = 0
+    hits_before = cache.hits if cache is not None else 0
+    for name, path in chunk:
+        try:
+            text = read_file(path, cache)
+            chars += len(text)
+            records.append(batch_record(analyze_text(text, contract_type=contract_type, timings=timings), name))
+        except (ImportError, ValueError, RuntimeError, OSError) as e:
+            records.append({"file": name, "error": str(e)})
+    cache_hits = cache.hits - hits_before if cache is not None else 0
+    return records, timings, chars, cache_hits
+
+
+def analyze_contracts(
+    directory: Path,
+    contract_type: Optional[str] = None,
+    jobs: int = DEFAULT_BATCH_JOBS,
+    stats: Optional[dict] = None,
+    cache: Optional[ExtractionCache] = None,
+) -> Iterator[dict]:
+    """Analyze every contract under `directory` in a process pool and yield records in file order.
+
+    Files are sent to workers in chunks of BATCH_CHUNK_SIZE with at most ``jobs * 2`` chunks
+    in flight. If `stats` is given, "contracts", "chars", extraction cache "cache_hits" and
+    per-pattern seconds ("seconds", keyed by pattern id) are accumulated into it.
+    """
+
+    def merge(result):
+        records, timings, chars, cache_hits = result
+        if stats is not None:
+            stats["contracts"] = stats.get("contracts", 0) + len(records)
+            stats["chars"] = stats.get("chars", 0) + chars
+            stats["cache_hits"] = stats.get("cache_hits", 0) + cache_hits
+            seconds = stats.setdefault("seconds", {})
+            for key, value in timings.items():
+                seconds[key] = seconds.get(key, 0.0) + value
+        return records
+
+    def chunks():
+        chunk = []
+        for path in iter_contract_files(directory):
+            chunk.append((path.relative_to(directory).as_posix(), path))
+            if len(chunk) >= BATCH_CHUNK_SIZE:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    if jobs <= 1:
+        for chunk in chunks():
+            yield from merge(_analyze_chunk(chunk, contract_type, cache))
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending = deque()
+        for chunk in chunks():
+            pending.append(pool.submit(_analyze_chunk, chunk, contract_type, cache))
+            if len(pending) >= jobs * 2:
+                yield from merge(pending.popleft().result())
+        while pending:
+            yield from merge(pending.popleft().result())
+
+
+def format_pattern_timings(stats: dict) -> str:
+    """Format per-pattern regex time for batch mode, slowest first, to spot pathological patterns."""
+    seconds = stats.get("seconds", {})
+    contracts = stats.get("contracts", 0)
+    chars = stats.get("chars", 0)
+    total = sum(seconds.values())
+    titles = {p["id"]: p["title"] for p in RED_FLAG_PATTERNS}
+    lines = ["Per-pattern time (single process, slowest first):"]
+    for pattern_id, elapsed in sorted(seconds.items(), key=lambda item: item[1], reverse=True):
+        share = elapsed / total * 100 if total > 0 else 0.0
+        per_contract = elapsed / contracts * 1000 if contracts else 0.0
+        rate = f"{chars / elapsed / 1e6:,.1f} MB/s" if elapsed > 0 else "-"
+        lines.append(
+            f"  {pattern_id} {titles.get(pattern_id, '')}: {elapsed:.3f}s "
+            f"({share:.0f}%, {per_contract:.2f} ms/contract, {rate})"
+        )
+    return "\n".join(lines)
+
+
+def run_batch(args, cache: Optional[ExtractionCache] = None) -> int:
+    """Batch CLI entry point. Writes one JSONL record per contract; exit code 1 if any contract failed."""
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    stats: dict = {}
+    errors = 0
+    levels: dict[str, int] = {}
+    start = time.perf_counter()
+    try:
+        records = analyze_contracts(args.input_file, contract_type=args.type, jobs=args.jobs, stats=stats, cache=cache)
+        for record in records:
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            if "error" in record:
+                errors += 1
+            else:
+                levels[record["risk_level"]] = levels.get(record["risk_level"], 0) + 1
+    finally:
+        if args.output:
+            out.close()
+    elapsed = time.perf_counter() - start
+
+    contracts = stats.get("contracts", 0)
+    print(
+        f"Analyzed {contracts - errors} contracts ({errors} errors) in {elapsed:.1f}s "
+        f"({contracts / elapsed if elapsed > 0 else 0:,.0f} contracts/sec, {args.jobs} jobs)",
+        file=sys.stderr,
+    )
+    print(f"Risk levels: {json.dumps(levels)}", file=sys.stderr)
+    print(format_pattern_timings(stats), file=sys.stderr)
+    if cache is not None:
+        print(f"Extraction cache: {stats.get('cache_hits', 0)} hit(s) ({cache.root})", file=sys.stderr)
+    if args.output:
+        print(f"Results written to: {args.output}", file=sys.stderr)
+    return 1 if errors else 0
+
+
 def main() -> int:
     """Main entry point.
 
@@ -540,6 +753,7 @@ def main() -> int:
             1 = Moderate risk (or general error)
             2 = High risk
             3 = Critical risk
+        With --batch: 0 if every contract was analyzed, 1 if any failed.
     """
     parser = argparse.ArgumentParser(
         description="Analyze contract documents for risks and red flags",
@@ -549,16 +763,37 @@ Examples:
   python analyze_contract.py contract.txt --output report.md
   python analyze_contract.py contract.pdf --type nda --output nda_report.md
   python analyze_contract.py contract.txt --party-name "Acme Corp" --verbose
+  python analyze_contract.py contracts/ --batch --jobs 8 --output results.jsonl
         """,
     )
 
-    parser.add_argument("input_file", type=Path, help="Contract file to analyze (txt, md, pdf)")
-    parser.add_argument("--output", "-o", type=Path, help="Output report file (Markdown)")
+    parser.add_argument(
+        "input_file", type=Path, help="Contract file to analyze (txt, md, pdf); with --batch, a directory"
+    )
+    parser.add_argument("--output", "-o", type=Path, help="Output report file (Markdown; JSONL with --batch)")
     parser.add_argument(
         "--type", "-t", choices=["nda", "msa", "sow", "sla", "license"], help="Override contract type detection"
     )
     parser.add_argument("--party-name", help="Your organization's name for context")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    parser.add_argument(
+        "--batch", action="store_true", help="Analyze every contract in a directory, writing one JSONL record each"
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=DEFAULT_BATCH_JOBS,
+        help=f"Worker processes for --batch (default: {DEFAULT_BATCH_JOBS})",
+    )
+    parser.add_argument(
+        "--extraction-cache-dir",
+        type=Path,
+        help="PDF text extraction cache (default: $DOC_TEXT_CACHE_DIR or ~/.cache/claude-skills/doc-text)",
+    )
+    parser.add_argument(
+        "--no-extraction-cache", action="store_true", help="Always re-extract PDF text instead of using the cache"
+    )
 
     args = parser.parse_args()
 
@@ -567,10 +802,24 @@ Examples:
         print(f"Error: File not found: {args.input_file}")
         return 1
 
+    if args.batch:
+        if not args.input_file.is_dir():
+            print(f"Error: --batch expects a directory: {args.input_file}")
+            return 1
+        cache = open_cache(args.extraction_cache_dir, enabled=not args.no_extraction_cache)
+        return run_batch(args, cache)
+
     # Run analysis with exception handling
+    cache = None
+    if args.input_file.suffix.lower() == ".pdf":
+        cache = open_cache(args.extraction_cache_dir, enabled=not args.no_extraction_cache)
     try:
         result = analyze_contract(
-            args.input_file, contract_type=args.type, party_name=args.party_name or "", verbose=args.verbose
+            args.input_file,
+            contract_type=args.type,
+            party_name=args.party_name or "",
+            verbose=args.verbose,
+            cache=cache,
         )
     except ImportError as e:
         print(f"Error: {e}")
@@ -582,6 +831,9 @@ Examples:
         print(f"Error: {e}")
         return 1
 
+    if args.verbose and cache is not None:
+        print(cache.report())
+
     # Generate report
     report = generate_report(result, args.input_file, args.party_name or "")
 
@@ -4,6 +4,7 @@ Tests for analyze_contract.py
 Run with: python -m pytest skills/contract-reviewer/scripts/tests/test_analyze_contract.py -v
 """
 
+import json
 import sys
 from pathlib import Path
 
@@ -14,16 +15,20 @@ scripts_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(scripts_dir))
 
 from analyze_contract import (
+    COMPILED_RED_FLAG_PATTERNS,
     AnalysisResult,
     ContractInfo,
+    LineIndex,
     RedFlag,
     _has_negation_context,
     analyze_contract,
+    analyze_contracts,
     calculate_risk_score,
     check_clause_coverage,
     detect_contract_type,
     detect_red_flags,
     extract_contract_info,
+    format_pattern_timings,
     generate_recommendations,
     generate_report,
     main,
@@ -562,6 +567,87 @@ class TestMain:
         assert "Preliminary Contract Analysis Report" in captured.out
 
 
+class TestCompiledPatterns:
+    """Tests for precompiled red flag patterns and line lookup."""
+
+    def test_every_pattern_compiled_once(self):
+        assert [c.pattern_id for c in COMPILED_RED_FLAG_PATTERNS] == [p["id"] for p in RED_FLAG_PATTERNS]
+        for compiled in COMPILED_RED_FLAG_PATTERNS:
+            assert (compiled.prerequisite is not None) == (compiled.detection_mode == "absence")
+
+    def test_line_index_matches_newline_count(self):
+        text = "first\n\nthird line\nfourth"
+        index = LineIndex(text)
+        for offset in range(len(text) + 1):
+            assert index.line_number(offset) == text[:offset].count("\n") + 1
+
+    def test_red_flag_location_uses_line_number(self):
+        text = "Preamble.\n\nPayment terms.\nThe customer shall have unlimited liability for any damages."
+        red_flags = [rf for rf in detect_red_flags(text) if rf.pattern_id == "RF001"]
+        assert [rf.location for rf in red_flags] == ["Approx. line 4"]
+
+    def test_timings_recorded_per_pattern(self):
+        timings = {}
+        detect_red_flags("Customer shall indemnify vendor.", timings=timings)
+        detect_red_flags("Provider may modify the terms at any time.", timings=timings)
+        assert set(timings) == {p["id"] for p in RED_FLAG_PATTERNS}
+        assert all(seconds >= 0 for seconds in timings.values())
+
+
+class TestBatchMode:
+    """Tests for multi-contract batch analysis."""
+
+    def _write_contracts(self, root):
+        (root / "vendor_b").mkdir(parents=True)
+        (root / "vendor_a.txt").write_text("The customer shall have unlimited liability for any damages.")
+        (root / "vendor_b" / "msa.md").write_text("This Master Services Agreement is governed by the laws of Delaware.")
+        (root / "notes.csv").write_text("ignored")
+        (root / "empty.txt").write_text("")
+
+    def test_records_in_file_order(self, tmp_path):
+        self._write_contracts(tmp_path)
+        stats = {}
+        records = list(analyze_contracts(tmp_path, jobs=1, stats=stats))
+        assert [r["file"] for r in records] == ["empty.txt", "vendor_a.txt", "vendor_b/msa.md"]
+        assert records[1]["red_flags"][0] == {"id": "RF001", "severity": "Critical", "location": "Approx. line 1"}
+        assert records[2]["contract_type"] == "MSA"
+        assert stats["contracts"] == 3
+        assert set(stats["seconds"]) == {p["id"] for p in RED_FLAG_PATTERNS}
+        assert "RF001 Unlimited Liability" in format_pattern_timings(stats)
+
+    def test_process_pool_matches_serial(self, tmp_path):
+        self._write_contracts(tmp_path)
+        assert list(analyze_contracts(tmp_path, jobs=2)) == list(analyze_contracts(tmp_path, jobs=1))
+
+    def test_unreadable_contract_reported(self, tmp_path, monkeypatch):
+        import analyze_contract as module
+
+        self._write_contracts(tmp_path)
+        (tmp_path / "scan.pdf").write_bytes(b"%PDF-1.4")
+        monkeypatch.setattr(module, "PDF_SUPPORT", False)
+        records = {r["file"]: r for r in analyze_contracts(tmp_path, jobs=1)}
+        assert "PyPDF2 not installed" in records["scan.pdf"]["error"]
+
+    def test_main_batch_writes_jsonl(self, tmp_path, monkeypatch, capsys):
+        contracts = tmp_path / "contracts"
+        contracts.mkdir()
+        self._write_contracts(contracts)
+        output = tmp_path / "results.jsonl"
+        monkeypatch.setattr(
+            "sys.argv", ["analyze_contract.py", str(contracts), "--batch", "-j", "1", "-o", str(output)]
+        )
+        assert main() == 0
+        lines = [json.loads(line) for line in output.read_text().splitlines()]
+        assert len(lines) == 3
+        assert "Per-pattern time" in capsys.readouterr().err
+
+    def test_main_batch_requires_directory(self, tmp_path, monkeypatch):
+        contract = tmp_path / "contract.txt"
+        contract.write_text("Simple agreement.")
+        monkeypatch.setattr("sys.argv", ["analyze_contract.py", str(contract), "--batch"])
+        assert main() == 1
+
+
 class TestPatternDefinitions:
     """Tests for pattern definition completeness."""
 
@@ -0,0 +1,163 @@
+"""
+Tests for doc_text_cache.py
+
+Run with: python -m pytest skills/contract-reviewer/scripts/tests/test_doc_text_cache.py -v
+"""
+
+import hashlib
+import os
+import stat
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+scripts_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+import analyze_contract
+from doc_text_cache import ExtractionCache, cached_extract, extract_pdf_pages, open_cache
+
+
+class FakePage:
+    def __init__(self, text):
+        self.text = text
+
+    def extract_text(self):
+        if isinstance(self.text, Exception):
+            raise self.text
+        return self.text
+
+
+@pytest.fixture
+def fake_pypdf2(monkeypatch):
+    """Install a PyPDF2 stand-in whose "PDFs" are text files with one page per line."""
+    calls = []
+
+    class PdfReader:
+        def __init__(self, f):
+            calls.append(f.name)
+            content = f.read().decode("utf-8")
+            self.is_encrypted = content.startswith("ENCRYPTED")
+            self.pages = [FakePage(RuntimeError("bad page") if line == "!" else line) for line in content.split("\n")]
+
+    module = types.SimpleNamespace(PdfReader=PdfReader, __version__="3.0.1")
+    monkeypatch.setitem(sys.modules, "PyPDF2", module)
+    monkeypatch.setattr(analyze_contract, "PDF_SUPPORT", True)
+    return calls
+
+
+class TestExtractionCache:
+    """Tests for the content-addressed extraction cache."""
+
+    def test_second_extraction_is_a_hit(self, tmp_path, fake_pypdf2):
+        pdf = tmp_path / "contract.pdf"
+        pdf.write_text("page one\npage two")
+        cache = ExtractionCache(tmp_path / "cache")
+
+        assert extract_pdf_pages(pdf, cache) == ["page one", "page two"]
+        assert extract_pdf_pages(pdf, cache) == ["page one", "page two"]
+        assert len(fake_pypdf2) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_keyed_by_content_not_path(self, tmp_path, fake_pypdf2):
+        cache = ExtractionCache(tmp_path / "cache")
+        first = tmp_path / "a.pdf"
+        first.write_text("same text")
+        copy = tmp_path / "renamed.pdf"
+        copy.write_text("same text")
+        extract_pdf_pages(first, cache)
+        extract_pdf_pages(copy, cache)
+        assert len(fake_pypdf2) == 1
+
+        first.write_text("edited text")
+        assert extract_pdf_pages(first, cache) == ["edited text"]
+        assert len(fake_pypdf2) == 2
+
+    def test_incomplete_extraction_not_cached(self, tmp_path, fake_pypdf2, capsys):
+        pdf = tmp_path / "partial.pdf"
+        pdf.write_text("good\n!")
+        cache = ExtractionCache(tmp_path / "cache")
+        assert extract_pdf_pages(pdf, cache) == ["good", ""]
+        assert "Failed to extract page 2/2" in capsys.readouterr().err
+        extract_pdf_pages(pdf, cache)
+        assert len(fake_pypdf2) == 2
+
+    def test_extractor_is_part_of_key(self, tmp_path):
+        doc = tmp_path / "doc.pdf"
+        doc.write_text("x")
+        cache = ExtractionCache(tmp_path / "cache")
+        assert cached_extract(doc, "v1", lambda p: (["one"], True), cache) == ["one"]
+        assert cached_extract(doc, "v2", lambda p: (["two"], True), cache) == ["two"]
+        assert cached_extract(doc, "v1", lambda p: (["stale"], True), cache) == ["one"]
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = ExtractionCache(tmp_path / "cache", max_bytes=300)
+        for name in ("old", "mid", "new"):
+            cache.put(name, ["x" * 100])
+        remaining = sorted(p.stem for p in cache.root.glob("*.json"))
+        assert "new" in remaining and "old" not in remaining
+        assert sum(p.stat().st_size for p in cache.root.glob("*.json")) <= 300
+
+    def test_cache_is_private_to_the_user(self, tmp_path):
+        previous = os.umask(0o022)
+        try:
+            existing = tmp_path / "existing"
+            existing.mkdir(mode=0o755)
+            for root in (tmp_path / "new" / "cache", existing):
+                cache = ExtractionCache(root)
+                cache.put("entry", ["confidential clause"])
+                assert stat.S_IMODE(root.stat().st_mode) == 0o700
+                assert stat.S_IMODE((root / "entry.json").stat().st_mode) == 0o600
+        finally:
+            os.umask(previous)
+
+    def test_open_cache_disabled(self, tmp_path):
+        assert open_cache(tmp_path, enabled=False) is None
+        assert open_cache(tmp_path).root == tmp_path
+
+
+class TestReadFileCache:
+    """Tests for analyze_contract.read_file with the extraction cache."""
+
+    def test_read_pdf_through_cache(self, tmp_path, fake_pypdf2):
+        pdf = tmp_path / "contract.pdf"
+        pdf.write_text("Master Services Agreement\n\nThe customer shall have unlimited liability.")
+        cache = ExtractionCache(tmp_path / "cache")
+        first = analyze_contract.read_file(pdf, cache)
+        second = analyze_contract.read_file(pdf, cache)
+        assert first == second == "Master Services Agreement\nThe customer shall have unlimited liability."
+        assert len(fake_pypdf2) == 1
+
+    def test_encrypted_pdf_rejected(self, tmp_path, fake_pypdf2):
+        pdf = tmp_path / "locked.pdf"
+        pdf.write_text("ENCRYPTED")
+        with pytest.raises(ValueError, match="encrypted"):
+            analyze_contract.read_file(pdf, ExtractionCache(tmp_path / "cache"))
+
+    def test_batch_reports_cache_hits(self, tmp_path, fake_pypdf2):
+        contracts = tmp_path / "contracts"
+        contracts.mkdir()
+        (contracts / "a.pdf").write_text("The customer shall have unlimited liability.")
+        cache = ExtractionCache(tmp_path / "cache")
+        for expected_hits in (0, 1):
+            stats = {}
+            records = list(analyze_contract.analyze_contracts(contracts, jobs=1, stats=stats, cache=cache))
+            assert records[0]["red_flags"][0]["id"] == "RF001"
+            assert stats["cache_hits"] == expected_hits
+
+
+class TestSharedCopies:
+    """doc_text_cache.py is vendored into several skills and must stay identical."""
+
+    COPIES = ("contract-reviewer", "wbs-review-assistant", "vendor-estimate-reviewer")
+
+    def test_copies_are_identical(self):
+        skills_dir = scripts_dir.resolve().parents[1]
+        digests = {
+            name: hashlib.sha256((skills_dir / name / "scripts" / "doc_text_cache.py").read_bytes()).hexdigest()
+            for name in self.COPIES
+        }
+        assert len(set(digests.values())) == 1, f"doc_text_cache.py copies differ: {digests}"
@@ -963,6 +963,41 @@ def review_single_skill(
     return report
 
 
+def run_review(
+    project_root: Path,
+    skill: str,
+    *,
+    output_dir: str = "reports",
+    skip_tests: bool = False,
+    emit_llm_prompt: bool = False,
+    llm_review_json: str | None = None,
+    auto_weight: float = 0.5,
+    llm_weight: float = 0.5,
+) -> dict:
+    """Review one skill in-process and return the report dict.
+
+    Importable equivalent of ``--skill <name>`` for orchestrators that would
+    otherwise spawn one interpreter per review. Report files are written to
+    ``output_dir`` exactly as the CLI does. Raises ValueError when the skill
+    is not found; returns ``{}`` when the LLM review JSON is invalid.
+    """
+    project_root = Path(project_root).resolve()
+    selected = pick_skill(discover_skills(project_root), skill, None)
+    args = argparse.Namespace(
+        project_root=str(project_root),
+        skill=skill,
+        seed=None,
+        output_dir=output_dir,
+        skip_tests=skip_tests,
+        emit_llm_prompt=emit_llm_prompt,
+        llm_review_json=llm_review_json,
+        all=False,
+        auto_weight=auto_weight,
+        llm_weight=llm_weight,
+    )
+    return review_single_skill(args, project_root, selected)
+
+
 def main() -> int:
     args = parse_args()
     project_root = Path(args.project_root).resolve()
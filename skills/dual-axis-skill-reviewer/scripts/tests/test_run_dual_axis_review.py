@@ -531,6 +531,22 @@ def test_main_e2e_generates_report_files(tmp_path: Path):
     assert report_files
 
 
+def test_run_review_returns_report_in_process(reviewer_module, tmp_path: Path):
+    write_text(
+        tmp_path / "skills" / "api-skill" / "SKILL.md",
+        "---\nname: api-skill\ndescription: test\n---\n\n## When to Use\nx\n## Workflow\nx\n",
+    )
+
+    report = reviewer_module.run_review(tmp_path, "api-skill", skip_tests=True)
+
+    assert report["skill_name"] == "api-skill"
+    assert report["selection_mode"] == "manual"
+    assert report["llm_review"]["provided"] is False
+    assert list((tmp_path / "reports").glob("skill_review_api-skill_*.json"))
+    with pytest.raises(ValueError):
+        reviewer_module.run_review(tmp_path, "missing-skill")
+
+
 def test_api_key_detected_from_scripts(reviewer_module, tmp_path: Path):
     """API key reference in scripts (not SKILL.md) should be detected."""
     project_root = tmp_path
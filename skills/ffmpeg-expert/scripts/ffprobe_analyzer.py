@@ -12,45 +12,67 @@ Examples:
     python ffprobe_analyzer.py video.mp4 --use-case web
     python ffprobe_analyzer.py video.mp4 --output report.md
     python ffprobe_analyzer.py video.mp4 --suggest-commands
+    python ffprobe_analyzer.py --batch /media/library "clips/**/*.mov" --format csv --output audit.csv
 """
 
 import argparse
+import csv
+import glob
 import json
+import os
+import sqlite3
 import subprocess
 import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# バッチモードで対象とする拡張子
+VIDEO_EXTENSIONS = set(".mp4 .m4v .mov .mkv .webm .avi .wmv .flv .mpg .mpeg .ts .mts .m2ts .3gp .mxf".split())
+AUDIO_EXTENSIONS = set(".mp3 .m4a .aac .wav .flac .ogg .opus .wma".split())
+MEDIA_EXTENSIONS = VIDEO_EXTENSIONS | AUDIO_EXTENSIONS
+
+DEFAULT_CACHE_DB = Path.home() / ".cache" / "ffmpeg-expert" / "probe_cache.sqlite3"
+DEFAULT_BATCH_JOBS = min(8, os.cpu_count() or 1)
+
+
+def run_ffprobe(file_path: str, timeout: Optional[float] = None) -> Dict:
+    """ffprobeを1回実行し、フォーマット・ストリーム情報のJSONを返す"""
+    cmd = ["ffprobe", "-v", "quiet", "-print_format", "json", "-show_format", "-show_streams", str(file_path)]
+
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=timeout)
+        return json.loads(result.stdout)
+    except FileNotFoundError:
+        raise RuntimeError("ffprobe not found. Please install FFmpeg.")
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"ffprobe failed: {e.stderr}")
+    except subprocess.TimeoutExpired:
+        raise RuntimeError(f"ffprobe timed out after {timeout}s")
+    except json.JSONDecodeError as e:
+        raise RuntimeError(f"Failed to parse ffprobe output: {e}")
 
 
 class MediaAnalyzer:
     """ffprobeを使用したメディアファイル分析クラス"""
 
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, probe_data: Optional[Dict] = None):
         """
         初期化
 
         Args:
             file_path: 分析対象ファイルパス
+            probe_data: 取得済みのffprobe結果（キャッシュ等）。指定時はffprobeを実行しない
         """
         self.file_path = file_path
-        self._probe_data: Optional[Dict] = None
+        self._probe_data: Optional[Dict] = probe_data
 
     def _run_ffprobe(self) -> Dict:
         """ffprobeを実行して結果を取得"""
-        if self._probe_data is not None:
-            return self._probe_data
-
-        cmd = ["ffprobe", "-v", "quiet", "-print_format", "json", "-show_format", "-show_streams", self.file_path]
-
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            self._probe_data = json.loads(result.stdout)
-            return self._probe_data
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"ffprobe failed: {e.stderr}")
-        except json.JSONDecodeError as e:
-            raise RuntimeError(f"Failed to parse ffprobe output: {e}")
+        if self._probe_data is None:
+            self._probe_data = run_ffprobe(self.file_path)
+        return self._probe_data
 
     def get_format_info(self) -> Dict[str, Any]:
         """コンテナフォーマット情報を取得"""
@@ -559,6 +581,249 @@ def generate_report(analyzer: MediaAnalyzer, use_case: Optional[str] = None, sug
     return "\n".join(md)
 
 
+# ============================================================
+# バッチモード
+# ============================================================
+
+
+class ProbeCache:
+    """ffprobe結果をパス・サイズ・更新時刻をキーにSQLiteへ保存するキャッシュ
+
+    サイズまたはmtimeが変わったファイルはキャッシュミスとなり、再プローブされる。
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path))
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS probes ("
+            "path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, "
+            "probe_json TEXT NOT NULL, probed_at TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, path: str, size: int, mtime_ns: int) -> Optional[Dict]:
+        """サイズとmtimeが一致するキャッシュ済みプローブ結果を返す"""
+        row = self._conn.execute(
+            "SELECT probe_json FROM probes WHERE path = ? AND size = ? AND mtime_ns = ?", (path, size, mtime_ns)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, path: str, size: int, mtime_ns: int, probe_data: Dict) -> None:
+        """プローブ結果を保存（同一パスの古い結果は置き換える）"""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO probes (path, size, mtime_ns, probe_json, probed_at) VALUES (?, ?, ?, ?, ?)",
+            (path, size, mtime_ns, json.dumps(probe_data, ensure_ascii=False), datetime.now().isoformat()),
+        )
+
+    def commit(self) -> None:
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.commit()
+        self._conn.close()
+
+
+def collect_media_files(inputs: Iterable[str], extensions: Optional[set] = None) -> List[Path]:
+    """ファイル・ディレクトリ（再帰）・globパターンからメディアファイル一覧を作成（重複除去・ソート済み）"""
+    extensions = MEDIA_EXTENSIONS if extensions is None else extensions
+    found = set()
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            candidates: Iterable[Path] = (p for p in path.rglob("*") if p.suffix.lower() in extensions)
+        elif path.is_file():
+            candidates = [path]
+        else:
+            candidates = (Path(p) for p in glob.glob(item, recursive=True) if Path(p).suffix.lower() in extensions)
+        for candidate in candidates:
+            if candidate.is_file():
+                found.add(candidate.resolve())
+    return sorted(found)
+
+
+_SEVERITY_RANK = {"ok": 0, "info": 1, "warning": 2, "error": 3}
+
+SUMMARY_FIELDS = [
+    "path",
+    "status",
+    "error",
+    "format_name",
+    "duration",
+    "size",
+    "bit_rate",
+    "video_codec",
+    "resolution",
+    "frame_rate",
+    "audio_codec",
+    "audio_channels",
+    "browser_status",
+    "browser_issues",
+    "mobile_status",
+    "mobile_issues",
+    "recommendation",
+    "estimated_size",
+]
+
+
+def _worst_severity(issues: List[Dict[str, Any]]) -> str:
+    return max((issue["severity"] for issue in issues), key=lambda sev: _SEVERITY_RANK.get(sev, 0), default="ok")
+
+
+def summarize_media(analyzer: MediaAnalyzer, use_case: str = "web") -> Dict[str, Any]:
+    """1ファイル分の分析・互換性チェック・推奨設定をフラットな1レコードに集約"""
+    fmt = analyzer.get_format_info()
+    video = analyzer.get_video_streams()
+    audio = analyzer.get_audio_streams()
+    checker = CompatibilityChecker(analyzer)
+    browser = checker.check_browser_compatibility()
+    mobile = checker.check_mobile_compatibility()
+    recommender = EncodingRecommender(analyzer)
+    recommendation = getattr(recommender, f"recommend_for_{use_case}")()
+
+    def problems(issues):
+        return "; ".join(i["message"] for i in issues if i["severity"] in ("warning", "error"))
+
+    return {
+        "path": analyzer.file_path,
+        "format_name": fmt["format_name"],
+        "duration": fmt["duration"],
+        "size": fmt["size"],
+        "bit_rate": fmt["bit_rate"],
+        "video_codec": video[0]["codec_name"] if video else "",
+        "resolution": video[0]["resolution"] if video else "",
+        "frame_rate": video[0]["frame_rate"] if video else 0,
+        "audio_codec": audio[0]["codec_name"] if audio else "",
+        "audio_channels": audio[0]["channels"] if audio else 0,
+        "browser_status": _worst_severity(browser),
+        "browser_issues": problems(browser),
+        "mobile_status": _worst_severity(mobile),
+        "mobile_issues": problems(mobile),
+        "recommendation": recommendation["description"],
+        "estimated_size": recommendation["estimated_size"],
+    }
+
+
+def batch_analyze(
+    paths: List[Path],
+    cache: Optional[ProbeCache] = None,
+    jobs: int = DEFAULT_BATCH_JOBS,
+    use_case: str = "web",
+    timeout: Optional[float] = None,
+) -> Iterator[Dict[str, Any]]:
+    """複数ファイルを分析し、1ファイル1レコードを順次yieldする
+
+    キャッシュヒットしたファイルはffprobeを実行しない。キャッシュミスは最大
+    ``jobs`` 並列でffprobeを実行し、完了順にレコードを返す（同時に保持する
+    未完了タスクは ``jobs * 4`` 件まで）。``status`` は cached / probed / error。
+    """
+
+    def record(path: Path, probe_data: Dict, status: str) -> Dict[str, Any]:
+        try:
+            return {**summarize_media(MediaAnalyzer(str(path), probe_data), use_case), "status": status, "error": ""}
+        except Exception as e:
+            return {"path": str(path), "status": "error", "error": f"summary failed: {e}"}
+
+    pending: List[Tuple[Path, int, int]] = []
+    for path in paths:
+        try:
+            st = path.stat()
+        except OSError as e:
+            yield {"path": str(path), "status": "error", "error": str(e)}
+            continue
+        cached = cache.get(str(path), st.st_size, st.st_mtime_ns) if cache else None
+        if cached is not None:
+            yield record(path, cached, "cached")
+        else:
+            pending.append((path, st.st_size, st.st_mtime_ns))
+
+    if not pending:
+        return
+
+    max_in_flight = max(1, jobs) * 4
+    todo = iter(pending)
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        in_flight = {}
+        for item in todo:
+            in_flight[pool.submit(run_ffprobe, str(item[0]), timeout)] = item
+            if len(in_flight) >= max_in_flight:
+                break
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                path, size, mtime_ns = in_flight.pop(future)
+                try:
+                    probe_data = future.result()
+                except RuntimeError as e:
+                    yield {"path": str(path), "status": "error", "error": str(e)}
+                else:
+                    if cache:
+                        cache.put(str(path), size, mtime_ns, probe_data)
+                    yield record(path, probe_data, "probed")
+                next_item = next(todo, None)
+                if next_item is not None:
+                    in_flight[pool.submit(run_ffprobe, str(next_item[0]), timeout)] = next_item
+            if cache:
+                cache.commit()
+
+
+def write_summary(records: Iterable[Dict[str, Any]], out, output_format: str = "jsonl") -> Dict[str, Any]:
+    """レコードをJSONLまたはCSVでストリーム出力し、集計結果を返す"""
+    totals: Dict[str, Any] = {"files": 0, "status": {}, "browser_status": {}, "mobile_status": {}}
+    writer = None
+    if output_format == "csv":
+        writer = csv.DictWriter(out, fieldnames=SUMMARY_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+    for rec in records:
+        if writer is not None:
+            writer.writerow(rec)
+        else:
+            out.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        totals["files"] += 1
+        for key in ("status", "browser_status", "mobile_status"):
+            if rec.get(key):
+                totals[key][rec[key]] = totals[key].get(rec[key], 0) + 1
+    return totals
+
+
+def run_batch(args) -> int:
+    """バッチモードのCLIエントリ。エラーが1件でもあれば終了コード1"""
+    if args.format not in (None, "jsonl", "csv"):
+        print(f"Error: Batch mode writes jsonl or csv, not {args.format}", file=sys.stderr)
+        return 1
+    paths = collect_media_files(args.inputs)
+    if not paths:
+        print("Error: No media files found", file=sys.stderr)
+        return 1
+
+    cache = None if args.no_cache else ProbeCache(Path(args.cache_db))
+    output_format = args.format or "jsonl"
+    out = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+    try:
+        records = batch_analyze(paths, cache=cache, jobs=args.jobs, use_case=args.use_case or "web")
+        totals = write_summary(records, out, output_format)
+    finally:
+        if args.output:
+            out.close()
+        if cache:
+            cache.close()
+
+    status = totals["status"]
+    print(
+        f"Analyzed {totals['files']} files: {status.get('probed', 0)} probed, "
+        f"{status.get('cached', 0)} cached, {status.get('error', 0)} errors",
+        file=sys.stderr,
+    )
+    print(
+        f"Browser: {json.dumps(totals['browser_status'])}  Mobile: {json.dumps(totals['mobile_status'])}",
+        file=sys.stderr,
+    )
+    if args.output:
+        print(f"Summary saved to: {args.output}", file=sys.stderr)
+    return 1 if status.get("error") else 0
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="FFprobe Media Analyzer - Comprehensive media file analysis tool",
@@ -569,13 +834,20 @@ Examples:
     python ffprobe_analyzer.py video.mp4 --use-case web --suggest-commands
     python ffprobe_analyzer.py video.mp4 --output report.md
     python ffprobe_analyzer.py video.mp4 --format json
+    python ffprobe_analyzer.py --batch /media/library --format csv --output audit.csv
         """,
     )
 
-    parser.add_argument("input_file", help="Input media file path")
+    parser.add_argument(
+        "inputs", nargs="+", metavar="input", help="Input media file (batch mode: files, directories or glob patterns)"
+    )
     parser.add_argument("--output", "-o", help="Output file path (default: stdout)")
     parser.add_argument(
-        "--format", "-f", choices=["markdown", "json"], default="markdown", help="Output format (default: markdown)"
+        "--format",
+        "-f",
+        choices=["markdown", "json", "jsonl", "csv"],
+        default=None,
+        help="Output format (default: markdown; batch mode: jsonl or csv, default jsonl)",
     )
     parser.add_argument(
         "--use-case",
@@ -584,9 +856,25 @@ Examples:
         help="Specific use case for recommendations",
     )
     parser.add_argument("--suggest-commands", "-s", action="store_true", help="Include encoding command suggestions")
+    parser.add_argument("--batch", action="store_true", help="Analyze many files and emit one summary record per file")
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=DEFAULT_BATCH_JOBS,
+        help=f"Concurrent ffprobe runs (default: {DEFAULT_BATCH_JOBS})",
+    )
+    parser.add_argument(
+        "--cache-db", default=str(DEFAULT_CACHE_DB), help=f"Probe cache database (default: {DEFAULT_CACHE_DB})"
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Probe every file; do not read or write the cache")
 
     args = parser.parse_args()
 
+    if args.batch or len(args.inputs) > 1 or Path(args.inputs[0]).is_dir() or args.format in ("jsonl", "csv"):
+        sys.exit(run_batch(args))
+    args.input_file = args.inputs[0]
+
     # ファイル存在確認
     if not Path(args.input_file).exists():
         print(f"Error: File not found: {args.input_file}", file=sys.stderr)
@@ -6,6 +6,7 @@ Unit tests for MediaAnalyzer, CompatibilityChecker, and EncodingRecommender clas
 
 import json
 import sys
+from argparse import Namespace
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -14,7 +15,19 @@ import pytest
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from ffprobe_analyzer import CompatibilityChecker, EncodingRecommender, MediaAnalyzer, generate_report
+import ffprobe_analyzer
+from ffprobe_analyzer import (
+    CompatibilityChecker,
+    EncodingRecommender,
+    MediaAnalyzer,
+    ProbeCache,
+    batch_analyze,
+    collect_media_files,
+    generate_report,
+    run_batch,
+    run_ffprobe,
+    write_summary,
+)
 
 
 class TestMediaAnalyzerFormatHelpers:
@@ -333,3 +346,101 @@ class TestGenerateReport:
         report = generate_report(analyzer, use_case="web", suggest_commands=True)
 
         assert "Web配信用" in report
+
+
+class TestBatchMode:
+    """Test batch probing, the SQLite probe cache and summary output"""
+
+    PROBE = {
+        "format": {"format_name": "matroska,webm", "duration": "10.0", "size": "1000", "bit_rate": "800"},
+        "streams": [
+            {"index": 0, "codec_type": "video", "codec_name": "hevc", "width": 4096, "height": 2160},
+            {"index": 1, "codec_type": "audio", "codec_name": "aac", "channels": 2},
+        ],
+    }
+
+    @pytest.fixture
+    def media_dir(self, tmp_path):
+        (tmp_path / "sub").mkdir()
+        for name in ("a.mp4", "sub/b.mkv", "notes.txt"):
+            (tmp_path / name).write_bytes(b"data")
+        return tmp_path
+
+    def test_collect_media_files_from_dirs_and_globs(self, media_dir):
+        from_dir = collect_media_files([str(media_dir)])
+        assert [p.name for p in from_dir] == ["a.mp4", "b.mkv"]
+
+        from_glob = collect_media_files([str(media_dir / "**" / "*.mkv"), str(media_dir / "a.mp4")])
+        assert [p.name for p in from_glob] == ["a.mp4", "b.mkv"]
+
+    def test_probe_cache_misses_after_change(self, tmp_path):
+        cache = ProbeCache(tmp_path / "cache.sqlite3")
+        cache.put("/m/a.mp4", 10, 111, self.PROBE)
+        assert cache.get("/m/a.mp4", 10, 111) == self.PROBE
+        assert cache.get("/m/a.mp4", 10, 222) is None
+        assert cache.get("/m/a.mp4", 11, 111) is None
+        cache.close()
+
+    def test_reaudit_only_probes_new_or_changed_files(self, media_dir, tmp_path):
+        paths = collect_media_files([str(media_dir)])
+        cache = ProbeCache(tmp_path / "cache.sqlite3")
+
+        with patch.object(ffprobe_analyzer, "run_ffprobe", return_value=self.PROBE) as mock_probe:
+            first = list(batch_analyze(paths, cache=cache, jobs=2))
+            assert mock_probe.call_count == 2
+            assert {r["status"] for r in first} == {"probed"}
+
+            second = list(batch_analyze(paths, cache=cache, jobs=2))
+            assert mock_probe.call_count == 2
+            assert {r["status"] for r in second} == {"cached"}
+
+            (media_dir / "a.mp4").write_bytes(b"new content")
+            third = {Path(r["path"]).name: r["status"] for r in batch_analyze(paths, cache=cache, jobs=2)}
+            assert mock_probe.call_count == 3
+            assert third == {"a.mp4": "probed", "b.mkv": "cached"}
+        cache.close()
+
+    def test_summary_records_aggregate_checks(self, media_dir):
+        paths = collect_media_files([str(media_dir)])
+        with patch.object(ffprobe_analyzer, "run_ffprobe", side_effect=[self.PROBE, RuntimeError("ffprobe failed")]):
+            records = sorted(batch_analyze(paths, jobs=1), key=lambda r: r["path"])
+
+        ok, failed = records
+        assert ok["video_codec"] == "hevc"
+        assert ok["browser_status"] == "error"
+        assert ok["mobile_status"] == "warning"
+        assert "4096x2160" in ok["mobile_issues"]
+        assert ok["recommendation"].startswith("Web")
+        assert failed["status"] == "error"
+        assert "ffprobe failed" in failed["error"]
+
+    def test_write_summary_csv_and_jsonl(self):
+        import io
+
+        records = [
+            {"path": "a.mp4", "status": "probed", "browser_status": "ok", "mobile_status": "ok"},
+            {"path": "b.mkv", "status": "error", "error": "boom"},
+        ]
+        out = io.StringIO()
+        totals = write_summary(records, out, "csv")
+        lines = out.getvalue().splitlines()
+        assert lines[0].startswith("path,status,error,")
+        assert len(lines) == 3
+        assert totals["status"] == {"probed": 1, "error": 1}
+
+        out = io.StringIO()
+        write_summary(records, out, "jsonl")
+        assert [json.loads(line)["path"] for line in out.getvalue().splitlines()] == ["a.mp4", "b.mkv"]
+
+    def test_run_batch_rejects_explicit_single_file_formats(self, media_dir, capsys):
+        for fmt in ("json", "markdown"):
+            args = Namespace(inputs=[str(media_dir)], format=fmt, output=None)
+            assert run_batch(args) == 1
+            assert f"not {fmt}" in capsys.readouterr().err
+
+    def test_missing_ffprobe_is_a_runtime_error(self, media_dir):
+        with patch.object(ffprobe_analyzer.subprocess, "run", side_effect=FileNotFoundError("ffprobe")):
+            with pytest.raises(RuntimeError, match="ffprobe not found"):
+                run_ffprobe("a.mp4")
+            records = list(batch_analyze(collect_media_files([str(media_dir)]), jobs=1))
+        assert {r["status"] for r in records} == {"error"}
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark table layout in markdown_to_fpdf.py on a synthetic large table.
+
+Generates a ROWS x COLS Markdown table (default 5,000 x 10 = 50k cells) and
+times column-width estimation and rendering with the streamed table renderer.
+With --compare, the same table is also rendered through fpdf2's table()
+(all rows measured, multi_cell wrapping) for reference — this is slow.
+
+Usage:
+    python benchmark_table_layout.py
+    python benchmark_table_layout.py --rows 2000 --cols 8 --compare
+    python benchmark_table_layout.py --font-regular /path/to/font.ttf --font-bold /path/to/bold.ttf
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_SCRIPT_DIR = Path(__file__).parent
+if str(_SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPT_DIR))
+
+import markdown_to_fpdf as fpdf_mod  # noqa: E402
+
+
+def make_table(rows: int, cols: int, seed: int = 0):
+    """Return (headers, rows) with cells of varying length."""
+    rng = random.Random(seed)
+    words = ["alpha", "beta", "gamma", "delta", "epsilon", "zeta", "theta", "kappa", "lambda"]
+    headers = [f"Column {c}" for c in range(cols)]
+    body = [
+        [f"{r}-{c} " + " ".join(rng.choice(words) for _ in range(rng.randint(0, 4))) for c in range(cols)]
+        for r in range(rows)
+    ]
+    return headers, body
+
+
+def to_markdown(headers, rows) -> str:
+    lines = ["| " + " | ".join(headers) + " |", "|" + "---|" * len(headers)]
+    lines.extend("| " + " | ".join(row) + " |" for row in rows)
+    return "# Table benchmark\n\n" + "\n".join(lines) + "\n"
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark markdown_to_fpdf table layout")
+    parser.add_argument("--rows", type=int, default=5000, help="Table rows (default: 5000)")
+    parser.add_argument("--cols", type=int, default=10, help="Table columns (default: 10)")
+    parser.add_argument("--compare", action="store_true", help="Also render through fpdf2 table() (slow)")
+    parser.add_argument("--font-regular", default=None, help="Path to regular weight font")
+    parser.add_argument("--font-bold", default=None, help="Path to bold weight font")
+    args = parser.parse_args()
+
+    headers, rows = make_table(args.rows, args.cols)
+    markdown_text = to_markdown(headers, rows)
+    fonts = fpdf_mod._resolve_fonts(args.font_regular, args.font_bold)
+    theme = fpdf_mod.get_theme("navy")
+    print(f"Table: {args.rows} rows x {args.cols} cols = {args.rows * args.cols} cells")
+
+    pdf = fpdf_mod.ProfessionalPDF(theme=theme, font_regular=fonts[0], font_bold=fonts[1])
+    pdf.add_page()
+
+    def col_widths():
+        fpdf_mod._compute_col_widths(pdf, headers, rows)
+
+    sample_limit = fpdf_mod.TABLE_SAMPLE_ROWS
+    fpdf_mod.TABLE_SAMPLE_ROWS = len(rows)
+    fpdf_mod._glyph_width_cache.clear()
+    full = _timed(col_widths)
+    fpdf_mod.TABLE_SAMPLE_ROWS = sample_limit
+    fpdf_mod._glyph_width_cache.clear()
+    sampled = _timed(col_widths)
+    print(f"Column widths, all rows:     {full:8.3f}s")
+    print(f"Column widths, sampled:      {sampled:8.3f}s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+
+        def render(name):
+            fpdf_mod.render_pdf(
+                markdown_text,
+                str(Path(tmp) / name),
+                frontmatter={},
+                no_cover=True,
+                font_regular=fonts[0],
+                font_bold=fonts[1],
+            )
+
+        streamed = _timed(lambda: render("streamed.pdf"))
+        print(f"Render, streamed rows:       {streamed:8.3f}s")
+        if args.compare:
+            stream_cells = fpdf_mod.TABLE_STREAM_CELLS
+            fpdf_mod.TABLE_STREAM_CELLS = sys.maxsize
+            try:
+                legacy = _timed(lambda: render("table.pdf"))
+            finally:
+                fpdf_mod.TABLE_STREAM_CELLS = stream_cells
+            print(f"Render, fpdf2 table():       {legacy:8.3f}s ({legacy / streamed:.1f}x slower)")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,11 +14,21 @@ Usage:
     python markdown_to_fpdf.py input.md output.pdf --theme gray --confidential
     python markdown_to_fpdf.py input.md output.pdf --no-cover
     python markdown_to_fpdf.py input.md output.pdf --font-regular /path/to/font.ttc --font-bold /path/to/bold.ttc
+    python markdown_to_fpdf.py input.md output.pdf --no-mermaid-cache
+    python markdown_to_fpdf.py docs/ out_pdfs/ --jobs 4
+    python markdown_to_fpdf.py report.md report.pdf --watch
 """
 
 import argparse
+import functools
+import hashlib
+import io
+import math
+import os
 import re
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -48,6 +58,11 @@ PAPER_SIZES = {
 DEFAULT_PAPER_SIZE = "letter"
 
 PAGE_MARGIN_MM = 10
+
+# Tables with more cells than this are laid out by the streamed renderer instead
+# of fpdf2's table(), and column widths are estimated from a sample of rows.
+TABLE_STREAM_CELLS = 2000
+TABLE_SAMPLE_ROWS = 200
 PAGE_WIDTH_MM = PAPER_SIZES[DEFAULT_PAPER_SIZE]["width"]
 PAGE_HEIGHT_MM = PAPER_SIZES[DEFAULT_PAPER_SIZE]["height"]
 CONTENT_WIDTH_MM = PAGE_WIDTH_MM - 2 * PAGE_MARGIN_MM
@@ -91,10 +106,15 @@ def parse_frontmatter(text: str) -> Tuple[Dict[str, Any], str]:
 # ============================================================
 
 
+@functools.lru_cache(maxsize=None)
+def _markdown_parser():
+    """Build the mistune parser once per process; it keeps no per-document state."""
+    return mistune.create_markdown(renderer=None, plugins=["table"])
+
+
 def parse_markdown(text: str) -> List[Dict]:
     """Parse Markdown to AST tokens using mistune 3.x."""
-    md = mistune.create_markdown(renderer=None, plugins=["table"])
-    tokens = md(text)
+    tokens = _markdown_parser()(text)
     return tokens
 
 
@@ -164,6 +184,7 @@ class ProfessionalPDF(FPDF):
         font_regular: str = "",
         font_bold: str = "",
         paper_size: str = DEFAULT_PAPER_SIZE,
+        image_dpi: Optional[int] = None,
     ):
         if paper_size not in PAPER_SIZES:
             raise ValueError(f"Unknown paper size: {paper_size}. Use one of {list(PAPER_SIZES.keys())}.")
@@ -172,6 +193,11 @@ class ProfessionalPDF(FPDF):
         self.theme = theme
         self.frontmatter = frontmatter or {}
         self._is_cover = False
+        # Downsample embedded raster images to this resolution (None = embed as-is)
+        self.image_dpi = image_dpi
+        # First path embedded for each image content digest, so identical images
+        # referenced under different paths share one XObject
+        self._image_sources: Dict[str, str] = {}
 
         # Register fonts — all 4 styles to avoid 'Undefined font' on markdown=True
         self.add_font(FONT_FAMILY, "", font_regular)
@@ -500,6 +526,19 @@ class ProfessionalPDF(FPDF):
         else:
             col_widths = _compute_col_widths(self, headers, rows)
 
+        if _is_large_table(headers, rows):
+            self._render_streamed_table(
+                headers,
+                rows,
+                col_widths,
+                ["L"] * len(headers),
+                header_fill=self.theme.primary,
+                row_fill=self.theme.primary_light,
+                size_pt=9,
+            )
+            self.ln(3)
+            return
+
         header_style = FontFace(
             color=DeviceRGB(*[c / 255 for c in self.theme.table_header_fg]),
             fill_color=DeviceRGB(*[c / 255 for c in self.theme.primary]),
@@ -548,6 +587,19 @@ class ProfessionalPDF(FPDF):
         while len(col_aligns) < len(headers):
             col_aligns.append("L")
 
+        if _is_large_table(headers, rows):
+            self._render_streamed_table(
+                headers,
+                rows,
+                col_widths,
+                col_aligns,
+                header_fill=self.theme.table_header_bg,
+                row_fill=self.theme.table_row_alt,
+                size_pt=8,
+            )
+            self.ln(3)
+            return
+
         header_style = FontFace(
             color=DeviceRGB(*[c / 255 for c in self.theme.table_header_fg]),
             fill_color=DeviceRGB(*[c / 255 for c in self.theme.table_header_bg]),
@@ -582,21 +634,99 @@ class ProfessionalPDF(FPDF):
                     row.cell(cell_val, align=align)
         self.ln(3)
 
+    def _render_streamed_table(
+        self,
+        headers: List[str],
+        rows: List[List[str]],
+        col_widths: List[float],
+        col_aligns: List[str],
+        header_fill: Tuple[int, int, int],
+        row_fill: Tuple[int, int, int],
+        size_pt: int,
+    ):
+        """Lay out a large table row by row with single-line cell() calls.
+
+        Matches the look of the fpdf2 table() path (borderless, header row in
+        bold, alternate rows filled) but wraps text with the cached glyph widths
+        instead of multi_cell(), and draws each row as soon as it is measured.
+        The header row is repeated at the top of every page; a row that does not
+        fit on a fresh page is split between pages line by line.
+        """
+        line_h = size_pt / self.k * 1.8
+        x0 = self.l_margin
+
+        def measure(cells: List[str], style: str) -> List[List[str]]:
+            self.set_font(FONT_FAMILY, style, size_pt)
+            char_width = _char_width_fn(self)
+            return [
+                _wrap_cell_text(cells[i] if i < len(cells) else "", col_widths[i] - 2 * self.c_margin, char_width)
+                for i in range(len(col_widths))
+            ]
+
+        header_lines = measure(headers, "B")
+        header_h = max(len(lines) for lines in header_lines) * line_h
+
+        def draw_lines(cell_lines: List[List[str]], first: int, last: int, fill):
+            y = self.get_y()
+            if fill is not None:
+                self.set_fill_color(*fill)
+                self.rect(x0, y, sum(col_widths), (last - first) * line_h, style="F")
+            x = x0
+            for i, lines in enumerate(cell_lines):
+                align = col_aligns[i] if i < len(col_aligns) else "L"
+                for j in range(first, min(last, len(lines))):
+                    self.set_xy(x, y + (j - first) * line_h)
+                    self.cell(col_widths[i], line_h, lines[j], align=align)
+                x += col_widths[i]
+            self.set_xy(x0, y + (last - first) * line_h)
+
+        def draw_header():
+            self.set_font(FONT_FAMILY, "B", size_pt)
+            self.set_text_color(*self.theme.table_header_fg)
+            draw_lines(header_lines, 0, len(max(header_lines, key=len)), header_fill)
+            self.set_font(FONT_FAMILY, "", size_pt)
+            self.set_text_color(*self.theme.text_dark)
+
+        if self.get_y() + header_h + line_h > self.page_break_trigger:
+            self.add_page()
+        draw_header()
+
+        for index, row in enumerate(rows):
+            cell_lines = measure(row, "")
+            n_lines = max(len(lines) for lines in cell_lines)
+            fill = row_fill if index % 2 == 0 else None
+            usable = self.page_break_trigger - self.t_margin - header_h
+            if self.get_y() + n_lines * line_h > self.page_break_trigger and n_lines * line_h <= usable:
+                self.add_page()
+                draw_header()
+            first = 0
+            while first < n_lines:
+                room = int((self.page_break_trigger - self.get_y()) // line_h)
+                if room <= 0:
+                    self.add_page()
+                    draw_header()
+                    continue
+                last = min(n_lines, first + room)
+                draw_lines(cell_lines, first, last, fill)
+                first = last
+
     def embed_image(self, image_path: str):
-        """Embed an image, fitting within content width and page height."""
+        """Embed an image, fitting within content width and page height.
+
+        Identical images (by content) are embedded once and reused. With
+        ``image_dpi`` set, images larger than needed for their rendered width are
+        downsampled before embedding.
+        """
         if not Path(image_path).exists():
             self.body_text(f"[Image not found: {image_path}]")
             return
         # Calculate image dimensions to fit within page
-        from PIL import Image as PILImage
-
-        try:
-            with PILImage.open(image_path) as img:
-                img_w_px, img_h_px = img.size
-        except Exception:
+        meta = _image_meta(image_path)
+        if meta is None:
             self.image(image_path, x=PAGE_MARGIN_MM, w=CONTENT_WIDTH_MM)
             self.ln(5)
             return
+        img_w_px, img_h_px, digest = meta
 
         # Scale to content width first
         scale = CONTENT_WIDTH_MM / img_w_px
@@ -619,10 +749,65 @@ class ProfessionalPDF(FPDF):
         if render_h > available_h:
             self.add_page()
 
-        self.image(image_path, x=x, w=render_w, h=render_h)
+        source = self._image_sources.setdefault(digest, str(image_path))
+        if self.image_dpi:
+            target_w_px = math.ceil(render_w / 25.4 * self.image_dpi)
+            if target_w_px < img_w_px:
+                source = io.BytesIO(_downsampled_image(source, digest, target_w_px))
+
+        self.image(source, x=x, w=render_w, h=render_h)
         self.ln(5)
 
 
+# ============================================================
+# Image metadata and downsampling
+# ============================================================
+
+
+@functools.lru_cache(maxsize=1024)
+def _image_meta_for(path: str, mtime_ns: int, size: int) -> Optional[Tuple[int, int, str]]:
+    """(width_px, height_px, sha256) of an image file, or None if PIL cannot read it.
+
+    Keyed by path, mtime and size so edits are picked up; memoized per process.
+    """
+    from PIL import Image as PILImage
+
+    data = Path(path).read_bytes()
+    try:
+        with PILImage.open(io.BytesIO(data)) as img:
+            width, height = img.size
+    except Exception:
+        return None
+    return width, height, hashlib.sha256(data).hexdigest()
+
+
+def _image_meta(image_path: str) -> Optional[Tuple[int, int, str]]:
+    st = os.stat(image_path)
+    return _image_meta_for(str(Path(image_path).resolve()), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=64)
+def _downsampled_image(image_path: str, digest: str, width_px: int) -> bytes:
+    """Resample an image to width_px (aspect preserved) and return the encoded bytes.
+
+    JPEG sources stay JPEG; everything else is written as PNG to keep transparency.
+    ``digest`` is part of the cache key so a changed file is resampled again.
+    """
+    from PIL import Image as PILImage
+
+    with PILImage.open(image_path) as img:
+        height_px = max(1, round(img.height * width_px / img.width))
+        resized = img.resize((width_px, height_px), PILImage.LANCZOS)
+        buf = io.BytesIO()
+        if img.format == "JPEG":
+            if resized.mode not in ("RGB", "L", "CMYK"):
+                resized = resized.convert("RGB")
+            resized.save(buf, format="JPEG", quality=85, optimize=True)
+        else:
+            resized.save(buf, format="PNG", optimize=True)
+    return buf.getvalue()
+
+
 # ============================================================
 # Column width computation
 # ============================================================
@@ -649,22 +834,88 @@ def _apply_col_widths_override(values: List[float], num_cols: int) -> List[float
     return [v / total * CONTENT_WIDTH_MM for v in values]
 
 
+# Per-font glyph widths: (font file, style, size) -> {char: width in mm}. Shared by
+# every document in the process, so batch and watch runs measure each glyph once.
+_glyph_width_cache: Dict[Tuple[str, str, float], Dict[str, float]] = {}
+
+
+def _char_width_fn(pdf: FPDF):
+    """Return a memoized char -> width (mm) function for pdf's current font and size."""
+    font_file = str(getattr(pdf.current_font, "ttffile", pdf.font_family))
+    widths = _glyph_width_cache.setdefault((font_file, pdf.font_style, pdf.font_size_pt), {})
+
+    def char_width(ch: str) -> float:
+        w = widths.get(ch)
+        if w is None:
+            w = widths[ch] = pdf.get_string_width(ch)
+        return w
+
+    return char_width
+
+
+def _wrap_cell_text(text: str, max_width: float, char_width) -> List[str]:
+    """Greedy word wrap using per-glyph widths; words wider than a line are split."""
+    lines = []
+    for para in text.split("\n"):
+        start, width, last_space, i = 0, 0.0, -1, 0
+        while i < len(para):
+            w = char_width(para[i])
+            if width + w > max_width and i > start:
+                if para[i] == " ":
+                    lines.append(para[start:i])
+                    start = i = i + 1
+                elif last_space > start:
+                    lines.append(para[start:last_space])
+                    start = last_space + 1
+                else:
+                    lines.append(para[start:i])
+                    start = i
+                width = sum(char_width(c) for c in para[start:i])
+                last_space = -1
+                continue
+            if para[i] == " ":
+                last_space = i
+            width += w
+            i += 1
+        lines.append(para[start:])
+    return lines
+
+
+def _is_large_table(headers: List[str], rows: List[List[str]]) -> bool:
+    return len(headers) * (len(rows) + 1) > TABLE_STREAM_CELLS
+
+
+def _sample_rows(rows: List[List[str]], num_cols: int) -> List[List[str]]:
+    """Pick the rows used to estimate column widths of a large table.
+
+    An evenly spaced sample of TABLE_SAMPLE_ROWS rows, plus the row holding the
+    longest cell (by character count) of each column so outliers still widen it.
+    """
+    if len(rows) <= TABLE_SAMPLE_ROWS:
+        return rows
+    step = len(rows) / TABLE_SAMPLE_ROWS
+    picked = {int(k * step) for k in range(TABLE_SAMPLE_ROWS)}
+    for i in range(num_cols):
+        picked.add(max(range(len(rows)), key=lambda r: len(rows[r][i]) if i < len(rows[r]) else 0))
+    return [rows[r] for r in sorted(picked)]
+
+
 def _compute_col_widths(pdf: FPDF, headers: List[str], rows: List[List[str]]) -> List[float]:
     """Compute proportional column widths based on content."""
     num_cols = len(headers)
     if num_cols == 0:
         return []
 
-    # Measure max string width per column
+    # Measure max string width per column (sampled for large tables)
     pdf.set_font(FONT_FAMILY, "", 9)
+    char_width = _char_width_fn(pdf)
     max_widths = []
+    sample = _sample_rows(rows, num_cols)
     for i in range(num_cols):
-        header_w = pdf.get_string_width(headers[i]) + 4
-        col_max = header_w
-        for row in rows:
+        col_max = sum(map(char_width, headers[i])) + 4
+        for row in sample:
             if i < len(row):
-                cell_w = pdf.get_string_width(row[i]) + 4
-                col_max = max(col_max, cell_w)
+                col_max = max(col_max, sum(map(char_width, row[i])) + 4)
         max_widths.append(col_max)
 
     # Cap and proportionally distribute
@@ -683,7 +934,14 @@ def _compute_col_widths(pdf: FPDF, headers: List[str], rows: List[List[str]]) ->
 class FPDFRenderer:
     """Renders mistune AST tokens to a ProfessionalPDF instance."""
 
-    def __init__(self, pdf: ProfessionalPDF, strict_mermaid: bool = True, debug_mermaid: bool = False):
+    def __init__(
+        self,
+        pdf: ProfessionalPDF,
+        strict_mermaid: bool = True,
+        debug_mermaid: bool = False,
+        mermaid_cache=None,
+        mermaid_jobs: Optional[int] = None,
+    ):
         self.pdf = pdf
         self._next_table_style = "data"  # "data" or "info"
         self._next_col_widths = None  # Optional[List[float]] — ratios for next table
@@ -692,6 +950,9 @@ class FPDFRenderer:
         self._mermaid_success = 0
         self._mermaid_failure = 0
         self._mermaid_renderer = None  # lazy init — shared across document
+        self._mermaid_cache = mermaid_cache  # Optional[MermaidDiskCache], persists across runs
+        self._mermaid_jobs = mermaid_jobs  # concurrent renders in the pre-pass (default: CPU count)
+        self._mermaid_results: Dict[str, Any] = {}  # raw code -> MermaidResult from the pre-pass
 
     @staticmethod
     def _parse_col_widths_directive(text: str):
@@ -717,6 +978,7 @@ class FPDFRenderer:
 
     def render(self, tokens: List[Dict]):
         """Walk all top-level tokens."""
+        self._prerender_mermaid(tokens)
         i = 0
         while i < len(tokens):
             token = tokens[i]
@@ -972,12 +1234,8 @@ class FPDFRenderer:
                 headers, rows, col_aligns=normalized_aligns, col_widths_override=col_widths_override
             )
 
-    def _render_mermaid(self, code: str):
-        """Render Mermaid diagram via MermaidRenderer (in-process).
-
-        In strict mode (default), raises MermaidRenderError on failure.
-        In permissive mode, falls back to rendering as a code block.
-        """
+    def _get_mermaid_renderer(self):
+        """Create the document's MermaidRenderer on first use."""
         if self._mermaid_renderer is None:
             from mermaid_renderer import MermaidBackend, MermaidRenderer
 
@@ -986,9 +1244,32 @@ class FPDFRenderer:
                 output_format="png",
                 width=1200,
                 debug=self._debug_mermaid,
+                disk_cache=self._mermaid_cache,
             )
+        return self._mermaid_renderer
+
+    def _prerender_mermaid(self, tokens: List[Dict]):
+        """Render every top-level Mermaid block concurrently before layout.
+
+        Layout then only embeds finished images; failures are still reported
+        (and raised in strict mode) at the block's position in the document.
+        """
+        codes = []
+        for token in tokens:
+            if token.get("type") == "block_code" and token.get("attrs", {}).get("info", "") == "mermaid":
+                raw = token.get("raw", token.get("children", ""))
+                codes.append(extract_text(raw) if isinstance(raw, list) else raw)
+        if codes:
+            self._mermaid_results.update(self._get_mermaid_renderer().render_many(codes, self._mermaid_jobs))
 
-        result = self._mermaid_renderer.render(code)
+    def _render_mermaid(self, code: str):
+        """Render Mermaid diagram via MermaidRenderer (in-process).
+
+        Uses the pre-pass result when available. In strict mode (default),
+        raises MermaidRenderError on failure. In permissive mode, falls back
+        to rendering as a code block.
+        """
+        result = self._mermaid_results.get(code) or self._get_mermaid_renderer().render(code)
         if result.success:
             self._mermaid_success += 1
             self.pdf.embed_image(result.image_path)
@@ -1018,6 +1299,18 @@ class FPDFRenderer:
 # Public API
 # ============================================================
 
+# discover_fonts() results per (font_regular, font_bold) request. Discovery opens
+# every candidate font with fontTools, so batch/watch runs resolve it only once.
+_font_cache: Dict[Tuple[Optional[str], Optional[str]], Tuple[str, str]] = {}
+
+
+def _resolve_fonts(font_regular: Optional[str], font_bold: Optional[str]) -> Tuple[str, str]:
+    """Memoized discover_fonts()."""
+    key = (font_regular, font_bold)
+    if key not in _font_cache:
+        _font_cache[key] = discover_fonts(font_regular, font_bold)
+    return _font_cache[key]
+
 
 def render_pdf(
     markdown_text: str,
@@ -1031,6 +1324,9 @@ def render_pdf(
     strict_mermaid: bool = True,
     debug_mermaid: bool = False,
     paper_size: Optional[str] = None,
+    mermaid_cache=None,
+    mermaid_jobs: Optional[int] = None,
+    image_dpi: Optional[int] = None,
 ) -> str:
     """Render Markdown text to a professional PDF.
 
@@ -1045,6 +1341,9 @@ def render_pdf(
         font_bold: Explicit bold font path.
         strict_mermaid: If True (default), raise MermaidRenderError on failure.
         debug_mermaid: If True, print detailed Mermaid debug output.
+        mermaid_cache: Optional MermaidDiskCache; unchanged diagrams are not re-rendered.
+        mermaid_jobs: Concurrent Mermaid renders (default: CPU count).
+        image_dpi: Downsample embedded images to this DPI at their rendered size.
 
     Returns:
         The output file path.
@@ -1068,11 +1367,16 @@ def render_pdf(
         frontmatter["cover"] = False
 
     # Discover fonts
-    fr, fb = discover_fonts(font_regular, font_bold)
+    fr, fb = _resolve_fonts(font_regular, font_bold)
 
     # Create PDF
     pdf = ProfessionalPDF(
-        theme=theme, frontmatter=frontmatter, font_regular=fr, font_bold=fb, paper_size=effective_paper_size
+        theme=theme,
+        frontmatter=frontmatter,
+        font_regular=fr,
+        font_bold=fb,
+        paper_size=effective_paper_size,
+        image_dpi=image_dpi,
     )
     pdf.alias_nb_pages()
 
@@ -1084,7 +1388,13 @@ def render_pdf(
 
     # Parse and render
     tokens = parse_markdown(markdown_text)
-    renderer = FPDFRenderer(pdf, strict_mermaid=strict_mermaid, debug_mermaid=debug_mermaid)
+    renderer = FPDFRenderer(
+        pdf,
+        strict_mermaid=strict_mermaid,
+        debug_mermaid=debug_mermaid,
+        mermaid_cache=mermaid_cache,
+        mermaid_jobs=mermaid_jobs,
+    )
     renderer.render(tokens)
 
     # Report Mermaid stats and cleanup cache
@@ -1098,6 +1408,277 @@ def render_pdf(
     return output_path
 
 
+# ============================================================
+# Batch and watch mode
+# ============================================================
+
+# Render settings of the current batch/watch process, set by preload().
+_worker_options: Dict[str, Any] = {}
+_worker_mermaid_cache = None
+
+
+def _render_options(args) -> Dict[str, Any]:
+    """Collect the picklable render_pdf() settings shared by every document of a run."""
+    return {
+        "theme_name": args.theme,
+        "confidential": args.confidential,
+        "no_cover": args.no_cover,
+        "font_regular": args.font_regular,
+        "font_bold": args.font_bold,
+        "strict_mermaid": not args.no_strict_mermaid,
+        "debug_mermaid": args.debug_mermaid,
+        "paper_size": args.paper_size,
+        "mermaid_jobs": args.mermaid_jobs,
+        "image_dpi": args.image_dpi,
+        "verify": args.verify or args.verify_save_images,
+        "verify_save_images": args.verify_save_images,
+        "mermaid_cache": None
+        if args.no_mermaid_cache
+        else (args.mermaid_cache_dir, args.mermaid_cache_max_mb * 1024 * 1024),
+    }
+
+
+def preload(options: Dict[str, Any]) -> None:
+    """Load fonts, theme and parser once so each document only pays for layout.
+
+    Used as the process-pool initializer in batch mode and once in watch mode.
+    ``options["fonts"]``, when set by the parent process, seeds the font cache so
+    workers skip discovery entirely.
+    """
+    global _worker_options, _worker_mermaid_cache
+    _worker_options = options
+    _worker_mermaid_cache = None
+    key = (options.get("font_regular"), options.get("font_bold"))
+    if options.get("fonts"):
+        _font_cache[key] = tuple(options["fonts"])
+    _resolve_fonts(*key)
+    get_theme(options.get("theme_name") or "navy")
+    _markdown_parser()
+
+
+def _mermaid_cache_for(options: Dict[str, Any]):
+    """Return this process's MermaidDiskCache, created on first use."""
+    global _worker_mermaid_cache
+    if options.get("mermaid_cache") is None:
+        return None
+    if _worker_mermaid_cache is None:
+        from mermaid_renderer import MermaidDiskCache
+
+        cache_dir, max_bytes = options["mermaid_cache"]
+        _worker_mermaid_cache = MermaidDiskCache(cache_dir, max_bytes)
+    return _worker_mermaid_cache
+
+
+def _convert_file(input_path: str, output_path: str) -> Dict[str, Any]:
+    """Render one Markdown file with the preloaded options; never raises."""
+    options = _worker_options
+    start = time.perf_counter()
+    error = None
+    layout_warnings = None
+    try:
+        text = Path(input_path).read_text(encoding="utf-8")
+        frontmatter, body = parse_frontmatter(text)
+        render_pdf(
+            markdown_text=body,
+            output_path=output_path,
+            frontmatter=frontmatter,
+            theme_name=options.get("theme_name"),
+            confidential=options.get("confidential", False),
+            no_cover=options.get("no_cover", False),
+            font_regular=options.get("font_regular"),
+            font_bold=options.get("font_bold"),
+            strict_mermaid=options.get("strict_mermaid", True),
+            debug_mermaid=options.get("debug_mermaid", False),
+            paper_size=options.get("paper_size"),
+            mermaid_cache=_mermaid_cache_for(options) if "```mermaid" in body else None,
+            mermaid_jobs=options.get("mermaid_jobs"),
+            image_dpi=options.get("image_dpi"),
+        )
+        if options.get("verify"):
+            layout_warnings = verify_layout(output_path, save_images=options.get("verify_save_images", False))
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    return {
+        "input": input_path,
+        "output": output_path,
+        "ok": error is None,
+        "seconds": round(time.perf_counter() - start, 3),
+        "error": error,
+        "layout_warnings": layout_warnings,
+    }
+
+
+def verify_layout(output_path: str, save_images: bool = False) -> Optional[List[str]]:
+    """Return layout overflow warnings for a generated PDF, or None if PyMuPDF is missing."""
+    try:
+        from verify_pdf_layout import verify_pdf
+    except ImportError:
+        print(
+            "Warning: PyMuPDF not installed, skipping layout verification. Run: pip install PyMuPDF",
+            file=sys.stderr,
+        )
+        return None
+    return verify_pdf(output_path, save_images=save_images)
+
+
+def _print_layout_warnings(warnings: Optional[List[str]]) -> None:
+    if warnings is None:
+        return
+    if warnings:
+        print(f"\n⚠ Layout verification ({len(warnings)} issues):", file=sys.stderr)
+        for w in warnings:
+            print(f"  - {w}", file=sys.stderr)
+    else:
+        print("✓ Layout verification passed — no overflow detected")
+
+
+def _print_result(result: Dict[str, Any]) -> None:
+    status = "OK  " if result["ok"] else "FAIL"
+    print(f"{status} {result['input']} -> {result['output']} ({result['seconds']:.2f}s)")
+    if result["error"]:
+        print(f"  Error ({result['error']})", file=sys.stderr)
+    _print_layout_warnings(result.get("layout_warnings"))
+
+
+def _batch_targets(input_path: Path, output_path: Path) -> List[Tuple[Path, Path]]:
+    """Map a Markdown file or a directory of *.md files to output PDF paths."""
+    if input_path.is_dir():
+        return [(md, output_path / md.with_suffix(".pdf").name) for md in sorted(input_path.glob("*.md"))]
+    return [(input_path, output_path)]
+
+
+def convert_batch(targets: List[Tuple[Path, Path]], options: Dict[str, Any], jobs: int = 1) -> List[Dict[str, Any]]:
+    """Render (input, output) pairs, in a process pool when jobs > 1.
+
+    Fonts are resolved once in the calling process and handed to the workers,
+    each of which preloads them before its first document. The Mermaid render
+    budget (``mermaid_jobs``, default CPU count) is split across the workers so
+    the pool does not start workers × CPU renderers. Results are returned in
+    input order.
+    """
+    options = dict(options)
+    options["fonts"] = _resolve_fonts(options.get("font_regular"), options.get("font_bold"))
+    pairs = [(str(src), str(dst)) for src, dst in targets]
+    if jobs <= 1 or len(pairs) <= 1:
+        preload(options)
+        results = []
+        for pair in pairs:
+            results.append(_convert_file(*pair))
+            _print_result(results[-1])
+        return results
+
+    workers = min(jobs, len(pairs))
+    options["mermaid_jobs"] = max(1, (options.get("mermaid_jobs") or os.cpu_count() or 1) // workers)
+    with ProcessPoolExecutor(max_workers=workers, initializer=preload, initargs=(options,)) as pool:
+        futures = [pool.submit(_convert_file, *pair) for pair in pairs]
+        results = []
+        for future in futures:
+            results.append(future.result())
+            _print_result(results[-1])
+    return results
+
+
+def run_batch(input_dir: Path, output_dir: Path, options: Dict[str, Any], jobs: Optional[int] = None) -> int:
+    """Convert every *.md file in input_dir into output_dir; returns an exit code."""
+    targets = _batch_targets(input_dir, output_dir)
+    if not targets:
+        print(f"No Markdown files found in {input_dir}", file=sys.stderr)
+        return 1
+    output_dir.mkdir(parents=True, exist_ok=True)
+    jobs = jobs or os.cpu_count() or 1
+
+    print(f"Converting {len(targets)} file(s) with {min(jobs, len(targets))} worker(s)...")
+    start = time.perf_counter()
+    results = convert_batch(targets, options, jobs=jobs)
+    succeeded = sum(1 for r in results if r["ok"])
+    print(f"Converted {succeeded}/{len(results)} file(s) in {time.perf_counter() - start:.1f}s")
+    return 0 if succeeded == len(results) else 1
+
+
+def _iter_image_urls(tokens: List[Dict]):
+    """Yield the URL of every image token in a mistune AST."""
+    for token in tokens:
+        if token.get("type") == "image":
+            url = token.get("attrs", {}).get("url", "")
+            if url:
+                yield url
+        children = token.get("children")
+        if isinstance(children, list):
+            yield from _iter_image_urls(children)
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _poll_changes(paths: List[Path], state: Dict[Path, Dict[str, Any]]) -> List[Path]:
+    """Return the documents whose Markdown or referenced images changed since the last poll.
+
+    ``state`` is updated in place. A document is only re-parsed (to refresh its
+    image list) when its own mtime changes; otherwise a poll is a few stat() calls.
+    Image paths are resolved the same way embed_image() resolves them. A document
+    that cannot be read yet (e.g. mid-save) is skipped and retried on the next poll.
+    """
+    changed = []
+    for path in paths:
+        md_mtime = _mtime_ns(path)
+        if md_mtime is None:
+            state.pop(path, None)
+            continue
+        entry = state.get(path)
+        if entry is None or entry["mtime"] != md_mtime:
+            try:
+                text = path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                continue
+            _, body = parse_frontmatter(text)
+            images = sorted(set(_iter_image_urls(parse_markdown(body))))
+        else:
+            images = entry["images"]
+        signature = (md_mtime, tuple(_mtime_ns(Path(url)) for url in images))
+        if entry is None or entry["signature"] != signature:
+            changed.append(path)
+        state[path] = {"mtime": md_mtime, "images": images, "signature": signature}
+    return changed
+
+
+def watch(
+    input_path: Path,
+    output_path: Path,
+    options: Dict[str, Any],
+    interval: float = 0.5,
+    max_polls: Optional[int] = None,
+) -> int:
+    """Re-render a file (or every *.md in a directory) whenever it or its images change.
+
+    Rendering happens in this process with fonts, theme and parser preloaded,
+    so a re-render costs only parsing and layout of the changed document.
+    """
+    options = dict(options)
+    options["fonts"] = _resolve_fonts(options.get("font_regular"), options.get("font_bold"))
+    preload(options)
+    if input_path.is_dir():
+        output_path.mkdir(parents=True, exist_ok=True)
+
+    state: Dict[Path, Dict[str, Any]] = {}
+    polls = 0
+    print(f"Watching {input_path} (Ctrl+C to stop)...")
+    try:
+        while max_polls is None or polls < max_polls:
+            targets = dict(_batch_targets(input_path, output_path))
+            for changed in _poll_changes(list(targets), state):
+                _print_result(_convert_file(str(changed), str(targets[changed])))
+            polls += 1
+            if max_polls is None or polls < max_polls:
+                time.sleep(interval)
+    except KeyboardInterrupt:
+        print("Stopped watching.")
+    return 0
+
+
 # ============================================================
 # CLI
 # ============================================================
@@ -1105,8 +1686,8 @@ def render_pdf(
 
 def main():
     parser = argparse.ArgumentParser(description="Convert Markdown to Professional PDF (fpdf2)")
-    parser.add_argument("input", help="Input Markdown file")
-    parser.add_argument("output", help="Output PDF file")
+    parser.add_argument("input", help="Input Markdown file, or a directory of *.md files (batch mode)")
+    parser.add_argument("output", help="Output PDF file, or output directory in batch mode")
     parser.add_argument(
         "--theme", choices=["navy", "gray"], default=None, help="Color theme (default: from frontmatter or navy)"
     )
@@ -1126,10 +1707,38 @@ def main():
         help="Allow Mermaid fallback to code block on failure (default: strict)",
     )
     parser.add_argument("--debug-mermaid", action="store_true", help="Print detailed Mermaid conversion debug output")
+    parser.add_argument(
+        "--mermaid-cache-dir",
+        default=None,
+        help="Persistent Mermaid render cache (default: $MERMAID_CACHE_DIR or ~/.cache/markdown-to-pdf/mermaid)",
+    )
+    parser.add_argument(
+        "--mermaid-cache-max-mb", type=int, default=256, help="Mermaid cache size limit in MB (default: 256)"
+    )
+    parser.add_argument("--no-mermaid-cache", action="store_true", help="Always re-render Mermaid diagrams")
+    parser.add_argument(
+        "--mermaid-jobs",
+        type=int,
+        default=None,
+        help="Concurrent Mermaid renders, split across batch workers (default: CPU count)",
+    )
+    parser.add_argument(
+        "--image-dpi",
+        type=int,
+        default=None,
+        help="Downsample embedded images to this DPI at their rendered size (default: embed as-is)",
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=None, help="Batch mode: documents rendered in parallel (default: CPU count)"
+    )
+    parser.add_argument("--watch", action="store_true", help="Re-render whenever the Markdown or its images change")
+    parser.add_argument(
+        "--watch-interval", type=float, default=0.5, help="Watch mode polling interval in seconds (default: 0.5)"
+    )
     parser.add_argument(
         "--verify",
         action="store_true",
-        help="Verify PDF layout after generation (check for overflow/clipping)",
+        help="Verify PDF layout after generation (check for overflow/clipping); applies to every document in batch/watch mode",
     )
     parser.add_argument(
         "--verify-save-images",
@@ -1144,9 +1753,20 @@ def main():
         print(f"Error: Input file not found: {input_path}", file=sys.stderr)
         sys.exit(1)
 
+    if args.watch:
+        sys.exit(watch(input_path, Path(args.output), _render_options(args), interval=args.watch_interval))
+    if input_path.is_dir():
+        sys.exit(run_batch(input_path, Path(args.output), _render_options(args), jobs=args.jobs))
+
     text = input_path.read_text(encoding="utf-8")
     frontmatter, body = parse_frontmatter(text)
 
+    mermaid_cache = None
+    if not args.no_mermaid_cache and "```mermaid" in body:
+        from mermaid_renderer import MermaidDiskCache
+
+        mermaid_cache = MermaidDiskCache(args.mermaid_cache_dir, args.mermaid_cache_max_mb * 1024 * 1024)
+
     try:
         output = render_pdf(
             markdown_text=body,
@@ -1160,29 +1780,17 @@ def main():
             strict_mermaid=not args.no_strict_mermaid,
             debug_mermaid=args.debug_mermaid,
             paper_size=args.paper_size,
+            mermaid_cache=mermaid_cache,
+            mermaid_jobs=args.mermaid_jobs,
+            image_dpi=args.image_dpi,
         )
         print(f"Generated: {output}")
+        if mermaid_cache is not None:
+            print(mermaid_cache.report())
 
         # Post-generation layout verification
         if args.verify or args.verify_save_images:
-            try:
-                from verify_pdf_layout import verify_pdf
-
-                warnings = verify_pdf(
-                    output,
-                    save_images=args.verify_save_images,
-                )
-                if warnings:
-                    print(f"\n⚠ Layout verification ({len(warnings)} issues):", file=sys.stderr)
-                    for w in warnings:
-                        print(f"  - {w}", file=sys.stderr)
-                else:
-                    print("✓ Layout verification passed — no overflow detected")
-            except ImportError:
-                print(
-                    "Warning: PyMuPDF not installed, skipping layout verification. Run: pip install PyMuPDF",
-                    file=sys.stderr,
-                )
+            _print_layout_warnings(verify_layout(output, save_images=args.verify_save_images))
     except Exception as e:
         # Catch MermaidRenderError (and any other render errors) at CLI boundary
         err_name = type(e).__name__
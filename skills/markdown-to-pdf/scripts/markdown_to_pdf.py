@@ -14,13 +14,18 @@ Usage:
     python markdown_to_pdf.py input.md output.pdf --theme dark
     python markdown_to_pdf.py input.md output.pdf --css custom.css
     python markdown_to_pdf.py input.md output.pdf --no-strict-mermaid
+    python markdown_to_pdf.py input.md output.pdf --no-mermaid-cache
+    python markdown_to_pdf.py docs/ out_pdfs/ --jobs 8   # batch: one shared browser
 """
 
 import argparse
 import asyncio
+import os
 import re
+import shutil
 import sys
 import tempfile
+import time
 from pathlib import Path
 
 # Ensure sibling imports work
@@ -34,12 +39,23 @@ _renderer_cache = {}
 
 
 def _get_or_create_renderer(
-    theme="default", background="white", output_format="png", width=3200, height=2400, debug=False
+    theme="default",
+    background="white",
+    output_format="png",
+    width=3200,
+    height=2400,
+    debug=False,
+    disk_cache=None,
+    max_concurrent=None,
 ):
-    """Get or create a shared MermaidRenderer instance."""
+    """Get or create a shared MermaidRenderer instance.
+
+    ``max_concurrent`` (default: CPU count) caps backend renders across every
+    document sharing the instance; it is fixed when the renderer is created.
+    """
     from mermaid_renderer import MermaidBackend, MermaidRenderer
 
-    key = (theme, output_format, background, width, height)
+    key = (theme, output_format, background, width, height, id(disk_cache))
     if key not in _renderer_cache:
         _renderer_cache[key] = MermaidRenderer(
             backend=MermaidBackend.AUTO,
@@ -49,6 +65,8 @@ def _get_or_create_renderer(
             width=width,
             height=height,
             debug=debug,
+            disk_cache=disk_cache,
+            max_concurrent=max_concurrent or os.cpu_count() or 1,
         )
     return _renderer_cache[key]
 
@@ -74,7 +92,15 @@ def extract_mermaid_blocks(markdown_content):
 
 
 def convert_mermaid_to_image(
-    mermaid_code, output_path, theme="default", background="white", format="png", width=3200, height=2400, debug=False
+    mermaid_code,
+    output_path,
+    theme="default",
+    background="white",
+    format="png",
+    width=3200,
+    height=2400,
+    debug=False,
+    disk_cache=None,
 ):
     """
     Convert Mermaid code to image using MermaidRenderer.
@@ -88,6 +114,7 @@ def convert_mermaid_to_image(
         width: Image width for PNG
         height: Image height for PNG
         debug: Enable debug output
+        disk_cache: Optional MermaidDiskCache shared across runs
 
     Returns:
         MermaidResult with success status and diagnostics.
@@ -99,6 +126,7 @@ def convert_mermaid_to_image(
         width=width,
         height=height,
         debug=debug,
+        disk_cache=disk_cache,
     )
     return renderer.render(mermaid_code, output_path=str(output_path))
 
@@ -111,10 +139,15 @@ def process_markdown_with_mermaid(
     image_format="png",
     strict_mermaid=True,
     debug_mermaid=False,
+    disk_cache=None,
+    jobs=None,
 ):
     """
     Process Markdown content and convert Mermaid blocks to images.
 
+    All diagrams are rendered up front by a bounded worker pool; blocks are
+    then replaced in document order.
+
     Args:
         markdown_content: Original Markdown content
         temp_dir: Temporary directory for image files
@@ -123,6 +156,9 @@ def process_markdown_with_mermaid(
         image_format: Image format (png or svg)
         strict_mermaid: If True, raise MermaidRenderError on failure.
         debug_mermaid: If True, print detailed debug output.
+        disk_cache: Optional MermaidDiskCache; unchanged diagrams are not re-rendered.
+        jobs: Concurrent Mermaid renders (default: CPU count); documents sharing a
+            renderer share this budget.
 
     Returns:
         Modified Markdown content with image references
@@ -140,23 +176,25 @@ def process_markdown_with_mermaid(
     success_count = 0
     failure_count = 0
 
+    # Render all diagrams concurrently (duplicates and cache hits are free)
+    renderer = _get_or_create_renderer(
+        theme=theme,
+        background=background,
+        output_format=image_format,
+        debug=debug_mermaid,
+        disk_cache=disk_cache,
+        max_concurrent=jobs,
+    )
+    results = renderer.render_many([code for _, code, _ in mermaid_blocks], max_workers=jobs)
+
     for full_block, mermaid_code, block_id in mermaid_blocks:
         # Generate image filename
         image_filename = f"{block_id}.{image_format}"
         image_path = Path(temp_dir) / image_filename
 
-        # Convert Mermaid to image
-        print(f"Converting {block_id}...")
-        result = convert_mermaid_to_image(
-            mermaid_code,
-            image_path,
-            theme,
-            background,
-            image_format,
-            debug=debug_mermaid,
-        )
-
+        result = results[mermaid_code]
         if result.success:
+            shutil.copy2(result.image_path, image_path)
             # Replace Mermaid block with image reference
             img_tag = f"![{block_id}]({image_filename})"
             modified_content = modified_content.replace(full_block, img_tag, 1)
@@ -318,6 +356,52 @@ def markdown_to_html(markdown_content, css_content=None):
     return html
 
 
+def _pdf_format(paper_size):
+    """Map a paper size name to Playwright's page.pdf() format value."""
+    return paper_size.capitalize() if paper_size.lower() in ("letter", "a4") else paper_size
+
+
+async def _print_page_to_pdf(page, html_content, output_path, base_dir=None, paper_size="letter"):
+    """Load HTML into an open Playwright page and print it to PDF."""
+    temp_html = None
+    try:
+        if base_dir:
+            # Write HTML to a uniquely named temp file so relative paths resolve
+            # and concurrent conversions sharing base_dir never overwrite each other
+            fd, temp_name = tempfile.mkstemp(prefix=".md2pdf_", suffix=".html", dir=str(base_dir))
+            temp_html = Path(temp_name)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(html_content)
+            await page.goto(temp_html.absolute().as_uri())
+        else:
+            await page.set_content(html_content, wait_until="networkidle")
+
+        # Generate PDF with options for high quality
+        await page.pdf(
+            path=str(output_path),
+            format=_pdf_format(paper_size),
+            print_background=True,
+            margin={"top": "12mm", "right": "10mm", "bottom": "12mm", "left": "10mm"},
+            scale=1.0,  # Use 1:1 scale for best quality
+            prefer_css_page_size=False,
+        )
+    finally:
+        if temp_html is not None and temp_html.exists():
+            temp_html.unlink()
+
+
+def _require_async_playwright():
+    """Import async_playwright or exit with install instructions."""
+    try:
+        from playwright.async_api import async_playwright
+    except ImportError:
+        print("Error: playwright not installed. Install with:", file=sys.stderr)
+        print("  pip install playwright", file=sys.stderr)
+        print("  playwright install chromium", file=sys.stderr)
+        sys.exit(1)
+    return async_playwright
+
+
 async def html_to_pdf_async(html_content, output_path, base_dir=None, paper_size="letter"):
     """
     Convert HTML to PDF using Playwright.
@@ -332,39 +416,13 @@ async def html_to_pdf_async(html_content, output_path, base_dir=None, paper_size
     Returns:
         True if successful, False otherwise
     """
-    try:
-        from playwright.async_api import async_playwright
-    except ImportError:
-        print("Error: playwright not installed. Install with:", file=sys.stderr)
-        print("  pip install playwright", file=sys.stderr)
-        print("  playwright install chromium", file=sys.stderr)
-        sys.exit(1)
+    async_playwright = _require_async_playwright()
 
     try:
         async with async_playwright() as p:
             browser = await p.chromium.launch()
             page = await browser.new_page()
-
-            # Set HTML content
-            if base_dir:
-                # Write HTML to temp file to resolve relative paths correctly
-                temp_html = Path(base_dir) / "temp_output.html"
-                with open(temp_html, "w", encoding="utf-8") as f:
-                    f.write(html_content)
-                await page.goto(f"file://{temp_html.absolute()}")
-            else:
-                await page.set_content(html_content, wait_until="networkidle")
-
-            # Generate PDF with options for high quality
-            await page.pdf(
-                path=str(output_path),
-                format=paper_size.capitalize() if paper_size.lower() in ("letter", "a4") else paper_size,
-                print_background=True,
-                margin={"top": "12mm", "right": "10mm", "bottom": "12mm", "left": "10mm"},
-                scale=1.0,  # Use 1:1 scale for best quality
-                prefer_css_page_size=False,
-            )
-
+            await _print_page_to_pdf(page, html_content, output_path, base_dir, paper_size)
             await browser.close()
         return True
 
@@ -373,6 +431,66 @@ async def html_to_pdf_async(html_content, output_path, base_dir=None, paper_size
         return False
 
 
+class BrowserPool:
+    """One Chromium instance with a fixed pool of reusable pages.
+
+    Use as an async context manager; ``print_pdf`` waits for a free page, so
+    at most ``size`` documents are printed at once. A page that fails is
+    replaced; if no replacement can be opened the pool shrinks, and once no
+    usable page is left every ``print_pdf`` call raises instead of waiting.
+    """
+
+    def __init__(self, size=4):
+        self.size = max(1, size)
+        self._playwright = None
+        self._browser = None
+        self._pages = None
+        self._live = 0  # usable pages, in the queue or printing
+
+    async def __aenter__(self):
+        async_playwright = _require_async_playwright()
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch()
+        self._pages = asyncio.Queue()
+        for _ in range(self.size):
+            self._pages.put_nowait(await self._browser.new_page())
+        self._live = self.size
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self._browser.close()
+        await self._playwright.stop()
+
+    async def print_pdf(self, html_content, output_path, base_dir=None, paper_size="letter"):
+        """Print HTML to PDF on a pooled page; returns True on success."""
+        page = await self._pages.get()
+        if page is None:
+            self._pages.put_nowait(None)  # wake the next waiter as well
+            raise RuntimeError("Browser pool has no usable pages left")
+        try:
+            await _print_page_to_pdf(page, html_content, output_path, base_dir, paper_size)
+            return True
+        except Exception as e:
+            print(f"Error converting HTML to PDF ({output_path}): {e}", file=sys.stderr)
+            # Don't hand a page in an unknown state to the next document
+            try:
+                await page.close()
+            except Exception:
+                pass
+            try:
+                page = await self._browser.new_page()
+            except Exception as e:
+                print(f"Error opening a replacement browser page: {e}", file=sys.stderr)
+                page = None
+                self._live -= 1
+            return False
+        finally:
+            if page is not None:
+                self._pages.put_nowait(page)
+            elif self._live == 0:
+                self._pages.put_nowait(None)
+
+
 def html_to_pdf(html_content, output_path, base_dir=None, paper_size="letter"):
     """
     Convert HTML to PDF using Playwright (sync wrapper).
@@ -389,10 +507,110 @@ def html_to_pdf(html_content, output_path, base_dir=None, paper_size="letter"):
     return asyncio.run(html_to_pdf_async(html_content, output_path, base_dir, paper_size=paper_size))
 
 
+def _read_css(css):
+    """Read a custom CSS file, or return None (with a warning if it is missing)."""
+    if not css:
+        return None
+    css_path = Path(css)
+    if not css_path.exists():
+        print(f"Warning: CSS file not found: {css_path}", file=sys.stderr)
+        return None
+    with open(css_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _markdown_file_to_html(input_path, temp_dir, args, css_content=None, disk_cache=None):
+    """Read a Markdown file, render its Mermaid blocks into temp_dir and return HTML."""
+    with open(input_path, "r", encoding="utf-8") as f:
+        markdown_content = f.read()
+    processed_markdown = process_markdown_with_mermaid(
+        markdown_content,
+        temp_dir,
+        args.theme,
+        args.background,
+        args.image_format,
+        strict_mermaid=not args.no_strict_mermaid,
+        debug_mermaid=args.debug_mermaid,
+        disk_cache=disk_cache,
+        jobs=args.mermaid_jobs,
+    )
+    return markdown_to_html(processed_markdown, css_content)
+
+
+async def convert_batch_async(input_files, output_dir, args, css_content=None, disk_cache=None, jobs=4):
+    """
+    Convert many Markdown files through one shared browser.
+
+    Each document gets its own temp directory (Mermaid images, HTML). Markdown
+    and Mermaid preparation runs in worker threads while other documents print,
+    with at most ``jobs`` documents in flight.
+
+    Returns:
+        List of (input_path, output_path, success) tuples in input order.
+    """
+    semaphore = asyncio.Semaphore(max(1, jobs))
+
+    async with BrowserPool(jobs) as pool:
+
+        async def convert_one(input_path):
+            output_path = Path(output_dir) / input_path.with_suffix(".pdf").name
+            async with semaphore:
+                temp_dir = tempfile.mkdtemp(prefix="mermaid_pdf_")
+                try:
+                    html_content = await asyncio.to_thread(
+                        _markdown_file_to_html, input_path, temp_dir, args, css_content, disk_cache
+                    )
+                    success = await pool.print_pdf(html_content, output_path, temp_dir, args.paper_size)
+                except Exception as e:
+                    print(f"Error ({type(e).__name__}) in {input_path}: {e}", file=sys.stderr)
+                    success = False
+                finally:
+                    if args.keep_temp:
+                        print(f"Temporary files for {input_path.name} kept at: {temp_dir}")
+                    else:
+                        shutil.rmtree(temp_dir, ignore_errors=True)
+            print(f"{'OK  ' if success else 'FAIL'} {input_path} -> {output_path}")
+            return input_path, output_path, success
+
+        return await asyncio.gather(*(convert_one(path) for path in input_files))
+
+
+def run_batch(args, input_dir, output_dir):
+    """Convert every *.md file in input_dir into output_dir; returns an exit code."""
+    input_files = sorted(input_dir.glob("*.md"))
+    if not input_files:
+        print(f"No Markdown files found in {input_dir}", file=sys.stderr)
+        return 1
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    disk_cache = None
+    if not args.no_mermaid_cache:
+        from mermaid_renderer import MermaidDiskCache
+
+        disk_cache = MermaidDiskCache(args.mermaid_cache_dir, args.mermaid_cache_max_mb * 1024 * 1024)
+
+    print(f"Converting {len(input_files)} file(s) with {args.jobs} browser page(s)...")
+    start = time.perf_counter()
+    try:
+        results = asyncio.run(
+            convert_batch_async(input_files, output_dir, args, _read_css(args.css), disk_cache, jobs=args.jobs)
+        )
+    finally:
+        for renderer in _renderer_cache.values():
+            renderer.cleanup_cache()
+        _renderer_cache.clear()
+
+    succeeded = sum(1 for _, _, ok in results if ok)
+    print(f"Converted {succeeded}/{len(results)} file(s) in {time.perf_counter() - start:.1f}s")
+    if disk_cache is not None:
+        print(disk_cache.report())
+    return 0 if succeeded == len(results) else 1
+
+
 def main():
     parser = argparse.ArgumentParser(description="Convert Markdown with Mermaid diagrams to PDF")
-    parser.add_argument("input", help="Input Markdown file")
-    parser.add_argument("output", help="Output PDF file")
+    parser.add_argument("input", help="Input Markdown file, or a directory of *.md files (batch mode)")
+    parser.add_argument("output", help="Output PDF file, or output directory in batch mode")
     parser.add_argument(
         "--theme",
         choices=["default", "forest", "dark", "neutral"],
@@ -417,6 +635,22 @@ def main():
         help="Allow Mermaid fallback to code block on failure (default: strict)",
     )
     parser.add_argument("--debug-mermaid", action="store_true", help="Print detailed Mermaid conversion debug output")
+    parser.add_argument(
+        "--mermaid-cache-dir",
+        default=None,
+        help="Persistent Mermaid render cache (default: $MERMAID_CACHE_DIR or ~/.cache/markdown-to-pdf/mermaid)",
+    )
+    parser.add_argument(
+        "--mermaid-cache-max-mb", type=int, default=256, help="Mermaid cache size limit in MB (default: 256)"
+    )
+    parser.add_argument("--no-mermaid-cache", action="store_true", help="Always re-render Mermaid diagrams")
+    parser.add_argument(
+        "--mermaid-jobs",
+        type=int,
+        default=None,
+        help="Concurrent Mermaid renders, shared by all batch documents (default: CPU count)",
+    )
+    parser.add_argument("--jobs", type=int, default=4, help="Batch mode: documents converted concurrently (default: 4)")
 
     args = parser.parse_args()
 
@@ -426,6 +660,9 @@ def main():
         print(f"Error: Input file not found: {input_path}", file=sys.stderr)
         sys.exit(1)
 
+    if input_path.is_dir():
+        sys.exit(run_batch(args, input_path, Path(args.output)))
+
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -434,6 +671,12 @@ def main():
     with open(input_path, "r", encoding="utf-8") as f:
         markdown_content = f.read()
 
+    disk_cache = None
+    if not args.no_mermaid_cache and "```mermaid" in markdown_content:
+        from mermaid_renderer import MermaidDiskCache
+
+        disk_cache = MermaidDiskCache(args.mermaid_cache_dir, args.mermaid_cache_max_mb * 1024 * 1024)
+
     # Create temporary directory
     temp_dir = tempfile.mkdtemp(prefix="mermaid_pdf_")
     print(f"Temporary directory: {temp_dir}")
@@ -449,17 +692,14 @@ def main():
             args.image_format,
             strict_mermaid=not args.no_strict_mermaid,
             debug_mermaid=args.debug_mermaid,
+            disk_cache=disk_cache,
+            jobs=args.mermaid_jobs,
         )
+        if disk_cache is not None:
+            print(disk_cache.report())
 
         # Read custom CSS if provided
-        css_content = None
-        if args.css:
-            css_path = Path(args.css)
-            if css_path.exists():
-                with open(css_path, "r", encoding="utf-8") as f:
-                    css_content = f.read()
-            else:
-                print(f"Warning: CSS file not found: {css_path}", file=sys.stderr)
+        css_content = _read_css(args.css)
 
         # Convert Markdown to HTML
         print("Converting Markdown to HTML...")
@@ -496,8 +736,6 @@ def main():
 
         # Cleanup temp dir
         if not args.keep_temp:
-            import shutil
-
             shutil.rmtree(temp_dir)
             print("Cleaned up temporary files")
         else:
@@ -4,7 +4,8 @@ MermaidRenderer — unified Mermaid diagram rendering with AUTO fallback.
 
 Provides a single MermaidRenderer class that supports mmdc (mermaid-cli)
 and Playwright backends with SHA256-based caching, error categorization,
-and strict/permissive control via MermaidRenderError.
+and strict/permissive control via MermaidRenderError. An optional
+MermaidDiskCache persists rendered diagrams across runs.
 
 Usage:
     from mermaid_renderer import MermaidRenderer, MermaidBackend, MermaidRenderError
@@ -13,14 +14,20 @@ Usage:
     result = renderer.render("graph TD; A-->B", output_path="/tmp/out.png")
     if not result.success:
         print(result.fix_suggestion)
+
+    # Reuse renders across runs
+    renderer = MermaidRenderer(disk_cache=MermaidDiskCache())
 """
 
+import functools
 import hashlib
 import os
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -73,6 +80,119 @@ class MermaidRenderError(Exception):
         super().__init__(f"Mermaid render failed [{cat}]: {result.error_message}")
 
 
+# Bump to invalidate every persistent cache entry (e.g. when render options change meaning)
+CACHE_FORMAT_VERSION = 1
+DEFAULT_CACHE_MAX_MB = 256
+# Mermaid version loaded by the Playwright backend (see _try_playwright)
+PLAYWRIGHT_MERMAID_VERSION = "mermaid@10"
+
+
+def default_cache_dir() -> Path:
+    """Persistent cache location: $MERMAID_CACHE_DIR, else the user cache directory."""
+    if os.environ.get("MERMAID_CACHE_DIR"):
+        return Path(os.environ["MERMAID_CACHE_DIR"])
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "markdown-to-pdf" / "mermaid"
+
+
+@functools.lru_cache(maxsize=None)
+def _mmdc_version() -> Optional[str]:
+    """Installed mermaid-cli version, or None if mmdc is unavailable."""
+    try:
+        result = subprocess.run(["mmdc", "--version"], capture_output=True, text=True, timeout=30)
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+class MermaidDiskCache:
+    """Content-addressed on-disk cache of rendered diagrams with LRU eviction.
+
+    Entries are stored as ``<key>.<format>``. A hit refreshes the entry's
+    mtime, and once the directory grows past ``max_bytes`` the least recently
+    used entries are deleted. Writes go through a temp file and an atomic
+    rename, so concurrent renders and processes never see partial images.
+    """
+
+    def __init__(self, root: Optional[str] = None, max_bytes: int = DEFAULT_CACHE_MAX_MB * 1024 * 1024):
+        self.root = Path(root) if root else default_cache_dir()
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._size: Optional[int] = None  # approximate total, refreshed on eviction
+        self._lock = threading.Lock()
+
+    def get(self, key: str, ext: str) -> Optional[Path]:
+        """Return the cached file for key, or None on a miss."""
+        path = self.root / f"{key}.{ext}"
+        try:
+            if path.stat().st_size > 0:
+                os.utime(path)
+                with self._lock:
+                    self.hits += 1
+                return path
+        except OSError:
+            pass
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, ext: str, source: str) -> Optional[Path]:
+        """Copy a rendered file into the cache; returns the cached path."""
+        path = self.root / f"{key}.{ext}"
+        tmp = self.root / f".{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            shutil.copyfile(source, tmp)
+            os.replace(tmp, path)
+            size = path.stat().st_size
+        except OSError:
+            if tmp.exists():
+                tmp.unlink()
+            return None
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan()[1]
+            else:
+                self._size += size
+            if self._size > self.max_bytes:
+                self._size = self.evict()
+        return path
+
+    def _scan(self) -> tuple:
+        """List ``(mtime, size, path)`` for every entry and their total size."""
+        entries = []
+        for entry in os.scandir(self.root):
+            if entry.name.startswith(".") or not entry.is_file():
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, entry.path))
+        return entries, sum(size for _, size, _ in entries)
+
+    def evict(self) -> int:
+        """Delete least recently used entries until the cache fits; returns the new total size."""
+        entries, total = self._scan()
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+        return total
+
+    def report(self) -> str:
+        """One-line hit/miss summary for CLI output."""
+        return f"Mermaid cache: {self.hits} hit(s), {self.misses} miss(es) ({self.root})"
+
+
 class MermaidRenderer:
     """Unified Mermaid renderer with mmdc/Playwright backends and caching."""
 
@@ -87,6 +207,8 @@ class MermaidRenderer:
         timeout: int = 60,
         cache_dir: Optional[str] = None,
         debug: bool = False,
+        disk_cache: Optional[MermaidDiskCache] = None,
+        max_concurrent: Optional[int] = None,
     ):
         self.backend = backend
         self.output_format = output_format
@@ -98,10 +220,18 @@ class MermaidRenderer:
         self.debug = debug
         self.cache_dir = cache_dir or tempfile.mkdtemp(prefix="mermaid_cache_")
         self._cache: dict = {}  # key -> cached file path
+        self.disk_cache = disk_cache  # persistent cache shared across runs (optional)
+        # Backend processes (mmdc/Chromium) running at once, across every thread using this instance
+        self._render_slots = threading.BoundedSemaphore(max_concurrent) if max_concurrent else None
+        self._key_locks: dict = {}  # cache key -> lock, so each diagram is rendered and written once
+        self._key_locks_guard = threading.Lock()
 
     def render(self, mermaid_code: str, output_path: Optional[str] = None) -> MermaidResult:
         """Render Mermaid code to an image file.
 
+        Safe to call from several threads: concurrent calls for the same diagram
+        wait for a single render instead of writing the cached file together.
+
         Args:
             mermaid_code: Mermaid diagram source code.
             output_path: Destination file path. If None, a cached temp path is used.
@@ -110,9 +240,17 @@ class MermaidRenderer:
             MermaidResult with success status and image path or error details.
         """
         code = mermaid_code.strip()
+        cache_key = self._compute_cache_key(code)
+        with self._key_lock(cache_key):
+            return self._render_locked(code, cache_key, output_path)
 
+    def _key_lock(self, cache_key: str) -> threading.Lock:
+        with self._key_locks_guard:
+            return self._key_locks.setdefault(cache_key, threading.Lock())
+
+    def _render_locked(self, code: str, cache_key: str, output_path: Optional[str]) -> MermaidResult:
+        """Body of ``render``; callers hold the per-key lock, so no other thread writes this diagram."""
         # Check cache
-        cache_key = self._compute_cache_key(code)
         cached = self._get_cached_path(cache_key)
         if cached and Path(cached).exists() and Path(cached).stat().st_size > 0:
             if output_path:
@@ -120,46 +258,100 @@ class MermaidRenderer:
                 return MermaidResult(success=True, image_path=output_path, backend_used="cache")
             return MermaidResult(success=True, image_path=cached, backend_used="cache")
 
+        # Check persistent cache
+        disk_key = None
+        if self.disk_cache is not None:
+            disk_key = self._persistent_cache_key(code)
+            hit = self.disk_cache.get(disk_key, self.output_format)
+            if hit:
+                self._store_cache(cache_key, str(hit))
+                if output_path:
+                    shutil.copy2(hit, output_path)
+                    return MermaidResult(success=True, image_path=output_path, backend_used="cache")
+                return MermaidResult(success=True, image_path=str(hit), backend_used="cache")
+
         # Determine effective output path
         effective_path = output_path or os.path.join(self.cache_dir, f"{cache_key}.{self.output_format}")
 
-        # Route to backend
+        if self._render_slots is None:
+            result = self._render_backend(code, effective_path)
+        else:
+            with self._render_slots:
+                result = self._render_backend(code, effective_path)
+
+        if result.success:
+            self._store_cache(cache_key, effective_path)
+            if disk_key is not None:
+                self.disk_cache.put(disk_key, self.output_format, effective_path)
+        return result
+
+    def _render_backend(self, code: str, effective_path: str) -> MermaidResult:
+        """Route to the configured backend(s), falling back from mmdc to Playwright in AUTO mode."""
         if self.backend == MermaidBackend.AUTO:
             result = self._try_mmdc(code, effective_path)
-            if result.success:
-                self._store_cache(cache_key, effective_path)
-                return result
             # SYNTAX_ERROR is a code problem — different backend won't help
-            if result.error_category == MermaidErrorCategory.SYNTAX_ERROR:
-                return result
-            # All other failures: try Playwright
-            if self.debug:
-                print(
-                    f"  mmdc failed ({result.error_category.value}), trying Playwright...",
-                    file=sys.stderr,
-                )
-            result = self._try_playwright(code, effective_path)
-            if result.success:
-                self._store_cache(cache_key, effective_path)
-            return result
+            if not result.success and result.error_category != MermaidErrorCategory.SYNTAX_ERROR:
+                # All other failures: try Playwright
+                if self.debug:
+                    print(
+                        f"  mmdc failed ({result.error_category.value}), trying Playwright...",
+                        file=sys.stderr,
+                    )
+                result = self._try_playwright(code, effective_path)
 
         elif self.backend == MermaidBackend.MMDC:
             result = self._try_mmdc(code, effective_path)
-            if result.success:
-                self._store_cache(cache_key, effective_path)
-            return result
 
         else:  # PLAYWRIGHT
             result = self._try_playwright(code, effective_path)
-            if result.success:
-                self._store_cache(cache_key, effective_path)
-            return result
+        return result
+
+    def render_many(self, codes: list, max_workers: Optional[int] = None) -> dict:
+        """Render several diagrams concurrently; returns ``{code: MermaidResult}``.
+
+        Sources that are identical after stripping are rendered once. Images
+        land in the cache directory, as with ``render(code)``; cache hits
+        return immediately, so only misses occupy a worker (default: CPU count).
+        ``max_concurrent`` still bounds backend processes when several threads
+        call this on a shared renderer.
+        """
+        unique = list(dict.fromkeys(code.strip() for code in codes))
+        workers = min(max_workers or os.cpu_count() or 1, len(unique))
+        if workers <= 1:
+            rendered = {code: self.render(code) for code in unique}
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                rendered = dict(zip(unique, executor.map(self.render, unique)))
+        return {code: rendered[code.strip()] for code in codes}
 
     def _compute_cache_key(self, code: str) -> str:
         """SHA256 of code + format + theme + background."""
         content = f"{code}|{self.output_format}|{self.theme}|{self.background}"
         return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
 
+    def _persistent_cache_key(self, code: str) -> str:
+        """SHA256 of everything that affects the rendered bytes, including renderer version."""
+        content = "|".join(
+            [
+                str(CACHE_FORMAT_VERSION),
+                code,
+                self.output_format,
+                self.theme,
+                self.background,
+                f"{self.width}x{self.height}",
+                self._renderer_version(),
+            ]
+        )
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def _renderer_version(self) -> str:
+        """Identify the backend (and its version) that renders diagrams for this instance."""
+        if self.backend != MermaidBackend.PLAYWRIGHT:
+            version = _mmdc_version()
+            if version or self.backend == MermaidBackend.MMDC:
+                return f"mmdc:{version}"
+        return f"playwright:{PLAYWRIGHT_MERMAID_VERSION}"
+
     def _get_cached_path(self, key: str) -> Optional[str]:
         return self._cache.get(key)
 
@@ -340,7 +532,7 @@ class MermaidRenderer:
             return False
 
     def cleanup_cache(self) -> None:
-        """Remove the cache directory and all cached files."""
+        """Remove the cache directory and all cached files (the persistent disk cache is kept)."""
         if self.cache_dir and Path(self.cache_dir).exists():
             shutil.rmtree(self.cache_dir, ignore_errors=True)
         self._cache.clear()
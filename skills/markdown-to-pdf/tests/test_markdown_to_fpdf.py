@@ -13,9 +13,14 @@ Tests cover:
 - Font discovery fail-fast
 - CLI font override
 - Mermaid fallback
+- Image embedding (metadata cache, dedupe, downsampling)
+- Batch and watch mode
 """
 
+import math
+import os
 import sys
+from concurrent.futures import Future
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -171,6 +176,43 @@ class TestTableRendering:
         assert tmp_pdf.stat().st_size > 0
 
 
+class TestLargeTableLayout:
+    """Sampled width estimation and the streamed renderer for large tables."""
+
+    def test_wrap_cell_text_breaks_at_spaces_and_splits_long_words(self):
+        mod = _import_fpdf_module()
+        assert mod._wrap_cell_text("aaa bbb ccc", 7, lambda ch: 1.0) == ["aaa bbb", "ccc"]
+        assert mod._wrap_cell_text("abcdefghij", 4, lambda ch: 1.0) == ["abcd", "efgh", "ij"]
+        assert mod._wrap_cell_text("one\ntwo", 10, lambda ch: 1.0) == ["one", "two"]
+        assert mod._wrap_cell_text("", 10, lambda ch: 1.0) == [""]
+
+    def test_sampled_rows_keep_longest_cell_per_column(self):
+        mod = _import_fpdf_module()
+        rows = [[f"r{i}", "x"] for i in range(1000)]
+        rows[777][1] = "a much longer outlier cell"
+        with patch.object(mod, "TABLE_SAMPLE_ROWS", 10):
+            sample = mod._sample_rows(rows, 2)
+        assert len(sample) <= 12
+        assert rows[777] in sample
+        assert mod._sample_rows(rows[:5], 2) == rows[:5]
+
+    def test_large_table_streams_across_pages(self, tmp_pdf):
+        mod = _import_fpdf_module()
+        header = "| ID | Name | Note |\n|---|---|---|\n"
+        body = "".join(f"| {i} | item {i} | {'wrapped text ' * (i % 6)} |\n" for i in range(300))
+        with (
+            patch.object(mod, "TABLE_STREAM_CELLS", 100),
+            patch.object(mod.ProfessionalPDF, "_render_streamed_table", autospec=True) as mock_stream,
+        ):
+            mod.render_pdf("# Big\n\n" + header + body, str(tmp_pdf), frontmatter={}, no_cover=True)
+        assert mock_stream.call_count == 1
+
+        with patch.object(mod, "TABLE_STREAM_CELLS", 100):
+            mod.render_pdf("# Big\n\n" + header + body, str(tmp_pdf), frontmatter={}, no_cover=True)
+        content = tmp_pdf.read_bytes()
+        assert content.count(b"/Type /Page\n") > 2
+
+
 # ===== Pagebreak and Thematic Break Tests =====
 
 
@@ -529,6 +571,24 @@ class TestMermaidStrictMode:
         sig = inspect.signature(mod.render_pdf)
         assert sig.parameters["strict_mermaid"].default is True
 
+    def test_diagrams_prerendered_once_before_layout(self, tmp_pdf):
+        """All Mermaid blocks are rendered in one pre-pass; duplicates render once."""
+        mod = _import_fpdf_module()
+        from mermaid_renderer import MermaidErrorCategory, MermaidRenderer, MermaidResult
+
+        md = "```mermaid\ngraph TD; A-->B\n```\n\ntext\n\n```mermaid\ngraph TD; A-->B\n```\n"
+        fail_result = MermaidResult(
+            success=False,
+            error_category=MermaidErrorCategory.MMDC_NOT_FOUND,
+            error_message="mmdc not found",
+        )
+
+        with patch.object(MermaidRenderer, "render", return_value=fail_result) as mock_render:
+            mod.render_pdf(md, str(tmp_pdf), strict_mermaid=False, mermaid_jobs=4)
+
+        assert mock_render.call_count == 1
+        assert tmp_pdf.exists()
+
 
 # ===== PDF Content Verification Tests =====
 
@@ -880,3 +940,219 @@ class TestFontTrueTypePreferred:
                 captured = capsys.readouterr()
                 assert "Could not verify" in captured.err
                 assert "Warning" in captured.err
+
+
+# ===== Image Embedding Tests =====
+
+
+class TestEmbedImage:
+    """Image metadata caching, content dedupe and DPI downsampling."""
+
+    @pytest.fixture
+    def png_factory(self, tmp_path):
+        Image = pytest.importorskip("PIL.Image")
+
+        def make(name, size=(400, 200), color=(30, 60, 90)):
+            path = tmp_path / name
+            Image.new("RGB", size, color).save(path)
+            return path
+
+        return make
+
+    def _pdf(self, mod, **kwargs):
+        fr, fb = mod._resolve_fonts(None, None)
+        pdf = mod.ProfessionalPDF(theme=mod.get_theme("navy"), font_regular=fr, font_bold=fb, **kwargs)
+        pdf.add_page()
+        return pdf
+
+    def test_image_meta_cached_until_file_changes(self, png_factory):
+        mod = _import_fpdf_module()
+        path = png_factory("shot.png")
+        from PIL import Image
+
+        with patch.object(Image, "open", wraps=Image.open) as mock_open:
+            first = mod._image_meta(str(path))
+            assert mod._image_meta(str(path)) == first
+            assert mock_open.call_count == 1
+
+            png_factory("shot.png", size=(100, 50))
+            os.utime(path, ns=(1, 10**18))
+            assert mod._image_meta(str(path))[:2] == (100, 50)
+            assert mock_open.call_count == 2
+
+    def test_identical_images_share_one_xobject(self, png_factory, tmp_path):
+        mod = _import_fpdf_module()
+        original = png_factory("a.png")
+        copy = tmp_path / "copy.png"
+        copy.write_bytes(original.read_bytes())
+        other = png_factory("b.png", color=(200, 10, 10))
+
+        pdf = self._pdf(mod)
+        for path in (original, copy, original, other):
+            pdf.embed_image(str(path))
+        assert len(pdf.image_cache.images) == 2
+
+    def test_image_dpi_downsamples_large_images(self, png_factory, tmp_pdf):
+        mod = _import_fpdf_module()
+        big = png_factory("big.png", size=(4000, 1000))
+
+        pdf = self._pdf(mod, image_dpi=72)
+        pdf.embed_image(str(big))
+        pdf.embed_image(str(big))
+        (info,) = pdf.image_cache.images.values()
+        assert info["w"] == math.ceil(mod.CONTENT_WIDTH_MM / 25.4 * 72)
+        assert info["usages"] == 2
+
+        pdf = self._pdf(mod)
+        pdf.embed_image(str(big))
+        (info,) = pdf.image_cache.images.values()
+        assert info["w"] == 4000
+
+
+# ===== Batch and Watch Mode Tests =====
+
+
+class TestBatchAndWatch:
+    """Directory batch conversion and change detection for watch mode."""
+
+    FONTS = ("/fonts/reg.ttf", "/fonts/bold.ttf")
+
+    def test_batch_preloads_fonts_once_and_reports_failures(self, tmp_path):
+        mod = _import_fpdf_module()
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        for name in ("b", "a", "bad"):
+            (docs / f"{name}.md").write_text(f"# {name}\n", encoding="utf-8")
+
+        def fake_render(markdown_text, output_path, **kwargs):
+            if "bad" in markdown_text:
+                raise ValueError("broken table")
+            Path(output_path).write_bytes(b"%PDF-1.4 stub")
+
+        options = {"font_regular": None, "font_bold": None, "mermaid_cache": None}
+        with (
+            patch.object(mod, "discover_fonts", return_value=self.FONTS) as mock_discover,
+            patch.object(mod, "render_pdf", side_effect=fake_render),
+        ):
+            mod._font_cache.clear()
+            code = mod.run_batch(docs, tmp_path / "out", options, jobs=1)
+            mod._font_cache.clear()
+
+        assert code == 1
+        assert mock_discover.call_count == 1
+        assert sorted(p.name for p in (tmp_path / "out").iterdir()) == ["a.pdf", "b.pdf"]
+
+    def test_batch_splits_mermaid_budget_across_workers(self, tmp_path):
+        mod = _import_fpdf_module()
+        seen = {}
+
+        class InlinePool:
+            def __init__(self, max_workers, initializer, initargs):
+                seen["workers"] = max_workers
+                seen["mermaid_jobs"] = initargs[0]["mermaid_jobs"]
+                initializer(*initargs)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def submit(self, fn, *args):
+                future = Future()
+                future.set_result(fn(*args))
+                return future
+
+        targets = [(tmp_path / f"{i}.md", tmp_path / f"{i}.pdf") for i in range(4)]
+        for src, _ in targets:
+            src.write_text("# doc\n", encoding="utf-8")
+        options = {"font_regular": None, "font_bold": None, "mermaid_cache": None, "mermaid_jobs": 8}
+        with (
+            patch.object(mod, "discover_fonts", return_value=self.FONTS),
+            patch.object(mod, "render_pdf"),
+            patch.object(mod, "ProcessPoolExecutor", InlinePool),
+        ):
+            mod._font_cache.clear()
+            results = mod.convert_batch(targets, options, jobs=4)
+            mod._font_cache.clear()
+
+        assert all(r["ok"] for r in results)
+        assert seen == {"workers": 4, "mermaid_jobs": 2}
+        assert options["mermaid_jobs"] == 8
+
+    def test_verify_runs_per_document(self, tmp_path, capsys):
+        mod = _import_fpdf_module()
+        doc = tmp_path / "doc.md"
+        doc.write_text("# doc\n", encoding="utf-8")
+        options = {"font_regular": None, "font_bold": None, "mermaid_cache": None, "verify": True}
+        with (
+            patch.object(mod, "discover_fonts", return_value=self.FONTS),
+            patch.object(mod, "render_pdf"),
+            patch.object(mod, "verify_layout", return_value=["Page 2: right edge overflow"]) as mock_verify,
+        ):
+            mod._font_cache.clear()
+            (result,) = mod.convert_batch([(doc, tmp_path / "doc.pdf")], options)
+            mod._font_cache.clear()
+
+        mock_verify.assert_called_once_with(str(tmp_path / "doc.pdf"), save_images=False)
+        assert result["layout_warnings"] == ["Page 2: right edge overflow"]
+        assert "right edge overflow" in capsys.readouterr().err
+
+    def test_poll_detects_markdown_and_image_changes(self, tmp_path):
+        mod = _import_fpdf_module()
+        image = tmp_path / "chart.png"
+        image.write_bytes(b"png")
+        doc = tmp_path / "report.md"
+        doc.write_text(f"# Report\n\n![chart]({image})\n", encoding="utf-8")
+        other = tmp_path / "other.md"
+        other.write_text("# Other\n", encoding="utf-8")
+
+        state = {}
+        assert mod._poll_changes([doc, other], state) == [doc, other]
+        assert state[doc]["images"] == [str(image)]
+        assert mod._poll_changes([doc, other], state) == []
+
+        os.utime(image, ns=(1, 10**18))
+        assert mod._poll_changes([doc, other], state) == [doc]
+
+        os.utime(other, ns=(1, 10**18))
+        assert mod._poll_changes([doc, other], state) == [other]
+
+        other.unlink()
+        assert mod._poll_changes([doc, other], state) == []
+        assert other not in state
+
+    def test_poll_retries_unreadable_document(self, tmp_path):
+        mod = _import_fpdf_module()
+        doc = tmp_path / "report.md"
+        doc.write_bytes(b"# Report \xe3\x81")  # truncated mid-save
+
+        state = {}
+        assert mod._poll_changes([doc], state) == []
+        assert doc not in state
+
+        doc.write_text("# Report\n", encoding="utf-8")
+        assert mod._poll_changes([doc], state) == [doc]
+
+    def test_watch_renders_every_document_on_first_poll(self, tmp_path):
+        mod = _import_fpdf_module()
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        for name in ("one", "two"):
+            (docs / f"{name}.md").write_text(f"# {name}\n", encoding="utf-8")
+
+        rendered = []
+
+        def fake_convert(input_path, output_path):
+            rendered.append((Path(input_path).name, Path(output_path).name))
+            return {"input": input_path, "output": output_path, "ok": True, "seconds": 0.0, "error": None}
+
+        with (
+            patch.object(mod, "discover_fonts", return_value=self.FONTS),
+            patch.object(mod, "_convert_file", side_effect=fake_convert),
+        ):
+            mod._font_cache.clear()
+            assert mod.watch(docs, tmp_path / "out", {"mermaid_cache": None}, max_polls=2) == 0
+            mod._font_cache.clear()
+
+        assert rendered == [("one.md", "one.pdf"), ("two.md", "two.pdf")]
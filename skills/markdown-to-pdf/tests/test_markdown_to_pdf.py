@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Unit tests for markdown_to_pdf.py — Playwright-mode batch conversion.
+
+Tests cover:
+- Unique temp HTML files per print job (no base_dir collisions)
+- Batch conversion through a shared browser pool (mocked, no Playwright)
+"""
+
+import asyncio
+import sys
+from argparse import Namespace
+from pathlib import Path
+from unittest.mock import patch
+
+# Add scripts directory to path
+SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+
+class FakePage:
+    """Records the file each print job loaded and writes a stub PDF."""
+
+    def __init__(self):
+        self.loaded = []
+
+    async def goto(self, url):
+        path = Path(url.replace("file://", ""))
+        self.loaded.append((path, path.read_text(encoding="utf-8")))
+        await asyncio.sleep(0.01)
+
+    async def set_content(self, html, wait_until=None):
+        self.loaded.append((None, html))
+
+    async def pdf(self, path, **kwargs):
+        Path(path).write_bytes(b"%PDF-1.4 stub")
+
+
+class FakePool:
+    """Stand-in for BrowserPool that prints through FakePage objects."""
+
+    instances = []
+
+    def __init__(self, size=4):
+        self.size = size
+        self.page = FakePage()
+        FakePool.instances.append(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return None
+
+    async def print_pdf(self, html_content, output_path, base_dir=None, paper_size="letter"):
+        import markdown_to_pdf
+
+        await markdown_to_pdf._print_page_to_pdf(self.page, html_content, output_path, base_dir, paper_size)
+        return True
+
+
+class TestPrintPage:
+    def test_concurrent_jobs_sharing_base_dir_use_unique_temp_files(self, tmp_path):
+        import markdown_to_pdf
+
+        page = FakePage()
+
+        async def run():
+            await asyncio.gather(
+                markdown_to_pdf._print_page_to_pdf(page, "<p>one</p>", tmp_path / "one.pdf", tmp_path),
+                markdown_to_pdf._print_page_to_pdf(page, "<p>two</p>", tmp_path / "two.pdf", tmp_path),
+            )
+
+        asyncio.run(run())
+
+        paths = {path for path, _ in page.loaded}
+        assert len(paths) == 2
+        assert sorted(html for _, html in page.loaded) == ["<p>one</p>", "<p>two</p>"]
+        assert not any(p.exists() for p in paths)  # temp HTML removed after printing
+        assert (tmp_path / "one.pdf").exists() and (tmp_path / "two.pdf").exists()
+
+
+class BrokenPage(FakePage):
+    async def pdf(self, path, **kwargs):
+        raise RuntimeError("Target page crashed")
+
+    async def close(self):
+        pass
+
+
+class CrashedBrowser:
+    async def new_page(self):
+        raise RuntimeError("Browser has been closed")
+
+
+class TestBrowserPool:
+    def test_page_that_cannot_be_replaced_is_not_reused(self, tmp_path):
+        """A failed page is dropped when new_page() fails, and an empty pool fails fast."""
+        import markdown_to_pdf
+
+        async def run():
+            pool = markdown_to_pdf.BrowserPool(size=1)
+            pool._browser = CrashedBrowser()
+            pool._pages = asyncio.Queue()
+            pool._pages.put_nowait(BrokenPage())
+            pool._live = 1
+            first = await pool.print_pdf("<p>one</p>", tmp_path / "one.pdf")
+            second = await asyncio.gather(
+                pool.print_pdf("<p>two</p>", tmp_path / "two.pdf"),
+                pool.print_pdf("<p>three</p>", tmp_path / "three.pdf"),
+                return_exceptions=True,
+            )
+            return first, second
+
+        first, second = asyncio.run(asyncio.wait_for(run(), timeout=5))
+
+        assert first is False
+        assert [type(r) for r in second] == [RuntimeError, RuntimeError]
+        assert all("no usable pages" in str(r) for r in second)
+
+
+class TestBatchConversion:
+    def _args(self, **overrides):
+        values = dict(
+            theme="default",
+            background="white",
+            image_format="png",
+            no_strict_mermaid=False,
+            debug_mermaid=False,
+            mermaid_jobs=None,
+            paper_size="letter",
+            keep_temp=False,
+            css=None,
+            no_mermaid_cache=True,
+            jobs=3,
+        )
+        values.update(overrides)
+        return Namespace(**values)
+
+    def test_batch_uses_one_pool_and_reports_per_file(self, tmp_path):
+        import markdown_to_pdf
+
+        input_dir = tmp_path / "docs"
+        input_dir.mkdir()
+        for name in ("b", "a", "c"):
+            (input_dir / f"{name}.md").write_text(f"# {name}", encoding="utf-8")
+
+        def fake_html(input_path, temp_dir, args, css_content=None, disk_cache=None):
+            if input_path.stem == "c":
+                raise RuntimeError("bad mermaid")
+            return f"<h1>{input_path.stem}</h1>"
+
+        FakePool.instances.clear()
+        with (
+            patch.object(markdown_to_pdf, "BrowserPool", FakePool),
+            patch.object(markdown_to_pdf, "_markdown_file_to_html", side_effect=fake_html),
+        ):
+            code = markdown_to_pdf.run_batch(self._args(), input_dir, tmp_path / "out")
+
+        assert code == 1  # c.md failed
+        assert len(FakePool.instances) == 1
+        assert FakePool.instances[0].size == 3
+        assert sorted(p.name for p in (tmp_path / "out").iterdir()) == ["a.pdf", "b.pdf"]
@@ -444,6 +444,213 @@ class TestCache:
         assert not Path(cache_dir).exists()
 
 
+# ===== Persistent Disk Cache Tests =====
+
+
+def _fake_render(code, output_path):
+    """Stand-in for a backend: writes a small file and reports success."""
+    from mermaid_renderer import MermaidResult
+
+    Path(output_path).write_bytes(b"PNG:" + code.encode())
+    return MermaidResult(success=True, image_path=output_path, backend_used="mmdc")
+
+
+class TestDiskCache:
+    def test_second_run_skips_backend(self, tmp_path):
+        """A fresh renderer (new CLI run) reuses the persistent entry."""
+        from mermaid_renderer import MermaidBackend, MermaidDiskCache, MermaidRenderer
+
+        cache = MermaidDiskCache(str(tmp_path / "cache"))
+        first = MermaidRenderer(backend=MermaidBackend.MMDC, disk_cache=cache)
+        with (
+            patch("mermaid_renderer._mmdc_version", return_value="11.0.0"),
+            patch.object(first, "_try_mmdc", side_effect=_fake_render),
+        ):
+            assert first.render("graph TD; A-->B").success
+        first.cleanup_cache()
+
+        second = MermaidRenderer(backend=MermaidBackend.MMDC, disk_cache=MermaidDiskCache(str(tmp_path / "cache")))
+        out = tmp_path / "out.png"
+        with (
+            patch("mermaid_renderer._mmdc_version", return_value="11.0.0"),
+            patch.object(second, "_try_mmdc") as mock_mmdc,
+        ):
+            result = second.render("graph TD; A-->B", output_path=str(out))
+        mock_mmdc.assert_not_called()
+        assert result.backend_used == "cache"
+        assert out.read_bytes() == b"PNG:graph TD; A-->B"
+        second.cleanup_cache()
+
+    def test_key_includes_renderer_version_and_size(self):
+        from mermaid_renderer import MermaidBackend, MermaidRenderer
+
+        r = MermaidRenderer(backend=MermaidBackend.MMDC)
+        with patch("mermaid_renderer._mmdc_version", return_value="10.9.0"):
+            key_old = r._persistent_cache_key("graph TD; A-->B")
+        with patch("mermaid_renderer._mmdc_version", return_value="11.0.0"):
+            key_new = r._persistent_cache_key("graph TD; A-->B")
+            r.width = 1200
+            key_narrow = r._persistent_cache_key("graph TD; A-->B")
+        assert len({key_old, key_new, key_narrow}) == 3
+        r.cleanup_cache()
+
+    def test_lru_eviction_keeps_recent_entries(self, tmp_path):
+        import os
+
+        from mermaid_renderer import MermaidDiskCache
+
+        cache = MermaidDiskCache(str(tmp_path / "cache"), max_bytes=250)
+        src = tmp_path / "src.png"
+        src.write_bytes(b"x" * 100)
+        for i, key in enumerate(["a", "b"]):
+            cache.put(key, "png", str(src))
+            os.utime(cache.root / f"{key}.png", (1000 + i, 1000 + i))
+        assert cache.get("a", "png") is not None  # touch "a": now "b" is least recently used
+
+        cache.put("c", "png", str(src))
+
+        assert sorted(p.name for p in cache.root.iterdir()) == ["a.png", "c.png"]
+        assert cache.get("b", "png") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_failed_render_not_persisted(self, tmp_path):
+        from mermaid_renderer import (
+            MermaidBackend,
+            MermaidDiskCache,
+            MermaidErrorCategory,
+            MermaidRenderer,
+            MermaidResult,
+        )
+
+        cache = MermaidDiskCache(str(tmp_path / "cache"))
+        renderer = MermaidRenderer(backend=MermaidBackend.MMDC, disk_cache=cache)
+        failure = MermaidResult(success=False, error_category=MermaidErrorCategory.SYNTAX_ERROR, error_message="x")
+        with (
+            patch("mermaid_renderer._mmdc_version", return_value="11.0.0"),
+            patch.object(renderer, "_try_mmdc", return_value=failure),
+        ):
+            assert not renderer.render("bad").success
+        assert list((tmp_path / "cache").iterdir()) == []
+        renderer.cleanup_cache()
+
+
+class TestRenderMany:
+    def test_renders_concurrently_and_deduplicates(self):
+        """Misses run in parallel; identical sources are rendered once."""
+        import threading
+        import time
+
+        from mermaid_renderer import MermaidBackend, MermaidRenderer, MermaidResult
+
+        renderer = MermaidRenderer(backend=MermaidBackend.MMDC)
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def slow_render(code, output_path):
+            with lock:
+                active.append(code)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.remove(code)
+            return MermaidResult(success=True, image_path=output_path, backend_used="mmdc")
+
+        codes = ["graph TD; A-->B", "graph TD; C-->D", "graph TD; E-->F", "  graph TD; A-->B\n"]
+        with patch.object(renderer, "_try_mmdc", side_effect=slow_render) as mock_mmdc:
+            results = renderer.render_many(codes, max_workers=3)
+
+        assert mock_mmdc.call_count == 3
+        assert max(peak) > 1
+        assert set(results) == set(codes)
+        assert results[codes[0]] is results[codes[3]]
+        renderer.cleanup_cache()
+
+    def test_single_worker_renders_in_order(self):
+        from mermaid_renderer import MermaidBackend, MermaidRenderer, MermaidResult
+
+        renderer = MermaidRenderer(backend=MermaidBackend.MMDC)
+        seen = []
+
+        def record(code, output_path):
+            seen.append(code)
+            return MermaidResult(success=True, image_path=output_path, backend_used="mmdc")
+
+        with patch.object(renderer, "_try_mmdc", side_effect=record):
+            renderer.render_many(["graph TD; X-->Y", "graph TD; Y-->Z"], max_workers=1)
+
+        assert seen == ["graph TD; X-->Y", "graph TD; Y-->Z"]
+        renderer.cleanup_cache()
+
+    def test_max_concurrent_caps_renders_across_threads(self):
+        """Several documents sharing one renderer never exceed its backend budget."""
+        import threading
+        import time
+
+        from mermaid_renderer import MermaidBackend, MermaidRenderer, MermaidResult
+
+        renderer = MermaidRenderer(backend=MermaidBackend.MMDC, max_concurrent=2)
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def slow_render(code, output_path):
+            with lock:
+                active.append(code)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.remove(code)
+            return MermaidResult(success=True, image_path=output_path, backend_used="mmdc")
+
+        documents = [[f"graph TD; D{doc}N{i}-->X" for i in range(4)] for doc in range(3)]
+        with patch.object(renderer, "_try_mmdc", side_effect=slow_render) as mock_mmdc:
+            threads = [threading.Thread(target=renderer.render_many, args=(codes, 4)) for codes in documents]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert mock_mmdc.call_count == 12
+        assert max(peak) == 2
+        renderer.cleanup_cache()
+
+    def test_same_diagram_from_concurrent_callers_renders_once(self):
+        """A second caller waits for the in-flight render and never sees a partial file."""
+        import threading
+        import time
+
+        from mermaid_renderer import MermaidBackend, MermaidRenderer, MermaidResult
+
+        renderer = MermaidRenderer(backend=MermaidBackend.MMDC)
+
+        def write_slowly(code, output_path):
+            with open(output_path, "wb") as f:
+                f.write(b"PNG-")
+                f.flush()
+                time.sleep(0.05)
+                f.write(b"complete")
+            return MermaidResult(success=True, image_path=output_path, backend_used="mmdc")
+
+        contents = []
+
+        def render_and_read():
+            result = renderer.render("graph TD; A-->B")
+            with open(result.image_path, "rb") as f:
+                contents.append(f.read())
+
+        with patch.object(renderer, "_try_mmdc", side_effect=write_slowly) as mock_mmdc:
+            threads = [threading.Thread(target=render_and_read) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert mock_mmdc.call_count == 1
+        assert contents == [b"PNG-complete"] * 4
+        renderer.cleanup_cache()
+
+
 # ===== Integration Tests =====
 
 
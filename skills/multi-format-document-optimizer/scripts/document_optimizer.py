@@ -8,12 +8,15 @@ and batch processing with configurable quality presets.
 """
 
 import argparse
+import hashlib
 import json
 import os
 import shutil
 import subprocess
 import sys
 import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import asdict, dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -120,6 +123,7 @@ class ConversionResult:
     processing_time_seconds: float
     status: str
     error_message: str = ""
+    image_report: dict = field(default_factory=dict)
     schema_version: str = "1.0"
 
     def to_json(self) -> str:
@@ -150,9 +154,31 @@ class DocumentOptimizer:
         ".gif": "image",
     }
 
-    def __init__(self, verbose: bool = False):
-        """Initialize the optimizer."""
+    # Environment variables pointing external tools at their scratch space
+    TEMP_ENV_VARS = ("TMPDIR", "TEMP", "TMP", "MAGICK_TEMPORARY_PATH")
+
+    def __init__(
+        self,
+        verbose: bool = False,
+        temp_root: Optional[Path] = None,
+        image_workers: Optional[int] = None,
+    ):
+        """Initialize the optimizer.
+
+        ``temp_root`` confines this optimizer's temp files, and those of the
+        tools it runs (docling, ImageMagick, markdown-to-pdf), to one directory
+        so that concurrent batch workers never share scratch space.
+        ``image_workers`` bounds concurrent image recompressions inside one PDF
+        (default: CPU count).
+        """
         self.verbose = verbose
+        self.temp_root = temp_root
+        self.image_workers = image_workers or os.cpu_count() or 1
+        self.env: Optional[dict] = None
+        if temp_root is not None:
+            temp_root.mkdir(parents=True, exist_ok=True)
+            self.env = dict(os.environ)
+            self.env.update({name: str(temp_root) for name in self.TEMP_ENV_VARS})
         self._check_dependencies()
 
     def _check_dependencies(self) -> None:
@@ -278,6 +304,7 @@ class DocumentOptimizer:
                     capture_output=True,
                     text=True,
                     timeout=30,
+                    env=self.env,
                 )
                 if result.returncode == 0:
                     parts = result.stdout.strip().split()
@@ -308,27 +335,14 @@ class DocumentOptimizer:
             shutil.copy(input_path, output_path)
             return True
 
-        cmd = ["magick", str(input_path)]
-
-        # Strip metadata if configured
-        if config.strip_metadata:
-            cmd.append("-strip")
-
-        # Apply resize if dimensions are set
-        if config.max_width > 0 or config.max_height > 0:
-            w = config.max_width if config.max_width > 0 else ""
-            h = config.max_height if config.max_height > 0 else ""
-            cmd.extend(["-filter", "Lanczos", "-resize", f"{w}x{h}>"])
-
-        # Apply quality setting
-        cmd.extend(["-quality", str(config.image_quality)])
+        cmd = ["magick", str(input_path), *self._magick_options(config)]
 
         # Set output format
         output_with_format = output_path.with_suffix(f".{config.image_format}")
         cmd.append(str(output_with_format))
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60, env=self.env)
             if result.returncode != 0:
                 self._log(f"ImageMagick error: {result.stderr}")
                 return False
@@ -343,6 +357,56 @@ class DocumentOptimizer:
             self._log(f"Image optimization error: {e}")
             return False
 
+    def _magick_options(self, config: PresetConfig) -> list:
+        """ImageMagick options implementing a preset (strip, resize, quality)."""
+        options = []
+
+        # Strip metadata if configured
+        if config.strip_metadata:
+            options.append("-strip")
+
+        # Apply resize if dimensions are set
+        if config.max_width > 0 or config.max_height > 0:
+            w = config.max_width if config.max_width > 0 else ""
+            h = config.max_height if config.max_height > 0 else ""
+            options.extend(["-filter", "Lanczos", "-resize", f"{w}x{h}>"])
+
+        # Apply quality setting
+        options.extend(["-quality", str(config.image_quality)])
+        return options
+
+    def optimize_image_bytes(
+        self,
+        data: bytes,
+        ext: str,
+        config: PresetConfig,
+        output_format: Optional[str] = None,
+    ) -> Optional[bytes]:
+        """Optimize an in-memory image by piping it through ImageMagick.
+
+        Returns the recompressed bytes, or None if ImageMagick is unavailable
+        or fails.
+        """
+        if not self.has_imagemagick:
+            return None
+
+        output_format = output_format or config.image_format
+        cmd = ["magick", f"{ext}:-", *self._magick_options(config), f"{output_format}:-"]
+
+        try:
+            result = subprocess.run(cmd, input=data, capture_output=True, timeout=60, env=self.env)
+        except subprocess.TimeoutExpired:
+            self._log("ImageMagick timeout")
+            return None
+        except Exception as e:
+            self._log(f"Image optimization error: {e}")
+            return None
+
+        if result.returncode != 0 or not result.stdout:
+            self._log(f"ImageMagick error: {result.stderr.decode(errors='replace')}")
+            return None
+        return result.stdout
+
     def convert(
         self,
         input_path: Path,
@@ -354,8 +418,6 @@ class DocumentOptimizer:
         keep_temp: bool = False,
     ) -> ConversionResult:
         """Convert and optimize a document."""
-        import time
-
         start_time = time.time()
 
         if config is None:
@@ -378,7 +440,7 @@ class DocumentOptimizer:
         )
 
         try:
-            with tempfile.TemporaryDirectory() as temp_dir:
+            with tempfile.TemporaryDirectory(dir=self.temp_root) as temp_dir:
                 temp_path = Path(temp_dir)
 
                 if file_format == "pdf":
@@ -432,60 +494,19 @@ class DocumentOptimizer:
             import fitz
 
             doc = fitz.open(input_path)
-            images_dir = temp_path / "images"
-            images_dir.mkdir()
+            groups = self._collect_pdf_images(doc)
+            replacements, result.image_report = self._recompress_pdf_images(groups, config)
 
-            # Extract and optimize images
-            image_map = {}  # xref -> optimized_path
-            images_processed = 0
+            # Re-insert each optimized image at every xref that shared its content;
+            # garbage=4 then stores the identical new streams only once.
+            for digest, image_data in replacements.items():
+                for page_num, xref in groups[digest]["refs"]:
+                    doc[page_num].replace_image(xref, stream=image_data)
 
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                images = page.get_images(full=True)
-                for img in images:
-                    xref = img[0]
-                    if xref in image_map:
-                        continue
-
-                    base_image = doc.extract_image(xref)
-                    if not base_image:
-                        continue
-
-                    img_ext = base_image.get("ext", "png")
-                    img_data = base_image.get("image", b"")
-                    if not img_data:
-                        continue
-
-                    # Save original image
-                    orig_path = images_dir / f"img_{xref}.{img_ext}"
-                    with open(orig_path, "wb") as f:
-                        f.write(img_data)
-
-                    # Optimize image
-                    opt_path = images_dir / f"img_{xref}_opt.{config.image_format}"
-                    if self.optimize_image(orig_path, opt_path, config):
-                        image_map[xref] = opt_path
-                        images_processed += 1
-                    else:
-                        image_map[xref] = orig_path
-
-            # Replace images in PDF
-            for xref, opt_path in image_map.items():
-                if opt_path.exists():
-                    with open(opt_path, "rb") as f:
-                        img_data = f.read()
-                    try:
-                        doc.delete_object(xref)
-                        # Note: Full image replacement would require more complex handling
-                        # For now, we save as a new PDF which re-embeds all images
-                    except Exception:
-                        pass
-
-            # Save optimized PDF
             doc.save(output_path, garbage=4, deflate=True)
             doc.close()
 
-            result.images_processed = images_processed
+            result.images_processed = result.image_report["images_replaced"]
 
         except Exception as e:
             result.status = "error"
@@ -496,6 +517,82 @@ class DocumentOptimizer:
 
         return result
 
+    def _collect_pdf_images(self, doc) -> dict:
+        """Group a PDF's image xrefs by a hash of their content.
+
+        Returns ``{digest: {"data", "ext", "refs": [(page_num, xref), ...]}}``.
+        Images with a soft mask (alpha) are left untouched.
+        """
+        groups: dict = {}
+        seen = set()
+        for page_num in range(len(doc)):
+            for img in doc[page_num].get_images(full=True):
+                xref, smask = img[0], img[1]
+                if xref in seen:
+                    continue
+                seen.add(xref)
+                if smask:
+                    continue
+
+                base_image = doc.extract_image(xref)
+                img_data = base_image.get("image", b"") if base_image else b""
+                if not img_data:
+                    continue
+
+                digest = hashlib.sha256(img_data).hexdigest()
+                group = groups.setdefault(digest, {"data": img_data, "ext": base_image.get("ext", "png"), "refs": []})
+                group["refs"].append((page_num, xref))
+        return groups
+
+    def _recompress_pdf_images(self, groups: dict, config: PresetConfig) -> tuple:
+        """Recompress each unique image once, concurrently, and report the savings.
+
+        Returns ``(replacements, report)`` where ``replacements`` maps digests to
+        new image bytes; results that are not smaller than the original are
+        dropped. PDFs cannot embed WebP, so non-PNG presets are written as JPEG.
+        """
+        output_format = "png" if config.image_format == "png" else "jpeg"
+        cpu_start = os.times()
+        wall_start = time.perf_counter()
+
+        optimized: dict = {}
+        if groups:
+            with ThreadPoolExecutor(max_workers=min(self.image_workers, len(groups))) as executor:
+                futures = {
+                    digest: executor.submit(
+                        self.optimize_image_bytes, group["data"], group["ext"], config, output_format
+                    )
+                    for digest, group in groups.items()
+                }
+                optimized = {digest: future.result() for digest, future in futures.items()}
+
+        cpu_end = os.times()
+        cpu_seconds = sum(cpu_end[i] - cpu_start[i] for i in range(4))  # user/system, self + children
+
+        replacements = {
+            digest: data for digest, data in optimized.items() if data and len(data) < len(groups[digest]["data"])
+        }
+        bytes_saved = sum(
+            (len(groups[digest]["data"]) - len(data)) * len(groups[digest]["refs"])
+            for digest, data in replacements.items()
+        )
+        report = {
+            "image_refs": sum(len(group["refs"]) for group in groups.values()),
+            "unique_images": len(groups),
+            "recompressed": len(replacements),
+            "images_replaced": sum(len(groups[digest]["refs"]) for digest in replacements),
+            "original_bytes": sum(len(group["data"]) * len(group["refs"]) for group in groups.values()),
+            "bytes_saved": bytes_saved,
+            "cpu_seconds": round(cpu_seconds, 3),
+            "wall_seconds": round(time.perf_counter() - wall_start, 3),
+            "bytes_saved_per_cpu_second": int(bytes_saved / cpu_seconds) if cpu_seconds > 0 else 0,
+        }
+        self._log(
+            f"Images: {report['unique_images']} unique of {report['image_refs']}, "
+            f"{bytes_saved:,} bytes saved in {report['cpu_seconds']}s CPU"
+        )
+        return replacements, report
+
     def _convert_office_to_pdf(
         self,
         input_path: Path,
@@ -523,7 +620,7 @@ class DocumentOptimizer:
             cmd.extend(["--ocr-lang", ocr_lang])
 
         try:
-            subprocess.run(cmd, capture_output=True, timeout=300, check=True)
+            subprocess.run(cmd, capture_output=True, timeout=300, check=True, env=self.env)
         except subprocess.CalledProcessError as e:
             result.status = "error"
             result.error_message = f"docling conversion failed: {e}"
@@ -560,7 +657,7 @@ class DocumentOptimizer:
         if fpdf_script.exists():
             cmd = ["python3", str(fpdf_script), str(md_file), str(output_path)]
             try:
-                subprocess.run(cmd, capture_output=True, timeout=120, check=True)
+                subprocess.run(cmd, capture_output=True, timeout=120, check=True, env=self.env)
             except Exception as e:
                 result.status = "error"
                 result.error_message = f"PDF generation failed: {e}"
@@ -589,7 +686,7 @@ class DocumentOptimizer:
         if fpdf_script.exists():
             cmd = ["python3", str(fpdf_script), str(input_path), str(output_path)]
             try:
-                subprocess.run(cmd, capture_output=True, timeout=120, check=True)
+                subprocess.run(cmd, capture_output=True, timeout=120, check=True, env=self.env)
             except Exception as e:
                 result.status = "error"
                 result.error_message = f"PDF generation failed: {e}"
@@ -622,7 +719,7 @@ class DocumentOptimizer:
         if self.has_imagemagick:
             cmd = ["magick", str(source_path), "-page", "A4", str(output_path)]
             try:
-                subprocess.run(cmd, capture_output=True, timeout=60, check=True)
+                subprocess.run(cmd, capture_output=True, timeout=60, check=True, env=self.env)
             except Exception as e:
                 result.status = "error"
                 result.error_message = f"PDF creation failed: {e}"
@@ -674,28 +771,175 @@ class DocumentOptimizer:
         pattern: str = "*.pdf,*.docx,*.pptx",
         parallel: int = 1,
         skip_existing: bool = False,
+        config: Optional[PresetConfig] = None,
     ) -> list:
-        """Process multiple documents in batch."""
+        """Process multiple documents in batch.
+
+        With ``parallel > 1`` documents are converted in a pool of worker
+        processes, each with its own temp root. Results are always returned in
+        input order (sorted per pattern), regardless of completion order.
+        """
         output_dir.mkdir(parents=True, exist_ok=True)
-        results = []
+        jobs = self._plan_batch(input_dir, output_dir, pattern, skip_existing)
+        results: list = [None] * len(jobs)
+
+        pending = []
+        for index, (input_file, output_file, claimed_by) in enumerate(jobs):
+            if claimed_by is not None:
+                message = f"Output {output_file.name} is already produced by {claimed_by.name}"
+                results[index] = self._error_result(input_file, output_file, preset, config, message)
+            else:
+                pending.append(index)
+
+        if parallel <= 1 or len(pending) <= 1:
+            for index in pending:
+                input_file, output_file, _ = jobs[index]
+                self._log(f"Processing: {input_file}")
+                results[index] = self.convert(input_file, output_file, preset, config)
+            return results
+
+        temp_base = Path(tempfile.mkdtemp(prefix="docopt-batch-", dir=self.temp_root))
+        try:
+            with ProcessPoolExecutor(
+                max_workers=min(parallel, len(pending)),
+                initializer=_init_batch_worker,
+                initargs=(str(temp_base), self.verbose),
+            ) as executor:
+                futures = {
+                    executor.submit(_run_batch_job, jobs[index][0], jobs[index][1], preset, config): index
+                    for index in pending
+                }
+                for done, future in enumerate(as_completed(futures), 1):
+                    index = futures[future]
+                    input_file, output_file, _ = jobs[index]
+                    try:
+                        results[index] = future.result()
+                    except Exception as e:
+                        message = f"Worker failed: {e}"
+                        results[index] = self._error_result(input_file, output_file, preset, config, message)
+                    self._log(f"[{done}/{len(pending)}] {results[index].status}: {input_file}")
+        finally:
+            shutil.rmtree(temp_base, ignore_errors=True)
+
+        return results
 
-        patterns = pattern.split(",")
+    def _plan_batch(self, input_dir: Path, output_dir: Path, pattern: str, skip_existing: bool) -> list:
+        """List ``(input, output, claimed_by)`` jobs for a batch run.
+
+        ``claimed_by`` is the earlier input that maps to the same output file
+        (e.g. ``a.docx`` and ``a.pptx``); such jobs are reported, not converted.
+        """
         files = []
-        for p in patterns:
-            files.extend(input_dir.glob(p.strip()))
+        for p in pattern.split(","):
+            files.extend(sorted(input_dir.glob(p.strip())))
 
-        for input_file in files:
+        jobs = []
+        claimed: dict = {}
+        for input_file in dict.fromkeys(files):
             output_file = output_dir / input_file.with_suffix(".pdf").name
 
             if skip_existing and output_file.exists():
                 self._log(f"Skipping existing: {output_file}")
                 continue
 
-            self._log(f"Processing: {input_file}")
-            result = self.convert(input_file, output_file, preset)
-            results.append(result)
+            jobs.append((input_file, output_file, claimed.get(output_file)))
+            claimed.setdefault(output_file, input_file)
+
+        return jobs
+
+    def _error_result(
+        self,
+        input_path: Path,
+        output_path: Path,
+        preset: QualityPreset,
+        config: Optional[PresetConfig],
+        message: str,
+    ) -> ConversionResult:
+        """Build a failed ConversionResult for a document that was not converted."""
+        try:
+            input_size = input_path.stat().st_size
+        except OSError:
+            input_size = 0
+
+        return ConversionResult(
+            input_file=str(input_path),
+            output_file=str(output_path),
+            pipeline=f"{self.detect_format(input_path)}_to_pdf",
+            preset=config.name if config else PresetConfig.from_preset(preset).name,
+            input_size_bytes=input_size,
+            output_size_bytes=0,
+            compression_ratio=0.0,
+            images_processed=0,
+            processing_time_seconds=0.0,
+            status="error",
+            error_message=message,
+        )
+
+
+# Per-process optimizer used by batch workers (set by _init_batch_worker)
+_worker_optimizer: Optional[DocumentOptimizer] = None
+
+
+def _init_batch_worker(temp_base: str, verbose: bool) -> None:
+    """Give each batch worker process an optimizer with a private temp root."""
+    global _worker_optimizer
+    worker_root = Path(tempfile.mkdtemp(prefix=f"worker-{os.getpid()}-", dir=temp_base))
+    # One image thread per worker: the process pool already occupies the cores
+    _worker_optimizer = DocumentOptimizer(verbose=verbose, temp_root=worker_root, image_workers=1)
+
+
+def _run_batch_job(
+    input_file: Path,
+    output_file: Path,
+    preset: QualityPreset,
+    config: Optional[PresetConfig],
+) -> ConversionResult:
+    """Convert one document inside a batch worker process."""
+    return _worker_optimizer.convert(input_file, output_file, preset, config)
+
+
+def summarize_batch(results: list, wall_seconds: float, parallel: int) -> dict:
+    """Summarize throughput of a batch run, overall and per input format."""
+    by_format: dict = {}
+    for r in results:
+        fmt = Path(r.input_file).suffix.lower().lstrip(".") or "unknown"
+        entry = by_format.setdefault(fmt, {"documents": 0, "failed": 0, "busy_seconds": 0.0})
+        entry["documents"] += 1
+        entry["failed"] += r.status != "success"
+        entry["busy_seconds"] = round(entry["busy_seconds"] + r.processing_time_seconds, 2)
+
+    return {
+        "parallel": parallel,
+        "documents": len(results),
+        "failed": sum(r.status != "success" for r in results),
+        "wall_seconds": round(wall_seconds, 2),
+        "busy_seconds": round(sum(r.processing_time_seconds for r in results), 2),
+        "documents_per_minute": round(len(results) * 60 / wall_seconds, 1) if wall_seconds > 0 else 0.0,
+        "input_bytes": sum(r.input_size_bytes for r in results),
+        "output_bytes": sum(r.output_size_bytes for r in results),
+        "by_format": by_format,
+    }
 
-        return results
+
+def benchmark_batch(
+    optimizer: DocumentOptimizer,
+    input_dir: Path,
+    worker_counts: list,
+    preset: QualityPreset = QualityPreset.WEB,
+    pattern: str = "*.pdf,*.docx,*.pptx",
+) -> list:
+    """Run the same batch once per worker count and report the throughput of each run."""
+    runs = []
+    for parallel in worker_counts:
+        with tempfile.TemporaryDirectory(prefix="docopt-bench-") as out_dir:
+            start = time.perf_counter()
+            results = optimizer.batch(input_dir, Path(out_dir), preset, pattern, parallel)
+            runs.append(summarize_batch(results, time.perf_counter() - start, parallel))
+
+    baseline = runs[0]["wall_seconds"] if runs else 0.0
+    for run in runs:
+        run["speedup"] = round(baseline / run["wall_seconds"], 2) if run["wall_seconds"] > 0 else 0.0
+    return runs
 
 
 def main():
@@ -730,6 +974,7 @@ def main():
     convert_parser.add_argument("--ocr", action="store_true", help="Enable OCR")
     convert_parser.add_argument("--ocr-lang", default="en,ja", help="OCR languages")
     convert_parser.add_argument("--keep-temp", action="store_true", help="Keep temp files")
+    convert_parser.add_argument("--image-workers", type=int, help="Concurrent image recompressions per PDF")
     convert_parser.add_argument("--verbose", action="store_true", help="Verbose output")
 
     # batch command
@@ -747,6 +992,20 @@ def main():
     batch_parser.add_argument("--skip-existing", action="store_true", help="Skip existing files")
     batch_parser.add_argument("--verbose", action="store_true", help="Verbose output")
 
+    # benchmark command
+    bench_parser = subparsers.add_parser("benchmark", help="Measure batch throughput per worker count")
+    bench_parser.add_argument("input_dir", type=Path, help="Directory of sample documents")
+    bench_parser.add_argument("--workers", default="1,2,4", help="Comma-separated worker counts (default: 1,2,4)")
+    bench_parser.add_argument(
+        "--preset",
+        choices=["web", "print", "archive", "minimal"],
+        default="web",
+        help="Quality preset",
+    )
+    bench_parser.add_argument("--pattern", default="*.pdf,*.docx,*.pptx", help="File patterns")
+    bench_parser.add_argument("--format", choices=["json", "text"], default="text", help="Output format")
+    bench_parser.add_argument("--verbose", action="store_true", help="Verbose output")
+
     # optimize-images command
     opt_parser = subparsers.add_parser("optimize-images", help="Optimize PDF images")
     opt_parser.add_argument("input", type=Path, help="Input PDF")
@@ -761,6 +1020,7 @@ def main():
     opt_parser.add_argument("--max-width", type=int, help="Max image width")
     opt_parser.add_argument("--max-height", type=int, help="Max image height")
     opt_parser.add_argument("--strip-metadata", action="store_true", help="Strip image metadata")
+    opt_parser.add_argument("--image-workers", type=int, help="Concurrent image recompressions per PDF")
     opt_parser.add_argument("--verbose", action="store_true", help="Verbose output")
 
     # verify command
@@ -776,7 +1036,7 @@ def main():
         sys.exit(1)
 
     verbose = getattr(args, "verbose", False)
-    optimizer = DocumentOptimizer(verbose=verbose)
+    optimizer = DocumentOptimizer(verbose=verbose, image_workers=getattr(args, "image_workers", None))
 
     if args.command == "analyze":
         analysis = optimizer.analyze(args.input)
@@ -833,6 +1093,19 @@ def main():
         for r in results:
             print(r.to_json())
 
+    elif args.command == "benchmark":
+        worker_counts = [int(w) for w in args.workers.split(",") if w.strip()]
+        runs = benchmark_batch(optimizer, args.input_dir, worker_counts, QualityPreset(args.preset), args.pattern)
+        if args.format == "json":
+            print(json.dumps(runs, indent=2))
+        else:
+            print(f"{'Workers':>7}  {'Docs':>5}  {'Failed':>6}  {'Wall s':>8}  {'Docs/min':>9}  {'Speedup':>7}")
+            for run in runs:
+                print(
+                    f"{run['parallel']:>7}  {run['documents']:>5}  {run['failed']:>6}  "
+                    f"{run['wall_seconds']:>8.2f}  {run['documents_per_minute']:>9.1f}  {run['speedup']:>6.2f}x"
+                )
+
     elif args.command == "optimize-images":
         preset = QualityPreset(args.preset)
         config = PresetConfig.from_preset(preset)
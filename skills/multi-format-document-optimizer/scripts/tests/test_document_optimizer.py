@@ -21,6 +21,8 @@ from document_optimizer import (
     DocumentOptimizer,
     PresetConfig,
     QualityPreset,
+    _init_batch_worker,
+    summarize_batch,
 )
 
 
@@ -257,6 +259,84 @@ class TestImageOptimization:
         assert result is False
 
 
+class TestPdfImageRecompression:
+    """Tests for deduplicated in-memory recompression of PDF images."""
+
+    @staticmethod
+    def _fake_doc(pages: list, images: dict) -> MagicMock:
+        """Build a PyMuPDF-like document: pages list image tuples, images maps xref -> bytes."""
+        doc = MagicMock()
+        doc.__len__.return_value = len(pages)
+        page_mocks = []
+        for page_images in pages:
+            page = MagicMock()
+            page.get_images.return_value = page_images
+            page_mocks.append(page)
+        doc.__getitem__.side_effect = lambda i: page_mocks[i]
+        doc.extract_image.side_effect = lambda xref: {"image": images[xref], "ext": "png"}
+        return doc
+
+    def test_collect_groups_identical_images(self):
+        """Test identical streams under different xrefs form one group; masked images are skipped."""
+        logo, photo = b"logo-bytes", b"photo-bytes"
+        doc = self._fake_doc(
+            pages=[[(10, 0), (11, 0)], [(12, 0), (10, 0)], [(13, 99)]],
+            images={10: logo, 11: photo, 12: logo, 13: photo},
+        )
+
+        groups = DocumentOptimizer()._collect_pdf_images(doc)
+
+        assert len(groups) == 2
+        refs = sorted(group["refs"] for group in groups.values())
+        assert refs == [[(0, 10), (1, 12)], [(0, 11)]]
+
+    def test_recompress_once_per_unique_image(self):
+        """Test each unique image is recompressed once and savings count every reference."""
+        optimizer = DocumentOptimizer(image_workers=2)
+        groups = {
+            "a": {"data": b"x" * 100, "ext": "png", "refs": [(0, 1), (1, 2), (2, 3)]},
+            "b": {"data": b"y" * 50, "ext": "jpeg", "refs": [(0, 4)]},
+        }
+        calls = []
+
+        def fake_optimize(data, ext, config, output_format):
+            calls.append(ext)
+            return data[:40] if ext == "png" else data * 2  # b grows, so it is kept as-is
+
+        optimizer.optimize_image_bytes = fake_optimize
+        replacements, report = optimizer._recompress_pdf_images(groups, PresetConfig.from_preset(QualityPreset.WEB))
+
+        assert sorted(calls) == ["jpeg", "png"]
+        assert replacements == {"a": b"x" * 40}
+        assert report["image_refs"] == 4
+        assert report["unique_images"] == 2
+        assert report["images_replaced"] == 3
+        assert report["original_bytes"] == 350
+        assert report["bytes_saved"] == 180
+        assert report["cpu_seconds"] >= 0
+
+    @patch("subprocess.run")
+    def test_optimize_image_bytes_pipes_through_magick(self, mock_run):
+        """Test in-memory optimization uses stdin/stdout instead of temp files."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=b"optimized", stderr=b"")
+        optimizer = DocumentOptimizer()
+        optimizer.has_imagemagick = True
+
+        data = optimizer.optimize_image_bytes(b"raw", "png", PresetConfig.from_preset(QualityPreset.WEB), "jpeg")
+
+        assert data == b"optimized"
+        cmd = mock_run.call_args.args[0]
+        assert cmd[1] == "png:-" and cmd[-1] == "jpeg:-"
+        assert mock_run.call_args.kwargs["input"] == b"raw"
+
+    def test_optimize_image_bytes_without_imagemagick(self):
+        """Test in-memory optimization is a no-op without ImageMagick."""
+        optimizer = DocumentOptimizer()
+        optimizer.has_imagemagick = False
+
+        assert optimizer.optimize_image_bytes(b"raw", "png", PresetConfig.from_preset(QualityPreset.WEB)) is None
+
+
 class TestBatchProcessing:
     """Tests for batch processing functionality."""
 
@@ -301,3 +381,58 @@ class TestBatchProcessing:
         results = optimizer.batch(input_dir, output_dir, pattern="*.png", skip_existing=True)
 
         assert len(results) == 0
+
+    def test_parallel_batch_returns_results_in_input_order(self, tmp_path, sample_pdf_content):
+        """Test parallel batch converts every file and keeps input order."""
+        optimizer = DocumentOptimizer()
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        names = [f"doc{i:02d}.pdf" for i in range(6)]
+        for name in reversed(names):
+            (input_dir / name).write_bytes(sample_pdf_content)
+        output_dir = tmp_path / "output"
+
+        results = optimizer.batch(input_dir, output_dir, pattern="*.pdf", parallel=3)
+
+        assert [Path(r.input_file).name for r in results] == names
+        assert all((output_dir / name).exists() for name in names)
+
+    def test_batch_reports_output_collisions(self, tmp_path, sample_pdf_content):
+        """Test inputs mapping to the same output are reported, not raced."""
+        optimizer = DocumentOptimizer()
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        (input_dir / "report.pdf").write_bytes(sample_pdf_content)
+        (input_dir / "report.docx").write_bytes(b"PK\x03\x04")
+
+        results = optimizer.batch(input_dir, tmp_path / "output", pattern="*.pdf,*.docx", parallel=2)
+
+        assert [Path(r.input_file).name for r in results] == ["report.pdf", "report.docx"]
+        assert results[1].status == "error"
+        assert "already produced by report.pdf" in results[1].error_message
+
+    def test_worker_gets_private_temp_root(self, tmp_path):
+        """Test each batch worker points external tools at its own temp dir."""
+        import document_optimizer
+
+        _init_batch_worker(str(tmp_path), False)
+        worker = document_optimizer._worker_optimizer
+
+        assert worker.temp_root.parent == tmp_path
+        for name in DocumentOptimizer.TEMP_ENV_VARS:
+            assert worker.env[name] == str(worker.temp_root)
+
+    def test_summarize_batch_throughput(self):
+        """Test throughput summary aggregates per format."""
+        results = [
+            ConversionResult("a.pdf", "a.pdf", "pdf_optimize", "web", 100, 50, 0.5, 0, 2.0, "success"),
+            ConversionResult("b.docx", "b.pdf", "docx_to_pdf", "web", 200, 0, 0.0, 0, 1.0, "error"),
+        ]
+
+        summary = summarize_batch(results, wall_seconds=1.5, parallel=2)
+
+        assert summary["documents"] == 2
+        assert summary["failed"] == 1
+        assert summary["busy_seconds"] == 3.0
+        assert summary["documents_per_minute"] == 80.0
+        assert summary["by_format"]["docx"] == {"documents": 1, "failed": 1, "busy_seconds": 1.0}
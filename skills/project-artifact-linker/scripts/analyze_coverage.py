@@ -4,6 +4,7 @@ Analyze traceability coverage and identify gaps in project artifacts.
 
 Usage:
     python3 analyze_coverage.py --artifacts artifacts.json --links links.json --output coverage.json
+    python3 analyze_coverage.py --store traceability.db --output coverage.json
 """
 
 import argparse
@@ -342,15 +343,18 @@ def main():
     parser.add_argument(
         "--artifacts",
         type=Path,
-        required=True,
         help="Path to artifacts JSON file",
     )
     parser.add_argument(
         "--links",
         type=Path,
-        required=True,
         help="Path to links JSON file",
     )
+    parser.add_argument(
+        "--store",
+        type=Path,
+        help="SQLite artifact store to read instead of --artifacts/--links (stale links are updated first)",
+    )
     parser.add_argument(
         "--output",
         "-o",
@@ -361,17 +365,29 @@ def main():
 
     args = parser.parse_args()
 
-    if not args.artifacts.exists():
-        print(f"Error: Artifacts file not found: {args.artifacts}", file=sys.stderr)
-        sys.exit(1)
-
-    if not args.links.exists():
-        print(f"Error: Links file not found: {args.links}", file=sys.stderr)
-        sys.exit(1)
-
-    # Load data
-    artifacts = json.loads(args.artifacts.read_text(encoding="utf-8"))
-    links = json.loads(args.links.read_text(encoding="utf-8"))
+    if args.store:
+        from artifact_store import load_store
+
+        try:
+            artifacts, links = load_store(args.store)
+        except FileNotFoundError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+    else:
+        if not args.artifacts or not args.links:
+            parser.error("--artifacts and --links are required unless --store is given")
+
+        if not args.artifacts.exists():
+            print(f"Error: Artifacts file not found: {args.artifacts}", file=sys.stderr)
+            sys.exit(1)
+
+        if not args.links.exists():
+            print(f"Error: Links file not found: {args.links}", file=sys.stderr)
+            sys.exit(1)
+
+        # Load data
+        artifacts = json.loads(args.artifacts.read_text(encoding="utf-8"))
+        links = json.loads(args.links.read_text(encoding="utf-8"))
 
     # Analyze coverage
     analyzer = CoverageAnalyzer(
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Persistent SQLite store for incremental artifact parsing and linking.
+
+Parsed artifacts are kept per source file, keyed by the SHA-256 of the file
+contents, so refreshing a project directory only re-parses files that were
+added or changed (unchanged size and mtime skip even the hash). Links are kept
+per link family and source file: a changed meeting file only re-links that
+file's meetings, action items and decisions, while a changed WBS or
+requirements file re-links the families that use it as a target. Generated IDs
+(AI-/DEC-/MTG-) continue from the store's counters, so artifacts of unchanged
+files keep their IDs between refreshes.
+
+Usage:
+    python3 parse_artifacts.py --input-dir docs/ --store traceability.db
+    python3 link_artifacts.py --store traceability.db
+    python3 analyze_coverage.py --store traceability.db
+    python3 generate_traceability_report.py --store traceability.db --output report.md
+"""
+
+import hashlib
+import json
+import sqlite3
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from link_artifacts import ArtifactLinker
+from parse_artifacts import ArtifactParser
+
+# Bump when the table layout (or path keying) changes; older stores are rebuilt from scratch
+STORE_SCHEMA_VERSION = 2
+
+ARTIFACT_KINDS = ("meetings", "wbs_tasks", "requirements", "decisions")
+
+# Link families in build_all_links order: linker method, source kinds (in the
+# order the linker visits them) and the target kind the family depends on.
+LINK_FAMILIES = {
+    "action_item": ("link_action_items_to_wbs", ("meetings",), "wbs_tasks"),
+    "decision": ("link_decisions_to_requirements", ("decisions", "meetings"), "requirements"),
+    "meeting": ("link_meetings_to_wbs", ("meetings",), "wbs_tasks"),
+    "requirement": ("link_requirements_to_wbs", ("requirements",), "wbs_tasks"),
+}
+
+# Stale marker meaning "every source file of the family"
+ALL_FILES = "*"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    ord INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS artifacts (
+    path TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    items TEXT NOT NULL,
+    PRIMARY KEY (path, kind)
+);
+CREATE TABLE IF NOT EXISTS links (
+    family TEXT NOT NULL,
+    path TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    links TEXT NOT NULL,
+    PRIMARY KEY (family, path, kind)
+);
+CREATE TABLE IF NOT EXISTS stale (
+    family TEXT NOT NULL,
+    path TEXT NOT NULL,
+    PRIMARY KEY (family, path)
+);
+"""
+
+
+def store_path(path) -> str:
+    """Key of a source file in the store: its resolved absolute path, however it was spelled."""
+    return str(Path(path).resolve())
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 hex digest of a file's contents."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+class ArtifactStore:
+    """Artifacts and links of one project, updated incrementally as source files change."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._conn = sqlite3.connect(str(self.db_path))
+        self._init_schema()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "ArtifactStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _init_schema(self) -> None:
+        self._conn.executescript(_SCHEMA)
+        if self._meta("schema_version") not in (None, str(STORE_SCHEMA_VERSION)):
+            with self._conn:
+                for table in ("meta", "files", "artifacts", "links", "stale"):
+                    self._conn.execute(f"DELETE FROM {table}")
+        with self._conn:
+            self._set_meta("schema_version", STORE_SCHEMA_VERSION)
+
+    def _meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value) -> None:
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value)))
+
+    # -- Parsing -----------------------------------------------------------
+
+    def update_directory(self, dir_path: Path) -> dict:
+        """Bring the store in line with a directory: parse new and changed files, drop removed ones.
+
+        Returns:
+            Counts of ``added``, ``changed``, ``removed``, ``unchanged`` and ``failed`` files
+        """
+        stats = {"added": 0, "changed": 0, "removed": 0, "unchanged": 0, "failed": 0}
+        dir_path = Path(dir_path).resolve()
+        seen = set()
+        for file_path in ArtifactParser().iter_files(dir_path):
+            seen.add(store_path(file_path))
+            stats[self.update_file(file_path)] += 1
+
+        for path in self._paths():
+            if path not in seen and Path(path).is_relative_to(dir_path):
+                self.remove_file(path)
+                stats["removed"] += 1
+        return stats
+
+    def update_file(self, file_path: Path) -> str:
+        """Re-parse a file if its contents changed; returns "added", "changed", "unchanged" or "failed".
+
+        Files that fail to parse are warned about and dropped from the store, as
+        ArtifactParser.parse_directory skips them, and retried on the next update.
+        Files are keyed (and their artifacts' ``source_file`` set) by resolved
+        absolute path, so refreshing through a relative or symlinked spelling
+        of the same directory does not add them twice.
+        """
+        file_path = Path(store_path(file_path))
+        path = str(file_path)
+        st = file_path.stat()
+        row = self._conn.execute("SELECT digest, size, mtime_ns FROM files WHERE path = ?", (path,)).fetchone()
+        if row and (row[1], row[2]) == (st.st_size, st.st_mtime_ns):
+            return "unchanged"
+
+        digest = file_digest(file_path)
+        if row and row[0] == digest:
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE files SET size = ?, mtime_ns = ? WHERE path = ?", (st.st_size, st.st_mtime_ns, path)
+                )
+            return "unchanged"
+
+        parser = ArtifactParser(counters=json.loads(self._meta("id_counters") or "{}"))
+        try:
+            parser.parse_file(file_path)
+        except Exception as e:
+            print(f"Warning: Failed to parse {file_path}: {e}", file=sys.stderr)
+            if row:
+                self.remove_file(path)
+            return "failed"
+
+        artifacts = parser.to_dict()["artifacts"]
+        with self._conn:
+            old_kinds = self._kinds(path)
+            if row:
+                self._conn.execute(
+                    "UPDATE files SET digest = ?, size = ?, mtime_ns = ? WHERE path = ?",
+                    (digest, st.st_size, st.st_mtime_ns, path),
+                )
+            else:
+                self._conn.execute(
+                    "INSERT INTO files (path, ord, digest, size, mtime_ns) "
+                    "VALUES (?, (SELECT COALESCE(MAX(ord), 0) + 1 FROM files), ?, ?, ?)",
+                    (path, digest, st.st_size, st.st_mtime_ns),
+                )
+            self._conn.execute("DELETE FROM artifacts WHERE path = ?", (path,))
+            for kind in ARTIFACT_KINDS:
+                if artifacts[kind]:
+                    self._conn.execute(
+                        "INSERT INTO artifacts (path, kind, items) VALUES (?, ?, ?)",
+                        (path, kind, json.dumps(artifacts[kind], ensure_ascii=False)),
+                    )
+            self._set_meta("id_counters", json.dumps(parser.counters()))
+            self._mark_stale(path, old_kinds | self._kinds(path))
+        return "changed" if row else "added"
+
+    def remove_file(self, path: str) -> None:
+        """Drop a source file and its artifacts from the store."""
+        path = store_path(path)
+        with self._conn:
+            kinds = self._kinds(path)
+            self._conn.execute("DELETE FROM files WHERE path = ?", (path,))
+            self._conn.execute("DELETE FROM artifacts WHERE path = ?", (path,))
+            self._mark_stale(path, kinds)
+
+    def _paths(self) -> list[str]:
+        return [row[0] for row in self._conn.execute("SELECT path FROM files ORDER BY ord")]
+
+    def _kinds(self, path: str) -> set[str]:
+        return {row[0] for row in self._conn.execute("SELECT kind FROM artifacts WHERE path = ?", (path,))}
+
+    def _mark_stale(self, path: str, kinds: set[str]) -> None:
+        """Record the link groups invalidated by a change to path's artifacts of the given kinds."""
+        for family, (_, source_kinds, target_kind) in LINK_FAMILIES.items():
+            if target_kind in kinds:
+                self._conn.execute("INSERT OR IGNORE INTO stale (family, path) VALUES (?, ?)", (family, ALL_FILES))
+            elif kinds.intersection(source_kinds):
+                self._conn.execute("INSERT OR IGNORE INTO stale (family, path) VALUES (?, ?)", (family, path))
+
+    # -- Linking -----------------------------------------------------------
+
+    def mark_all_stale(self) -> None:
+        """Force every link to be recomputed on the next update_links() (e.g. after a linker upgrade)."""
+        with self._conn:
+            for family in LINK_FAMILIES:
+                self._conn.execute("INSERT OR IGNORE INTO stale (family, path) VALUES (?, ?)", (family, ALL_FILES))
+
+    def pending_link_updates(self) -> int:
+        """Number of stale link groups (ALL_FILES counts once per family)."""
+        return self._conn.execute("SELECT COUNT(*) FROM stale").fetchone()[0]
+
+    def update_links(self) -> dict:
+        """Recompute the stale link groups.
+
+        Returns:
+            Number of source files re-linked per family
+        """
+        stale: dict[str, set[str]] = {}
+        for family, path in self._conn.execute("SELECT family, path FROM stale"):
+            stale.setdefault(family, set()).add(path)
+        if not stale:
+            return {}
+
+        artifacts = self.artifacts()
+        linker = ArtifactLinker(artifacts)
+        by_file = self._artifacts_by_file()
+        relinked = {}
+        with self._conn:
+            for family, paths in stale.items():
+                method, source_kinds, _ = LINK_FAMILIES[family]
+                if ALL_FILES in paths:
+                    self._conn.execute("DELETE FROM links WHERE family = ?", (family,))
+                    paths = {path for path, kinds in by_file.items() if kinds.keys() & set(source_kinds)}
+                for path in paths:
+                    self._conn.execute("DELETE FROM links WHERE family = ? AND path = ?", (family, path))
+                    for kind in source_kinds:
+                        items = by_file.get(path, {}).get(kind)
+                        if not items:
+                            continue
+                        sources = {source_kind: [] for source_kind in source_kinds}
+                        sources[kind] = items
+                        links = getattr(linker.with_sources(**sources), method)()
+                        self._conn.execute(
+                            "INSERT INTO links (family, path, kind, links) VALUES (?, ?, ?, ?)",
+                            (family, path, kind, json.dumps([vars(link) for link in links], ensure_ascii=False)),
+                        )
+                relinked[family] = len(paths)
+            self._conn.execute("DELETE FROM stale")
+        return relinked
+
+    # -- Reading -----------------------------------------------------------
+
+    def _artifacts_by_file(self) -> dict[str, dict[str, list]]:
+        by_file: dict[str, dict[str, list]] = {}
+        rows = self._conn.execute(
+            "SELECT a.path, a.kind, a.items FROM artifacts a JOIN files f ON f.path = a.path ORDER BY f.ord"
+        )
+        for path, kind, items in rows:
+            by_file.setdefault(path, {})[kind] = json.loads(items)
+        return by_file
+
+    def artifacts(self) -> dict:
+        """All stored artifacts in ArtifactParser.to_dict()["artifacts"] layout, in file order."""
+        artifacts: dict[str, list] = {kind: [] for kind in ARTIFACT_KINDS}
+        for kinds in self._artifacts_by_file().values():
+            for kind, items in kinds.items():
+                artifacts[kind].extend(items)
+        return artifacts
+
+    def links(self) -> list[dict]:
+        """All stored links in ArtifactLinker.build_all_links() order (stale groups are not refreshed)."""
+        rows = self._conn.execute(
+            "SELECT l.family, l.kind, f.ord, l.links FROM links l JOIN files f ON f.path = l.path"
+        )
+        families = list(LINK_FAMILIES)
+        ordered = sorted(
+            rows,
+            key=lambda row: (families.index(row[0]), LINK_FAMILIES[row[0]][1].index(row[1]), row[2]),
+        )
+        return [link for *_, links in ordered for link in json.loads(links)]
+
+    def to_artifacts_dict(self) -> dict:
+        """Artifacts in the parse_artifacts.py JSON output format."""
+        return {
+            "schema_version": "1.0",
+            "extraction_date": datetime.now().isoformat(),
+            "artifacts": self.artifacts(),
+        }
+
+    def to_links_dict(self) -> dict:
+        """Links in the link_artifacts.py JSON output format."""
+        return {
+            "schema_version": "1.0",
+            "link_date": datetime.now().isoformat(),
+            "links": self.links(),
+        }
+
+
+def load_store(db_path: Path) -> tuple[dict, dict]:
+    """Artifacts and links dicts from a store, bringing stale links up to date first.
+
+    Raises:
+        FileNotFoundError: If the store does not exist
+    """
+    if not Path(db_path).exists():
+        raise FileNotFoundError(f"Artifact store not found: {db_path}")
+    with ArtifactStore(db_path) as store:
+        store.update_links()
+        return store.to_artifacts_dict(), store.to_links_dict()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Benchmark ArtifactLinker.build_all_links on synthetic programmes of growing size.
+
+Generates programmes with TASKS WBS tasks (default 2,500, doubled --steps times)
+plus proportional requirements, meetings, action items, decisions, people and
+calendar days, with text drawn from a Zipf-distributed vocabulary, and times link building with the blocking index.
+With --compare, every step is also linked by scoring all pairs (use_blocking=False)
+and the two link sets are checked to be identical — this is quadratic and slow.
+
+Usage:
+    python benchmark_linking.py
+    python benchmark_linking.py --tasks 5000 --steps 3
+    python benchmark_linking.py --tasks 500 --steps 3 --compare
+"""
+
+import argparse
+import random
+import sys
+import time
+from dataclasses import asdict
+from datetime import date, timedelta
+from pathlib import Path
+
+_SCRIPT_DIR = Path(__file__).parent
+if str(_SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPT_DIR))
+
+from link_artifacts import ArtifactLinker  # noqa: E402
+
+DOMAIN_WORDS = [w for words in ArtifactLinker.DOMAIN_KEYWORDS.values() for w in words]
+GENERIC_WORDS = ["review", "update", "prepare", "implement", "test", "document", "deploy", "design", "define"]
+
+
+def _syllable_words(rng: random.Random, count: int) -> list[str]:
+    syllables = ["ka", "lo", "mi", "ner", "sto", "val", "qui", "dra", "pen", "tor", "zu", "bel", "cor", "fin"]
+    words = set()
+    while len(words) < count:
+        words.add("".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+def make_programme(tasks: int, seed: int = 0) -> dict:
+    """Return a synthetic artifacts dict scaled by the number of WBS tasks."""
+    rng = random.Random(seed)
+    vocabulary = GENERIC_WORDS + DOMAIN_WORDS + _syllable_words(rng, max(500, tasks // 2))
+    weights = [1.0 / (rank + 1) for rank in range(len(vocabulary))]
+    first_names = _syllable_words(rng, max(60, tasks // 40))
+    people = [f"{first} {last}" for first in first_names for last in ("Tanaka", "Smith", "Garcia")]
+    start = date(2024, 1, 1)
+
+    def text(low: int, high: int) -> str:
+        return " ".join(rng.choices(vocabulary, weights, k=rng.randint(low, high)))
+
+    # Teams and timelines grow with the programme, so people and dates stay about as selective
+    horizon = max(720, tasks // 3)
+
+    def day(offset_limit: int = horizon) -> date:
+        return start + timedelta(days=rng.randrange(offset_limit))
+
+    wbs_tasks = []
+    for i in range(tasks):
+        begin = day()
+        wbs_tasks.append(
+            {
+                "id": f"WBS-{i // 100 + 1}.{i % 100 + 1}",
+                "name": text(3, 7),
+                "owner": rng.choice(people),
+                "start_date": begin.isoformat(),
+                "end_date": (begin + timedelta(days=rng.randint(5, 60))).isoformat(),
+            }
+        )
+    requirements = [{"id": f"FR-{i + 1:04d}", "description": text(6, 14)} for i in range(max(1, tasks // 10))]
+
+    meetings = []
+    for m in range(max(1, tasks // 20)):
+        action_items = []
+        for a in range(5):
+            description = text(4, 10)
+            if rng.random() < 0.2:
+                description += f" for {rng.choice(wbs_tasks)['id']}"
+            action_items.append(
+                {
+                    "id": f"AI-{m * 5 + a + 1:05d}",
+                    "description": description,
+                    "owner": rng.choice(people),
+                    "due_date": day().isoformat(),
+                }
+            )
+        decisions = []
+        for d in range(2):
+            description = text(5, 12)
+            if rng.random() < 0.2:
+                description += f" per {rng.choice(requirements)['id']}"
+            decisions.append({"id": f"DEC-{m * 2 + d + 1:05d}", "description": description})
+        meetings.append(
+            {
+                "id": f"MTG-{m + 1:04d}",
+                "date": day().isoformat(),
+                "title": text(2, 5),
+                "attendees": rng.sample(people, 6),
+                "action_items": action_items,
+                "decisions": decisions,
+            }
+        )
+    return {"meetings": meetings, "wbs_tasks": wbs_tasks, "requirements": requirements, "decisions": []}
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ArtifactLinker candidate generation")
+    parser.add_argument("--tasks", type=int, default=2500, help="WBS tasks in the first step (default: 2500)")
+    parser.add_argument("--steps", type=int, default=4, help="Number of sizes, doubling each time (default: 4)")
+    parser.add_argument("--compare", action="store_true", help="Also score all pairs and check identical links")
+    args = parser.parse_args()
+
+    mismatches = 0
+    previous = None
+    for step in range(args.steps):
+        tasks = args.tasks * 2**step
+        artifacts = make_programme(tasks, seed=step)
+        action_items = sum(len(m["action_items"]) for m in artifacts["meetings"])
+        elapsed, links = _timed(lambda: ArtifactLinker(artifacts).build_all_links())
+        growth = f" ({elapsed / previous:.1f}x previous)" if previous else ""
+        previous = elapsed
+        print(
+            f"{tasks:>7} tasks, {len(artifacts['meetings']):>5} meetings, {action_items:>6} action items: "
+            f"{elapsed:8.2f}s, {len(links)} links{growth}"
+        )
+        if args.compare:
+            full, reference = _timed(lambda: ArtifactLinker(artifacts, use_blocking=False).build_all_links())
+            same = [asdict(link) for link in links] == [asdict(link) for link in reference]
+            mismatches += not same
+            print(f"{'':>7} all pairs: {full:8.2f}s ({full / elapsed:.1f}x slower), identical: {same}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,6 +5,7 @@ Generate traceability reports from artifacts and links.
 Usage:
     python3 generate_traceability_report.py --artifacts artifacts.json --links links.json --output report.md
     python3 generate_traceability_report.py --artifacts artifacts.json --links links.json --output report.json --format json
+    python3 generate_traceability_report.py --store traceability.db --output report.md
 """
 
 import argparse
@@ -430,15 +431,18 @@ def main():
     parser.add_argument(
         "--artifacts",
         type=Path,
-        required=True,
         help="Path to artifacts JSON file",
     )
     parser.add_argument(
         "--links",
         type=Path,
-        required=True,
         help="Path to links JSON file",
     )
+    parser.add_argument(
+        "--store",
+        type=Path,
+        help="SQLite artifact store to read instead of --artifacts/--links (stale links are updated first)",
+    )
     parser.add_argument(
         "--output",
         "-o",
@@ -455,17 +459,29 @@ def main():
 
     args = parser.parse_args()
 
-    if not args.artifacts.exists():
-        print(f"Error: Artifacts file not found: {args.artifacts}", file=sys.stderr)
-        sys.exit(1)
+    if args.store:
+        from artifact_store import load_store
+
+        try:
+            artifacts, links = load_store(args.store)
+        except FileNotFoundError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+    else:
+        if not args.artifacts or not args.links:
+            parser.error("--artifacts and --links are required unless --store is given")
+
+        if not args.artifacts.exists():
+            print(f"Error: Artifacts file not found: {args.artifacts}", file=sys.stderr)
+            sys.exit(1)
 
-    if not args.links.exists():
-        print(f"Error: Links file not found: {args.links}", file=sys.stderr)
-        sys.exit(1)
+        if not args.links.exists():
+            print(f"Error: Links file not found: {args.links}", file=sys.stderr)
+            sys.exit(1)
 
-    # Load data
-    artifacts = json.loads(args.artifacts.read_text(encoding="utf-8"))
-    links = json.loads(args.links.read_text(encoding="utf-8"))
+        # Load data
+        artifacts = json.loads(args.artifacts.read_text(encoding="utf-8"))
+        links = json.loads(args.links.read_text(encoding="utf-8"))
 
     # Generate report
     generator = TraceabilityReportGenerator(
@@ -4,16 +4,18 @@ Build cross-reference links between extracted project artifacts.
 
 Usage:
     python3 link_artifacts.py --artifacts artifacts.json --output links.json
+    python3 link_artifacts.py --store traceability.db
 """
 
 import argparse
 import json
 import re
 import sys
+from collections import Counter, defaultdict
 from dataclasses import asdict, dataclass
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 
 @dataclass
@@ -29,6 +31,175 @@ class Link:
     match_reason: str
 
 
+class IdFinder:
+    """Find which of a set of IDs occur in a text, with the same semantics as ``artifact_id in text``."""
+
+    def __init__(self, ids: Iterable[str]):
+        self.ids = {artifact_id for artifact_id in ids if artifact_id}
+        self.lengths = sorted({len(artifact_id) for artifact_id in self.ids})
+        self.first_chars = {artifact_id[0] for artifact_id in self.ids}
+
+    def find(self, text: str) -> set[str]:
+        """Return the IDs that are substrings of text."""
+        found = set()
+        if not text or not self.ids:
+            return found
+        for start, char in enumerate(text):
+            if char not in self.first_chars:
+                continue
+            for length in self.lengths:
+                if start + length > len(text):
+                    break
+                chunk = text[start : start + length]
+                if chunk in self.ids:
+                    found.add(chunk)
+        return found
+
+
+class CandidateIndex:
+    """Inverted indexes over link targets (WBS tasks or requirements) for candidate generation.
+
+    Stems, domain and normalized owner are computed once per target. Lookups return
+    sets of positions in ``items``, so linkers only score plausible pairs instead of
+    every source/target combination.
+    """
+
+    def __init__(self, linker: "ArtifactLinker", items: list[dict], text_key: str):
+        self.items = items
+        self.text_key = text_key
+        self.stems = [linker._extract_stems(item.get(text_key, "")) for item in items]
+        self.domains = [linker._get_domain(item.get(text_key, "")) for item in items]
+        self.owners = [linker._normalize_name(item.get("owner") or "") for item in items]
+        self._linker = linker
+
+        self._by_stem: dict[str, list[int]] = defaultdict(list)
+        self._by_owner: dict[str, list[int]] = defaultdict(list)
+        self._by_owner_first: dict[str, list[int]] = defaultdict(list)
+        self._by_domain: dict[str, list[int]] = defaultdict(list)
+        self._by_due_day: dict[int, list[int]] = defaultdict(list)
+        self._by_month: dict[tuple, list[int]] = defaultdict(list)
+        self._by_id: dict[str, list[int]] = defaultdict(list)
+
+        for i, item in enumerate(items):
+            for stem in self.stems[i]:
+                self._by_stem[stem].append(i)
+            if item.get("owner"):
+                self._by_owner[self.owners[i]].append(i)
+                if self.owners[i]:
+                    self._by_owner_first[self.owners[i].split()[0]].append(i)
+            if self.domains[i]:
+                self._by_domain[self.domains[i]].append(i)
+            if item.get("id"):
+                self._by_id[item["id"]].append(i)
+            end = _parse_date(item.get("end_date"))
+            start = _parse_date(item.get("start_date"))
+            # Action items are compared with the end date, or the start date if there is none
+            due = end if item.get("end_date") else start
+            if due:
+                self._by_due_day[due.toordinal()].append(i)
+            if end:
+                if start and start <= end:
+                    for month in _months_between(start, end):
+                        self._by_month[month].append(i)
+        self._id_finder = IdFinder(self._by_id)
+
+    def _union(self, keys, postings: dict) -> set[int]:
+        result: set[int] = set()
+        for key in keys:
+            result.update(postings.get(key, ()))
+        return result
+
+    def stem_similarities(self, stems: set[str], threshold: float) -> dict[int, float]:
+        """Jaccard similarity with stems for every target scoring above threshold.
+
+        Overlaps are counted from the stem postings, so targets are never compared
+        as sets; values equal ArtifactLinker._jaccard_similarity.
+        """
+        if not stems:
+            return {}
+        overlaps: Counter = Counter()
+        for stem in stems:
+            overlaps.update(self._by_stem.get(stem, ()))
+        size = len(stems)
+        similarities = {}
+        for i, common in overlaps.items():
+            similarity = common / (size + len(self.stems[i]) - common)
+            if similarity > threshold:
+                similarities[i] = similarity
+        return similarities
+
+    def by_similar_stems(self, stems: set[str], threshold: float) -> set[int]:
+        """Targets whose stem Jaccard similarity with stems is above threshold."""
+        return set(self.stem_similarities(stems, threshold))
+
+    def by_owners(self, normalized_names: set[str]) -> set[int]:
+        """Targets whose normalized owner is one of the given names."""
+        return self._union(normalized_names, self._by_owner)
+
+    def by_owner_first_name(self, owner: Optional[str]) -> set[int]:
+        """Targets whose owner has a non-zero ArtifactLinker._owner_match_score with owner."""
+        if not owner:
+            return set()
+        normalized = self._linker._normalize_name(owner)
+        if not normalized:
+            # Names made only of titles normalize to "" and match each other exactly
+            return set(self._by_owner.get("", ()))
+        return set(self._by_owner_first.get(normalized.split()[0], ()))
+
+    def by_due_date_near(self, date: Optional[str], days: int) -> set[int]:
+        """Targets whose end date (start date if they have none) is within `days` days of date."""
+        parsed = _parse_date(date)
+        if not parsed:
+            return set()
+        day = parsed.toordinal()
+        return self._union(range(day - days, day + days + 1), self._by_due_day)
+
+    def spanning(self, date: Optional[str]) -> set[int]:
+        """Targets whose start..end month range covers date (a superset of exact containment)."""
+        parsed = _parse_date(date)
+        return set(self._by_month.get((parsed.year, parsed.month), ())) if parsed else set()
+
+    def mentioned_in(self, text: str) -> set[int]:
+        """Targets whose ID occurs in text."""
+        return self._union(self._id_finder.find(text), self._by_id)
+
+    def mentioning(self, ids: Iterable[str]) -> dict[str, list[int]]:
+        """Map each of the given IDs to the targets whose text contains it."""
+        finder = IdFinder(ids)
+        result: dict[str, list[int]] = defaultdict(list)
+        for i, item in enumerate(self.items):
+            for found in finder.find(item.get(self.text_key, "")):
+                result[found].append(i)
+        return result
+
+    def first_in_domain(self, domain: Optional[str], exclude: set[int]) -> set[int]:
+        """The first target (in order) of the given domain that is not already in exclude."""
+        for i in self._by_domain.get(domain, ()) if domain else ():
+            if i not in exclude:
+                return {i}
+        return set()
+
+
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    """Parse an ISO date/datetime string to a date, or None."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).date()
+    except (TypeError, ValueError):
+        return None
+
+
+def _months_between(start: date, end: date):
+    """Yield (year, month) for every month from start to end inclusive."""
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        yield year, month
+        month += 1
+        if month > 12:
+            year, month = year + 1, 1
+
+
 class ArtifactLinker:
     """Build cross-reference links between project artifacts."""
 
@@ -99,9 +270,22 @@ class ArtifactLinker:
         ],
     }
 
-    def __init__(self, artifacts: dict):
+    # _date_proximity_score is non-zero up to 30 whole days apart, which is at most
+    # 31 calendar days when the values carry times of day.
+    DUE_DATE_WINDOW_DAYS = 31
+
+    def __init__(self, artifacts: dict, use_blocking: bool = True):
+        """
+        Args:
+            artifacts: Parsed artifacts (meetings, wbs_tasks, requirements, decisions)
+            use_blocking: Score only candidate pairs from a CandidateIndex. Disable to
+                score every source/target pair (reference behaviour, O(n*m)).
+        """
         self.artifacts = artifacts
         self.links: list[Link] = []
+        self.use_blocking = use_blocking
+        self._wbs_index: Optional[CandidateIndex] = None
+        self._req_index: Optional[CandidateIndex] = None
 
     # Common English stopwords that don't carry semantic weight when matching.
     _STOPWORDS = frozenset(
@@ -199,10 +383,11 @@ class ArtifactLinker:
         """Calculate owner match score."""
         if not owner_a or not owner_b:
             return 0.0
+        return self._normalized_owner_match_score(self._normalize_name(owner_a), self._normalize_name(owner_b))
 
-        norm_a = self._normalize_name(owner_a)
-        norm_b = self._normalize_name(owner_b)
-
+    @staticmethod
+    def _normalized_owner_match_score(norm_a: str, norm_b: str) -> float:
+        """Owner match score for names already passed through _normalize_name."""
         if norm_a == norm_b:
             return 1.0
 
@@ -238,22 +423,68 @@ class ArtifactLinker:
         except ValueError:
             return 0.0
 
+    def with_sources(self, **sources: list) -> "ArtifactLinker":
+        """A linker over the same targets with other source artifacts (e.g. one file's meetings).
+
+        The candidate indexes over WBS tasks and requirements are built once and
+        shared, so linking many small groups of sources does not re-index targets.
+        Only link methods whose sources were replaced give meaningful results.
+        """
+        linker = ArtifactLinker(dict(self.artifacts, **sources), self.use_blocking)
+        linker._wbs_index = self._task_index()
+        linker._req_index = self._requirement_index()
+        return linker
+
+    def _task_index(self) -> "CandidateIndex":
+        if self._wbs_index is None:
+            self._wbs_index = CandidateIndex(self, self.artifacts.get("wbs_tasks", []), "name")
+        return self._wbs_index
+
+    def _requirement_index(self) -> "CandidateIndex":
+        if self._req_index is None:
+            self._req_index = CandidateIndex(self, self.artifacts.get("requirements", []), "description")
+        return self._req_index
+
+    def _ordered(self, candidates: set[int], index: "CandidateIndex"):
+        """Candidate positions in original target order (every target when blocking is off)."""
+        if not self.use_blocking:
+            return range(len(index.items))
+        return sorted(candidates)
+
     def link_action_items_to_wbs(self) -> list[Link]:
         """Link action items from meetings to WBS tasks."""
         links = []
+        index = self._task_index()
 
         for meeting in self.artifacts.get("meetings", []):
             for action_item in meeting.get("action_items", []):
-                ai_keywords = self._extract_stems(action_item.get("description", ""))
+                description = action_item.get("description", "")
+                ai_keywords = self._extract_stems(description)
                 ai_owner = action_item.get("owner")
                 ai_due = action_item.get("due_date")
 
+                # Tasks matching on owner, date or ID are scored in full. Any other task can
+                # only score keyword_sim * 0.30, so of those only the most similar (first on
+                # ties) can win.
+                ai_owner_normalized = self._normalize_name(ai_owner) if ai_owner else ""
+                candidates = set()
+                if self.use_blocking:
+                    candidates = index.by_owner_first_name(ai_owner) | index.mentioned_in(description)
+                    candidates |= index.by_due_date_near(ai_due, self.DUE_DATE_WINDOW_DAYS)
+                    keyword_only = None
+                    for i, similarity in index.stem_similarities(ai_keywords, 0.1).items():
+                        if i not in candidates and (keyword_only is None or (-similarity, i) < keyword_only):
+                            keyword_only = (-similarity, i)
+                    if keyword_only:
+                        candidates.add(keyword_only[1])
+
                 best_match = None
                 best_score = 0.0
                 best_reasons = []
 
-                for task in self.artifacts.get("wbs_tasks", []):
-                    task_keywords = self._extract_stems(task.get("name", ""))
+                for i in self._ordered(candidates, index):
+                    task = index.items[i]
+                    task_keywords = index.stems[i]
                     task_owner = task.get("owner")
                     task_start = task.get("start_date")
                     task_end = task.get("end_date")
@@ -262,7 +493,9 @@ class ArtifactLinker:
                     score = 0.0
 
                     # Owner match (weight: 0.35)
-                    owner_score = self._owner_match_score(ai_owner, task_owner)
+                    owner_score = 0.0
+                    if ai_owner and task_owner:
+                        owner_score = self._normalized_owner_match_score(ai_owner_normalized, index.owners[i])
                     if owner_score > 0:
                         score += owner_score * 0.35
                         reasons.append(f"owner_match({owner_score:.2f})")
@@ -285,7 +518,7 @@ class ArtifactLinker:
 
                     # Explicit reference (weight: 0.15)
                     task_id = task.get("id", "")
-                    if task_id and task_id in action_item.get("description", ""):
+                    if task_id and task_id in description:
                         score += 0.15
                         reasons.append("explicit_reference")
 
@@ -312,6 +545,7 @@ class ArtifactLinker:
     def link_decisions_to_requirements(self) -> list[Link]:
         """Link decisions to requirements they address."""
         links = []
+        index = self._requirement_index()
 
         # Collect decisions from meetings and standalone
         decisions = list(self.artifacts.get("decisions", []))
@@ -319,16 +553,25 @@ class ArtifactLinker:
             decisions.extend(meeting.get("decisions", []))
 
         for decision in decisions:
-            dec_keywords = self._extract_stems(decision.get("description", ""))
-            dec_domain = self._get_domain(decision.get("description", ""))
+            description = decision.get("description", "")
+            dec_keywords = self._extract_stems(description)
+            dec_domain = self._get_domain(description)
+
+            # Requirements scoring >= 0.15 have keyword similarity > 0.1, are referenced by ID, or
+            # share the domain; domain-only matches all score 0.25, so only the first one can win.
+            candidates = set()
+            if self.use_blocking:
+                candidates = index.by_similar_stems(dec_keywords, 0.1) | index.mentioned_in(description)
+                candidates |= index.first_in_domain(dec_domain, exclude=candidates)
 
             best_match = None
             best_score = 0.0
             best_reasons = []
 
-            for req in self.artifacts.get("requirements", []):
-                req_keywords = self._extract_stems(req.get("description", ""))
-                req_domain = self._get_domain(req.get("description", ""))
+            for i in self._ordered(candidates, index):
+                req = index.items[i]
+                req_keywords = index.stems[i]
+                req_domain = index.domains[i]
 
                 reasons = []
                 score = 0.0
@@ -348,7 +591,7 @@ class ArtifactLinker:
 
                 # Explicit reference (weight: 0.15)
                 req_id = req.get("id", "")
-                if req_id and req_id in decision.get("description", ""):
+                if req_id and req_id in description:
                     score += 0.15
                     reasons.append("explicit_reference")
 
@@ -375,6 +618,7 @@ class ArtifactLinker:
     def link_meetings_to_wbs(self) -> list[Link]:
         """Link meetings to WBS tasks discussed."""
         links = []
+        index = self._task_index()
 
         for meeting in self.artifacts.get("meetings", []):
             meeting_attendees = {self._normalize_name(a) for a in meeting.get("attendees", [])}
@@ -390,9 +634,18 @@ class ArtifactLinker:
             )
             meeting_keywords = self._extract_stems(meeting_text)
 
-            for task in self.artifacts.get("wbs_tasks", []):
+            # Tasks scoring >= 0.15 are owned by an attendee, mentioned by ID, have topic
+            # similarity > 0.2 with the meeting text, or span the meeting date.
+            candidates = set()
+            if self.use_blocking:
+                candidates = index.by_similar_stems(meeting_keywords, 0.2) | index.mentioned_in(meeting_text)
+                candidates |= index.by_owners(meeting_attendees)
+                candidates |= index.spanning(meeting_date)
+
+            for i in self._ordered(candidates, index):
+                task = index.items[i]
                 task_owner = task.get("owner")
-                task_keywords = self._extract_stems(task.get("name", ""))
+                task_keywords = index.stems[i]
                 task_start = task.get("start_date")
                 task_end = task.get("end_date")
 
@@ -400,7 +653,7 @@ class ArtifactLinker:
                 score = 0.0
 
                 # Task owner present (weight: 0.30)
-                if task_owner and self._normalize_name(task_owner) in meeting_attendees:
+                if task_owner and index.owners[i] in meeting_attendees:
                     score += 0.30
                     reasons.append("owner_present")
 
@@ -444,25 +697,35 @@ class ArtifactLinker:
     def link_requirements_to_wbs(self) -> list[Link]:
         """Link requirements to implementing WBS tasks."""
         links = []
+        index = self._task_index()
+        requirements = self.artifacts.get("requirements", [])
+        traced = index.mentioning([req.get("id", "") for req in requirements]) if self.use_blocking else {}
 
-        for req in self.artifacts.get("requirements", []):
+        for req in requirements:
             req_keywords = self._extract_stems(req.get("description", ""))
             req_domain = self._get_domain(req.get("description", ""))
+            req_id = req.get("id", "")
+
+            # Tasks scoring >= 0.15 name the requirement ID, have keyword similarity > 0.15, or
+            # share the domain (the rest all score exactly 0.15, so only the first can win).
+            candidates = set()
+            if self.use_blocking:
+                candidates = index.by_similar_stems(req_keywords, 0.15) | set(traced.get(req_id, ()))
+                candidates |= index.first_in_domain(req_domain, exclude=candidates)
 
             best_match = None
             best_score = 0.0
             best_reasons = []
 
-            for task in self.artifacts.get("wbs_tasks", []):
-                task_keywords = self._extract_stems(task.get("name", ""))
-                task_domain = self._get_domain(task.get("name", ""))
+            for i in self._ordered(candidates, index):
+                task = index.items[i]
+                task_keywords = index.stems[i]
+                task_domain = index.domains[i]
 
                 reasons = []
                 score = 0.0
 
                 # Explicit traceability (weight: 0.45)
-                req_id = req.get("id", "")
-                task_id = task.get("id", "")
                 if req_id and req_id in task.get("name", ""):
                     score += 0.45
                     reasons.append("explicit_trace")
@@ -518,34 +781,64 @@ def main():
     parser.add_argument(
         "--artifacts",
         type=Path,
-        required=True,
         help="Path to artifacts JSON file",
     )
+    parser.add_argument(
+        "--store",
+        type=Path,
+        help="SQLite artifact store (see parse_artifacts.py --store); only stale links are recomputed",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="With --store, recompute every link (e.g. after upgrading this script)",
+    )
     parser.add_argument(
         "--output",
         "-o",
         type=Path,
-        default=Path("links.json"),
-        help="Output JSON file path",
+        help="Output JSON file path (default: links.json, or none with --store)",
     )
 
     args = parser.parse_args()
 
-    if not args.artifacts.exists():
-        print(f"Error: Artifacts file not found: {args.artifacts}", file=sys.stderr)
-        sys.exit(1)
-
-    # Load artifacts
-    artifacts = json.loads(args.artifacts.read_text(encoding="utf-8"))
-
-    # Build links
-    linker = ArtifactLinker(artifacts.get("artifacts", artifacts))
-    linker.build_all_links()
+    if bool(args.artifacts) == bool(args.store):
+        parser.error("Exactly one of --artifacts or --store is required")
+
+    if args.store:
+        from artifact_store import ArtifactStore
+
+        if not args.store.exists():
+            print(f"Error: Artifact store not found: {args.store}", file=sys.stderr)
+            sys.exit(1)
+
+        with ArtifactStore(args.store) as store:
+            if args.full:
+                store.mark_all_stale()
+            relinked = store.update_links()
+            result = store.to_links_dict()
+        print(
+            f"Artifact store {args.store} updated: "
+            + (", ".join(f"{family} links for {count} file(s)" for family, count in relinked.items()) or "up to date")
+        )
+    else:
+        if not args.artifacts.exists():
+            print(f"Error: Artifacts file not found: {args.artifacts}", file=sys.stderr)
+            sys.exit(1)
+
+        # Load artifacts
+        artifacts = json.loads(args.artifacts.read_text(encoding="utf-8"))
+
+        # Build links
+        linker = ArtifactLinker(artifacts.get("artifacts", artifacts))
+        linker.build_all_links()
+        result = linker.to_dict()
 
     # Write output
-    result = linker.to_dict()
-    args.output.write_text(json.dumps(result, indent=2, ensure_ascii=False))
-    print(f"Links written to {args.output}")
+    output = args.output or (None if args.store else Path("links.json"))
+    if output:
+        output.write_text(json.dumps(result, indent=2, ensure_ascii=False))
+        print(f"Links written to {output}")
 
     # Print summary
     link_types = {}
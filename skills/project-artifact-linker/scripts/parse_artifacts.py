@@ -5,6 +5,7 @@ Parse project artifacts (meeting minutes, WBS, requirements, decisions) and extr
 Usage:
     python3 parse_artifacts.py --input-dir /path/to/docs --output artifacts.json
     python3 parse_artifacts.py --input-file meeting.md --output artifacts.json
+    python3 parse_artifacts.py --input-dir /path/to/docs --store traceability.db
 """
 
 import argparse
@@ -14,7 +15,7 @@ import sys
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 
 @dataclass
@@ -115,14 +116,30 @@ class ArtifactParser:
     # Decision ID patterns
     DEC_ID_PATTERN = r"(DEC-\d+|D\d+|DECISION-\d+|ADR-\d+)"
 
-    def __init__(self):
+    SUPPORTED_EXTENSIONS = [".md", ".txt", ".json", ".csv"]
+
+    def __init__(self, counters: Optional[dict] = None):
+        """
+        Args:
+            counters: Generated-ID counters to continue from (see counters()), so
+                action item, decision and meeting IDs stay unique across runs
+        """
         self.meetings: list[Meeting] = []
         self.wbs_tasks: list[WBSTask] = []
         self.requirements: list[Requirement] = []
         self.decisions: list[Decision] = []
-        self._action_counter = 0
-        self._decision_counter = 0
-        self._meeting_counter = 0
+        counters = counters or {}
+        self._action_counter = counters.get("action", 0)
+        self._decision_counter = counters.get("decision", 0)
+        self._meeting_counter = counters.get("meeting", 0)
+
+    def counters(self) -> dict:
+        """Current generated-ID counters."""
+        return {
+            "action": self._action_counter,
+            "decision": self._decision_counter,
+            "meeting": self._meeting_counter,
+        }
 
     def _generate_action_id(self) -> str:
         self._action_counter += 1
@@ -455,15 +472,18 @@ class ArtifactParser:
             elif re.search(self.REQ_ID_PATTERN, content):
                 self.parse_requirements(content, rel_path)
 
+    def iter_files(self, dir_path: Path) -> Iterator[Path]:
+        """Supported files under a directory, in parse order."""
+        for ext in self.SUPPORTED_EXTENSIONS:
+            yield from dir_path.rglob(f"*{ext}")
+
     def parse_directory(self, dir_path: Path) -> None:
         """Parse all supported files in a directory."""
-        extensions = [".md", ".txt", ".json", ".csv"]
-        for ext in extensions:
-            for file_path in dir_path.rglob(f"*{ext}"):
-                try:
-                    self.parse_file(file_path)
-                except Exception as e:
-                    print(f"Warning: Failed to parse {file_path}: {e}", file=sys.stderr)
+        for file_path in self.iter_files(dir_path):
+            try:
+                self.parse_file(file_path)
+            except Exception as e:
+                print(f"Warning: Failed to parse {file_path}: {e}", file=sys.stderr)
 
     def to_dict(self) -> dict:
         """Convert all parsed artifacts to a dictionary."""
@@ -495,8 +515,12 @@ def main():
         "--output",
         "-o",
         type=Path,
-        default=Path("artifacts.json"),
-        help="Output JSON file path",
+        help="Output JSON file path (default: artifacts.json, or none with --store)",
+    )
+    parser.add_argument(
+        "--store",
+        type=Path,
+        help="SQLite artifact store to update incrementally (only new or changed files are parsed)",
     )
 
     args = parser.parse_args()
@@ -504,24 +528,41 @@ def main():
     if not args.input_dir and not args.input_file:
         parser.error("Either --input-dir or --input-file is required")
 
-    artifact_parser = ArtifactParser()
-
-    if args.input_file:
-        if not args.input_file.exists():
-            print(f"Error: File not found: {args.input_file}", file=sys.stderr)
-            sys.exit(1)
-        artifact_parser.parse_file(args.input_file)
-
-    if args.input_dir:
-        if not args.input_dir.is_dir():
-            print(f"Error: Directory not found: {args.input_dir}", file=sys.stderr)
-            sys.exit(1)
-        artifact_parser.parse_directory(args.input_dir)
+    if args.input_file and not args.input_file.exists():
+        print(f"Error: File not found: {args.input_file}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.input_dir and not args.input_dir.is_dir():
+        print(f"Error: Directory not found: {args.input_dir}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.store:
+        from artifact_store import ArtifactStore
+
+        with ArtifactStore(args.store) as store:
+            stats = {"added": 0, "changed": 0, "removed": 0, "unchanged": 0, "failed": 0}
+            if args.input_file:
+                stats[store.update_file(args.input_file)] += 1
+            if args.input_dir:
+                for status, count in store.update_directory(args.input_dir).items():
+                    stats[status] += count
+            result = store.to_artifacts_dict()
+        print(
+            f"Artifact store {args.store} updated: " + ", ".join(f"{count} {status}" for status, count in stats.items())
+        )
+    else:
+        artifact_parser = ArtifactParser()
+        if args.input_file:
+            artifact_parser.parse_file(args.input_file)
+        if args.input_dir:
+            artifact_parser.parse_directory(args.input_dir)
+        result = artifact_parser.to_dict()
 
     # Write output
-    result = artifact_parser.to_dict()
-    args.output.write_text(json.dumps(result, indent=2, ensure_ascii=False))
-    print(f"Extracted artifacts written to {args.output}")
+    output = args.output or (None if args.store else Path("artifacts.json"))
+    if output:
+        output.write_text(json.dumps(result, indent=2, ensure_ascii=False))
+        print(f"Extracted artifacts written to {output}")
 
     # Print summary
     artifacts = result["artifacts"]
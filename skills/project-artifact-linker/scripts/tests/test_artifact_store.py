@@ -0,0 +1,182 @@
+"""
+Tests for artifact_store.py
+"""
+
+from pathlib import Path
+
+import pytest
+from artifact_store import ArtifactStore, load_store
+from link_artifacts import ArtifactLinker
+
+WBS = """
+| Task ID | Task Name | Owner | Start | End |
+|---------|-----------|-------|-------|-----|
+| WBS-1.1 | Design authentication module | Alice | 2024-01-01 | 2024-01-20 |
+| WBS-1.2 | Implement database migration | Bob | 2024-01-10 | 2024-02-10 |
+| WBS-1.3 | Performance load testing | Carol | 2024-02-01 | 2024-02-28 |
+"""
+
+REQUIREMENTS = """
+FR-001: System shall support OAuth authentication
+FR-002: Database migration must preserve data
+NFR-001: Response time under load below 200ms
+"""
+
+DECISIONS = """
+DECISION: Adopt OAuth2 for authentication
+"""
+
+
+def meeting(title: str, day: int, owner: str, action: str, decision: str) -> str:
+    return f"""# {title}
+
+Date: 2024-01-{day:02d}
+Attendees: Alice, Bob
+
+ACTION: @{owner} to {action}
+DECISION: {decision}
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "wbs.md").write_text(WBS)
+    (docs / "requirements.md").write_text(REQUIREMENTS)
+    (docs / "decision-log.md").write_text(DECISIONS)
+    (docs / "meeting-01.md").write_text(
+        meeting("Kickoff", 15, "Alice", "design authentication", "Use OAuth for authentication")
+    )
+    return docs
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ArtifactStore(tmp_path / "traceability.db") as store:
+        yield store
+
+
+def relinked_from_scratch(store: ArtifactStore) -> list[dict]:
+    return [vars(link) for link in ArtifactLinker(store.artifacts()).build_all_links()]
+
+
+class TestIncrementalParsing:
+    """Tests for parsing only new and changed files."""
+
+    def test_initial_update_parses_everything(self, project, store):
+        assert store.update_directory(project) == {
+            "added": 4,
+            "changed": 0,
+            "removed": 0,
+            "unchanged": 0,
+            "failed": 0,
+        }
+        artifacts = store.artifacts()
+        assert len(artifacts["wbs_tasks"]) == 3
+        assert len(artifacts["requirements"]) == 3
+        assert len(artifacts["meetings"]) == 1
+        assert len(artifacts["decisions"]) == 1
+
+    def test_second_update_is_a_no_op(self, project, store):
+        store.update_directory(project)
+        store.update_links()
+        stats = store.update_directory(project)
+        assert stats["unchanged"] == 4
+        assert store.pending_link_updates() == 0
+
+    def test_touched_but_identical_file_is_unchanged(self, project, store):
+        store.update_directory(project)
+        wbs = project / "wbs.md"
+        wbs.write_text(WBS)
+        assert store.update_file(wbs) == "unchanged"
+
+    def test_generated_ids_stable_across_refreshes(self, project, store):
+        store.update_directory(project)
+        before = store.artifacts()["meetings"][0]
+        (project / "meeting-00.md").write_text(meeting("Prep", 10, "Bob", "prepare migration", "Migrate in phases"))
+        store.update_directory(project)
+
+        meetings = store.artifacts()["meetings"]
+        assert meetings[0] == before
+        assert meetings[1]["action_items"][0]["id"] == "AI-002"
+
+    def test_refresh_through_other_path_spelling(self, project, store, monkeypatch):
+        monkeypatch.chdir(project.parent)
+        store.update_directory(Path("docs"))
+        stats = store.update_directory(project.resolve())
+        assert stats["unchanged"] == 4 and stats["added"] == 0
+        assert len(store.artifacts()["wbs_tasks"]) == 3
+
+        (project / "decision-log.md").unlink()
+        assert store.update_directory(Path("docs"))["removed"] == 1
+        assert store.artifacts()["decisions"] == []
+
+    def test_removed_file_is_dropped(self, project, store):
+        store.update_directory(project)
+        (project / "decision-log.md").unlink()
+        assert store.update_directory(project)["removed"] == 1
+        assert store.artifacts()["decisions"] == []
+
+
+class TestIncrementalLinking:
+    """Tests that only affected links are recomputed, with the same result as a full relink."""
+
+    def test_new_meeting_relinks_only_that_file(self, project, store):
+        store.update_directory(project)
+        store.update_links()
+
+        (project / "meeting-02.md").write_text(
+            meeting("Sync", 22, "Bob", "run database migration dry run", "Migrate data in two phases")
+        )
+        store.update_directory(project)
+        assert store.update_links() == {"action_item": 1, "decision": 1, "meeting": 1}
+        assert store.links() == relinked_from_scratch(store)
+
+    def test_wbs_change_relinks_dependent_families(self, project, store):
+        store.update_directory(project)
+        store.update_links()
+
+        (project / "wbs.md").write_text(
+            WBS + "| WBS-1.4 | OAuth authentication rollout | Alice | 2024-01-12 | 2024-01-19 |\n"
+        )
+        store.update_directory(project)
+        relinked = store.update_links()
+        assert set(relinked) == {"action_item", "meeting", "requirement"}
+        assert store.links() == relinked_from_scratch(store)
+
+    def test_removed_meeting_drops_its_links(self, project, store):
+        store.update_directory(project)
+        store.update_links()
+        assert any(link["source_type"] == "meeting" for link in store.links())
+
+        (project / "meeting-01.md").unlink()
+        store.update_directory(project)
+        store.update_links()
+        assert not any(link["source_type"] in ("meeting", "action_item") for link in store.links())
+        assert store.links() == relinked_from_scratch(store)
+
+    def test_mark_all_stale(self, project, store):
+        store.update_directory(project)
+        store.update_links()
+        store.mark_all_stale()
+        assert set(store.update_links()) == {"action_item", "decision", "meeting", "requirement"}
+        assert store.links() == relinked_from_scratch(store)
+
+
+class TestLoadStore:
+    """Tests for reading artifacts and links for reports."""
+
+    def test_load_store_updates_stale_links(self, project, tmp_path):
+        db = tmp_path / "traceability.db"
+        with ArtifactStore(db) as store:
+            store.update_directory(project)
+
+        artifacts, links = load_store(db)
+        assert len(artifacts["artifacts"]["wbs_tasks"]) == 3
+        assert links["links"]
+        assert "schema_version" in links
+
+    def test_load_missing_store(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_store(tmp_path / "missing.db")
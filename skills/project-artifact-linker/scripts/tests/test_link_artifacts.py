@@ -3,7 +3,8 @@ Tests for link_artifacts.py
 """
 
 import pytest
-from link_artifacts import ArtifactLinker
+from benchmark_linking import make_programme
+from link_artifacts import ArtifactLinker, IdFinder
 
 
 class TestKeywordExtraction:
@@ -372,3 +373,38 @@ class TestLinkConfidence:
 
         # No link should be created due to low similarity
         assert len(links) == 0
+
+
+class TestCandidateBlocking:
+    """Tests that the blocking index finds exactly the links of all-pairs scoring."""
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_blocking_matches_all_pairs(self, seed):
+        """Links with the candidate index equal links from scoring every pair."""
+        artifacts = make_programme(200, seed=seed)
+        blocked = ArtifactLinker(artifacts).build_all_links()
+        full = ArtifactLinker(artifacts, use_blocking=False).build_all_links()
+
+        assert blocked
+        assert [vars(link) for link in blocked] == [vars(link) for link in full]
+
+    def test_id_finder_substring_semantics(self):
+        """IdFinder reports IDs contained in the text, like the `in` operator."""
+        finder = IdFinder(["WBS-1.1", "WBS-1.10", "FR-01", ""])
+        assert finder.find("Blocked by WBS-1.10 and FR-012") == {"WBS-1.1", "WBS-1.10", "FR-01"}
+        assert finder.find("WBS-1") == set()
+        assert finder.find("") == set()
+
+    def test_domain_only_match_links_first_task(self):
+        """A requirement sharing only its domain links to the first task of that domain."""
+        artifacts = {
+            "requirements": [{"id": "REQ-SEC-001", "description": "Encryption of stored data"}],
+            "wbs_tasks": [
+                {"id": "WBS-1.1", "name": "Build reports"},
+                {"id": "WBS-1.2", "name": "Configure access rules"},
+                {"id": "WBS-1.3", "name": "Security audit"},
+            ],
+        }
+        links = ArtifactLinker(artifacts).link_requirements_to_wbs()
+
+        assert [(link.target_id, link.confidence) for link in links] == [("WBS-1.2", 0.15)]
@@ -8,12 +8,15 @@ a weighted 0-100 completeness score with prioritized action items.
 
 import argparse
 import json
+import os
 import re
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from pathlib import Path
-from typing import Any
+from pathlib import Path, PurePosixPath
+from typing import Any, Optional
 
 # Severity weights for priority calculation
 SEVERITY_WEIGHTS = {"critical": 3, "major": 2, "minor": 1}
@@ -35,6 +38,7 @@ class Criterion:
     met: bool = False
     score: float = 0.0
     details: str = ""
+    elapsed_ms: float = 0.0
 
 
 @dataclass
@@ -560,197 +564,282 @@ def get_templates() -> dict:
     }
 
 
+def _glob_to_regex(pattern: str) -> "re.Pattern[str]":
+    """Translate a pathlib-style glob (supports ``**``) to a regex over POSIX relative paths."""
+    parts = [p for p in pattern.strip("/").split("/") if p]
+    regex = ""
+    for i, part in enumerate(parts):
+        last = i == len(parts) - 1
+        if part == "**":
+            regex += ".*" if last else "(?:[^/]+/)*"
+            continue
+        j = 0
+        while j < len(part):
+            ch = part[j]
+            if ch == "*":
+                regex += "[^/]*"
+            elif ch == "?":
+                regex += "[^/]"
+            elif ch == "[":
+                end = part.find("]", j + 1)
+                if end == -1:
+                    regex += re.escape(ch)
+                else:
+                    body = part[j + 1 : end]
+                    if body.startswith("!"):
+                        body = "^" + body[1:]
+                    regex += f"[{body}]"
+                    j = end
+            else:
+                regex += re.escape(ch)
+            j += 1
+        if not last:
+            regex += "/"
+    return re.compile(regex)
+
+
+class ProjectSnapshot:
+    """One-pass view of a project tree shared by all ProjectScorer checks.
+
+    The tree is walked once; glob results, decoded file contents and heading
+    lists are computed on first use and cached.
+    """
+
+    def __init__(self, project_path: Path):
+        self.project_path = project_path
+        self.files: set[str] = set()
+        self.dirs: set[str] = set()
+        self._ordered: list[str] = []
+        self._glob_cache: dict[str, list[str]] = {}
+        self._text_cache: dict[str, Optional[str]] = {}
+        self._heading_cache: dict[str, list[str]] = {}
+        self._walk()
+
+    def _walk(self) -> None:
+        root = str(self.project_path)
+        for dirpath, dirnames, filenames in os.walk(root):
+            rel_dir = os.path.relpath(dirpath, root)
+            prefix = "" if rel_dir == "." else rel_dir.replace(os.sep, "/") + "/"
+            dirnames.sort()
+            for name in dirnames:
+                self.dirs.add(prefix + name)
+                self._ordered.append(prefix + name)
+            for name in sorted(filenames):
+                self.files.add(prefix + name)
+                self._ordered.append(prefix + name)
+
+    @staticmethod
+    def _normalize(path: str) -> Optional[str]:
+        """Return a clean relative POSIX path, or None if it escapes the project."""
+        pure = PurePosixPath(path.replace("\\", "/"))
+        if pure.is_absolute() or ".." in pure.parts:
+            return None
+        return pure.as_posix()
+
+    def is_file(self, path: str) -> bool:
+        rel = self._normalize(path)
+        if rel is None:
+            return (self.project_path / path).is_file()
+        return rel in self.files
+
+    def is_dir(self, path: str) -> bool:
+        rel = self._normalize(path)
+        if rel is None:
+            return (self.project_path / path).is_dir()
+        return rel == "." or rel in self.dirs
+
+    def glob(self, pattern: str) -> list[str]:
+        """Relative paths (files and directories) matching a pathlib-style glob."""
+        if pattern not in self._glob_cache:
+            regex = _glob_to_regex(pattern)
+            self._glob_cache[pattern] = [p for p in self._ordered if regex.fullmatch(p)]
+        return self._glob_cache[pattern]
+
+    def text(self, path: str) -> Optional[str]:
+        """Decoded file content, or None if unreadable, a directory, or not UTF-8."""
+        if path not in self._text_cache:
+            try:
+                self._text_cache[path] = (self.project_path / path).read_bytes().decode("utf-8")
+            except (OSError, UnicodeDecodeError):
+                self._text_cache[path] = None
+        return self._text_cache[path]
+
+    def headings(self, path: str) -> list[str]:
+        """Markdown heading lines (starting with ``#``) of a file."""
+        if path not in self._heading_cache:
+            content = self.text(path) or ""
+            self._heading_cache[path] = [line for line in content.split("\n") if line.startswith("#")]
+        return self._heading_cache[path]
+
+
 class ProjectScorer:
     """Evaluates project completeness against a template."""
 
-    def __init__(self, project_path: Path, template: dict):
+    def __init__(self, project_path: Path, template: dict, snapshot: Optional[ProjectSnapshot] = None):
         self.project_path = project_path
         self.template = template
         self.dimensions: list[Dimension] = []
         self.gaps: list[Gap] = []
+        self._snapshot = snapshot
+
+    @property
+    def snapshot(self) -> ProjectSnapshot:
+        """Project snapshot, built on first use."""
+        if self._snapshot is None:
+            self._snapshot = ProjectSnapshot(self.project_path)
+        return self._snapshot
 
     def check_file_exists(self, path: str) -> tuple[bool, str]:
         """Check if a file exists."""
-        full_path = self.project_path / path
-        exists = full_path.is_file()
+        exists = self.snapshot.is_file(path)
         return exists, f"File {'exists' if exists else 'missing'}: {path}"
 
     def check_dir_exists(self, path: str) -> tuple[bool, str]:
         """Check if a directory exists."""
-        full_path = self.project_path / path
-        exists = full_path.is_dir()
+        exists = self.snapshot.is_dir(path)
         return exists, f"Directory {'exists' if exists else 'missing'}: {path}"
 
     def check_file_exists_any(self, paths: list[str]) -> tuple[bool, str]:
         """Check if any of the files exist."""
         for path in paths:
-            if (self.project_path / path).is_file():
+            if self.snapshot.is_file(path):
                 return True, f"Found: {path}"
         return False, f"None found: {', '.join(paths)}"
 
     def check_dir_exists_any(self, paths: list[str]) -> tuple[bool, str]:
         """Check if any of the directories exist."""
         for path in paths:
-            if (self.project_path / path).is_dir():
+            if self.snapshot.is_dir(path):
                 return True, f"Found: {path}"
         return False, f"None found: {', '.join(paths)}"
 
     def check_file_count(self, pattern: str, minimum: int) -> tuple[bool, str]:
         """Check if minimum number of files matching pattern exist."""
-        matches = list(self.project_path.glob(pattern))
-        count = len(matches)
+        count = len(self.snapshot.glob(pattern))
         met = count >= minimum
         return met, f"Found {count} files (minimum: {minimum})"
 
     def check_test_count(self, pattern: str, minimum: int) -> tuple[bool, str]:
         """Count test functions in test files."""
-        matches = list(self.project_path.glob(pattern))
         test_count = 0
-        for match in matches:
-            try:
-                content = match.read_text()
-                # Count def test_ and async def test_ functions
-                test_count += len(re.findall(r"(async\s+)?def\s+test_", content))
-            except (OSError, UnicodeDecodeError):
+        for match in self.snapshot.glob(pattern):
+            content = self.snapshot.text(match)
+            if content is None:
                 continue
+            # Count def test_ and async def test_ functions
+            test_count += len(re.findall(r"(async\s+)?def\s+test_", content))
         met = test_count >= minimum
         return met, f"Found {test_count} test functions (minimum: {minimum})"
 
     def check_yaml_frontmatter(self, path: str) -> tuple[bool, str]:
         """Check if file has valid YAML frontmatter."""
-        full_path = self.project_path / path
-        if not full_path.is_file():
+        if not self.snapshot.is_file(path):
             return False, "File does not exist"
-        try:
-            content = full_path.read_text()
-            if content.startswith("---"):
-                # Find closing ---
-                end_idx = content.find("---", 3)
-                if end_idx > 3:
-                    frontmatter = content[3:end_idx].strip()
-                    if "name:" in frontmatter and "description:" in frontmatter:
-                        return True, "Valid YAML frontmatter found"
-                    return False, "Missing name or description in frontmatter"
-            return False, "No YAML frontmatter (must start with ---)"
-        except (OSError, UnicodeDecodeError) as e:
-            return False, f"Error reading file: {e}"
+        content = self.snapshot.text(path)
+        if content is None:
+            return False, f"Error reading file: {path}"
+        if content.startswith("---"):
+            # Find closing ---
+            end_idx = content.find("---", 3)
+            if end_idx > 3:
+                frontmatter = content[3:end_idx].strip()
+                if "name:" in frontmatter and "description:" in frontmatter:
+                    return True, "Valid YAML frontmatter found"
+                return False, "Missing name or description in frontmatter"
+        return False, "No YAML frontmatter (must start with ---)"
 
     def check_has_heading(self, path: str, heading: str) -> tuple[bool, str]:
         """Check if file contains a specific heading."""
-        full_path = self.project_path / path
-        if not full_path.is_file():
+        if not self.snapshot.is_file(path):
             return False, "File does not exist"
-        try:
-            content = full_path.read_text()
-            # Case-insensitive heading check
-            pattern = re.escape(heading)
-            if re.search(pattern, content, re.IGNORECASE):
-                return True, f"Found heading: {heading}"
-            return False, f"Missing heading: {heading}"
-        except (OSError, UnicodeDecodeError) as e:
-            return False, f"Error reading file: {e}"
+        content = self.snapshot.text(path)
+        if content is None:
+            return False, f"Error reading file: {path}"
+        # Case-insensitive heading check
+        pattern = re.escape(heading)
+        if re.search(pattern, content, re.IGNORECASE):
+            return True, f"Found heading: {heading}"
+        return False, f"Missing heading: {heading}"
 
     def check_shebang(self, pattern: str) -> tuple[bool, str]:
         """Check if Python files have shebang."""
-        matches = list(self.project_path.glob(pattern))
+        matches = self.snapshot.glob(pattern)
         if not matches:
             return True, "No Python files to check"
         missing = []
         for match in matches:
-            try:
-                content = match.read_text()
-                if not content.startswith("#!"):
-                    missing.append(match.name)
-            except (OSError, UnicodeDecodeError):
+            content = self.snapshot.text(match)
+            if content is None:
                 continue
+            if not content.startswith("#!"):
+                missing.append(PurePosixPath(match).name)
         if missing:
             return False, f"Missing shebang in: {', '.join(missing)}"
         return True, "All Python files have shebang"
 
     def check_no_pattern(self, pattern: str, forbidden: list[str]) -> tuple[bool, str]:
         """Check that files don't contain forbidden patterns."""
-        matches = list(self.project_path.glob(pattern))
         found = []
-        for match in matches:
-            try:
-                content = match.read_text()
-                for f in forbidden:
-                    if f in content:
-                        found.append(f"{match.name}: {f}")
-            except (OSError, UnicodeDecodeError):
+        for match in self.snapshot.glob(pattern):
+            content = self.snapshot.text(match)
+            if content is None:
                 continue
+            for f in forbidden:
+                if f in content:
+                    found.append(f"{PurePosixPath(match).name}: {f}")
         if found:
             return False, f"Found forbidden patterns: {', '.join(found[:3])}"
         return True, "No forbidden patterns found"
 
     def check_contains(self, pattern: str, search: str) -> tuple[bool, str]:
         """Check if any file matching pattern contains search string."""
-        matches = list(self.project_path.glob(pattern))
-        for match in matches:
-            try:
-                content = match.read_text()
-                if search in content:
-                    return True, f"Found '{search}' in {match.name}"
-            except (OSError, UnicodeDecodeError):
-                continue
+        for match in self.snapshot.glob(pattern):
+            content = self.snapshot.text(match)
+            if content is not None and search in content:
+                return True, f"Found '{search}' in {PurePosixPath(match).name}"
         return False, f"'{search}' not found in any matching files"
 
     def check_contains_any(self, pattern: str, search: list[str]) -> tuple[bool, str]:
         """Check if any file contains any of the search strings."""
-        matches = list(self.project_path.glob(pattern))
-        for match in matches:
-            try:
-                content = match.read_text()
-                for s in search:
-                    if s in content:
-                        return True, f"Found '{s}' in {match.name}"
-            except (OSError, UnicodeDecodeError):
+        for match in self.snapshot.glob(pattern):
+            content = self.snapshot.text(match)
+            if content is None:
                 continue
+            for s in search:
+                if s in content:
+                    return True, f"Found '{s}' in {PurePosixPath(match).name}"
         return False, "None of the patterns found"
 
     def check_has_heading_any(self, pattern: str, headings: list[str]) -> tuple[bool, str]:
         """Check if any file contains any of the headings."""
-        matches = list(self.project_path.glob(pattern))
-        for match in matches:
-            try:
-                content = match.read_text()
-                for h in headings:
-                    if re.search(re.escape(h), content, re.IGNORECASE):
-                        return True, f"Found heading: {h}"
-            except (OSError, UnicodeDecodeError):
+        for match in self.snapshot.glob(pattern):
+            content = self.snapshot.text(match)
+            if content is None:
                 continue
+            for h in headings:
+                if re.search(re.escape(h), content, re.IGNORECASE):
+                    return True, f"Found heading: {h}"
         return False, "No matching headings found"
 
     def check_heading_hierarchy(self, pattern: str) -> tuple[bool, str]:
         """Check that markdown files have proper heading hierarchy."""
-        matches = list(self.project_path.glob(pattern))
-        for match in matches:
-            try:
-                content = match.read_text()
-                lines = content.split("\n")
-                prev_level = 0
-                for line in lines:
-                    if line.startswith("#"):
-                        level = len(line) - len(line.lstrip("#"))
-                        if prev_level > 0 and level > prev_level + 1:
-                            return False, f"Hierarchy skip in {match.name}"
-                        prev_level = level
-            except (OSError, UnicodeDecodeError):
-                continue
+        for match in self.snapshot.glob(pattern):
+            prev_level = 0
+            for line in self.snapshot.headings(match):
+                level = len(line) - len(line.lstrip("#"))
+                if prev_level > 0 and level > prev_level + 1:
+                    return False, f"Hierarchy skip in {PurePosixPath(match).name}"
+                prev_level = level
         return True, "Heading hierarchy is valid"
 
     def check_images_have_alt(self, pattern: str) -> tuple[bool, str]:
         """Check that images in markdown have alt text."""
-        matches = list(self.project_path.glob(pattern))
         missing_alt = []
-        for match in matches:
-            try:
-                content = match.read_text()
-                # Find images without alt text: ![](...)
-                if re.search(r"!\[\]\(", content):
-                    missing_alt.append(match.name)
-            except (OSError, UnicodeDecodeError):
-                continue
+        for match in self.snapshot.glob(pattern):
+            content = self.snapshot.text(match)
+            # Find images without alt text: ![](...)
+            if content is not None and re.search(r"!\[\]\(", content):
+                missing_alt.append(PurePosixPath(match).name)
         if missing_alt:
             return False, f"Missing alt text in: {', '.join(missing_alt)}"
         return True, "All images have alt text"
@@ -765,6 +854,7 @@ class ProjectScorer:
             action=criterion_def.get("action", ""),
         )
 
+        started = time.perf_counter()
         check = criterion_def["check"]
         if check == "file_exists":
             c.met, c.details = self.check_file_exists(criterion_def["path"])
@@ -801,6 +891,7 @@ class ProjectScorer:
             c.details = f"Unknown check type: {check}"
 
         c.score = 100.0 if c.met else 0.0
+        c.elapsed_ms = (time.perf_counter() - started) * 1000
         return c
 
     def evaluate_dimension(self, dim_def: dict) -> Dimension:
@@ -924,6 +1015,168 @@ class ProjectScorer:
         )
 
 
+def score_portfolio_project(project_path: str, template: dict, slowest: int = 5) -> dict:
+    """Score one project for portfolio mode and return a JSON-serializable record.
+
+    Module-level so it can run in a process pool. Errors are reported in the
+    record instead of raised, so one bad repository does not stop the batch.
+    The directory walk is timed separately (``scan_ms``) so per-check timings
+    only measure the checks themselves.
+    """
+    started = time.perf_counter()
+    if not Path(project_path).is_dir():
+        reason = "is not a directory" if Path(project_path).exists() else "does not exist"
+        return {
+            "project_path": project_path,
+            "error": f"{project_path} {reason}",
+            "elapsed_seconds": round(time.perf_counter() - started, 3),
+        }
+    try:
+        scan_started = time.perf_counter()
+        snapshot = ProjectSnapshot(Path(project_path))
+        scan_ms = (time.perf_counter() - scan_started) * 1000
+        scorer = ProjectScorer(Path(project_path), template, snapshot=snapshot)
+        result = scorer.score()
+    except Exception as e:
+        return {
+            "project_path": project_path,
+            "error": f"{type(e).__name__}: {e}",
+            "elapsed_seconds": round(time.perf_counter() - started, 3),
+        }
+
+    timings = [
+        {"criterion": c.name, "check": c.check_type, "elapsed_ms": round(c.elapsed_ms, 2)}
+        for d in scorer.dimensions
+        for c in d.criteria
+    ]
+    timings.sort(key=lambda t: t["elapsed_ms"], reverse=True)
+    return {
+        "project_path": result.project_path,
+        "project_type": result.project_type,
+        "timestamp": result.timestamp,
+        "overall_score": result.overall_score,
+        "dimensions": [{"name": d["name"], "raw_score": d["raw_score"]} for d in result.dimensions],
+        "summary": result.summary,
+        "elapsed_seconds": round(time.perf_counter() - started, 3),
+        "scan_ms": round(scan_ms, 2),
+        "slowest_checks": timings[:slowest],
+    }
+
+
+def discover_portfolio_projects(parent_dirs: list[Path], list_files: list[Path]) -> list[str]:
+    """Collect project paths from parent directories (immediate subdirs) and list files.
+
+    List files contain one path per line; blank lines and ``#`` comments are ignored.
+    Relative paths in a list file are resolved against the list file's directory.
+    Listed paths are not checked here; missing ones get an error record when scored.
+    """
+    projects: list[str] = []
+    for parent in parent_dirs:
+        projects.extend(str(p) for p in sorted(parent.iterdir()) if p.is_dir() and not p.name.startswith("."))
+    for list_file in list_files:
+        for line in list_file.read_text().splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            path = Path(line).expanduser()
+            if not path.is_absolute():
+                path = list_file.parent / path
+            projects.append(str(path))
+    # Preserve order, drop duplicates
+    return list(dict.fromkeys(projects))
+
+
+def score_portfolio(
+    projects: list[str],
+    template: dict,
+    workers: int = 1,
+    on_result=None,
+) -> list[dict]:
+    """Score many projects, optionally in a process pool.
+
+    ``on_result`` is called with each record as soon as it completes (completion
+    order), which lets the CLI stream JSON Lines. Returns records in input order.
+    """
+    records: dict[str, dict] = {}
+    if workers > 1 and len(projects) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(score_portfolio_project, p, template): p for p in projects}
+            for future in as_completed(futures):
+                record = future.result()
+                records[futures[future]] = record
+                if on_result:
+                    on_result(record)
+    else:
+        for p in projects:
+            record = score_portfolio_project(p, template)
+            records[p] = record
+            if on_result:
+                on_result(record)
+    return [records[p] for p in projects]
+
+
+def build_portfolio_ranking(records: list[dict], template_id: str) -> dict:
+    """Aggregate portfolio records into a ranking sorted by score (descending)."""
+    scored = [r for r in records if "error" not in r]
+    ranked = sorted(scored, key=lambda r: (-r["overall_score"], r["project_path"]))
+    scores = sorted(r["overall_score"] for r in scored)
+    median = None
+    if scores:
+        mid = len(scores) // 2
+        median = scores[mid] if len(scores) % 2 else (scores[mid - 1] + scores[mid]) / 2
+    return {
+        "schema_version": "1.0",
+        "mode": "portfolio",
+        "project_type": template_id,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "project_count": len(records),
+        "scored": len(scored),
+        "errors": [{"project_path": r["project_path"], "error": r["error"]} for r in records if "error" in r],
+        "average_score": round(sum(scores) / len(scores), 1) if scores else None,
+        "median_score": median,
+        "ready_for_release": sum(1 for r in scored if r["summary"]["ready_for_release"]),
+        "total_elapsed_seconds": round(sum(r["elapsed_seconds"] for r in records), 3),
+        "ranking": [
+            {
+                "rank": i,
+                "project_path": r["project_path"],
+                "overall_score": r["overall_score"],
+                "critical_gaps": r["summary"]["critical_gaps"],
+                "major_gaps": r["summary"]["major_gaps"],
+                "ready_for_release": r["summary"]["ready_for_release"],
+                "elapsed_seconds": r["elapsed_seconds"],
+            }
+            for i, r in enumerate(ranked, start=1)
+        ],
+    }
+
+
+def generate_portfolio_markdown(ranking: dict) -> str:
+    """Generate a markdown ranking table from a portfolio ranking."""
+    lines = [
+        "# Project Portfolio Completeness Ranking",
+        "",
+        f"**Type**: {ranking['project_type']}",
+        f"**Projects**: {ranking['scored']} scored, {len(ranking['errors'])} failed",
+        f"**Average Score**: {ranking['average_score']}",
+        f"**Median Score**: {ranking['median_score']}",
+        f"**Ready for Release**: {ranking['ready_for_release']}",
+        "",
+        "| Rank | Project | Score | Critical | Major | Time (s) |",
+        "|------|---------|-------|----------|-------|----------|",
+    ]
+    for row in ranking["ranking"]:
+        lines.append(
+            f"| {row['rank']} | {row['project_path']} | {row['overall_score']} | "
+            f"{row['critical_gaps']} | {row['major_gaps']} | {row['elapsed_seconds']} |"
+        )
+    if ranking["errors"]:
+        lines.extend(["", "## Errors", ""])
+        for err in ranking["errors"]:
+            lines.append(f"- {err['project_path']}: {err['error']}")
+    return "\n".join(lines) + "\n"
+
+
 def generate_markdown_report(result: ScoringResult) -> str:
     """Generate a markdown report from scoring result."""
     lines = [
@@ -1024,6 +1277,31 @@ def main():
         action="store_true",
         help="Show detailed evaluation progress",
     )
+    parser.add_argument(
+        "--portfolio-dir",
+        type=Path,
+        action="append",
+        default=[],
+        help="Portfolio mode: score every subdirectory of this directory (repeatable)",
+    )
+    parser.add_argument(
+        "--portfolio-list",
+        type=Path,
+        action="append",
+        default=[],
+        help="Portfolio mode: text file with one project path per line (repeatable)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Portfolio mode: number of worker processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--jsonl",
+        type=Path,
+        help="Portfolio mode: write per-project JSON Lines here instead of stdout",
+    )
 
     args = parser.parse_args()
 
@@ -1036,11 +1314,12 @@ def main():
             print()
         return 0
 
-    if not args.project_path:
+    portfolio = bool(args.portfolio_dir or args.portfolio_list)
+    if not args.project_path and not portfolio:
         print("Error: --project-path is required", file=sys.stderr)
         return 1
 
-    if not args.project_path.is_dir():
+    if args.project_path and not args.project_path.is_dir():
         print(f"Error: {args.project_path} is not a directory", file=sys.stderr)
         return 1
 
@@ -1058,6 +1337,9 @@ def main():
         templates = get_templates()
         template = templates[args.template]
 
+    if portfolio:
+        return run_portfolio(args, template)
+
     if args.verbose:
         print(f"Evaluating: {args.project_path}")
         print(f"Template: {template['display_name']}")
@@ -1122,5 +1404,60 @@ def main():
     return 0
 
 
+def run_portfolio(args: argparse.Namespace, template: dict) -> int:
+    """Portfolio mode: stream per-project JSON Lines, then emit the aggregate ranking."""
+    for path in [*args.portfolio_dir, *args.portfolio_list]:
+        if not path.exists():
+            print(f"Error: {path} does not exist", file=sys.stderr)
+            return 1
+    projects = discover_portfolio_projects(args.portfolio_dir, args.portfolio_list)
+    if args.project_path:
+        projects.insert(0, str(args.project_path))
+    if not projects:
+        print("Error: no projects found for portfolio mode", file=sys.stderr)
+        return 1
+
+    if args.verbose:
+        print(f"Scoring {len(projects)} projects with {args.workers} workers", file=sys.stderr)
+
+    out = args.jsonl.open("w") if args.jsonl else sys.stdout
+    try:
+
+        def emit(record: dict) -> None:
+            out.write(json.dumps(record) + "\n")
+            out.flush()
+            if args.verbose:
+                print(f"  {record.get('overall_score', 'ERR'):>3}  {record['project_path']}", file=sys.stderr)
+
+        records = score_portfolio(projects, template, workers=args.workers, on_result=emit)
+    finally:
+        if args.jsonl:
+            out.close()
+
+    ranking = build_portfolio_ranking(records, template["template_id"])
+    md_ranking = generate_portfolio_markdown(ranking)
+
+    if args.output_dir:
+        args.output_dir.mkdir(parents=True, exist_ok=True)
+        base_name = f"portfolio_{template['template_id']}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        if args.format in ("json", "both"):
+            json_path = args.output_dir / f"{base_name}.json"
+            json_path.write_text(json.dumps(ranking, indent=2))
+            print(f"JSON ranking: {json_path}", file=sys.stderr)
+        if args.format in ("markdown", "both"):
+            md_path = args.output_dir / f"{base_name}.md"
+            md_path.write_text(md_ranking)
+            print(f"Markdown ranking: {md_path}", file=sys.stderr)
+    else:
+        print(md_ranking, file=sys.stderr)
+
+    print(
+        f"\nScored {ranking['scored']}/{ranking['project_count']} projects, "
+        f"average {ranking['average_score']}, {ranking['ready_for_release']} ready for release",
+        file=sys.stderr,
+    )
+    return 1 if ranking["errors"] else 0
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -1,6 +1,7 @@
 """Tests for the project completeness scorer."""
 
 import json
+import time
 from pathlib import Path
 
 import pytest
@@ -8,12 +9,17 @@ from score_project import (
     EFFORT_MULTIPLIERS,
     SEVERITY_WEIGHTS,
     ProjectScorer,
+    ProjectSnapshot,
+    build_portfolio_ranking,
+    discover_portfolio_projects,
     generate_markdown_report,
     get_document_template,
     get_library_template,
     get_skill_template,
     get_templates,
     get_webapp_template,
+    score_portfolio,
+    score_portfolio_project,
 )
 
 
@@ -314,3 +320,102 @@ class TestDirExistsAny:
         met, details = scorer.check_dir_exists_any(["src", "lib"])
         assert met is False
         assert "None found" in details
+
+
+class TestProjectSnapshot:
+    """Tests for the shared one-pass project snapshot."""
+
+    def test_glob_matches_pathlib(self, sample_skill_project):
+        """Snapshot glob returns the same paths as Path.glob."""
+        (sample_skill_project / "docs" / "deep").mkdir(parents=True)
+        (sample_skill_project / "docs" / "deep" / "guide.md").write_text("# Guide\n")
+        snapshot = ProjectSnapshot(sample_skill_project)
+        for pattern in ["**/*.md", "**/*.py", "scripts/*.py", "scripts/tests/test_*.py", "references/*.md"]:
+            expected = sorted(
+                p.relative_to(sample_skill_project).as_posix() for p in sample_skill_project.glob(pattern)
+            )
+            assert sorted(snapshot.glob(pattern)) == expected, pattern
+
+    def test_contents_read_once_across_checks(self, sample_skill_project, monkeypatch):
+        """Each file is read at most once however many checks use it."""
+        reads = []
+        original = Path.read_bytes
+
+        def counting_read_bytes(self):
+            reads.append(self.name)
+            return original(self)
+
+        monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+        scorer = ProjectScorer(sample_skill_project, get_skill_template())
+        scorer.score()
+        assert reads
+        assert len(reads) == len(set(reads))
+
+    def test_shared_snapshot_and_headings(self, sample_skill_project):
+        """A snapshot can be shared between scorers; headings are precomputed lines."""
+        snapshot = ProjectSnapshot(sample_skill_project)
+        assert "# Test Skill" in snapshot.headings("SKILL.md")
+        assert snapshot.is_dir("scripts") and not snapshot.is_file("scripts")
+        result_a = ProjectScorer(sample_skill_project, get_skill_template(), snapshot=snapshot).score()
+        result_b = ProjectScorer(sample_skill_project, get_skill_template()).score()
+        assert result_a.overall_score == result_b.overall_score
+
+
+class TestPortfolio:
+    """Tests for batch/portfolio scoring."""
+
+    def test_discover_from_parent_dir_and_list(self, sample_skill_project, incomplete_skill_project, tmp_path):
+        """Subdirectories and list-file entries are collected without duplicates."""
+        list_file = tmp_path / "projects.txt"
+        list_file.write_text(f"# comment\n\n{sample_skill_project.name}\n")
+        projects = discover_portfolio_projects([tmp_path], [list_file])
+        assert str(sample_skill_project) in projects
+        assert str(incomplete_skill_project) in projects
+        assert len(projects) == len(set(projects))
+
+    def test_score_portfolio_parallel_streams_and_keeps_order(self, sample_skill_project, incomplete_skill_project):
+        """Records stream via callback and are returned in input order."""
+        projects = [str(incomplete_skill_project), str(sample_skill_project)]
+        streamed = []
+        records = score_portfolio(projects, get_skill_template(), workers=2, on_result=streamed.append)
+        assert [r["project_path"] for r in records] == projects
+        assert len(streamed) == 2
+        assert all(r["slowest_checks"] and "elapsed_ms" in r["slowest_checks"][0] for r in records)
+
+    def test_scan_time_reported_apart_from_checks(self, sample_skill_project, monkeypatch):
+        """The directory walk is not charged to whichever check runs first."""
+        original_walk = ProjectSnapshot._walk
+
+        def slow_walk(snapshot):
+            time.sleep(0.05)
+            original_walk(snapshot)
+
+        monkeypatch.setattr(ProjectSnapshot, "_walk", slow_walk)
+        record = score_portfolio_project(str(sample_skill_project), get_skill_template())
+        assert record["scan_ms"] >= 50
+        assert record["slowest_checks"][0]["elapsed_ms"] < 50
+
+    def test_missing_or_file_entries_are_errors(self, sample_skill_project, tmp_path):
+        """List-file entries that are not directories are reported, not scored."""
+        not_a_dir = tmp_path / "notes.txt"
+        not_a_dir.write_text("x")
+        list_file = tmp_path / "projects.txt"
+        list_file.write_text(f"{sample_skill_project}\nmissing-project\nnotes.txt\n")
+        projects = discover_portfolio_projects([], [list_file])
+        records = score_portfolio(projects, get_skill_template())
+        assert "error" not in records[0]
+        assert records[1]["error"].endswith("does not exist")
+        assert "overall_score" not in records[1]
+        assert records[2]["error"].endswith("is not a directory")
+        assert build_portfolio_ranking(records, "skill")["scored"] == 1
+
+    def test_ranking_sorted_and_errors_reported(self, sample_skill_project, incomplete_skill_project, tmp_path):
+        """Ranking is by descending score; failures are listed separately."""
+        projects = [str(incomplete_skill_project), str(sample_skill_project)]
+        records = score_portfolio(projects, get_skill_template())
+        records.append({"project_path": str(tmp_path / "gone"), "error": "boom", "elapsed_seconds": 0.0})
+        ranking = build_portfolio_ranking(records, "skill")
+        assert ranking["scored"] == 2
+        assert ranking["ranking"][0]["project_path"] == str(sample_skill_project)
+        assert ranking["ranking"][0]["overall_score"] >= ranking["ranking"][1]["overall_score"]
+        assert ranking["errors"][0]["error"] == "boom"
@@ -0,0 +1,34 @@
+"""
+Pytest configuration and fixtures for salesforce-flow-expert tests.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+scripts_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(scripts_dir))
+
+FLOW_HEADER = """<?xml version="1.0" encoding="UTF-8"?>
+<Flow{xmlns}>
+    <apiVersion>60.0</apiVersion>
+    <label>Test Flow</label>
+    <processType>AutoLaunchedFlow</processType>
+    <status>Draft</status>
+"""
+
+
+@pytest.fixture
+def write_flow(tmp_path):
+    """Write a Flow file from its top-level body XML; namespaced like real .flow-meta.xml files by default."""
+
+    def write(body: str, name: str = "Test.flow-meta.xml", namespaced: bool = True):
+        xmlns = ' xmlns="http://soap.sforce.com/2006/04/metadata"' if namespaced else ""
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(FLOW_HEADER.format(xmlns=xmlns) + body + "</Flow>\n", encoding="utf-8")
+        return path
+
+    return write
@@ -0,0 +1,185 @@
+"""
+Tests for validate_flow.py
+"""
+
+import pytest
+from validate_flow import FlowLoadError, FlowValidator
+
+
+def loop(name: str, first: str, after: str = "") -> str:
+    return f"""    <loops>
+        <name>{name}</name>
+        <collectionReference>colAccounts</collectionReference>
+        <nextValueConnector><targetReference>{first}</targetReference></nextValueConnector>
+        <noMoreValuesConnector><targetReference>{after}</targetReference></noMoreValuesConnector>
+    </loops>
+"""
+
+
+def step(tag: str, name: str, target: str = "", extra: str = "") -> str:
+    connector = f"<connector><targetReference>{target}</targetReference></connector>" if target else ""
+    return f"    <{tag}>\n        <name>{name}</name>\n        {extra}{connector}\n    </{tag}>\n"
+
+
+COL_ACCOUNTS = """    <variables>
+        <name>colAccounts</name>
+        <dataType>SObject</dataType>
+        <isCollection>true</isCollection>
+        <objectType>Account</objectType>
+    </variables>
+"""
+
+
+def validate(path) -> FlowValidator:
+    validator = FlowValidator(str(path))
+    validator.run_all_validations()
+    return validator
+
+
+def codes(issues: list) -> list:
+    return [issue["code"] for issue in issues]
+
+
+class TestLoopReachability:
+    """Tests for DML/SOQL-in-loop detection through the connector graph."""
+
+    def test_dml_behind_decision(self, write_flow):
+        decision = """    <decisions>
+        <name>Is_Active</name>
+        <rules>
+            <name>Active</name>
+            <connector><targetReference>Update_Account</targetReference></connector>
+        </rules>
+        <defaultConnector><targetReference>Loop_Accounts</targetReference></defaultConnector>
+    </decisions>
+"""
+        path = write_flow(
+            COL_ACCOUNTS
+            + decision
+            + loop("Loop_Accounts", "Is_Active")
+            + step("recordUpdates", "Update_Account", "Loop_Accounts")
+        )
+        errors = validate(path).errors
+        assert codes(errors) == ["E101"]
+        assert "'Update_Account' inside loop 'Loop_Accounts'" in errors[0]["message"]
+
+    def test_nested_loop_reported_for_each_enclosing_loop(self, write_flow):
+        path = write_flow(
+            COL_ACCOUNTS
+            + loop("Outer_Loop", "Inner_Loop", "Update_After")
+            + loop("Inner_Loop", "Get_Contacts", "Outer_Loop")
+            + step("recordLookups", "Get_Contacts", "Create_Task")
+            + step("recordCreates", "Create_Task", "Inner_Loop")
+            + step("recordUpdates", "Update_After")
+        )
+        validator = validate(path)
+        assert sorted(e["element"] for e in validator.errors) == ["Inner_Loop", "Outer_Loop"]
+        assert sorted(w["element"] for w in validator.warnings if w["code"] == "W001") == ["Inner_Loop", "Outer_Loop"]
+
+    def test_no_more_values_exit_not_in_loop(self, write_flow):
+        path = write_flow(
+            COL_ACCOUNTS
+            + loop("Loop_Accounts", "Add_To_Collection", "Update_All")
+            + step("assignments", "Add_To_Collection", "Loop_Accounts")
+            + step("recordUpdates", "Update_All")
+        )
+        validator = validate(path)
+        assert validator.graph.loop_body("Loop_Accounts") == {"Add_To_Collection"}
+        assert validator.errors == []
+
+    def test_path_leaving_loop_not_in_loop(self, write_flow):
+        fault = "<faultConnector><targetReference>Delete_On_Error</targetReference></faultConnector>"
+        path = write_flow(
+            COL_ACCOUNTS
+            + loop("Loop_Accounts", "Add_To_Collection")
+            + step("assignments", "Add_To_Collection", "Loop_Accounts", fault)
+            + step("recordDeletes", "Delete_On_Error")
+        )
+        assert validate(path).errors == []
+
+    def test_unlisted_element_types_are_graph_nodes(self, write_flow):
+        filter_step = step("collectionProcessors", "Filter_Accs", "Add_To_Collection")
+        path = write_flow(
+            COL_ACCOUNTS
+            + loop("Loop_Accounts", "Filter_Accs")
+            + filter_step
+            + step("assignments", "Add_To_Collection", "Update_Account")
+            + step("recordUpdates", "Update_Account", "Loop_Accounts")
+        )
+        validator = validate(path)
+        assert codes(validator.errors) == ["E101"]
+        assert validator.elements["Filter_Accs"]["type"] == "collectionProcessors"
+
+
+class TestReferences:
+    """Tests for undeclared variable and invalid element reference checks."""
+
+    def test_formula_and_text_template_references_are_declared(self, write_flow):
+        resources = """    <formulas>
+        <name>DiscountFormula</name>
+        <dataType>Number</dataType>
+        <expression>{!Amount} * 0.9</expression>
+    </formulas>
+    <textTemplates>
+        <name>BodyTemplate</name>
+        <text>Discounted: {!DiscountFormula}</text>
+    </textTemplates>
+    <constants>
+        <name>MaxItems</name>
+        <dataType>Number</dataType>
+    </constants>
+"""
+        body = "<inputAssignments><value><stringValue>{!BodyTemplate} {!MaxItems} {!DiscountFormula}</stringValue></value></inputAssignments>"
+        path = write_flow(resources + step("actionCalls", "Send_Email", extra=body))
+        errors = validate(path).errors
+        # Amount is used by the formula but never declared
+        assert [e["message"] for e in errors] == ["Undeclared Variable: 'Amount' referenced in DiscountFormula"]
+
+    def test_screen_field_references_are_declared(self, write_flow):
+        screen = """    <screens>
+        <name>Collect_Email</name>
+        <fields>
+            <name>Email_Input</name>
+            <fieldType>InputField</fieldType>
+        </fields>
+        <connector><targetReference>Confirm</targetReference></connector>
+    </screens>
+"""
+        confirm = step(
+            "screens", "Confirm", extra="<fields><name>Echo</name><fieldText>{!Email_Input}</fieldText></fields>"
+        )
+        assert validate(write_flow(screen + confirm)).errors == []
+
+    def test_undeclared_variable_suggestion(self, write_flow):
+        variable = "<variables><name>totalAmount</name><dataType>Number</dataType></variables>\n"
+        assign = "<assignmentItems><value><elementReference>{!totalAmout}</elementReference></value></assignmentItems>"
+        errors = validate(write_flow(variable + step("assignments", "Add_Total", extra=assign))).errors
+        assert codes(errors) == ["E001"]
+        assert "Did you mean 'totalAmount'?" in errors[0]["detail"]
+
+    def test_invalid_connector_target_reported_once(self, write_flow):
+        errors = validate(write_flow(step("assignments", "Set_Value", "Missing_Step"))).errors
+        assert codes(errors) == ["E002"]
+
+
+class TestFlowFile:
+    """Tests for loading namespaced and plain Flow files."""
+
+    @pytest.mark.parametrize("namespaced", [True, False])
+    def test_namespace_does_not_change_results(self, write_flow, namespaced):
+        path = write_flow(
+            COL_ACCOUNTS
+            + loop("Loop_Accounts", "Update_Account")
+            + step("recordUpdates", "Update_Account", "Loop_Accounts"),
+            namespaced=namespaced,
+        )
+        validator = validate(path)
+        assert validator.api_version == "60.0"
+        assert set(validator.elements) == {"Loop_Accounts", "Update_Account"}
+        assert codes(validator.errors) == ["E101"]
+
+    def test_malformed_file_raises_load_error(self, tmp_path):
+        path = tmp_path / "Broken.flow-meta.xml"
+        path.write_text("<Flow>")
+        with pytest.raises(FlowLoadError, match="Failed to parse"):
+            FlowValidator(str(path))
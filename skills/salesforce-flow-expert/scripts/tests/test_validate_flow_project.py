@@ -0,0 +1,156 @@
+"""
+Tests for validate_flow_project.py
+"""
+
+import json
+import xml.etree.ElementTree as ET
+
+import pytest
+import validate_flow_project
+from validate_flow import FlowValidator
+from validate_flow_project import FlowResultCache, discover_flows, generate_project_report, validate_project
+
+CLEAN = ""
+FAILING = """    <assignments>
+        <name>Set_Value</name>
+        <connector><targetReference>Missing_Step</targetReference></connector>
+    </assignments>
+"""
+FLOWS = "force-app/main/default/flows"
+
+
+@pytest.fixture
+def project(write_flow, tmp_path):
+    write_flow(CLEAN, f"{FLOWS}/Clean.flow-meta.xml")
+    write_flow(FAILING, f"{FLOWS}/Failing.flow-meta.xml")
+    broken = tmp_path / FLOWS / "Broken.flow-meta.xml"
+    broken.write_text("<Flow>")
+    return tmp_path
+
+
+def by_flow(records: list) -> dict:
+    return {record["flow"].rsplit("/", 1)[-1]: record for record in records}
+
+
+class TestDiscoverFlows:
+    """Tests for finding Flow files in a project."""
+
+    def test_without_sfdx_project_walks_everything_but_tool_dirs(self, write_flow, tmp_path):
+        write_flow(CLEAN, "src/flows/A.flow-meta.xml")
+        write_flow(CLEAN, "mdapi/flows/B.flow")
+        write_flow(CLEAN, "node_modules/pkg/C.flow-meta.xml")
+        write_flow(CLEAN, ".sfdx/tools/D.flow-meta.xml")
+        (tmp_path / "src/flows/A.flowDefinition-meta.xml").write_text("<x/>")
+
+        assert [p.relative_to(tmp_path).as_posix() for p in discover_flows(tmp_path)] == [
+            "mdapi/flows/B.flow",
+            "src/flows/A.flow-meta.xml",
+        ]
+
+    def test_sfdx_project_limits_search_to_package_directories(self, write_flow, tmp_path):
+        (tmp_path / "sfdx-project.json").write_text(json.dumps({"packageDirectories": [{"path": "force-app"}]}))
+        write_flow(CLEAN, f"{FLOWS}/A.flow-meta.xml")
+        write_flow(CLEAN, "scratch/B.flow-meta.xml")
+
+        assert [p.name for p in discover_flows(tmp_path)] == ["A.flow-meta.xml"]
+
+
+class TestValidateProject:
+    """Tests for project validation records."""
+
+    def test_records_pass_fail_and_load_errors(self, project):
+        records = by_flow(validate_project(project))
+
+        assert list(records) == ["Broken.flow-meta.xml", "Clean.flow-meta.xml", "Failing.flow-meta.xml"]
+        assert records["Clean.flow-meta.xml"]["passed"] is True
+        assert records["Failing.flow-meta.xml"]["errorCount"] == 1
+        broken = records["Broken.flow-meta.xml"]
+        assert broken["passed"] is False
+        assert broken["error"].startswith("Failed to parse XML file")
+        assert "errors" not in broken
+
+    def test_unexpected_validator_exception_is_an_error_record(self, project, monkeypatch):
+        original = FlowValidator.run_all_validations
+
+        def run_all_validations(self):
+            if self.flow_file.name == "Clean.flow-meta.xml":
+                raise KeyError("boom")
+            original(self)
+
+        monkeypatch.setattr(FlowValidator, "run_all_validations", run_all_validations)
+        records = by_flow(validate_project(project))
+
+        assert records["Clean.flow-meta.xml"]["error"] == "Validator failed: KeyError: 'boom'"
+        assert records["Failing.flow-meta.xml"]["errorCount"] == 1
+
+    def test_strict_fails_on_warnings(self, write_flow, tmp_path):
+        write_flow("<variables><name>Bad_Name</name><dataType>String</dataType></variables>\n", "W.flow-meta.xml")
+
+        assert validate_project(tmp_path)[0]["passed"] is True
+        assert validate_project(tmp_path, strict=True)[0]["passed"] is False
+
+
+class TestFlowResultCache:
+    """Tests for the file-digest result cache."""
+
+    def test_miss_then_hit(self, project, tmp_path):
+        cache_file = tmp_path / "cache.json"
+        cache = FlowResultCache(cache_file)
+        first = validate_project(project, cache=cache)
+        cache.save()
+        assert cache.hits == 0 and not any(r["cached"] for r in first)
+
+        cache = FlowResultCache(cache_file)
+        second = by_flow(validate_project(project, cache=cache))
+        # Load errors are not cached
+        assert cache.hits == 2
+        assert second["Clean.flow-meta.xml"]["cached"] is True
+        assert second["Clean.flow-meta.xml"]["seconds"] == 0.0
+        assert second["Broken.flow-meta.xml"]["cached"] is False
+        assert second["Failing.flow-meta.xml"]["errorCount"] == 1
+
+    def test_changed_file_is_revalidated(self, project, write_flow, tmp_path):
+        cache = FlowResultCache(tmp_path / "cache.json")
+        validate_project(project, cache=cache)
+        write_flow("<variables><name>fixedValue</name></variables>\n", f"{FLOWS}/Failing.flow-meta.xml")
+
+        records = by_flow(validate_project(project, cache=cache))
+
+        assert records["Failing.flow-meta.xml"]["cached"] is False
+        assert records["Failing.flow-meta.xml"]["passed"] is True
+
+    def test_validator_change_invalidates_cache(self, project, tmp_path, monkeypatch):
+        cache_file = tmp_path / "cache.json"
+        cache = FlowResultCache(cache_file)
+        validate_project(project, cache=cache)
+        cache.save()
+
+        monkeypatch.setattr(validate_flow_project, "validator_fingerprint", lambda: "edited-validator")
+        cache = FlowResultCache(cache_file)
+
+        assert cache.entries == {}
+        validate_project(project, cache=cache)
+        assert cache.hits == 0
+
+
+class TestProjectReport:
+    """Tests for consolidated JUnit and JSON reports."""
+
+    def test_junit_counts_failures_and_errors(self, project):
+        records = validate_project(project)
+        suites = ET.fromstring(generate_project_report(records, project, format="junit").split("\n", 1)[1])
+
+        assert (suites.get("tests"), suites.get("failures"), suites.get("errors")) == ("3", "1", "1")
+        cases = {case.get("name"): case for case in suites.iter("testcase")}
+        assert cases["Broken.flow-meta.xml"].find("error") is not None
+        assert "[E002]" in cases["Failing.flow-meta.xml"].find("failure").text
+        assert list(cases["Clean.flow-meta.xml"]) == []
+
+    def test_json_summary_excludes_cached_time(self, project, tmp_path):
+        cache = FlowResultCache(tmp_path / "cache.json")
+        validate_project(project, cache=cache)
+        records = validate_project(project, cache=cache)
+        report = json.loads(generate_project_report(records, project, format="json"))
+
+        assert (report["flowCount"], report["passed"], report["failed"], report["cacheHits"]) == (3, 1, 2, 2)
+        assert report["validationSeconds"] == records[0]["seconds"]  # only the uncached Broken flow
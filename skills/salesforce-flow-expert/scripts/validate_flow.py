@@ -10,18 +10,114 @@ Comprehensive pre-deployment validation for Salesforce Flows focusing on:
 
 Usage:
     python3 validate_flow.py <flow_file.flow-meta.xml> [--strict] [--format {text|json|markdown}] [--output <file>]
+    python3 validate_flow.py <project_dir> --project [--jobs N] [--format {text|json|junit}] [--output <file>]
 
 Example:
     python3 validate_flow.py MyFlow.flow-meta.xml --format markdown --output validation_report.md
+    python3 validate_flow.py force-app --project --jobs 8 --format junit --output flow-validation.xml
 """
 
 import argparse
 import json
+import os
 import re
 import sys
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, List, Set
+
+# Top-level resources: referenced by name in merge fields, but not steps in the connector graph.
+# Every other named top-level child (screens, loops, collectionProcessors, customErrors, ...) is an element.
+FLOW_RESOURCE_TYPES = ["variables", "formulas", "constants", "textTemplates", "stages"]
+NON_ELEMENT_TYPES = FLOW_RESOURCE_TYPES + ["processMetadataValues"]
+DML_ELEMENT_TYPES = ["recordCreates", "recordUpdates", "recordDeletes"]
+
+# Pattern: {!VariableName}
+VARIABLE_REFERENCE_PATTERN = re.compile(r"\{!([a-zA-Z_][a-zA-Z0-9_]*)\}")
+
+
+def strip_namespaces(root: ET.Element) -> None:
+    """Drop the metadata namespace from every tag so child lookups work on .flow-meta.xml files"""
+    for node in root.iter():
+        if isinstance(node.tag, str) and "}" in node.tag:
+            node.tag = node.tag.split("}", 1)[1]
+
+
+def find_references(elem: ET.Element) -> List[str]:
+    """``{!name}`` merge fields used anywhere inside an element, in document order"""
+    references = []
+    for node in elem.iter():
+        if node.text and "{!" in node.text:
+            references.extend(VARIABLE_REFERENCE_PATTERN.findall(node.text))
+        if node is not elem and node.tail and "{!" in node.tail:
+            references.extend(VARIABLE_REFERENCE_PATTERN.findall(node.tail))
+    return references
+
+
+class FlowLoadError(Exception):
+    """Flow file is missing or is not well-formed XML"""
+
+
+class FlowGraph:
+    """Connector graph and variable references of a Flow, built in one pass over its elements
+
+    ``successors`` maps each element to the targets of all of its connectors
+    (default, rule, fault and both loop connectors), ``predecessors`` is the
+    reverse map and ``references`` lists the ``{!variable}`` merge fields used
+    by each element in document order.
+    """
+
+    def __init__(self, elements: Dict[str, Dict]):
+        self.connectors: List[Dict] = []
+        self.successors: Dict[str, List[str]] = {}
+        self.predecessors: Dict[str, List[str]] = {}
+        self.references: Dict[str, List[str]] = {}
+        self.loop_entries: Dict[str, str] = {}
+
+        for elem_name, elem_data in elements.items():
+            elem = elem_data["element"]
+            targets = []
+            for node in elem.iter():
+                if node.tag == "targetReference" and node.text:
+                    targets.append(node.text)
+
+            self.references[elem_name] = find_references(elem)
+            self.successors[elem_name] = targets
+            for target in targets:
+                self.connectors.append({"from": elem_name, "to": target})
+                self.predecessors.setdefault(target, []).append(elem_name)
+
+            if elem_data["type"] == "loops":
+                entry = elem.find("nextValueConnector/targetReference")
+                if entry is not None and entry.text:
+                    self.loop_entries[elem_name] = entry.text
+
+    def loop_body(self, loop_name: str) -> Set[str]:
+        """Elements run once per iteration of a loop
+
+        These are the elements reachable from the loop's nextValueConnector that
+        lead back to the loop, along any path (decisions, nested loops, fault
+        connectors) that does not pass through the loop element itself.
+        """
+        entry = self.loop_entries.get(loop_name)
+        if not entry:
+            return set()
+        forward = self._reachable([entry], self.successors, loop_name)
+        backward = self._reachable(self.predecessors.get(loop_name, []), self.predecessors, loop_name)
+        return forward & backward
+
+    @staticmethod
+    def _reachable(starts: Iterable[str], adjacency: Dict[str, List[str]], barrier: str) -> Set[str]:
+        """Elements reachable from starts without passing through barrier"""
+        seen = set()
+        stack = [name for name in starts if name != barrier]
+        while stack:
+            name = stack.pop()
+            if name in seen:
+                continue
+            seen.add(name)
+            stack.extend(target for target in adjacency.get(name, []) if target != barrier and target not in seen)
+        return seen
 
 
 class FlowValidator:
@@ -43,6 +139,7 @@ class FlowValidator:
         # Parse Flow XML
         self.tree = self._load_flow_xml()
         self.root = self.tree.getroot()
+        strip_namespaces(self.root)
 
         # Extract Flow metadata
         self.api_version = self._get_text("apiVersion")
@@ -53,7 +150,9 @@ class FlowValidator:
         # Extract Flow components
         self.variables = self._extract_variables()
         self.elements = self._extract_elements()
-        self.connectors = self._extract_connectors()
+        self.resources = self._extract_resources()
+        self.graph = FlowGraph(self.elements)
+        self.connectors = self.graph.connectors
 
     def _load_flow_xml(self) -> ET.ElementTree:
         """Load and parse Flow XML file"""
@@ -61,23 +160,17 @@ class FlowValidator:
             tree = ET.parse(self.flow_file)
             return tree
         except ET.ParseError as e:
-            print(f"ERROR: Failed to parse XML file: {e}")
-            sys.exit(1)
-        except FileNotFoundError:
-            print(f"ERROR: File not found: {self.flow_file}")
-            sys.exit(1)
+            raise FlowLoadError(f"Failed to parse XML file: {e}") from e
+        except FileNotFoundError as e:
+            raise FlowLoadError(f"File not found: {self.flow_file}") from e
 
     def _get_text(self, tag: str, default: str = "") -> str:
         """Get text from XML element"""
-        ns = {"sf": "http://soap.sforce.com/2006/04/metadata"}
-        elem = self.root.find(f"sf:{tag}", ns) if "soap.sforce.com" in str(self.root.tag) else self.root.find(tag)
+        elem = self.root.find(tag)
         return elem.text if elem is not None and elem.text else default
 
     def _find_all(self, tag: str) -> List[ET.Element]:
         """Find all elements with given tag"""
-        ns = {"sf": "http://soap.sforce.com/2006/04/metadata"}
-        if "soap.sforce.com" in str(self.root.tag):
-            return self.root.findall(f"sf:{tag}", ns)
         return self.root.findall(tag)
 
     def _extract_variables(self) -> Dict[str, Dict]:
@@ -105,79 +198,61 @@ class FlowValidator:
         return elem.text if elem is not None and elem.text else default
 
     def _extract_elements(self) -> Dict[str, Dict]:
-        """Extract all Flow elements (screens, assignments, decisions, etc.)"""
+        """Extract all Flow elements: every named top-level child that is not a resource"""
         elements = {}
 
-        # Common element types in Flows
-        element_types = [
-            "screens",
-            "assignments",
-            "decisions",
-            "recordCreates",
-            "recordUpdates",
-            "recordDeletes",
-            "recordLookups",
-            "loops",
-            "subflows",
-            "actionCalls",
-            "waits",
-            "choices",
-            "dynamicChoiceSets",
-        ]
-
-        for elem_type in element_types:
-            for elem in self._find_all(elem_type):
-                name_elem = elem.find("name")
-                if name_elem is None or not name_elem.text:
-                    continue
+        for elem in self.root:
+            if elem.tag in NON_ELEMENT_TYPES:
+                continue
+            name_elem = elem.find("name")
+            if name_elem is None or not name_elem.text:
+                continue
 
-                name = name_elem.text
-                elements[name] = {"name": name, "type": elem_type, "element": elem}
+            name = name_elem.text
+            elements[name] = {"name": name, "type": elem.tag, "element": elem}
 
         return elements
 
-    def _extract_connectors(self) -> List[Dict]:
-        """Extract all connectors from elements"""
-        connectors = []
+    def _extract_resources(self) -> Dict[str, Dict]:
+        """Extract formulas, constants, text templates, stages and screen fields referenced by merge fields"""
+        resources = {}
 
-        for elem_name, elem_data in self.elements.items():
-            elem = elem_data["element"]
-
-            # Find connector or targetReference
-            for connector in elem.findall(".//connector"):
-                target_elem = connector.find("targetReference")
-                if target_elem is not None and target_elem.text:
-                    connectors.append({"from": elem_name, "to": target_elem.text, "source_element": elem})
+        for resource_type in FLOW_RESOURCE_TYPES:
+            if resource_type == "variables":
+                continue
+            for elem in self._find_all(resource_type):
+                name = self._get_elem_text(elem, "name")
+                if name:
+                    resources[name] = {"name": name, "type": resource_type, "element": elem}
 
-            # Also check direct targetReference (in choices, etc.)
-            for target_ref in elem.findall(".//targetReference"):
-                if target_ref.text and target_ref.text != "":
-                    connectors.append({"from": elem_name, "to": target_ref.text, "source_element": elem})
+        for screen in self._find_all("screens"):
+            for field in screen.iter("fields"):
+                name = self._get_elem_text(field, "name")
+                if name:
+                    resources.setdefault(name, {"name": name, "type": "screenFields", "element": field})
 
-        return connectors
+        return resources
 
     def validate_references(self):
         """Validate variable and element references (Priority 1)"""
         # Check 1: Undeclared variables in assignments, formulas, etc.
-        for elem_name, elem_data in self.elements.items():
-            elem = elem_data["element"]
-
-            # Search for variable references in element
-            elem_str = ET.tostring(elem, encoding="unicode")
-
-            # Pattern: {!VariableName}
-            var_pattern = r"\{!([a-zA-Z_][a-zA-Z0-9_]*)\}"
-            matches = re.findall(var_pattern, elem_str)
-
-            for var_name in matches:
+        suggestions_by_name = {}
+        references = dict(self.graph.references)
+        for name, resource in self.resources.items():
+            if resource["type"] in ("formulas", "textTemplates"):
+                references.setdefault(name, find_references(resource["element"]))
+        for elem_name, var_names in references.items():
+            for var_name in var_names:
                 # Skip system variables and resources
                 if var_name.startswith("$") or var_name.startswith("Global."):
                     continue
 
                 # Check if variable is declared
-                if var_name not in self.variables and var_name not in self.elements:
+                if var_name not in self.variables and var_name not in self.elements and var_name not in self.resources:
                     # Suggest similar names (simple Levenshtein)
-                    suggestions = self._find_similar_names(var_name, list(self.variables.keys()))
+                    if var_name not in suggestions_by_name:
+                        suggestions_by_name[var_name] = self._find_similar_names(var_name, list(self.variables.keys()))
+                    suggestions = suggestions_by_name[var_name]
                     suggestion_text = f" → Did you mean '{suggestions[0]}'?" if suggestions else ""
 
                     self.errors.append(
@@ -192,6 +267,7 @@ class FlowValidator:
                     )
 
         # Check 2: Invalid element references in connectors
+        available = ", ".join(list(self.elements.keys())[:5])
         for connector in self.connectors:
             target = connector["to"]
 
@@ -200,7 +276,6 @@ class FlowValidator:
                 continue
 
             if target not in self.elements:
-                available = ", ".join(list(self.elements.keys())[:5])
                 self.errors.append(
                     {
                         "code": "E002",
@@ -267,51 +342,43 @@ class FlowValidator:
 
     def validate_governor_limits(self):
         """Validate governor limit patterns (DML/SOQL in loops)"""
-        # Check for loops
-        loops = {name: data for name, data in self.elements.items() if data["type"] == "loops"}
-
-        for loop_name, loop_data in loops.items():
-            loop_elem = loop_data["element"]
-
-            # Check for DML operations inside loop (ERROR)
-            dml_types = ["recordCreates", "recordUpdates", "recordDeletes"]
-            for dml_type in dml_types:
-                # Check if any DML element is referenced within the loop
-                # (This is simplified - real implementation would trace connectors)
-                loop_str = ET.tostring(loop_elem, encoding="unicode")
-
-                # Check for nested elements (very simplified)
-                for elem_name, elem_data in self.elements.items():
-                    if elem_data["type"] in dml_types:
-                        # Check if this DML is inside the loop by checking connectors
-                        for connector in self.connectors:
-                            if connector["from"] == loop_name and connector["to"] == elem_name:
-                                self.errors.append(
-                                    {
-                                        "code": "E101",
-                                        "type": "DML in Loop",
-                                        "message": f"DML in Loop: {elem_data['type']} element '{elem_name}' inside loop '{loop_name}'",
-                                        "detail": " → Causes governor limit error with bulk data (limit: 150 DML statements)",
-                                        "fix": "Move DML outside loop: collect records in loop, perform batch update after",
-                                        "element": loop_name,
-                                    }
-                                )
-
-            # Check for SOQL (Get Records) inside loop (WARNING)
+        # Check for DML/SOQL anywhere in a loop body, including behind decisions and nested loops
+        loops = [name for name, data in self.elements.items() if data["type"] == "loops"]
+
+        for loop_name in loops:
+            body = self.graph.loop_body(loop_name)
+            if not body:
+                continue
+
             for elem_name, elem_data in self.elements.items():
-                if elem_data["type"] == "recordLookups":
-                    for connector in self.connectors:
-                        if connector["from"] == loop_name and connector["to"] == elem_name:
-                            self.warnings.append(
-                                {
-                                    "code": "W001",
-                                    "type": "SOQL in Loop",
-                                    "message": f"SOQL in Loop: Get Records element '{elem_name}' inside loop '{loop_name}'",
-                                    "detail": " → Risk: May exceed 100 SOQL query limit",
-                                    "fix": "Move Get Records before loop and filter in memory",
-                                    "element": loop_name,
-                                }
-                            )
+                if elem_name not in body:
+                    continue
+
+                # DML operations inside loop (ERROR)
+                if elem_data["type"] in DML_ELEMENT_TYPES:
+                    self.errors.append(
+                        {
+                            "code": "E101",
+                            "type": "DML in Loop",
+                            "message": f"DML in Loop: {elem_data['type']} element '{elem_name}' inside loop '{loop_name}'",
+                            "detail": " → Causes governor limit error with bulk data (limit: 150 DML statements)",
+                            "fix": "Move DML outside loop: collect records in loop, perform batch update after",
+                            "element": loop_name,
+                        }
+                    )
+
+                # SOQL (Get Records) inside loop (WARNING)
+                elif elem_data["type"] == "recordLookups":
+                    self.warnings.append(
+                        {
+                            "code": "W001",
+                            "type": "SOQL in Loop",
+                            "message": f"SOQL in Loop: Get Records element '{elem_name}' inside loop '{loop_name}'",
+                            "detail": " → Risk: May exceed 100 SOQL query limit",
+                            "fix": "Move Get Records before loop and filter in memory",
+                            "element": loop_name,
+                        }
+                    )
 
         # Check total SOQL count
         soql_count = len([e for e in self.elements.values() if e["type"] == "recordLookups"])
@@ -328,9 +395,7 @@ class FlowValidator:
             )
 
         # Check total DML count
-        dml_count = len(
-            [e for e in self.elements.values() if e["type"] in ["recordCreates", "recordUpdates", "recordDeletes"]]
-        )
+        dml_count = len([e for e in self.elements.values() if e["type"] in DML_ELEMENT_TYPES])
         if dml_count > 120:
             self.warnings.append(
                 {
@@ -591,20 +656,51 @@ Examples:
   python3 validate_flow.py MyFlow.flow-meta.xml
   python3 validate_flow.py MyFlow.flow-meta.xml --format markdown --output report.md
   python3 validate_flow.py MyFlow.flow-meta.xml --strict
+
+  # Validate every Flow in an sfdx project (cached by file hash, 8 worker processes)
+  python3 validate_flow.py . --project --jobs 8 --format junit --output flow-validation.xml
         """,
     )
 
-    parser.add_argument("flow_file", help="Path to Flow XML file (.flow or .flow-meta.xml)")
+    parser.add_argument(
+        "flow_file", help="Path to Flow XML file (.flow or .flow-meta.xml), or project directory with --project"
+    )
     parser.add_argument("--strict", action="store_true", help="Treat warnings as errors")
     parser.add_argument(
-        "--format", choices=["text", "json", "markdown"], default="text", help="Output format (default: text)"
+        "--format",
+        choices=["text", "json", "markdown", "junit"],
+        default="text",
+        help="Output format (default: text; junit only with --project, markdown only for a single Flow)",
     )
     parser.add_argument("--output", "-o", help="Output file (default: stdout)")
+    parser.add_argument("--project", action="store_true", help="Validate every Flow under a project directory")
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=os.cpu_count() or 1, help="Worker processes for --project (default: CPUs)"
+    )
+    parser.add_argument(
+        "--cache",
+        help="Result cache file for --project (default: $FLOW_VALIDATION_CACHE or "
+        "~/.cache/claude-skills/flow-validation.json)",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Revalidate every Flow in --project mode")
 
     args = parser.parse_args()
 
+    if args.project:
+        if args.format == "markdown":
+            parser.error("--format markdown is not supported with --project")
+        from validate_flow_project import run_project
+
+        sys.exit(run_project(args))
+    if args.format == "junit":
+        parser.error("--format junit requires --project")
+
     # Validate Flow
-    validator = FlowValidator(args.flow_file, strict=args.strict)
+    try:
+        validator = FlowValidator(args.flow_file, strict=args.strict)
+    except FlowLoadError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
     validator.run_all_validations()
 
     # Generate report
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+Project mode for validate_flow.py
+
+Discovers every Flow (.flow-meta.xml in source format, .flow in metadata API
+format) under an sfdx project, validates them in a process pool and writes one
+consolidated report (text, JSON or JUnit XML) with per-flow validation time.
+
+Results are cached by the SHA-256 of each Flow file, so CI runs only revalidate
+Flows that changed. The cache is tied to the validator source: editing
+validate_flow.py invalidates every entry.
+
+Usage:
+    python3 validate_flow.py <project_dir> --project [--jobs N] [--format {text|json|junit}] [--output <file>]
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from validate_flow import FlowLoadError, FlowValidator
+
+FLOW_SUFFIXES = (".flow-meta.xml", ".flow")
+SKIP_DIRS = {".git", ".sf", ".sfdx", ".localdevserver", "node_modules"}
+BATCH_CHUNK_SIZE = 16  # flows per worker task
+CACHE_FORMAT_VERSION = 1
+CACHE_MAX_ENTRIES = 20000
+
+
+def default_cache_path() -> Path:
+    """Cache location: $FLOW_VALIDATION_CACHE, else the user cache directory."""
+    if os.environ.get("FLOW_VALIDATION_CACHE"):
+        return Path(os.environ["FLOW_VALIDATION_CACHE"])
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "claude-skills" / "flow-validation.json"
+
+
+def validator_fingerprint() -> str:
+    """Hash of the validator source, so cached results expire when the rules change."""
+    source = Path(__file__).with_name("validate_flow.py").read_bytes()
+    return hashlib.sha256(source).hexdigest()[:16]
+
+
+def discover_flows(root: Path) -> List[Path]:
+    """Flow files under root, sorted.
+
+    If root holds an sfdx-project.json, only its packageDirectories are
+    searched; tool directories (.sf, .sfdx, node_modules, ...) are skipped.
+    """
+    search_dirs = [root]
+    project_file = root / "sfdx-project.json"
+    if project_file.is_file():
+        try:
+            packages = json.loads(project_file.read_text(encoding="utf-8")).get("packageDirectories", [])
+            package_dirs = [root / package["path"] for package in packages if package.get("path")]
+        except (OSError, ValueError, TypeError, KeyError):
+            package_dirs = []
+        search_dirs = [path for path in package_dirs if path.is_dir()] or [root]
+
+    flows = set()
+    for search_dir in search_dirs:
+        for dirpath, dirnames, filenames in os.walk(search_dir):
+            dirnames[:] = [name for name in dirnames if name not in SKIP_DIRS]
+            for filename in filenames:
+                if filename.endswith(FLOW_SUFFIXES):
+                    flows.add(Path(dirpath) / filename)
+    return sorted(flows)
+
+
+class FlowResultCache:
+    """JSON file of validation results keyed by Flow file digest.
+
+    Entries record when they were last used; on save only the
+    CACHE_MAX_ENTRIES most recently used are kept. A cache written by a
+    different validator version is discarded on load.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else default_cache_path()
+        self.validator = validator_fingerprint()
+        self.entries: Dict[str, Dict] = {}
+        self.hits = 0
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == CACHE_FORMAT_VERSION and data.get("validator") == self.validator:
+                self.entries = data["entries"]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            self.entries = {}
+
+    def get(self, digest: str) -> Optional[Dict]:
+        """Cached result for a file digest, or None on a miss."""
+        entry = self.entries.get(digest)
+        if entry is None:
+            return None
+        entry["used"] = time.time()
+        self.hits += 1
+        return entry["result"]
+
+    def put(self, digest: str, result: Dict) -> None:
+        """Store a result for a file digest."""
+        self.entries[digest] = {"used": time.time(), "result": result}
+
+    def save(self) -> None:
+        """Write the cache atomically, keeping the most recently used entries."""
+        if len(self.entries) > CACHE_MAX_ENTRIES:
+            recent = sorted(self.entries.items(), key=lambda item: item[1]["used"], reverse=True)
+            self.entries = dict(recent[:CACHE_MAX_ENTRIES])
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": CACHE_FORMAT_VERSION, "validator": self.validator, "entries": self.entries},
+                    f,
+                    ensure_ascii=False,
+                )
+            os.replace(tmp, self.path)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+
+
+def validate_flow_file(path: Path) -> Dict:
+    """Validate one Flow; returns its apiVersion, errors, warnings and seconds, or a load error."""
+    start = time.perf_counter()
+    try:
+        validator = FlowValidator(str(path))
+        validator.run_all_validations()
+    except (FlowLoadError, OSError) as e:
+        return {"error": str(e), "seconds": time.perf_counter() - start}
+    except Exception as e:
+        # One malformed Flow must not abort a project run
+        return {"error": f"Validator failed: {type(e).__name__}: {e}", "seconds": time.perf_counter() - start}
+    return {
+        "apiVersion": validator.api_version,
+        "errors": validator.errors,
+        "warnings": validator.warnings,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def _validate_chunk(paths: List[Path]) -> List[Dict]:
+    """Validate a list of Flow files. Runs in worker processes."""
+    return [validate_flow_file(path) for path in paths]
+
+
+def validate_project(
+    root: Path, jobs: int = 1, cache: Optional[FlowResultCache] = None, strict: bool = False
+) -> List[Dict]:
+    """Validate every Flow under root; returns one record per Flow in path order.
+
+    Flows whose digest is in the cache are not revalidated. The rest are sent
+    to ``jobs`` worker processes in chunks of BATCH_CHUNK_SIZE. Each record has
+    the Flow path relative to root, pass/fail (warnings fail in strict mode),
+    error/warning lists, validation seconds in this run (0 for cached Flows)
+    and whether it came from the cache.
+    """
+    paths = discover_flows(root)
+    results: List[Optional[Dict]] = [None] * len(paths)
+    cached = [False] * len(paths)
+    digests = []
+    misses = []
+    for i, path in enumerate(paths):
+        try:
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        except OSError as e:
+            digests.append(None)
+            results[i] = {"error": str(e), "seconds": 0.0}
+            continue
+        digests.append(digest)
+        result = cache.get(digest) if cache is not None else None
+        if result is None:
+            misses.append(i)
+        else:
+            results[i] = result
+            cached[i] = True
+
+    chunks = [misses[i : i + BATCH_CHUNK_SIZE] for i in range(0, len(misses), BATCH_CHUNK_SIZE)]
+    if jobs <= 1 or len(chunks) <= 1:
+        chunk_results = [_validate_chunk([paths[i] for i in chunk]) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(chunks))) as pool:
+            chunk_results = list(pool.map(_validate_chunk, [[paths[i] for i in chunk] for chunk in chunks]))
+    for chunk, chunk_result in zip(chunks, chunk_results):
+        for i, result in zip(chunk, chunk_result):
+            results[i] = result
+            if cache is not None and "error" not in result:
+                cache.put(digests[i], result)
+
+    records = []
+    for path, result, from_cache in zip(paths, results, cached):
+        record = {"flow": path.relative_to(root).as_posix()}
+        if "error" in result:
+            record.update({"passed": False, "error": result["error"]})
+        else:
+            errors, warnings = result["errors"], result["warnings"]
+            record.update(
+                {
+                    "apiVersion": result["apiVersion"],
+                    "passed": not errors and not (strict and warnings),
+                    "errorCount": len(errors),
+                    "warningCount": len(warnings),
+                    "errors": errors,
+                    "warnings": warnings,
+                }
+            )
+        # Cached Flows took no validation time in this run
+        record.update({"seconds": 0.0 if from_cache else round(result["seconds"], 6), "cached": from_cache})
+        records.append(record)
+    return records
+
+
+def summarize(records: List[Dict]) -> Dict:
+    """Totals over project records."""
+    return {
+        "flowCount": len(records),
+        "passed": sum(1 for r in records if r["passed"]),
+        "failed": sum(1 for r in records if not r["passed"]),
+        "loadErrors": sum(1 for r in records if "error" in r),
+        "errorCount": sum(r.get("errorCount", 0) for r in records),
+        "warningCount": sum(r.get("warningCount", 0) for r in records),
+        "cacheHits": sum(1 for r in records if r["cached"]),
+        "validationSeconds": round(sum(r["seconds"] for r in records), 6),
+    }
+
+
+def generate_project_report(
+    records: List[Dict], root: Path, format: str = "text", strict: bool = False, elapsed: float = 0.0
+) -> str:
+    """Consolidated report for a project run (text, json or junit)."""
+    summary = summarize(records)
+
+    if format == "json":
+        return json.dumps(
+            {"project": str(root), "strict": strict, "elapsedSeconds": round(elapsed, 3), **summary, "flows": records},
+            indent=2,
+        )
+
+    if format == "junit":
+        suites = ET.Element(
+            "testsuites",
+            name="Flow validation",
+            tests=str(summary["flowCount"]),
+            failures=str(summary["failed"] - summary["loadErrors"]),
+            errors=str(summary["loadErrors"]),
+            time=f"{elapsed:.3f}",
+        )
+        suite = ET.SubElement(
+            suites,
+            "testsuite",
+            name=root.resolve().name or str(root),
+            tests=str(summary["flowCount"]),
+            failures=str(summary["failed"] - summary["loadErrors"]),
+            errors=str(summary["loadErrors"]),
+            skipped="0",
+            time=f"{summary['validationSeconds']:.3f}",
+        )
+        for record in records:
+            classname, _, name = record["flow"].rpartition("/")
+            case = ET.SubElement(
+                suite,
+                "testcase",
+                classname=classname.replace("/", ".") or "flows",
+                name=name,
+                time=f"{record['seconds']:.6f}",
+            )
+            if "error" in record:
+                ET.SubElement(case, "error", message=record["error"], type="FlowLoadError").text = record["error"]
+                continue
+            issues = record["errors"] + (record["warnings"] if strict else [])
+            if not record["passed"]:
+                failure = ET.SubElement(
+                    case,
+                    "failure",
+                    message=f"{record['errorCount']} errors, {record['warningCount']} warnings",
+                    type="FlowValidationError",
+                )
+                failure.text = "\n".join(
+                    f"[{issue['code']}] {issue['message']}{issue.get('detail', '')}" for issue in issues
+                )
+            if record["warnings"] and not strict:
+                ET.SubElement(case, "system-out").text = "\n".join(
+                    f"[{warning['code']}] {warning['message']}" for warning in record["warnings"]
+                )
+            if record["cached"]:
+                ET.SubElement(ET.SubElement(case, "properties"), "property", name="cached", value="true")
+        ET.indent(suites)
+        return '<?xml version="1.0" encoding="UTF-8"?>\n' + ET.tostring(suites, encoding="unicode")
+
+    # text format
+    lines = []
+    lines.append("=" * 80)
+    lines.append("FLOW PROJECT VALIDATION REPORT")
+    lines.append("=" * 80)
+    lines.append(f"Project: {root}")
+    lines.append(
+        f"Flows: {summary['flowCount']} ({summary['passed']} passed, {summary['failed']} failed, "
+        f"{summary['cacheHits']} cached)"
+    )
+    lines.append("")
+    for record in records:
+        status = "✅" if record["passed"] else "❌"
+        cached = ", cached" if record["cached"] else ""
+        if "error" in record:
+            lines.append(f"{status} {record['flow']} (load error{cached})")
+            lines.append(f"       {record['error']}")
+            continue
+        lines.append(
+            f"{status} {record['flow']} ({record['errorCount']} errors, {record['warningCount']} warnings, "
+            f"{record['seconds'] * 1000:.1f} ms{cached})"
+        )
+        for issue in record["errors"] + (record["warnings"] if strict else []):
+            lines.append(f"       [{issue['code']}] {issue['message']}")
+    lines.append("=" * 80)
+    return "\n".join(lines)
+
+
+def run_project(args) -> int:
+    """Project CLI entry point for validate_flow.py --project; exit code 1 if any Flow failed."""
+    root = Path(args.flow_file)
+    if not root.is_dir():
+        print(f"ERROR: Project directory not found: {root}")
+        return 1
+
+    cache = None if args.no_cache else FlowResultCache(args.cache)
+    start = time.perf_counter()
+    records = validate_project(root, jobs=args.jobs, cache=cache, strict=args.strict)
+    elapsed = time.perf_counter() - start
+    if cache is not None:
+        try:
+            cache.save()
+        except OSError as e:
+            print(f"Warning: could not write result cache ({e})", file=sys.stderr)
+
+    report = generate_project_report(records, root, format=args.format, strict=args.strict, elapsed=elapsed)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report)
+        print(f"✅ Validation report written to: {args.output}", file=sys.stderr)
+    else:
+        print(report)
+
+    summary = summarize(records)
+    print(
+        f"Validated {summary['flowCount']} flows ({summary['cacheHits']} cached) in {elapsed:.1f}s "
+        f"with {args.jobs} jobs: {summary['passed']} passed, {summary['failed']} failed",
+        file=sys.stderr,
+    )
+    return 1 if summary["failed"] else 0
@@ -10,6 +10,7 @@ Usage:
     python soxi_analyzer.py input.wav -o report.md
     python soxi_analyzer.py input.wav -o report.md -s  # include statistics
     python soxi_analyzer.py *.wav -o batch_report.md   # batch analysis
+    python soxi_analyzer.py *.wav -s -j 8              # analyze 8 files in parallel
 
 Requirements:
     - sox installed (brew install sox / apt install sox)
@@ -18,8 +19,11 @@ Requirements:
 
 import argparse
 import json
+import os
+import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -109,37 +113,15 @@ class AudioAnalyzer:
             raise RuntimeError("sox/soxi not found. Please install SoX.")
 
     def get_file_info(self) -> AudioInfo:
-        """Get basic file information using soxi."""
+        """Get basic file information from a single soxi call (header only, no decoding)."""
         if self._info is not None:
             return self._info
 
-        info = AudioInfo(file_path=str(self.file_path))
-
-        # Get individual properties
-        soxi_flags = {
-            "-t": "file_type",
-            "-r": "sample_rate",
-            "-c": "channels",
-            "-b": "bit_depth",
-            "-e": "encoding",
-            "-D": "duration_seconds",
-            "-d": "duration_formatted",
-            "-s": "num_samples",
-        }
-
-        for flag, attr in soxi_flags.items():
-            try:
-                output = self._run_command(["soxi", flag, str(self.file_path)])
-                value = output.strip()
-                if value:
-                    if attr in ("sample_rate", "channels", "bit_depth", "num_samples"):
-                        setattr(info, attr, int(value))
-                    elif attr == "duration_seconds":
-                        setattr(info, attr, float(value))
-                    else:
-                        setattr(info, attr, value)
-            except (ValueError, RuntimeError):
-                pass
+        info = AudioInfo(file_path=str(self.file_path), file_type=self.file_path.suffix.lstrip(".").lower())
+        try:
+            _parse_soxi_output(self._run_command(["soxi", str(self.file_path)]), info)
+        except RuntimeError:
+            pass
 
         # Get file size
         info.file_size_bytes = self.file_path.stat().st_size
@@ -152,87 +134,19 @@ class AudioAnalyzer:
         return info
 
     def get_statistics(self) -> AudioStatistics:
-        """Get audio statistics using sox stat."""
+        """Get audio statistics in one decoding pass.
+
+        The ``stat`` and ``stats`` effects pass audio through unchanged, so one
+        ``sox FILE -n stat stats`` run reports both sets of metrics.
+        """
         if self._stats is not None:
             return self._stats
 
         stats = AudioStatistics()
-
-        # Run sox stat
         try:
-            output = self._run_command(["sox", str(self.file_path), "-n", "stat"])
-
-            # Parse stat output
-            for line in output.split("\n"):
-                line = line.strip()
-                if ":" in line:
-                    key, value = line.split(":", 1)
-                    key = key.strip().lower()
-                    value = value.strip()
-
-                    try:
-                        if "dc offset" in key:
-                            stats.dc_offset = float(value)
-                        elif "min level" in key or "minimum amplitude" in key:
-                            stats.min_amplitude = float(value)
-                        elif "max level" in key or "maximum amplitude" in key:
-                            stats.max_amplitude = float(value)
-                        elif "midline amplitude" in key:
-                            stats.midline_amplitude = float(value)
-                        elif "mean norm" in key:
-                            stats.mean_norm = float(value)
-                        elif "mean amplitude" in key:
-                            stats.mean_amplitude = float(value)
-                        elif "rms amplitude" in key:
-                            stats.rms_amplitude = float(value)
-                        elif "maximum delta" in key:
-                            stats.max_delta = float(value)
-                        elif "minimum delta" in key:
-                            stats.min_delta = float(value)
-                        elif "mean delta" in key:
-                            stats.mean_delta = float(value)
-                        elif "rms delta" in key:
-                            stats.rms_delta = float(value)
-                        elif "rough frequency" in key:
-                            stats.rough_frequency = float(value)
-                        elif "volume adjustment" in key:
-                            stats.volume_adjustment = float(value)
-                    except ValueError:
-                        pass
-        except RuntimeError:
-            pass
-
-        # Run sox stats for additional metrics
-        try:
-            output = self._run_command(["sox", str(self.file_path), "-n", "stats"])
-
-            for line in output.split("\n"):
-                line = line.strip()
-                if "Pk lev dB" in line:
-                    try:
-                        stats.peak_level_db = float(line.split()[-1])
-                    except (ValueError, IndexError):
-                        pass
-                elif "RMS lev dB" in line:
-                    try:
-                        stats.rms_level_db = float(line.split()[-1])
-                    except (ValueError, IndexError):
-                        pass
-                elif "Crest factor" in line:
-                    try:
-                        stats.crest_factor = float(line.split()[-1])
-                    except (ValueError, IndexError):
-                        pass
-                elif "Flat factor" in line:
-                    try:
-                        stats.flat_factor = float(line.split()[-1])
-                    except (ValueError, IndexError):
-                        pass
-                elif "Pk count" in line:
-                    try:
-                        stats.pk_count = int(line.split()[-1])
-                    except (ValueError, IndexError):
-                        pass
+            output = self._run_command(["sox", str(self.file_path), "-n", "stat", "stats"])
+            _parse_stat_output(output, stats)
+            _parse_stats_output(output, stats)
         except RuntimeError:
             pass
 
@@ -323,6 +237,129 @@ class AudioAnalyzer:
         return issues
 
 
+# sox stat: "Key:   value" lines (keys padded with runs of spaces, e.g. "Mean    norm")
+_STAT_FIELDS = {
+    "maximum amplitude": "max_amplitude",
+    "minimum amplitude": "min_amplitude",
+    "midline amplitude": "midline_amplitude",
+    "mean norm": "mean_norm",
+    "mean amplitude": "mean_amplitude",
+    "rms amplitude": "rms_amplitude",
+    "maximum delta": "max_delta",
+    "minimum delta": "min_delta",
+    "mean delta": "mean_delta",
+    "rms delta": "rms_delta",
+    "rough frequency": "rough_frequency",
+    "volume adjustment": "volume_adjustment",
+}
+
+
+def _sox_count(token: str) -> int:
+    """Parse a sox count, which is abbreviated once large (``512``, ``1.51k``, ``8.64M``)."""
+    multiplier = {"k": 1_000, "M": 1_000_000, "G": 1_000_000_000}.get(token[-1:])
+    if multiplier:
+        return round(float(token[:-1]) * multiplier)
+    return int(token)
+
+
+# sox stats: "Label   Overall [Ch1 Ch2 ...]" lines without a colon
+_STATS_FIELDS = {
+    "dc offset": ("dc_offset", float),
+    "min level": ("min_amplitude", float),
+    "max level": ("max_amplitude", float),
+    "pk lev db": ("peak_level_db", float),
+    "rms lev db": ("rms_level_db", float),
+    "crest factor": ("crest_factor", float),
+    "flat factor": ("flat_factor", float),
+    "pk count": ("pk_count", _sox_count),
+}
+
+_STATS_LINE = re.compile(r"^([A-Za-z][A-Za-z ]*?)\s{2,}(\S.*)$")
+
+
+def _parse_soxi_output(output: str, info: AudioInfo) -> None:
+    """Fill AudioInfo from the default ``soxi FILE`` report."""
+    for line in output.splitlines():
+        if ":" not in line:
+            continue
+        key, value = (part.strip() for part in line.split(":", 1))
+        key = key.lower()
+        try:
+            if key == "channels":
+                info.channels = int(value)
+            elif key == "sample rate":
+                info.sample_rate = int(float(value))
+            elif key == "precision":
+                info.bit_depth = int(value.split("-")[0])
+            elif key == "duration":
+                # "00:00:10.00 = 441000 samples ~ 750 CDDA sectors"
+                formatted, _, rest = value.partition("=")
+                info.duration_formatted = formatted.strip()
+                info.num_samples = int(rest.split()[0])
+            elif key == "sample encoding":
+                info.encoding = re.sub(r"^\d+-bit\s+", "", value)
+        except (ValueError, IndexError):
+            pass
+    if info.sample_rate and info.num_samples:
+        info.duration_seconds = info.num_samples / info.sample_rate
+
+
+def _parse_stat_output(output: str, stats: AudioStatistics) -> None:
+    """Fill AudioStatistics from ``stat`` effect lines."""
+    for line in output.splitlines():
+        if ":" not in line:
+            continue
+        key, value = line.split(":", 1)
+        attr = _STAT_FIELDS.get(" ".join(key.split()).lower())
+        if attr:
+            try:
+                setattr(stats, attr, float(value.strip()))
+            except ValueError:
+                pass
+
+
+def _parse_stats_output(output: str, stats: AudioStatistics) -> None:
+    """Fill AudioStatistics from ``stats`` effect lines.
+
+    Uses the Overall column; where sox prints ``-`` there (crest factor of a
+    multi-channel file) the largest per-channel value is used instead.
+    """
+    for line in output.splitlines():
+        match = _STATS_LINE.match(line.strip())
+        if not match:
+            continue
+        field = _STATS_FIELDS.get(match.group(1).lower())
+        if not field:
+            continue
+        attr, cast = field
+        values = []
+        for token in match.group(2).split():
+            try:
+                values.append(cast(token))
+            except ValueError:
+                values.append(None)
+        if values and values[0] is not None:
+            setattr(stats, attr, values[0])
+        elif any(v is not None for v in values):
+            setattr(stats, attr, max(v for v in values if v is not None))
+
+
+def prefetch(analyzers: List["AudioAnalyzer"], include_stats: bool = True, jobs: int = 1) -> None:
+    """Run soxi/sox for many files concurrently so report generation only reads cached results."""
+
+    def load(analyzer: AudioAnalyzer) -> None:
+        analyzer.get_file_info()
+        if include_stats:
+            analyzer.get_statistics()
+
+    if jobs <= 1 or len(analyzers) <= 1:
+        for analyzer in analyzers:
+            load(analyzer)
+        return
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        list(pool.map(load, analyzers))
+
+
 class ProcessingRecommender:
     """Provides processing recommendations based on audio analysis."""
 
@@ -437,8 +474,10 @@ class ProcessingRecommender:
         return recommendations
 
 
-def generate_report(analyzers: List[AudioAnalyzer], include_stats: bool = True) -> str:
-    """Generate markdown report for analyzed files."""
+def generate_report(analyzers: List[AudioAnalyzer], include_stats: bool = True, jobs: int = 1) -> str:
+    """Generate markdown report for analyzed files; ``jobs`` files are analyzed in parallel."""
+    # Quality checks always need statistics, so fetch them regardless of include_stats
+    prefetch(analyzers, include_stats=True, jobs=jobs)
     lines = [
         "# Audio Analysis Report",
         "",
@@ -566,6 +605,7 @@ Examples:
   %(prog)s input.wav -o report.md       # Save report to file
   %(prog)s input.wav -s                 # Include detailed statistics
   %(prog)s *.wav -o batch_report.md     # Analyze multiple files
+  %(prog)s *.wav -j 8                   # Analyze 8 files in parallel
   %(prog)s input.wav --json             # Output as JSON
 """,
     )
@@ -575,6 +615,9 @@ Examples:
     parser.add_argument("-s", "--stats", action="store_true", help="Include detailed audio statistics")
     parser.add_argument("--json", action="store_true", help="Output as JSON instead of Markdown")
     parser.add_argument("-q", "--quiet", action="store_true", help="Suppress progress messages")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count() or 1, help="Files analyzed in parallel (default: CPU count)"
+    )
 
     args = parser.parse_args()
 
@@ -602,6 +645,7 @@ Examples:
 
     # Generate output
     if args.json:
+        prefetch(analyzers, include_stats=True, jobs=args.jobs)
         output_data = []
         for analyzer in analyzers:
             info = analyzer.get_file_info()
@@ -660,7 +704,7 @@ Examples:
 
         output = json.dumps(output_data, indent=2, ensure_ascii=False)
     else:
-        output = generate_report(analyzers, include_stats=args.stats)
+        output = generate_report(analyzers, include_stats=args.stats, jobs=args.jobs)
 
     # Write output
     if args.output:
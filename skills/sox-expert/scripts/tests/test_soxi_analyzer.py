@@ -0,0 +1,207 @@
+"""
+Tests for soxi_analyzer.py
+
+Parser inputs are captured ``soxi FILE`` and ``sox FILE -n stat stats`` output.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from soxi_analyzer import (
+    AudioAnalyzer,
+    AudioInfo,
+    AudioStatistics,
+    _parse_soxi_output,
+    _parse_stat_output,
+    _parse_stats_output,
+    _sox_count,
+)
+
+SOXI_MONO = """
+Input File     : 'mono.wav'
+Channels       : 1
+Sample Rate    : 44100
+Precision      : 16-bit
+Duration       : 00:00:10.00 = 441000 samples = 750 CDDA sectors
+File Size      : 882k
+Bit Rate       : 706k
+Sample Encoding: 16-bit Signed Integer PCM
+
+"""
+
+SOXI_STEREO = """
+Input File     : 'stereo.flac'
+Channels       : 2
+Sample Rate    : 48000
+Precision      : 24-bit
+Duration       : 00:03:00.00 = 8640000 samples ~ 13500 CDDA sectors
+File Size      : 31.2M
+Bit Rate       : 1.39M
+Sample Encoding: 24-bit FLAC
+Comment        : 'Title=Take 3'
+
+"""
+
+STAT_STATS_MONO = """Samples read:            441000
+Length (seconds):     10.000000
+Scaled by:         2147483647.0
+Maximum amplitude:     0.499969
+Minimum amplitude:    -0.500000
+Midline amplitude:    -0.000015
+Mean    norm:          0.318310
+Mean    amplitude:    -0.000000
+RMS     amplitude:     0.353553
+Maximum delta:         0.031372
+Minimum delta:         0.000000
+Mean    delta:         0.019974
+RMS     delta:         0.022188
+Rough   frequency:          999
+Volume adjustment:        2.000
+
+DC offset  -0.000000
+Min level  -0.500000
+Max level   0.499969
+Pk lev dB      -6.02
+RMS lev dB     -9.03
+RMS Pk dB      -9.03
+RMS Tr dB      -9.03
+Crest factor    1.41
+Flat factor     0.00
+Pk count           2
+Bit-depth      16/16
+Num samples     441k
+Length s      10.000
+Scale max   1.000000
+Window s       0.050
+"""
+
+STAT_STATS_STEREO = """Samples read:          17280000
+Length (seconds):    180.000000
+Scaled by:         2147483647.0
+Maximum amplitude:     0.905029
+Minimum amplitude:    -0.891235
+Midline amplitude:     0.006897
+Mean    norm:          0.121402
+Mean    amplitude:    -0.000004
+RMS     amplitude:     0.179448
+Maximum delta:         0.912780
+Minimum delta:         0.000000
+Mean    delta:         0.020126
+RMS     delta:         0.035591
+Rough   frequency:         1911
+Volume adjustment:        1.105
+
+             Overall     Left      Right
+DC offset  -0.000012 -0.000012  0.000003
+Min level  -0.891235 -0.891235 -0.712830
+Max level   0.905029  0.905029  0.718414
+Pk lev dB      -0.87     -0.87     -2.87
+RMS lev dB    -14.92    -14.21    -15.77
+RMS Pk dB     -10.53    -10.53    -12.18
+RMS Tr dB     -89.21    -89.21    -90.31
+Crest factor       -      5.10      4.41
+Flat factor     0.00      0.00      0.00
+Pk count       1.51k     1.00k       512
+Bit-depth      24/24     24/24     24/24
+Num samples    8.64M
+Length s     180.000
+Scale max   1.000000
+Window s       0.050
+"""
+
+
+def _parse_stats(output):
+    stats = AudioStatistics()
+    _parse_stat_output(output, stats)
+    _parse_stats_output(output, stats)
+    return stats
+
+
+class TestParseSoxiOutput:
+    """Tests for the soxi report parser."""
+
+    def test_mono_wav(self):
+        info = AudioInfo(file_path="mono.wav")
+        _parse_soxi_output(SOXI_MONO, info)
+        assert info.channels == 1
+        assert info.sample_rate == 44100
+        assert info.bit_depth == 16
+        assert info.encoding == "Signed Integer PCM"
+        assert info.duration_formatted == "00:00:10.00"
+        assert info.num_samples == 441000
+        assert info.duration_seconds == pytest.approx(10.0)
+
+    def test_stereo_flac_with_approximate_sectors(self):
+        info = AudioInfo(file_path="stereo.flac")
+        _parse_soxi_output(SOXI_STEREO, info)
+        assert info.channels == 2
+        assert info.sample_rate == 48000
+        assert info.bit_depth == 24
+        assert info.encoding == "FLAC"
+        assert info.num_samples == 8640000
+        assert info.duration_seconds == pytest.approx(180.0)
+
+
+class TestParseStatistics:
+    """Tests for the combined ``stat stats`` parsers."""
+
+    def test_mono(self):
+        stats = _parse_stats(STAT_STATS_MONO)
+        assert stats.mean_norm == pytest.approx(0.318310)
+        assert stats.rms_amplitude == pytest.approx(0.353553)
+        assert stats.rough_frequency == 999
+        assert stats.volume_adjustment == pytest.approx(2.0)
+        assert stats.max_amplitude == pytest.approx(0.499969)
+        assert stats.min_amplitude == pytest.approx(-0.5)
+        assert stats.peak_level_db == pytest.approx(-6.02)
+        assert stats.rms_level_db == pytest.approx(-9.03)
+        assert stats.crest_factor == pytest.approx(1.41)
+        assert stats.pk_count == 2
+
+    def test_stereo_uses_overall_column(self):
+        stats = _parse_stats(STAT_STATS_STEREO)
+        assert stats.dc_offset == pytest.approx(-0.000012)
+        assert stats.max_amplitude == pytest.approx(0.905029)
+        assert stats.peak_level_db == pytest.approx(-0.87)
+        assert stats.rms_level_db == pytest.approx(-14.92)
+        assert stats.flat_factor == 0.0
+
+    def test_stereo_crest_factor_falls_back_to_loudest_channel(self):
+        """sox prints "-" as the Overall crest factor of a multi-channel file."""
+        stats = _parse_stats(STAT_STATS_STEREO)
+        assert stats.crest_factor == pytest.approx(5.10)
+
+    def test_stereo_pk_count_with_k_suffix(self):
+        stats = _parse_stats(STAT_STATS_STEREO)
+        assert stats.pk_count == 1510
+
+    def test_sox_count(self):
+        assert _sox_count("512") == 512
+        assert _sox_count("1.51k") == 1510
+        assert _sox_count("8.64M") == 8640000
+        with pytest.raises(ValueError):
+            _sox_count("-")
+
+
+class TestAudioAnalyzer:
+    """Tests for AudioAnalyzer with sox output stubbed."""
+
+    def test_file_type_comes_from_suffix(self, tmp_path):
+        audio = tmp_path / "take3.FLAC"
+        audio.write_bytes(b"\0" * 1000)
+        analyzer = AudioAnalyzer(str(audio))
+        with patch.object(analyzer, "_run_command", return_value=SOXI_STEREO) as mock_run:
+            info = analyzer.get_file_info()
+            assert analyzer.get_file_info() is info
+        assert mock_run.call_count == 1
+        assert info.file_type == "flac"
+        assert info.file_size_bytes == 1000
+
+    def test_statistics_use_one_sox_run(self, tmp_path):
+        audio = tmp_path / "mono.wav"
+        audio.write_bytes(b"\0" * 1000)
+        analyzer = AudioAnalyzer(str(audio))
+        with patch.object(analyzer, "_run_command", return_value=STAT_STATS_MONO) as mock_run:
+            stats = analyzer.get_statistics()
+        mock_run.assert_called_once_with(["sox", str(audio), "-n", "stat", "stats"])
+        assert stats.pk_count == 2
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Benchmark DST classification in timezone_event_tracker.py on a synthetic multi-year dataset.
+
+Generates EVENTS local timestamps spread over YEARS years and TIMEZONES IANA timezones
+(default 200,000 events, 10 years, 50 timezones), a tenth of them placed next to DST
+transitions. Times building the per-timezone TransitionIndex tables and classifying the
+whole batch with classify_events, then the same classification done per event with
+zoneinfo fold checks for reference (and checks that both agree), and a dst-check run
+(check_dst_issues) for every year of the range.
+
+Usage:
+    python benchmark_dst_index.py
+    python benchmark_dst_index.py --events 1000000 --start-year 2010 --years 15 --timezones 80
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+_SCRIPT_DIR = Path(__file__).parent
+if str(_SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPT_DIR))
+
+import timezone_event_tracker as tracker  # noqa: E402
+
+try:
+    from zoneinfo import available_timezones
+except ImportError:
+    from backports.zoneinfo import available_timezones
+
+
+def pick_timezones(count: int) -> list[str]:
+    """Return `count` region/city timezones spread evenly over the tz database."""
+    names = sorted(n for n in available_timezones() if "/" in n and not n.startswith(("Etc/", "SystemV/")))
+    step = max(1, len(names) // count)
+    return names[::step][:count]
+
+
+def make_events(count: int, timezones: list[str], start_year: int, years: int, seed: int = 0):
+    """Return events with local wall-clock original timestamps, some near DST transitions."""
+    rng = random.Random(seed)
+    start = datetime(start_year, 1, 1)
+    span_seconds = int((datetime(start_year + years, 1, 1) - start).total_seconds())
+    windows = {
+        tz: tracker.get_transition_index(tz, start_year, start_year + years - 1).window_starts for tz in timezones
+    }
+
+    events = []
+    for i in range(count):
+        tz_name = rng.choice(timezones)
+        if i % 10 == 0 and windows[tz_name]:
+            local_us = rng.choice(windows[tz_name]) + rng.randint(-2 * 3600, 2 * 3600) * 1_000_000
+            local = datetime(1970, 1, 1) + timedelta(microseconds=local_us)
+        else:
+            local = start + timedelta(seconds=rng.randrange(span_seconds))
+        local = local.replace(microsecond=0)
+        dt_utc = local.replace(tzinfo=tracker._zone(tz_name)).astimezone(tracker.UTC)
+        events.append(
+            tracker.Event(
+                id=f"evt-{i + 1:07d}",
+                original_timestamp=local.isoformat(sep=" "),
+                normalized_timestamp=dt_utc.isoformat(),
+                source_timezone=tz_name,
+                description="",
+                metadata={},
+                dst_status="unknown",
+                epoch_us=tracker.to_epoch_us(dt_utc),
+            )
+        )
+    return events
+
+
+def classify_with_fold(event) -> str:
+    """Per-event reference classification using zoneinfo fold semantics."""
+    tz = tracker._zone(event.source_timezone)
+    naive = datetime.fromisoformat(event.original_timestamp)
+    first = naive.replace(tzinfo=tz)
+    if first.utcoffset() == naive.replace(tzinfo=tz, fold=1).utcoffset():
+        return tracker.DST_NORMAL
+    round_trip = first.astimezone(tracker.UTC).astimezone(tz).replace(tzinfo=None)
+    return tracker.DST_AMBIGUOUS if round_trip == naive else tracker.DST_NON_EXISTENT
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark timezone_event_tracker DST classification")
+    parser.add_argument("--events", type=int, default=200_000, help="Number of events (default: 200000)")
+    parser.add_argument("--start-year", type=int, default=2015, help="First year (default: 2015)")
+    parser.add_argument("--years", type=int, default=10, help="Number of years (default: 10)")
+    parser.add_argument("--timezones", type=int, default=50, help="Number of timezones (default: 50)")
+    args = parser.parse_args()
+
+    end_year = args.start_year + args.years - 1
+    timezones = pick_timezones(args.timezones)
+    print(f"Dataset: {args.events} events, {len(timezones)} timezones, {args.start_year}-{end_year}")
+
+    tracker.get_transition_index.cache_clear()
+    build, _ = _timed(lambda: [tracker.get_transition_index(tz, args.start_year, end_year) for tz in timezones])
+    transitions = sum(len(tracker.get_transition_index(tz, args.start_year, end_year).instants) for tz in timezones)
+    print(f"Build transition indexes:    {build:8.3f}s ({transitions} transitions)")
+
+    events = make_events(args.events, timezones, args.start_year, args.years)
+
+    indexed, batch = _timed(lambda: [c for _, c in tracker.classify_events(events, args.start_year, end_year)])
+    print(f"classify_events (batch):     {indexed:8.3f}s")
+
+    per_event, reference = _timed(lambda: [classify_with_fold(e) for e in events])
+    print(f"Per-event zoneinfo folds:    {per_event:8.3f}s ({per_event / indexed:.1f}x slower)")
+
+    dst_check, _ = _timed(lambda: [tracker.check_dst_issues(events, y) for y in range(args.start_year, end_year + 1)])
+    print(f"check_dst_issues, each year: {dst_check:8.3f}s")
+
+    counts = {c: batch.count(c) for c in tracker.DST_CLASSES}
+    mismatches = sum(1 for a, b in zip(batch, reference) if a != b)
+    print(f"Classification counts: {counts}")
+    print(f"Mismatches vs zoneinfo: {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,18 +9,31 @@ Tests cover:
 """
 
 import json
+from argparse import Namespace
 from datetime import datetime
 from pathlib import Path
 
 import pytest
 from timezone_event_tracker import (
+    DST_AMBIGUOUS,
+    DST_NON_EXISTENT,
+    DST_NORMAL,
+    DST_UNKNOWN,
     TZ_ABBREVIATIONS,
     CorrelationGroup,
     Event,
+    UnsortedInputError,
     check_dst_issues,
+    classify_events,
     classify_pattern,
     correlate_events,
+    correlate_stream,
     generate_markdown_report,
+    get_dst_transitions,
+    get_transition_index,
+    iter_correlation_groups,
+    iter_events,
+    local_wall_us,
     parse_events,
     parse_timestamp,
 )
@@ -305,6 +318,91 @@ class TestDSTCheck:
         assert len(result["dst_transitions"].get("Asia/Tokyo", [])) == 0
 
 
+class TestTransitionIndex:
+    """Tests for the precomputed DST transition index and batch classification."""
+
+    @staticmethod
+    def _event(event_id, local, tz_name):
+        dt_utc, source_tz, dst_status, warning = parse_timestamp(local, tz_name)
+        return Event(
+            id=event_id,
+            original_timestamp=local,
+            normalized_timestamp=dt_utc.isoformat(),
+            source_timezone=source_tz,
+            description="",
+            metadata={},
+            dst_status=dst_status,
+        )
+
+    def test_index_has_exact_transition_instants(self):
+        """Test that transitions are located to the second (2024-03-10 10:00 UTC for Los Angeles)."""
+        index = get_transition_index("America/Los_Angeles", 2023, 2024)
+
+        assert len(index.instants) == 4
+        assert datetime.fromtimestamp(index.instants[2] / 1_000_000, ZoneInfo("UTC")) == datetime(
+            2024, 3, 10, 10, 0, tzinfo=ZoneInfo("UTC")
+        )
+        assert index.window_kinds == [DST_NON_EXISTENT, DST_AMBIGUOUS] * 2
+
+    def test_classify_local_times(self):
+        """Test that skipped and repeated wall-clock times are detected."""
+        index = get_transition_index("America/Los_Angeles", 2024, 2024)
+
+        def classify(value):
+            return index.classify_local(local_wall_us(datetime.fromisoformat(value)))
+
+        assert classify("2024-03-10 01:59:59") == DST_NORMAL
+        assert classify("2024-03-10 02:00:00") == DST_NON_EXISTENT
+        assert classify("2024-03-10 03:00:00") == DST_NORMAL
+        assert classify("2024-11-03 01:30:00") == DST_AMBIGUOUS
+        assert classify("2024-11-03 02:00:00") == DST_NORMAL
+        assert classify("2025-03-09 02:30:00") == DST_UNKNOWN  # outside the indexed years
+
+    def test_classify_events_batch(self):
+        """Test classifying a batch of events from several timezones in one pass."""
+        events = [
+            self._event("a", "2024-03-10 02:30:00", "America/New_York"),
+            self._event("b", "2024-10-27 02:30:00", "Europe/Paris"),
+            self._event("c", "2024-10-27 02:30:00", "Asia/Tokyo"),
+            self._event("d", "2024-03-10T02:30:00-05:00", "UTC"),
+            Event("e", "", "2024-01-01T00:00:00+00:00", "Mars/Olympus", "", {}, "unknown"),
+        ]
+
+        result = {event.id: status for event, status in classify_events(events, 2024, 2024)}
+
+        assert result == {"a": DST_NON_EXISTENT, "b": DST_AMBIGUOUS, "c": DST_NORMAL, "d": DST_NORMAL, "e": DST_UNKNOWN}
+
+    def test_transition_date_is_local_date(self):
+        """Test that evening transitions report the local date (Nuuk switches at 22:00 on Saturday)."""
+        transitions = get_dst_transitions(2024, "America/Nuuk")
+
+        assert (transitions[0][0].strftime("%Y-%m-%d"), transitions[0][1]) == ("2024-03-30", "spring_forward")
+
+    def test_check_dst_issues_reports_classification(self):
+        """Test that DST issues say whether the local time was skipped or repeated."""
+        events = [self._event("evt-001", "2024-03-10 02:30:00 PST", "UTC")]
+
+        result = check_dst_issues(events, 2024)
+
+        assert result["issues"][0]["classification"] == DST_NON_EXISTENT
+        assert "does not exist" in result["issues"][0]["warning"]
+
+    def test_check_dst_issues_southern_hemisphere(self):
+        """Test that zones ahead of UTC are checked on their local transition dates (Sydney, 2024)."""
+        events = [
+            self._event("fall-back", "2024-04-07 02:30:00", "Australia/Sydney"),
+            self._event("spring-forward", "2024-10-06 02:30:00", "Australia/Sydney"),
+            self._event("ordinary", "2024-10-05 02:30:00", "Australia/Sydney"),
+        ]
+
+        issues = check_dst_issues(events, 2024)["issues"]
+
+        assert [(i["event_id"], i["date"], i["classification"]) for i in issues] == [
+            ("fall-back", "2024-04-07", DST_AMBIGUOUS),
+            ("spring-forward", "2024-10-06", DST_NON_EXISTENT),
+        ]
+
+
 class TestReportGeneration:
     """Tests for report generation."""
 
@@ -333,6 +431,123 @@ class TestReportGeneration:
         assert "Los_Angel" in report  # Truncated timezone name
 
 
+class TestStreaming:
+    """Tests for epoch keys and streamed CSV/JSONL ingest."""
+
+    CSV = """timestamp,description,source
+2024-03-10 01:58:00 PST,Deploy started,ops-west
+2024-03-10 11:00:00 UTC,Rollback,ops-west
+2024-03-10 05:59:00 EST,Error spike,monitoring
+2024-03-10 11:01:00 UTC,Recovered,monitoring
+"""
+
+    def test_event_epoch_us_from_iso_string(self):
+        """Test that events without epoch_us derive it from normalized_timestamp."""
+        event = Event(
+            id="evt-001",
+            original_timestamp="2024-03-15 10:00:00 UTC",
+            normalized_timestamp="2024-03-15T10:00:00.5Z",
+            source_timezone="UTC",
+            description="Test",
+            metadata={},
+            dst_status="standard_time",
+        )
+        assert event.epoch_us == 1710496800_500000
+
+    def test_iter_events_csv_matches_parse_events(self, tmp_path):
+        """Test that streamed CSV rows carry the same epoch keys as parse_events."""
+        csv_file = tmp_path / "events.csv"
+        csv_file.write_text(self.CSV)
+
+        streamed = list(iter_events(csv_file))
+        parsed = parse_events(csv_file)
+
+        assert [e.id for e in streamed] == ["evt-0001", "evt-0002", "evt-0003", "evt-0004"]
+        assert sorted(e.epoch_us for e in streamed) == [e.epoch_us for e in parsed]
+        assert streamed[0].epoch_us == datetime.fromisoformat(streamed[0].normalized_timestamp).timestamp() * 1_000_000
+
+    def test_iter_events_jsonl_raw_and_normalized(self, tmp_path):
+        """Test that JSONL rows may be raw events or normalized events."""
+        jsonl_file = tmp_path / "events.jsonl"
+        raw = {"timestamp": "2024-03-15T10:30:00-07:00", "description": "Raw"}
+        done = {
+            "id": "evt-0009",
+            "original_timestamp": "2024-03-15 10:31:00 UTC",
+            "normalized_timestamp": "2024-03-15T10:31:00+00:00",
+            "source_timezone": "UTC",
+            "description": "Normalized",
+            "metadata": {},
+            "dst_status": "unknown",
+        }
+        jsonl_file.write_text(json.dumps(raw) + "\n\n" + json.dumps(done) + "\n")
+
+        events = list(iter_events(jsonl_file))
+
+        assert [e.description for e in events] == ["Raw", "Normalized"]
+        assert events[1].id == "evt-0009"
+
+    def test_iter_correlation_groups_rejects_unsorted_input(self):
+        """Test that streamed correlation requires chronological input."""
+        events = [
+            Event(
+                id=f"evt-{i}",
+                original_timestamp="",
+                normalized_timestamp=ts,
+                source_timezone="UTC",
+                description="",
+                metadata={},
+                dst_status="unknown",
+            )
+            for i, ts in enumerate(["2024-03-15T10:05:00+00:00", "2024-03-15T10:00:00+00:00"])
+        ]
+        with pytest.raises(UnsortedInputError):
+            list(iter_correlation_groups(events))
+        assert len(correlate_events(events)) == 1
+
+    def test_correlate_stream_matches_in_memory(self, tmp_path):
+        """Test streamed correlation (including unsorted fallback) against correlate_events."""
+        csv_file = tmp_path / "events.csv"
+        csv_file.write_text(self.CSV)
+        out = tmp_path / "groups.jsonl"
+        args = Namespace(output=str(out), window_minutes=5, reference_tz="UTC")
+
+        assert correlate_stream(csv_file, args) == 0
+
+        groups = [json.loads(line) for line in out.read_text().splitlines()]
+        expected = correlate_events(parse_events(csv_file), 5)
+        assert [g["event_ids"] for g in groups] == [g.event_ids for g in expected]
+        assert [g["event_ids"] for g in groups] == [["evt-0001", "evt-0003"], ["evt-0002", "evt-0004"]]
+
+    def test_correlate_stream_rejects_non_jsonl_output(self, tmp_path):
+        """Test that streamed correlation refuses to write JSON Lines into a .json file."""
+        csv_file = tmp_path / "events.csv"
+        csv_file.write_text(self.CSV)
+        out = tmp_path / "groups.json"
+        args = Namespace(output=str(out), window_minutes=5, reference_tz="UTC")
+
+        assert correlate_stream(csv_file, args) == 1
+        assert not out.exists()
+
+    def test_correlate_stream_does_not_mask_bad_input(self, tmp_path):
+        """Test that malformed rows raise instead of triggering the unsorted fallback."""
+        jsonl_file = tmp_path / "events.jsonl"
+        jsonl_file.write_text('{"timestamp": "2024-03-15T10:30:00Z"}\n{not json\n')
+        args = Namespace(output=str(tmp_path / "groups.jsonl"), window_minutes=5, reference_tz="UTC")
+
+        with pytest.raises(json.JSONDecodeError):
+            correlate_stream(jsonl_file, args)
+
+    def test_check_dst_issues_accepts_stream(self, tmp_path):
+        """Test that dst-check works on a single-pass iterator."""
+        csv_file = tmp_path / "events.csv"
+        csv_file.write_text(self.CSV)
+
+        result = check_dst_issues(iter_events(csv_file), 2024)
+
+        assert result["timezones_checked"] == ["America/Los_Angeles", "America/New_York"]
+        assert [i["event_id"] for i in result["issues"]] == ["evt-0001", "evt-0003"]
+
+
 class TestTimezoneAbbreviations:
     """Tests for timezone abbreviation mapping."""
 
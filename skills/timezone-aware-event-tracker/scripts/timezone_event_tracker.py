@@ -10,17 +10,24 @@ Usage:
     python timezone_event_tracker.py correlate --input normalized.json --window-minutes 5
     python timezone_event_tracker.py report --input normalized.json --timezones "America/Los_Angeles,Asia/Tokyo"
     python timezone_event_tracker.py dst-check --input normalized.json --year 2024
+
+Large exports can be streamed: ``correlate`` and ``dst-check`` accept CSV or JSON Lines
+(``.jsonl``) input directly and process it one event at a time.
 """
 
 import argparse
+import bisect
 import csv
 import json
 import re
+import shutil
 import sys
-from dataclasses import asdict, dataclass
-from datetime import date, datetime, timedelta
+import tempfile
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 # Use zoneinfo for Python 3.9+
 try:
@@ -61,6 +68,83 @@ TZ_ABBREVIATIONS = {
     "Z": "UTC",
 }
 
+MONTHS = {
+    "Jan": 1,
+    "Feb": 2,
+    "Mar": 3,
+    "Apr": 4,
+    "May": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Aug": 8,
+    "Sep": 9,
+    "Oct": 10,
+    "Nov": 11,
+    "Dec": 12,
+}
+
+ISO_OFFSET_PATTERN = re.compile(r"^(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2})([+-]\d{2}:?\d{2}|Z)$")
+TZ_ABBREV_PATTERN = re.compile(r"^(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2})\s+([A-Z]{2,4})$")
+LOG_PATTERN = re.compile(r"^(\d{2})/([A-Za-z]{3})/(\d{4}):(\d{2}):(\d{2}):(\d{2})\s*([+-]\d{4})$")
+
+ISO_FRACTION_PATTERN = re.compile(r"\.(\d+)")
+
+# Input formats that correlate/dst-check read one event at a time
+STREAM_SUFFIXES = {".csv", ".jsonl"}
+
+# Results of classifying a local wall-clock time against a timezone's transitions
+DST_NORMAL = "normal"
+DST_AMBIGUOUS = "ambiguous"  # occurs twice (fall back)
+DST_NON_EXISTENT = "non_existent"  # skipped (spring forward)
+DST_UNKNOWN = "unknown"  # no IANA timezone, or outside the indexed years
+DST_CLASSES = (DST_NORMAL, DST_AMBIGUOUS, DST_NON_EXISTENT, DST_UNKNOWN)
+DST_WARNINGS = {
+    DST_AMBIGUOUS: "Local time is ambiguous (occurs twice during fall back)",
+    DST_NON_EXISTENT: "Local time does not exist (skipped during spring forward)",
+}
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.date().toordinal()
+_ONE_MICROSECOND = timedelta(microseconds=1)
+_MICROSECONDS_PER_DAY = 86_400_000_000
+
+
+@lru_cache(maxsize=None)
+def _zone(name: str) -> ZoneInfo:
+    """Return a ZoneInfo for an IANA name, constructed once per name."""
+    return ZoneInfo(name)
+
+
+UTC = _zone("UTC")
+
+
+def to_epoch_us(dt: datetime) -> int:
+    """Convert an aware datetime to integer microseconds since the Unix epoch."""
+    return (dt - _EPOCH) // _ONE_MICROSECOND
+
+
+def iso_to_epoch_us(value: str) -> int:
+    """Convert an ISO 8601 timestamp (naive values are taken as UTC) to epoch microseconds."""
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    # Python < 3.11 only accepts 3- or 6-digit fractions, so pad/truncate to microseconds
+    value = ISO_FRACTION_PATTERN.sub(lambda m: "." + m.group(1).ljust(6, "0")[:6], value, count=1)
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return to_epoch_us(dt)
+
+
+def local_wall_us(dt: datetime) -> int:
+    """Convert a naive local datetime to microseconds on an epoch-style wall-clock scale (no offset applied)."""
+    return (dt - _EPOCH_NAIVE) // _ONE_MICROSECOND
+
+
+def epoch_us_to_date(epoch_us: int) -> date:
+    """Return the UTC calendar date of an epoch-microsecond timestamp."""
+    return date.fromordinal(_EPOCH_ORDINAL + epoch_us // _MICROSECONDS_PER_DAY)
+
 
 @dataclass
 class Event:
@@ -74,6 +158,12 @@ class Event:
     metadata: dict
     dst_status: str  # "standard_time", "daylight_time", or "ambiguous"
     ambiguity_warning: Optional[str] = None
+    epoch_us: Optional[int] = None  # normalized_timestamp as microseconds since the Unix epoch
+
+    def __post_init__(self):
+        # Events loaded from older normalized files only carry the ISO string
+        if self.epoch_us is None:
+            self.epoch_us = iso_to_epoch_us(self.normalized_timestamp)
 
 
 @dataclass
@@ -96,8 +186,7 @@ def parse_timestamp(raw: str, default_tz: str = "UTC") -> tuple[datetime, str, s
     warning = None
 
     # Pattern 1: ISO 8601 with offset (2024-03-15T10:30:00-07:00)
-    iso_offset_pattern = r"^(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2})([+-]\d{2}:?\d{2}|Z)$"
-    match = re.match(iso_offset_pattern, raw)
+    match = ISO_OFFSET_PATTERN.match(raw)
     if match:
         dt_str, offset = match.groups()
         if offset == "Z":
@@ -106,20 +195,19 @@ def parse_timestamp(raw: str, default_tz: str = "UTC") -> tuple[datetime, str, s
             offset = offset[:3] + ":" + offset[3:]
         full_str = dt_str.replace(" ", "T") + offset
         dt = datetime.fromisoformat(full_str)
-        dt_utc = dt.astimezone(ZoneInfo("UTC"))
+        dt_utc = dt.astimezone(UTC)
         # Determine source timezone from offset
         return dt_utc, "UTC (from offset)", "unknown", warning
 
     # Pattern 2: Datetime with timezone abbreviation (2024-03-15 10:30:00 PST)
-    tz_abbrev_pattern = r"^(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2})\s+([A-Z]{2,4})$"
-    match = re.match(tz_abbrev_pattern, raw)
+    match = TZ_ABBREV_PATTERN.match(raw)
     if match:
         dt_str, tz_abbrev = match.groups()
         tz_name = TZ_ABBREVIATIONS.get(tz_abbrev.upper(), default_tz)
         if tz_abbrev.upper() not in TZ_ABBREVIATIONS:
             warning = f"Unknown timezone abbreviation '{tz_abbrev}', using {default_tz}"
 
-        tz = ZoneInfo(tz_name)
+        tz = _zone(tz_name)
         # Parse naive datetime and localize
         dt_naive = datetime.fromisoformat(dt_str.replace(" ", "T"))
         try:
@@ -127,16 +215,16 @@ def parse_timestamp(raw: str, default_tz: str = "UTC") -> tuple[datetime, str, s
         except Exception:
             dt_local = dt_naive.replace(tzinfo=tz)
 
-        dt_utc = dt_local.astimezone(ZoneInfo("UTC"))
+        dt_utc = dt_local.astimezone(UTC)
         dst_status = get_dst_status(dt_local, tz)
         return dt_utc, tz_name, dst_status, warning
 
     # Pattern 3: Just datetime, no timezone (use default)
     try:
         dt_naive = datetime.fromisoformat(raw.replace(" ", "T"))
-        tz = ZoneInfo(default_tz)
+        tz = _zone(default_tz)
         dt_local = dt_naive.replace(tzinfo=tz)
-        dt_utc = dt_local.astimezone(ZoneInfo("UTC"))
+        dt_utc = dt_local.astimezone(UTC)
         warning = f"No timezone specified, assumed {default_tz}"
         dst_status = get_dst_status(dt_local, tz)
         return dt_utc, default_tz, dst_status, warning
@@ -144,28 +232,13 @@ def parse_timestamp(raw: str, default_tz: str = "UTC") -> tuple[datetime, str, s
         pass
 
     # Pattern 4: Common log format (15/Mar/2024:10:30:00 -0700)
-    log_pattern = r"^(\d{2})/([A-Za-z]{3})/(\d{4}):(\d{2}):(\d{2}):(\d{2})\s*([+-]\d{4})$"
-    match = re.match(log_pattern, raw)
+    match = LOG_PATTERN.match(raw)
     if match:
         day, month_str, year, hour, minute, second, offset = match.groups()
-        months = {
-            "Jan": 1,
-            "Feb": 2,
-            "Mar": 3,
-            "Apr": 4,
-            "May": 5,
-            "Jun": 6,
-            "Jul": 7,
-            "Aug": 8,
-            "Sep": 9,
-            "Oct": 10,
-            "Nov": 11,
-            "Dec": 12,
-        }
-        month = months.get(month_str, 1)
+        month = MONTHS.get(month_str, 1)
         dt_str = f"{year}-{month:02d}-{day}T{hour}:{minute}:{second}{offset[:3]}:{offset[3:]}"
         dt = datetime.fromisoformat(dt_str)
-        dt_utc = dt.astimezone(ZoneInfo("UTC"))
+        dt_utc = dt.astimezone(UTC)
         return dt_utc, f"UTC{offset}", "unknown", warning
 
     raise ValueError(f"Unable to parse timestamp: {raw}")
@@ -188,71 +261,245 @@ def get_dst_status(dt: datetime, tz: ZoneInfo) -> str:
         return "unknown"
 
 
+@dataclass
+class TransitionIndex:
+    """
+    UTC offset changes of one timezone over a range of years, searchable with bisect.
+
+    ``instants`` are the UTC epoch microseconds at which the offset changes; ``offsets_before`` and
+    ``offsets_after`` are the UTC offsets (microseconds) on either side. Each transition also opens a
+    wall-clock window (on the ``local_wall_us`` scale) that is skipped or repeated.
+    """
+
+    tz_name: str
+    start_year: int
+    end_year: int
+    base_offset_us: int = 0  # offset in effect at the start of the range
+    instants: list = field(default_factory=list)
+    offsets_before: list = field(default_factory=list)
+    offsets_after: list = field(default_factory=list)
+    window_starts: list = field(default_factory=list)
+    window_ends: list = field(default_factory=list)
+    window_kinds: list = field(default_factory=list)
+
+    def __post_init__(self):
+        self.local_start_us = local_wall_us(datetime(self.start_year, 1, 1))
+        self.local_end_us = local_wall_us(datetime(self.end_year + 1, 1, 1))
+
+    def add(self, instant_us: int, offset_before_us: int, offset_after_us: int):
+        self.instants.append(instant_us)
+        self.offsets_before.append(offset_before_us)
+        self.offsets_after.append(offset_after_us)
+        if offset_after_us > offset_before_us:
+            start, end, kind = instant_us + offset_before_us, instant_us + offset_after_us, DST_NON_EXISTENT
+        else:
+            start, end, kind = instant_us + offset_after_us, instant_us + offset_before_us, DST_AMBIGUOUS
+        self.window_starts.append(start)
+        self.window_ends.append(end)
+        self.window_kinds.append(kind)
+
+    def classify_local(self, local_us: int) -> str:
+        """Classify a wall-clock time (``local_wall_us`` scale) as normal, ambiguous or non-existent."""
+        if not self.local_start_us <= local_us < self.local_end_us:
+            return DST_UNKNOWN
+        i = bisect.bisect_right(self.window_starts, local_us) - 1
+        if i >= 0 and local_us < self.window_ends[i]:
+            return self.window_kinds[i]
+        return DST_NORMAL
+
+    def utc_offset_us(self, epoch_us: int) -> int:
+        """Return the UTC offset in effect at a UTC instant (epoch microseconds)."""
+        i = bisect.bisect_right(self.instants, epoch_us)
+        if i == 0:
+            return self.base_offset_us
+        return self.offsets_after[i - 1]
+
+    def transitions_in_year(self, year: int) -> list[tuple[date, str]]:
+        """Return (local date, "spring_forward" | "fall_back") for transitions in a year."""
+        result = []
+        for instant, before, after in zip(self.instants, self.offsets_before, self.offsets_after):
+            local_date = epoch_us_to_date(instant + before)
+            if local_date.year == year:
+                result.append((local_date, "spring_forward" if after > before else "fall_back"))
+        return result
+
+
+def _offset_us_at(tz: ZoneInfo, epoch_seconds: int) -> int:
+    return (_EPOCH + timedelta(seconds=epoch_seconds)).astimezone(tz).utcoffset() // _ONE_MICROSECOND
+
+
+@lru_cache(maxsize=None)
+def get_transition_index(tz_name: str, start_year: int, end_year: int) -> TransitionIndex:
+    """
+    Build the TransitionIndex of a timezone for start_year..end_year (inclusive), once per arguments.
+
+    The offset is sampled daily in UTC; each change is narrowed to the exact second by bisection.
+    """
+    tz = _zone(tz_name)
+    # Pad by a day so transitions near the range edges (in any UTC offset) are included
+    lo = int((datetime(start_year, 1, 1, tzinfo=timezone.utc) - _EPOCH).total_seconds()) - 86_400
+    end = int((datetime(end_year + 1, 1, 1, tzinfo=timezone.utc) - _EPOCH).total_seconds()) + 86_400
+
+    prev_offset = _offset_us_at(tz, lo)
+    index = TransitionIndex(tz_name, start_year, end_year, base_offset_us=prev_offset)
+    while lo < end:
+        hi = min(lo + 86_400, end)
+        offset = _offset_us_at(tz, hi)
+        if offset != prev_offset:
+            left, right = lo, hi
+            while right - left > 1:
+                mid = (left + right) // 2
+                if _offset_us_at(tz, mid) == prev_offset:
+                    left = mid
+                else:
+                    right = mid
+            index.add(right * 1_000_000, prev_offset, offset)
+            prev_offset = offset
+        lo = hi
+
+    return index
+
+
 def get_dst_transitions(year: int, tz_name: str) -> list[tuple[datetime, str]]:
     """Get DST transition dates for a timezone in a given year."""
-    tz = ZoneInfo(tz_name)
-    transitions = []
-
-    # Check each day of the year for offset changes
-    current_date = date(year, 1, 1)
-    end_date = date(year, 12, 31)
-
-    prev_offset = None
-    while current_date <= end_date:
-        dt = datetime(current_date.year, current_date.month, current_date.day, 12, 0, tzinfo=tz)
-        current_offset = dt.utcoffset()
-
-        if prev_offset is not None and current_offset != prev_offset:
-            # Transition found
-            transition_type = "spring_forward" if current_offset > prev_offset else "fall_back"
-            transitions.append(
-                (datetime(current_date.year, current_date.month, current_date.day, tzinfo=tz), transition_type)
-            )
+    tz = _zone(tz_name)
+    return [
+        (datetime(d.year, d.month, d.day, tzinfo=tz), kind)
+        for d, kind in get_transition_index(tz_name, year, year).transitions_in_year(year)
+    ]
 
-        prev_offset = current_offset
-        current_date += timedelta(days=1)
 
-    return transitions
+def _event_local_wall_us(event: Event, index: TransitionIndex) -> int:
+    """Wall-clock time of an event in its source timezone, taken from the original timestamp when possible."""
+    try:
+        return local_wall_us(datetime.fromisoformat(event.original_timestamp.lstrip()[:19]))
+    except ValueError:
+        pass
+    # Converting back from UTC cannot land in a skipped window, but still detects repeated times
+    return event.epoch_us + index.utc_offset_us(event.epoch_us)
 
 
-def parse_events(input_file: Path, reference_tz: str = "UTC") -> list[Event]:
-    """Parse events from CSV or JSON file."""
-    events = []
+def classify_events(events: Iterable[Event], start_year: int, end_year: int) -> Iterator[tuple[Event, str]]:
+    """
+    Classify events as normal, ambiguous or non-existent local times in one pass.
+
+    Yields (event, classification) in input order. Each source timezone's TransitionIndex for
+    start_year..end_year is built on first sight. UTC and fixed-offset sources ("UTC-0700") are always
+    normal; unknown timezone names, and local times outside the range, are classified as "unknown".
+    """
+    indexes: dict[str, Optional[TransitionIndex]] = {}
+    for event in events:
+        tz_name = event.source_timezone
+        if tz_name.startswith("UTC"):
+            yield event, DST_NORMAL
+            continue
+        if tz_name not in indexes:
+            try:
+                indexes[tz_name] = get_transition_index(tz_name, start_year, end_year)
+            except Exception:
+                indexes[tz_name] = None
+        index = indexes[tz_name]
+
+        if index is None:
+            yield event, DST_UNKNOWN
+        else:
+            yield event, index.classify_local(_event_local_wall_us(event, index))
+
 
-    if input_file.suffix.lower() == ".csv":
+def _event_from_csv_row(row: dict, index: int, reference_tz: str) -> Optional[Event]:
+    """Build an Event from a CSV row, or return None (with a warning) if its timestamp is unparseable."""
+    # Expect columns: timestamp, description, [timezone], [severity], [source]
+    raw_ts = row.get("timestamp", "")
+    description = row.get("description", "")
+    source_tz_hint = row.get("timezone", reference_tz)
+
+    try:
+        dt_utc, source_tz, dst_status, warning = parse_timestamp(raw_ts, source_tz_hint)
+    except ValueError as e:
+        print(f"Warning: Skipping row {index + 1}: {e}", file=sys.stderr)
+        return None
+
+    metadata = {}
+    if "severity" in row:
+        metadata["severity"] = row["severity"]
+    if "source" in row:
+        metadata["source_system"] = row["source"]
+
+    return Event(
+        id=f"evt-{index + 1:04d}",
+        original_timestamp=raw_ts,
+        normalized_timestamp=dt_utc.isoformat(),
+        source_timezone=source_tz,
+        description=description,
+        metadata=metadata,
+        dst_status=dst_status,
+        ambiguity_warning=warning,
+        epoch_us=to_epoch_us(dt_utc),
+    )
+
+
+def _event_from_item(item: dict, index: int, reference_tz: str) -> Optional[Event]:
+    """Build an Event from a JSON object, or return None (with a warning) if its timestamp is unparseable."""
+    raw_ts = item.get("timestamp", item.get("original_timestamp", ""))
+    description = item.get("description", "")
+    source_tz_hint = item.get("timezone", item.get("source_timezone", reference_tz))
+
+    try:
+        dt_utc, source_tz, dst_status, warning = parse_timestamp(raw_ts, source_tz_hint)
+    except ValueError as e:
+        print(f"Warning: Skipping item {index + 1}: {e}", file=sys.stderr)
+        return None
+
+    metadata = item.get("metadata", {})
+    if "severity" in item:
+        metadata["severity"] = item["severity"]
+    if "source" in item:
+        metadata["source_system"] = item["source"]
+
+    return Event(
+        id=item.get("id", f"evt-{index + 1:04d}"),
+        original_timestamp=raw_ts,
+        normalized_timestamp=dt_utc.isoformat(),
+        source_timezone=source_tz,
+        description=description,
+        metadata=metadata,
+        dst_status=dst_status,
+        ambiguity_warning=warning,
+        epoch_us=to_epoch_us(dt_utc),
+    )
+
+
+def iter_events(input_file: Path, reference_tz: str = "UTC") -> Iterator[Event]:
+    """
+    Yield events from a CSV, JSON Lines or JSON file in file order.
+
+    CSV and JSON Lines are read one row at a time, so memory stays flat regardless of file size.
+    JSON Lines rows may be raw events or normalized events (as written by ``parse -o events.jsonl``);
+    normalized rows are loaded as-is without re-parsing their timestamps.
+    """
+    suffix = input_file.suffix.lower()
+
+    if suffix == ".csv":
+        with open(input_file, "r", encoding="utf-8", newline="") as f:
+            for i, row in enumerate(csv.DictReader(f)):
+                event = _event_from_csv_row(row, i, reference_tz)
+                if event is not None:
+                    yield event
+
+    elif suffix == ".jsonl":
         with open(input_file, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for i, row in enumerate(reader):
-                # Expect columns: timestamp, description, [timezone], [severity], [source]
-                raw_ts = row.get("timestamp", "")
-                description = row.get("description", "")
-                source_tz_hint = row.get("timezone", reference_tz)
-
-                try:
-                    dt_utc, source_tz, dst_status, warning = parse_timestamp(raw_ts, source_tz_hint)
-                except ValueError as e:
-                    print(f"Warning: Skipping row {i + 1}: {e}", file=sys.stderr)
+            for i, line in enumerate(f):
+                if not line.strip():
                     continue
+                item = json.loads(line)
+                if "normalized_timestamp" in item:
+                    yield Event(**item)
+                    continue
+                event = _event_from_item(item, i, reference_tz)
+                if event is not None:
+                    yield event
 
-                metadata = {}
-                if "severity" in row:
-                    metadata["severity"] = row["severity"]
-                if "source" in row:
-                    metadata["source_system"] = row["source"]
-
-                event = Event(
-                    id=f"evt-{i + 1:04d}",
-                    original_timestamp=raw_ts,
-                    normalized_timestamp=dt_utc.isoformat(),
-                    source_timezone=source_tz,
-                    description=description,
-                    metadata=metadata,
-                    dst_status=dst_status,
-                    ambiguity_warning=warning,
-                )
-                events.append(event)
-
-    elif input_file.suffix.lower() == ".json":
+    elif suffix == ".json":
         with open(input_file, "r", encoding="utf-8") as f:
             data = json.load(f)
 
@@ -260,98 +507,67 @@ def parse_events(input_file: Path, reference_tz: str = "UTC") -> list[Event]:
         event_list = data if isinstance(data, list) else data.get("events", [])
 
         for i, item in enumerate(event_list):
-            raw_ts = item.get("timestamp", item.get("original_timestamp", ""))
-            description = item.get("description", "")
-            source_tz_hint = item.get("timezone", item.get("source_timezone", reference_tz))
-
-            try:
-                dt_utc, source_tz, dst_status, warning = parse_timestamp(raw_ts, source_tz_hint)
-            except ValueError as e:
-                print(f"Warning: Skipping item {i + 1}: {e}", file=sys.stderr)
-                continue
-
-            metadata = item.get("metadata", {})
-            if "severity" in item:
-                metadata["severity"] = item["severity"]
-            if "source" in item:
-                metadata["source_system"] = item["source"]
-
-            event = Event(
-                id=item.get("id", f"evt-{i + 1:04d}"),
-                original_timestamp=raw_ts,
-                normalized_timestamp=dt_utc.isoformat(),
-                source_timezone=source_tz,
-                description=description,
-                metadata=metadata,
-                dst_status=dst_status,
-                ambiguity_warning=warning,
-            )
-            events.append(event)
+            event = _event_from_item(item, i, reference_tz)
+            if event is not None:
+                yield event
 
     else:
         raise ValueError(f"Unsupported file format: {input_file.suffix}")
 
-    # Sort events by normalized timestamp
-    events.sort(key=lambda e: e.normalized_timestamp)
 
+def parse_events(input_file: Path, reference_tz: str = "UTC") -> list[Event]:
+    """Parse events from CSV, JSON Lines or JSON file, sorted by normalized timestamp."""
+    events = list(iter_events(input_file, reference_tz))
+    events.sort(key=lambda e: e.epoch_us)
     return events
 
 
-def correlate_events(events: list[Event], window_minutes: int = 5) -> list[CorrelationGroup]:
-    """Group events that occur within the specified time window."""
-    if not events:
-        return []
+def _close_group(group_events: list[Event], group_counter: int) -> CorrelationGroup:
+    return CorrelationGroup(
+        group_id=f"corr-{group_counter:03d}",
+        event_ids=[e.id for e in group_events],
+        time_span_seconds=(group_events[-1].epoch_us - group_events[0].epoch_us) / 1_000_000,
+        pattern=classify_pattern(group_events),
+    )
 
-    groups = []
-    window = timedelta(minutes=window_minutes)
 
-    # Sort by timestamp
-    sorted_events = sorted(events, key=lambda e: e.normalized_timestamp)
+class UnsortedInputError(ValueError):
+    """Raised by iter_correlation_groups when events are not in chronological order."""
 
-    current_group_events = [sorted_events[0]]
-    group_counter = 1
 
-    for event in sorted_events[1:]:
-        current_time = datetime.fromisoformat(event.normalized_timestamp)
-        group_start_time = datetime.fromisoformat(current_group_events[0].normalized_timestamp)
+def iter_correlation_groups(events: Iterable[Event], window_minutes: int = 5) -> Iterator[CorrelationGroup]:
+    """
+    Yield correlation groups from events that are already in chronological order.
 
-        if current_time - group_start_time <= window:
-            current_group_events.append(event)
-        else:
+    Only the events of the current group are held in memory. Raises UnsortedInputError when an
+    event is earlier than its predecessor, since the input then has to be sorted first.
+    """
+    window_us = window_minutes * 60 * 1_000_000
+    current_group_events: list[Event] = []
+    group_counter = 1
+
+    for event in events:
+        if current_group_events:
+            if event.epoch_us < current_group_events[-1].epoch_us:
+                raise UnsortedInputError(f"Events are not in chronological order at {event.id}")
+            if event.epoch_us - current_group_events[0].epoch_us <= window_us:
+                current_group_events.append(event)
+                continue
             # Close current group if it has multiple events
             if len(current_group_events) > 1:
-                start = datetime.fromisoformat(current_group_events[0].normalized_timestamp)
-                end = datetime.fromisoformat(current_group_events[-1].normalized_timestamp)
-                span = (end - start).total_seconds()
-
-                groups.append(
-                    CorrelationGroup(
-                        group_id=f"corr-{group_counter:03d}",
-                        event_ids=[e.id for e in current_group_events],
-                        time_span_seconds=span,
-                        pattern=classify_pattern(current_group_events),
-                    )
-                )
+                yield _close_group(current_group_events, group_counter)
                 group_counter += 1
-
-            current_group_events = [event]
+        current_group_events = [event]
 
     # Handle last group
     if len(current_group_events) > 1:
-        start = datetime.fromisoformat(current_group_events[0].normalized_timestamp)
-        end = datetime.fromisoformat(current_group_events[-1].normalized_timestamp)
-        span = (end - start).total_seconds()
-
-        groups.append(
-            CorrelationGroup(
-                group_id=f"corr-{group_counter:03d}",
-                event_ids=[e.id for e in current_group_events],
-                time_span_seconds=span,
-                pattern=classify_pattern(current_group_events),
-            )
-        )
+        yield _close_group(current_group_events, group_counter)
 
-    return groups
+
+def correlate_events(events: list[Event], window_minutes: int = 5) -> list[CorrelationGroup]:
+    """Group events that occur within the specified time window."""
+    sorted_events = sorted(events, key=lambda e: e.epoch_us)
+    return list(iter_correlation_groups(sorted_events, window_minutes))
 
 
 def classify_pattern(events: list[Event]) -> str:
@@ -359,10 +575,11 @@ def classify_pattern(events: list[Event]) -> str:
     if len(events) <= 1:
         return "single_event"
 
+    timestamps = [e.epoch_us for e in events]
+
     # Check for cascading pattern (rapid succession)
     if len(events) >= 3:
-        timestamps = [datetime.fromisoformat(e.normalized_timestamp) for e in events]
-        intervals = [(timestamps[i + 1] - timestamps[i]).total_seconds() for i in range(len(timestamps) - 1)]
+        intervals = [(timestamps[i + 1] - timestamps[i]) / 1_000_000 for i in range(len(timestamps) - 1)]
         avg_interval = sum(intervals) / len(intervals)
 
         if avg_interval < 60:  # Less than 1 minute average
@@ -371,7 +588,6 @@ def classify_pattern(events: list[Event]) -> str:
             return "rapid_sequence"
 
     # Check for simultaneous events
-    timestamps = [datetime.fromisoformat(e.normalized_timestamp) for e in events]
     if all(t == timestamps[0] for t in timestamps):
         return "simultaneous"
 
@@ -382,7 +598,7 @@ def generate_report(
     events: list[Event], groups: list[CorrelationGroup], timezones: list[str], format: str = "markdown"
 ) -> str:
     """Generate a timeline report in the specified format."""
-    now = datetime.now(ZoneInfo("UTC"))
+    now = datetime.now(UTC)
 
     if format == "markdown":
         return generate_markdown_report(events, groups, timezones, now)
@@ -442,7 +658,7 @@ def generate_markdown_report(
 
         for tz_name in timezones:
             try:
-                tz = ZoneInfo(tz_name)
+                tz = _zone(tz_name)
                 dt_local = dt_utc.astimezone(tz)
                 row += f" {dt_local.strftime('%H:%M')} |"
             except Exception:
@@ -501,42 +717,60 @@ def generate_json_report(
     return json.dumps(report, indent=2)
 
 
-def check_dst_issues(events: list[Event], year: int) -> dict:
-    """Check for events that may have occurred during DST transitions."""
-    # Get unique timezones from events
-    unique_timezones = set(e.source_timezone for e in events if e.source_timezone != "UTC")
+def check_dst_issues(events: Iterable[Event], year: int) -> dict:
+    """
+    Check for events that may have occurred during DST transitions.
 
-    issues = []
+    Events are consumed in a single pass (a streamed iterable from iter_events works too).
+    Transitions come from each timezone's TransitionIndex, which also classifies events on
+    transition dates as ambiguous, non-existent or normal local times.
+    """
+    timezones_checked = []
     transitions_info = {}
+    # Per timezone: (index, local day numbers of transition dates), or None when there is nothing to check
+    checks: dict[str, Optional[tuple[TransitionIndex, set]]] = {}
+    issues = []
 
-    for tz_name in unique_timezones:
-        if tz_name.startswith("UTC"):
+    for event in events:
+        tz_name = event.source_timezone
+        if tz_name == "UTC":
             continue
-        try:
-            transitions = get_dst_transitions(year, tz_name)
+        if tz_name not in checks:
+            timezones_checked.append(tz_name)
+            checks[tz_name] = None
+            if tz_name.startswith("UTC"):
+                continue
+            try:
+                index = get_transition_index(tz_name, year, year)
+            except Exception as e:
+                print(f"Warning: Could not check DST for {tz_name}: {e}", file=sys.stderr)
+                continue
+            transitions = index.transitions_in_year(year)
             if transitions:
-                transitions_info[tz_name] = [{"date": t[0].strftime("%Y-%m-%d"), "type": t[1]} for t in transitions]
-
-                # Check if any events fall on transition dates
-                transition_dates = set(t[0].date() for t in transitions)
-                for event in events:
-                    if event.source_timezone == tz_name:
-                        event_date = datetime.fromisoformat(event.normalized_timestamp).date()
-                        if event_date in transition_dates:
-                            issues.append(
-                                {
-                                    "event_id": event.id,
-                                    "timezone": tz_name,
-                                    "date": str(event_date),
-                                    "warning": "Event occurred on DST transition date",
-                                }
-                            )
-        except Exception as e:
-            print(f"Warning: Could not check DST for {tz_name}: {e}", file=sys.stderr)
+                transitions_info[tz_name] = [{"date": d.strftime("%Y-%m-%d"), "type": kind} for d, kind in transitions]
+                checks[tz_name] = (index, {d.toordinal() - _EPOCH_ORDINAL for d, _ in transitions})
+
+        # Check if the event falls on a transition date, in its own timezone's calendar
+        check = checks[tz_name]
+        if check is None:
+            continue
+        index, transition_days = check
+        local_epoch_us = event.epoch_us + index.utc_offset_us(event.epoch_us)
+        if local_epoch_us // _MICROSECONDS_PER_DAY in transition_days:
+            classification = index.classify_local(_event_local_wall_us(event, index))
+            issues.append(
+                {
+                    "event_id": event.id,
+                    "timezone": tz_name,
+                    "date": str(epoch_us_to_date(local_epoch_us)),
+                    "classification": classification,
+                    "warning": DST_WARNINGS.get(classification, "Event occurred on DST transition date"),
+                }
+            )
 
     return {
         "year": year,
-        "timezones_checked": list(unique_timezones),
+        "timezones_checked": timezones_checked,
         "dst_transitions": transitions_info,
         "issues": issues,
     }
@@ -551,10 +785,18 @@ def cmd_parse(args):
 
     events = parse_events(input_path, args.reference_tz)
 
+    if args.output and Path(args.output).suffix.lower() == ".jsonl":
+        output_path = Path(args.output)
+        with open(output_path, "w", encoding="utf-8") as f:
+            for event in events:
+                f.write(json.dumps(asdict(event)) + "\n")
+        print(f"Parsed {len(events)} events to {output_path}")
+        return 0
+
     output = {
         "schema_version": "1.0",
         "reference_timezone": args.reference_tz,
-        "generated_at": datetime.now(ZoneInfo("UTC")).isoformat(),
+        "generated_at": datetime.now(UTC).isoformat(),
         "events": [asdict(e) for e in events],
     }
 
@@ -569,6 +811,53 @@ def cmd_parse(args):
     return 0
 
 
+def _write_groups_jsonl(groups: Iterable[CorrelationGroup], out) -> int:
+    count = 0
+    for group in groups:
+        out.write(json.dumps(asdict(group)) + "\n")
+        count += 1
+    return count
+
+
+def correlate_stream(input_path: Path, args) -> int:
+    """
+    Correlate a CSV/JSON Lines file one event at a time, writing one group per line.
+
+    Groups are spooled to a temporary file so nothing is emitted if the input turns out to be
+    unsorted; in that case the events are re-read, sorted in memory and correlated again.
+    The output file, if any, must end in .jsonl.
+    """
+    if args.output and Path(args.output).suffix.lower() != ".jsonl":
+        print(
+            f"Error: streamed correlation writes JSON Lines; use a .jsonl output path, not {args.output}",
+            file=sys.stderr,
+        )
+        return 1
+
+    with tempfile.TemporaryFile("w+", encoding="utf-8") as spool:
+        try:
+            count = _write_groups_jsonl(
+                iter_correlation_groups(iter_events(input_path, args.reference_tz), args.window_minutes), spool
+            )
+        except UnsortedInputError as e:
+            print(f"Warning: {e}; sorting in memory", file=sys.stderr)
+            spool.seek(0)
+            spool.truncate()
+            events = sorted(iter_events(input_path, args.reference_tz), key=lambda ev: ev.epoch_us)
+            count = _write_groups_jsonl(iter_correlation_groups(events, args.window_minutes), spool)
+
+        spool.seek(0)
+        if args.output:
+            output_path = Path(args.output)
+            with open(output_path, "w", encoding="utf-8") as f:
+                shutil.copyfileobj(spool, f)
+            print(f"Found {count} correlation groups, saved to {output_path}")
+        else:
+            shutil.copyfileobj(spool, sys.stdout)
+
+    return 0
+
+
 def cmd_correlate(args):
     """Handle correlate command."""
     input_path = Path(args.input)
@@ -576,6 +865,9 @@ def cmd_correlate(args):
         print(f"Error: Input file not found: {input_path}", file=sys.stderr)
         return 1
 
+    if input_path.suffix.lower() in STREAM_SUFFIXES:
+        return correlate_stream(input_path, args)
+
     with open(input_path, "r", encoding="utf-8") as f:
         data = json.load(f)
 
@@ -585,7 +877,7 @@ def cmd_correlate(args):
     output = {
         "schema_version": "1.0",
         "reference_timezone": data.get("reference_timezone", "UTC"),
-        "generated_at": datetime.now(ZoneInfo("UTC")).isoformat(),
+        "generated_at": datetime.now(UTC).isoformat(),
         "correlation_window_minutes": args.window_minutes,
         "events": [asdict(e) for e in events],
         "correlation_groups": [asdict(g) for g in groups],
@@ -636,10 +928,13 @@ def cmd_dst_check(args):
         print(f"Error: Input file not found: {input_path}", file=sys.stderr)
         return 1
 
-    with open(input_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    if input_path.suffix.lower() in STREAM_SUFFIXES:
+        events = iter_events(input_path, args.reference_tz)
+    else:
+        with open(input_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        events = [Event(**e) for e in data.get("events", [])]
 
-    events = [Event(**e) for e in data.get("events", [])]
     result = check_dst_issues(events, args.year)
 
     if args.output:
@@ -661,15 +956,20 @@ def main():
 
     # Parse command
     parse_parser = subparsers.add_parser("parse", help="Parse events and normalize timestamps")
-    parse_parser.add_argument("--input", "-i", required=True, help="Input file (CSV or JSON)")
-    parse_parser.add_argument("--output", "-o", help="Output JSON file")
+    parse_parser.add_argument("--input", "-i", required=True, help="Input file (CSV, JSON or JSONL)")
+    parse_parser.add_argument("--output", "-o", help="Output JSON file (.jsonl writes one event per line)")
     parse_parser.add_argument("--reference-tz", default="UTC", help="Reference timezone (default: UTC)")
 
     # Correlate command
     correlate_parser = subparsers.add_parser("correlate", help="Correlate events within time windows")
-    correlate_parser.add_argument("--input", "-i", required=True, help="Input JSON file (from parse)")
-    correlate_parser.add_argument("--output", "-o", help="Output JSON file")
+    correlate_parser.add_argument(
+        "--input", "-i", required=True, help="Input JSON file (from parse), or CSV/JSONL to stream"
+    )
+    correlate_parser.add_argument("--output", "-o", help="Output file (JSON, or JSONL groups when streaming)")
     correlate_parser.add_argument("--window-minutes", "-w", type=int, default=5, help="Correlation window in minutes")
+    correlate_parser.add_argument(
+        "--reference-tz", default="UTC", help="Timezone for streamed rows without one (default: UTC)"
+    )
 
     # Report command
     report_parser = subparsers.add_parser("report", help="Generate timeline report")
@@ -685,9 +985,12 @@ def main():
 
     # DST check command
     dst_parser = subparsers.add_parser("dst-check", help="Check for DST-related issues")
-    dst_parser.add_argument("--input", "-i", required=True, help="Input JSON file")
+    dst_parser.add_argument("--input", "-i", required=True, help="Input JSON file, or CSV/JSONL to stream")
     dst_parser.add_argument("--output", "-o", help="Output JSON file")
     dst_parser.add_argument("--year", "-y", type=int, default=datetime.now().year, help="Year to check DST transitions")
+    dst_parser.add_argument(
+        "--reference-tz", default="UTC", help="Timezone for streamed rows without one (default: UTC)"
+    )
 
     args = parser.parse_args()
 
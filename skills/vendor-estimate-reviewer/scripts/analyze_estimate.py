@@ -15,6 +15,7 @@ Options:
     --budget           Client budget (for comparison)
     --template         Report template to use (default, executive, detailed)
     --rates-file       JSON file with market rate benchmarks
+    --no-extraction-cache  Always re-extract PDF text (see doc_text_cache.py)
     --verbose, -v      Verbose output
 
 Examples:
@@ -30,6 +31,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from doc_text_cache import ExtractionCache, extract_pdf_pages, open_cache
+
 # Optional imports with graceful fallback
 try:
     import pandas as pd
@@ -57,8 +60,9 @@ except ImportError:
 class EstimateAnalyzer:
     """Analyzes vendor estimates and generates review reports."""
 
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, extraction_cache: Optional[ExtractionCache] = None):
         self.verbose = verbose
+        self.extraction_cache = extraction_cache
         self.findings = []
         self.warnings = []
         self.risks = []
@@ -143,11 +147,7 @@ class EstimateAnalyzer:
         """Parse PDF file (basic text extraction)."""
         self.log(f"Parsing PDF file: {file_path}")
 
-        with open(file_path, "rb") as f:
-            reader = PyPDF2.PdfReader(f)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text()
+        text = "".join(extract_pdf_pages(file_path, self.extraction_cache))
 
         # Basic extraction (this is simplified - production would need more sophisticated parsing)
         estimate_data = {
@@ -637,6 +637,8 @@ def main():
         "--template", choices=["default", "executive", "detailed"], default="default", help="Report template"
     )
     parser.add_argument("--rates-file", type=Path, help="JSON file with market rate benchmarks")
+    parser.add_argument("--extraction-cache-dir", type=Path, help="PDF text extraction cache directory")
+    parser.add_argument("--no-extraction-cache", action="store_true", help="Always re-extract PDF text")
     parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
 
     args = parser.parse_args()
@@ -658,8 +660,11 @@ def main():
         print("Error: PyPDF2 is required for PDF analysis. Install with: pip install PyPDF2", file=sys.stderr)
         return 1
 
-    # Create analyzer
-    analyzer = EstimateAnalyzer(verbose=args.verbose)
+    # Create analyzer (PDF text is cached across runs)
+    cache = None
+    if args.input_file.suffix.lower() == ".pdf":
+        cache = open_cache(args.extraction_cache_dir, enabled=not args.no_extraction_cache)
+    analyzer = EstimateAnalyzer(verbose=args.verbose, extraction_cache=cache)
 
     # Load custom rates if provided
     if args.rates_file:
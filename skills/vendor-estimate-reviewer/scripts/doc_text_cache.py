@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Document text extraction cache shared by skills that read PDF/DOCX files.
+
+Extracted PDF page text and DOCX paragraphs are stored on disk, keyed by the
+SHA-256 of the file contents plus the extractor (library and version), so
+re-running an analysis on an unchanged document skips extraction entirely,
+even if the file was renamed or copied. contract-reviewer,
+wbs-review-assistant and vendor-estimate-reviewer ship identical copies of
+this module and share one cache directory; keep the copies in sync
+(contract-reviewer's tests compare their digests).
+
+Extracted text can be confidential, so the cache directory is private to the
+user (0700) and entries are written 0600 regardless of the umask.
+
+Usage:
+    from doc_text_cache import ExtractionCache, extract_pdf_pages
+
+    cache = ExtractionCache()  # $DOC_TEXT_CACHE_DIR, else ~/.cache/claude-skills/doc-text
+    pages = extract_pdf_pages(Path("contract.pdf"), cache)
+    print(cache.report())
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Callable, Optional
+
+# Bump to invalidate every cache entry (e.g. when the entry layout changes)
+CACHE_FORMAT_VERSION = 1
+DEFAULT_CACHE_MAX_MB = 256
+_DIGEST_CHUNK_BYTES = 1024 * 1024
+
+
+def default_cache_dir() -> Path:
+    """Cache location: $DOC_TEXT_CACHE_DIR, else the user cache directory."""
+    if os.environ.get("DOC_TEXT_CACHE_DIR"):
+        return Path(os.environ["DOC_TEXT_CACHE_DIR"])
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "claude-skills" / "doc-text"
+
+
+def default_max_bytes() -> int:
+    """Size bound: $DOC_TEXT_CACHE_MAX_MB, else DEFAULT_CACHE_MAX_MB."""
+    try:
+        max_mb = float(os.environ.get("DOC_TEXT_CACHE_MAX_MB", DEFAULT_CACHE_MAX_MB))
+    except ValueError:
+        max_mb = DEFAULT_CACHE_MAX_MB
+    return int(max_mb * 1024 * 1024)
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_DIGEST_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """Content-addressed on-disk cache of extracted document text with LRU eviction.
+
+    Entries are JSON files named ``<key>.json`` holding a list of text parts
+    (pages or paragraphs). A hit refreshes the entry's mtime, and once the
+    directory grows past ``max_bytes`` the least recently used entries are
+    deleted. Writes go through a temp file and an atomic rename, so concurrent
+    processes never read partial entries. Instances hold no locks and can be
+    passed to worker processes.
+
+    The root directory is created (or tightened to) mode 0700 and entries are
+    created 0600, so other users on a shared host cannot read extracted text.
+    """
+
+    def __init__(self, root: Optional[Path] = None, max_bytes: Optional[int] = None):
+        self.root = Path(root) if root else default_cache_dir()
+        self.root.mkdir(mode=0o700, parents=True, exist_ok=True)
+        os.chmod(self.root, 0o700)
+        self.max_bytes = default_max_bytes() if max_bytes is None else max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._size: Optional[int] = None  # approximate total, refreshed on eviction
+
+    @staticmethod
+    def key(digest: str, extractor: str) -> str:
+        """Cache key for a file digest and extractor id."""
+        return hashlib.sha256(f"{CACHE_FORMAT_VERSION}:{extractor}:{digest}".encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[list[str]]:
+        """Return the cached text parts for key, or None on a miss."""
+        path = self.root / f"{key}.json"
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                parts = json.load(f)["parts"]
+            os.utime(path)
+        except (OSError, ValueError, KeyError, TypeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return parts
+
+    def put(self, key: str, parts: list[str], extractor: str = "") -> None:
+        """Store text parts under key, evicting old entries if the cache is over its size bound."""
+        path = self.root / f"{key}.json"
+        tmp = None
+        try:
+            # mkstemp creates the file 0600, whatever the process umask
+            fd, tmp = tempfile.mkstemp(prefix=f".{key}.", suffix=".tmp", dir=self.root)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"extractor": extractor, "parts": parts}, f, ensure_ascii=False)
+            os.replace(tmp, path)
+            size = path.stat().st_size
+        except OSError:
+            if tmp is not None and os.path.exists(tmp):
+                os.unlink(tmp)
+            return
+
+        if self._size is None:
+            self._size = self._scan()[1]
+        else:
+            self._size += size
+        if self._size > self.max_bytes:
+            self._size = self.evict()
+
+    def _scan(self) -> tuple:
+        """List ``(mtime, size, path)`` for every entry and their total size."""
+        entries = []
+        for entry in os.scandir(self.root):
+            if entry.name.startswith(".") or not entry.name.endswith(".json"):
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, entry.path))
+        return entries, sum(size for _, size, _ in entries)
+
+    def evict(self) -> int:
+        """Delete least recently used entries until the cache fits; returns the new total size."""
+        entries, total = self._scan()
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+        return total
+
+    def report(self) -> str:
+        """One-line hit/miss summary for CLI output."""
+        return f"Extraction cache: {self.hits} hit(s), {self.misses} miss(es) ({self.root})"
+
+
+def open_cache(root: Optional[Path] = None, enabled: bool = True) -> Optional[ExtractionCache]:
+    """CLI helper: an ExtractionCache at root, or None if disabled or the directory is not writable."""
+    if not enabled:
+        return None
+    try:
+        return ExtractionCache(root)
+    except OSError as e:
+        print(f"Warning: extraction cache disabled ({e})", file=sys.stderr)
+        return None
+
+
+def cached_extract(
+    path: Path, extractor: str, extract: Callable[[Path], tuple], cache: Optional[ExtractionCache] = None
+) -> list[str]:
+    """Return extract(path)'s text parts, through the cache when one is given.
+
+    ``extract`` returns ``(parts, complete)``; incomplete extractions (some
+    pages failed) are returned but not cached, so they are retried next run.
+    """
+    if cache is None:
+        return extract(path)[0]
+    key = cache.key(file_digest(path), extractor)
+    parts = cache.get(key)
+    if parts is None:
+        parts, complete = extract(path)
+        if complete:
+            cache.put(key, parts, extractor)
+    return parts
+
+
+def _pdf_pages(path: Path) -> tuple:
+    import PyPDF2
+
+    parts = []
+    complete = True
+    with open(path, "rb") as f:
+        reader = PyPDF2.PdfReader(f)
+        if reader.is_encrypted:
+            raise ValueError("PDF is encrypted. Cannot analyze encrypted documents.")
+        total_pages = len(reader.pages)
+        for i, page in enumerate(reader.pages, 1):
+            try:
+                parts.append(page.extract_text() or "")
+            except Exception as e:
+                print(f"Warning: Failed to extract page {i}/{total_pages}: {e}", file=sys.stderr)
+                parts.append("")
+                complete = False
+    return parts, complete
+
+
+def _docx_paragraphs(path: Path) -> tuple:
+    from docx import Document
+
+    return [para.text for para in Document(path).paragraphs], True
+
+
+def extract_pdf_pages(path: Path, cache: Optional[ExtractionCache] = None) -> list[str]:
+    """Text of each PDF page (PyPDF2; "" for pages without text).
+
+    Raises:
+        ImportError: If PyPDF2 is not installed
+        ValueError: If the PDF is encrypted
+    """
+    import PyPDF2
+
+    return cached_extract(path, f"PyPDF2-{PyPDF2.__version__}:pages", _pdf_pages, cache)
+
+
+def extract_docx_paragraphs(path: Path, cache: Optional[ExtractionCache] = None) -> list[str]:
+    """Text of each DOCX paragraph (python-docx).
+
+    Raises:
+        ImportError: If python-docx is not installed
+    """
+    import docx
+
+    return cached_extract(path, f"python-docx-{getattr(docx, '__version__', '')}:paragraphs", _docx_paragraphs, cache)
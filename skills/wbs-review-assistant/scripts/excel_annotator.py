@@ -7,13 +7,13 @@ Add review comments and conditional formatting to Excel WBS files
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 try:
     from openpyxl import load_workbook
     from openpyxl.comments import Comment
     from openpyxl.styles import Font, PatternFill
-    from openpyxl.utils import get_column_letter
+    from openpyxl.utils import column_index_from_string, get_column_letter
 except ImportError:
     print("Error: openpyxl not installed. Install with: pip install openpyxl", file=sys.stderr)
     sys.exit(1)
@@ -79,23 +79,15 @@ class ExcelAnnotator:
         """
         # Convert column letter to number if needed
         if isinstance(col, str):
-            from openpyxl.utils import column_index_from_string
-
             col = column_index_from_string(col)
 
         # Get cell
         cell = self.worksheet.cell(row=row, column=col)
 
-        # Build comment text
-        comment_text = f"[{finding_id}]\n"
-        comment_text += f"Severity: {severity.upper()}\n\n"
-        comment_text += f"Issue: {issue}\n\n"
-        if requirement_ref:
-            comment_text += f"Reference: {requirement_ref}\n\n"
-        comment_text += f"Recommendation: {recommendation}"
-
         # Add comment
-        cell.comment = Comment(comment_text, "WBS Reviewer")
+        cell.comment = Comment(
+            self._comment_text(finding_id, severity, issue, recommendation, requirement_ref), "WBS Reviewer"
+        )
 
         # Apply conditional formatting (background color)
         if severity in self.SEVERITY_COLORS:
@@ -104,24 +96,63 @@ class ExcelAnnotator:
 
         self.annotations_added += 1
 
+    @staticmethod
+    def _comment_text(
+        finding_id: str, severity: str, issue: str, recommendation: str, requirement_ref: Optional[str] = None
+    ) -> str:
+        """Build the comment text for one finding"""
+        comment_text = f"[{finding_id}]\n"
+        comment_text += f"Severity: {severity.upper()}\n\n"
+        comment_text += f"Issue: {issue}\n\n"
+        if requirement_ref:
+            comment_text += f"Reference: {requirement_ref}\n\n"
+        comment_text += f"Recommendation: {recommendation}"
+        return comment_text
+
     def add_findings_batch(self, findings: List[Dict]):
         """
         Add multiple findings at once
 
+        Findings are grouped by cell and each cell is written once: findings on the
+        same cell share one comment (in input order) and the cell gets the color
+        of the most severe one, instead of the last finding overwriting the others.
+        Fills are created once per severity rather than once per cell.
+
         Args:
             findings: List of finding dicts with keys:
                 row, col, finding_id, severity, issue, recommendation, requirement_ref
         """
+        fills = {
+            severity: PatternFill(start_color=color, end_color=color, fill_type="solid")
+            for severity, color in self.SEVERITY_COLORS.items()
+        }
+        severity_rank = {severity: rank for rank, severity in enumerate(self.SEVERITY_COLORS)}
+
+        by_cell: Dict[Tuple[int, int], List[Dict]] = {}
         for finding in findings:
-            self.add_finding(
-                row=finding["row"],
-                col=finding["col"],
-                finding_id=finding["finding_id"],
-                severity=finding["severity"],
-                issue=finding["issue"],
-                recommendation=finding["recommendation"],
-                requirement_ref=finding.get("requirement_ref"),
-            )
+            col = finding["col"]
+            if isinstance(col, str):
+                col = column_index_from_string(col)
+            by_cell.setdefault((finding["row"], col), []).append(finding)
+
+        for (row, col), cell_findings in by_cell.items():
+            cell = self.worksheet.cell(row=row, column=col)
+            texts = [
+                self._comment_text(
+                    f["finding_id"], f["severity"], f["issue"], f["recommendation"], f.get("requirement_ref")
+                )
+                for f in cell_findings
+            ]
+            comment = Comment("\n\n---\n\n".join(texts), "WBS Reviewer")
+            if len(texts) > 1:
+                comment.height *= len(texts)
+            cell.comment = comment
+
+            severities = [f["severity"] for f in cell_findings if f["severity"] in fills]
+            if severities:
+                cell.fill = fills[min(severities, key=severity_rank.get)]
+
+        self.annotations_added += len(findings)
 
     def create_review_summary_sheet(self, findings: List[Dict], summary_stats: Dict):
         """
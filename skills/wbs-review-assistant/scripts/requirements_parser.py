@@ -9,6 +9,8 @@ import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from doc_text_cache import ExtractionCache, extract_docx_paragraphs, extract_pdf_pages, open_cache
+
 
 class RequirementsParser:
     """Parse requirements documents and extract structured requirement data"""
@@ -23,9 +25,10 @@ class RequirementsParser:
         r"\b(機能-\d+)\b",  # Japanese functional
     ]
 
-    def __init__(self, file_path: str):
-        """Initialize parser with file path"""
+    def __init__(self, file_path: str, extraction_cache: Optional[ExtractionCache] = None):
+        """Initialize parser with file path (PDF/DOCX text is read through extraction_cache if given)"""
         self.file_path = Path(file_path)
+        self.extraction_cache = extraction_cache
         if not self.file_path.exists():
             raise FileNotFoundError(f"Requirements file not found: {file_path}")
 
@@ -79,14 +82,7 @@ class RequirementsParser:
     def _read_pdf(self) -> str:
         """Read PDF file (placeholder - requires PyPDF2 or similar)"""
         try:
-            import PyPDF2
-
-            with open(self.file_path, "rb") as f:
-                reader = PyPDF2.PdfReader(f)
-                text = []
-                for page in reader.pages:
-                    text.append(page.extract_text())
-                return "\n".join(text)
+            return "\n".join(extract_pdf_pages(self.file_path, self.extraction_cache))
         except ImportError:
             # Fallback: suggest using docling or other tools
             print("Warning: PyPDF2 not available. PDF content not parsed.", file=sys.stderr)
@@ -95,13 +91,7 @@ class RequirementsParser:
     def _read_docx(self) -> str:
         """Read DOCX file (placeholder - requires python-docx)"""
         try:
-            from docx import Document
-
-            doc = Document(self.file_path)
-            text = []
-            for para in doc.paragraphs:
-                text.append(para.text)
-            return "\n".join(text)
+            return "\n".join(extract_docx_paragraphs(self.file_path, self.extraction_cache))
         except ImportError:
             print("Warning: python-docx not available. DOCX content not parsed.", file=sys.stderr)
             return f"[DOCX file: {self.file_path.name} - requires manual extraction]"
@@ -269,11 +259,16 @@ def main():
     parser = argparse.ArgumentParser(description="Parse requirements document")
     parser.add_argument("file_path", help="Path to requirements document")
     parser.add_argument("--output", "-o", help="Output JSON file path")
+    parser.add_argument("--extraction-cache-dir", help="PDF/DOCX text extraction cache directory")
+    parser.add_argument("--no-extraction-cache", action="store_true", help="Always re-extract PDF/DOCX text")
 
     args = parser.parse_args()
 
     # Parse requirements
-    req_parser = RequirementsParser(args.file_path)
+    cache = None
+    if Path(args.file_path).suffix.lower() in (".pdf", ".docx", ".doc"):
+        cache = open_cache(args.extraction_cache_dir, enabled=not args.no_extraction_cache)
+    req_parser = RequirementsParser(args.file_path, extraction_cache=cache)
     result = req_parser.parse()
 
     # Print summary
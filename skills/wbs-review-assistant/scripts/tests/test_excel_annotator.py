@@ -122,6 +122,50 @@ class TestExcelAnnotator:
 
         assert annotator.annotations_added == 3
 
+    def test_batch_matches_single_findings(self, sample_wbs_excel, sample_findings):
+        """Test that a batch writes the same comments and colors as one finding at a time"""
+        single = ExcelAnnotator(str(sample_wbs_excel))
+        for finding in sample_findings:
+            single.add_finding(**finding)
+        batch = ExcelAnnotator(str(sample_wbs_excel))
+        batch.add_findings_batch(sample_findings)
+
+        for finding in sample_findings:
+            expected = single.worksheet.cell(row=finding["row"], column=finding["col"])
+            cell = batch.worksheet.cell(row=finding["row"], column=finding["col"])
+            assert cell.comment.text == expected.comment.text
+            assert cell.fill.start_color.rgb == expected.fill.start_color.rgb
+
+    def test_batch_merges_findings_on_same_cell(self, sample_wbs_excel):
+        """Test that findings on one cell share a comment and the most severe color"""
+        annotator = ExcelAnnotator(str(sample_wbs_excel))
+        annotator.add_findings_batch(
+            [
+                {
+                    "row": 3,
+                    "col": "C",
+                    "finding_id": "MINOR-001",
+                    "severity": "minor",
+                    "issue": "A",
+                    "recommendation": "Fix A",
+                },
+                {
+                    "row": 3,
+                    "col": 3,
+                    "finding_id": "MAJOR-002",
+                    "severity": "major",
+                    "issue": "B",
+                    "recommendation": "Fix B",
+                },
+            ]
+        )
+
+        cell = annotator.worksheet.cell(row=3, column=3)
+        assert "MINOR-001" in cell.comment.text
+        assert "MAJOR-002" in cell.comment.text
+        assert cell.fill.start_color.rgb[-6:] == "FFE5CC"  # Major = orange
+        assert annotator.annotations_added == 2
+
     def test_severity_colors(self, sample_wbs_excel, tmp_path):
         """Test that different severities get correct colors"""
         output_path = tmp_path / "annotated_colors.xlsx"
@@ -178,3 +178,28 @@ class TestRequirementsParser:
         assert "description" in req_001
         assert len(req_001["description"]) > 0
         assert "authentication" in req_001["description"].lower() or "email" in req_001["description"].lower()
+
+    def test_pdf_text_read_through_extraction_cache(self, tmp_path, monkeypatch):
+        """Unchanged PDFs are not re-extracted when a cache is given"""
+        import sys
+        import types
+
+        from doc_text_cache import ExtractionCache
+
+        calls = []
+
+        def pdf_reader(f):
+            calls.append(f.name)
+            page = types.SimpleNamespace(extract_text=lambda: "REQ-001: Login\nREQ-002: Export")
+            return types.SimpleNamespace(is_encrypted=False, pages=[page])
+
+        monkeypatch.setitem(sys.modules, "PyPDF2", types.SimpleNamespace(PdfReader=pdf_reader, __version__="3.0.1"))
+        req_file = tmp_path / "requirements.pdf"
+        req_file.write_bytes(b"%PDF-1.4 stub")
+        cache = ExtractionCache(tmp_path / "cache")
+
+        for _ in range(2):
+            result = RequirementsParser(str(req_file), extraction_cache=cache).parse()
+            assert [req["req_id"] for req in result["requirements"]] == ["REQ-001", "REQ-002"]
+        assert len(calls) == 1
+        assert cache.hits == 1
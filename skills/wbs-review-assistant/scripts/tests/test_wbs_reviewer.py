@@ -304,3 +304,20 @@ class TestWBSReviewer:
 
         # 1.0 is not a leaf (has 1.1, 1.2 children)
         assert reviewer._is_leaf_task("1.0") is False
+
+    def test_requirement_index_substring_semantics(self, sample_wbs_excel, sample_requirements):
+        """Test that requirement IDs map to every task name containing them"""
+        reviewer = WBSReviewer(wbs_path=str(sample_wbs_excel), requirements_path=str(sample_requirements))
+
+        assert reviewer._find_wbs_tasks_for_requirement("REQ-001") == ["1.1"]
+        assert reviewer._find_wbs_tasks_for_requirement("REQ-004") == []
+        # IDs that are not in the requirements document are looked up on demand
+        assert reviewer._find_wbs_tasks_for_requirement("REQ-00") == ["1.1", "2.1", "3.1"]
+
+    def test_is_leaf_task_nested_codes(self, sample_wbs_excel, sample_requirements):
+        """Test leaf detection for summary rows and deeper levels"""
+        reviewer = WBSReviewer(wbs_path=str(sample_wbs_excel), requirements_path=str(sample_requirements))
+
+        assert reviewer._is_leaf_task("3.0") is False
+        assert reviewer._is_leaf_task("3.1") is True
+        assert reviewer._is_leaf_task("") is False
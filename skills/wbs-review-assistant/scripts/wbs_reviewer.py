@@ -9,7 +9,7 @@ import re
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 try:
     import pandas as pd
@@ -21,6 +21,7 @@ except ImportError:
     sys.exit(1)
 
 # Import local modules
+from doc_text_cache import ExtractionCache, open_cache
 from excel_annotator import ExcelAnnotator
 from requirements_parser import RequirementsParser
 
@@ -34,6 +35,7 @@ class WBSReviewer:
         requirements_path: str,
         checklist_path: Optional[str] = None,
         hearing_sheet_path: Optional[str] = None,
+        extraction_cache: Optional[ExtractionCache] = None,
     ):
         """
         Initialize WBS reviewer
@@ -43,6 +45,7 @@ class WBSReviewer:
             requirements_path: Path to requirements document
             checklist_path: Path to review checklist YAML (optional)
             hearing_sheet_path: Path to hearing notes (optional)
+            extraction_cache: Cache for PDF/DOCX requirements text (optional)
         """
         self.wbs_path = Path(wbs_path)
         self.requirements_path = Path(requirements_path)
@@ -58,7 +61,7 @@ class WBSReviewer:
 
         # Parse requirements
         print("Parsing requirements document...")
-        req_parser = RequirementsParser(str(self.requirements_path))
+        req_parser = RequirementsParser(str(self.requirements_path), extraction_cache=extraction_cache)
         self.requirements_data = req_parser.parse()
 
         # Parse hearing notes if provided
@@ -76,6 +79,10 @@ class WBSReviewer:
         self.traceability_matrix: List[Dict] = []
         self.missing_tasks: List[Dict] = []
 
+        # Lookup tables built from the WBS on first use
+        self._req_task_index: Optional[Dict[str, List[str]]] = None
+        self._child_summaries: Optional[Dict[str, Set[str]]] = None
+
     def _load_checklist(self, checklist_path: str) -> Dict:
         """Load review checklist YAML"""
         path = Path(checklist_path)
@@ -233,20 +240,59 @@ class WBSReviewer:
 
     def _find_wbs_tasks_for_requirement(self, req_id: str) -> List[str]:
         """Find WBS tasks that reference a requirement ID"""
-        mapped_tasks = []
+        if self._req_task_index is None:
+            req_ids = [req["req_id"] for req in self.requirements_data["requirements"]]
+            self._req_task_index = self._build_requirement_task_index(req_ids)
 
-        if self.task_name_col is None:
-            return mapped_tasks
+        if req_id in self._req_task_index:
+            return list(self._req_task_index[req_id])
+        return self._build_requirement_task_index([req_id])[req_id]
 
-        for idx, row in self.wbs_df.iterrows():
-            task_name = str(row.get(self.task_name_col, ""))
-            wbs_code = str(row.get(self.wbs_code_col, "")) if self.wbs_code_col else f"Row{idx}"
+    def _build_requirement_task_index(self, req_ids: Iterable[str]) -> Dict[str, List[str]]:
+        """
+        Map requirement IDs to the WBS tasks whose name contains them, in one pass over the WBS
 
-            # Check if requirement ID appears in task description
-            if req_id in task_name:
-                mapped_tasks.append(wbs_code)
+        Each task name is scanned once for substrings that are requirement IDs
+        (same semantics as ``req_id in task_name``), instead of scanning the
+        whole WBS once per requirement.
+        """
+        index: Dict[str, List[str]] = {req_id: [] for req_id in req_ids}
+        if self.task_name_col is None:
+            return index
 
-        return mapped_tasks
+        task_names = self._column_strings(self.task_name_col)
+        if self.wbs_code_col:
+            wbs_codes = self._column_strings(self.wbs_code_col)
+        else:
+            wbs_codes = [f"Row{idx}" for idx in self.wbs_df.index]
+
+        ids = {req_id for req_id in index if req_id}
+        lengths = sorted({len(req_id) for req_id in ids})
+        first_chars = {req_id[0] for req_id in ids}
+
+        for task_name, wbs_code in zip(task_names, wbs_codes):
+            found = set()
+            for start, char in enumerate(task_name):
+                if char not in first_chars:
+                    continue
+                for length in lengths:
+                    token = task_name[start : start + length]
+                    if len(token) < length:
+                        break
+                    if token in ids:
+                        found.add(token)
+            for req_id in found:
+                index[req_id].append(wbs_code)
+
+        if "" in index:
+            index[""] = list(wbs_codes)
+        return index
+
+    def _column_strings(self, col) -> List[str]:
+        """str() of every row's value in a WBS column ("" for each row if the column is missing)"""
+        if col not in self.wbs_df.columns:
+            return [""] * len(self.wbs_df)
+        return [str(value) for value in self.wbs_df[col]]
 
     def _validate_structure(self):
         """Validate WBS hierarchical structure"""
@@ -255,8 +301,9 @@ class WBSReviewer:
 
         # Check WBS numbering consistency
         prev_code = None
-        for idx, row in self.wbs_df.iterrows():
-            wbs_code = str(row.get(self.wbs_code_col, "")).strip()
+        rows = zip(self.wbs_df.index, self._column_strings(self.wbs_code_col), self._column_strings(self.task_name_col))
+        for idx, wbs_code, task_name in rows:
+            wbs_code = wbs_code.strip()
 
             if not wbs_code or wbs_code == "nan":
                 continue
@@ -277,7 +324,7 @@ class WBSReviewer:
                             "category": "structure",
                             "row": idx + 2,  # +2 for header and 0-index
                             "col": self._get_col_num(self.wbs_code_col),
-                            "task_name": str(row.get(self.task_name_col, "")),
+                            "task_name": task_name,
                             "issue": f"WBS code {wbs_code} skips hierarchy levels",
                             "requirement_ref": None,
                             "recommendation": f"Add intermediate level(s) between {'.'.join(map(str, prev_code))} and {wbs_code}",
@@ -290,11 +337,13 @@ class WBSReviewer:
         """Check task-level content quality"""
         # Check for missing effort estimates
         if self.effort_col:
-            for idx, row in self.wbs_df.iterrows():
-                effort = row.get(self.effort_col)
-                task_name = str(row.get(self.task_name_col, ""))
-                wbs_code = str(row.get(self.wbs_code_col, ""))
-
+            rows = zip(
+                self.wbs_df.index,
+                self.wbs_df[self.effort_col],
+                self._column_strings(self.task_name_col),
+                self._column_strings(self.wbs_code_col),
+            )
+            for idx, effort, task_name, wbs_code in rows:
                 if pd.isna(effort) or effort == "" or effort == 0:
                     # Check if it's a leaf task (no children)
                     if self._is_leaf_task(wbs_code):
@@ -312,31 +361,40 @@ class WBSReviewer:
                             }
                         )
 
+    @staticmethod
+    def _summary_code(wbs_code: str) -> str:
+        """Strip trailing ".0" levels: "2.0" is the summary row of "2.1", "2.2", ..."""
+        while wbs_code.endswith(".0"):
+            wbs_code = wbs_code[:-2]
+        return wbs_code
+
     def _is_leaf_task(self, wbs_code: str) -> bool:
         """Check if a WBS code represents a leaf task (no children)"""
         if not wbs_code or wbs_code == "nan":
             return False
 
-        # Check if any other task starts with this code + "."
-        for idx, row in self.wbs_df.iterrows():
-            other_code = str(row.get(self.wbs_code_col, ""))
-            if other_code.startswith(wbs_code + "."):
-                return False  # Has children
+        # Index every code under each of its ancestor prefixes once ("1.2.3" under "1" and "1.2")
+        if self._child_summaries is None:
+            self._child_summaries = {}
+            for other_code in self._column_strings(self.wbs_code_col):
+                summary = self._summary_code(other_code)
+                for i, char in enumerate(other_code):
+                    if char == ".":
+                        self._child_summaries.setdefault(other_code[:i], set()).add(summary)
 
-        return True
+        # A task has children if another code (not just its own ".0" form) sits under it
+        own = self._summary_code(wbs_code)
+        return not (self._child_summaries.get(own, set()) - {own})
 
     def _check_hearing_notes(self):
         """Cross-check hearing notes against WBS"""
+        task_names = self._column_strings(self.task_name_col)
         for decision in self.hearing_notes:
             decision_text = decision["content"]
 
             # Search WBS for decision keywords
-            found = False
-            for idx, row in self.wbs_df.iterrows():
-                task_name = str(row.get(self.task_name_col, ""))
-                if any(keyword in task_name for keyword in decision_text.split()[:5]):
-                    found = True
-                    break
+            keywords = decision_text.split()[:5]
+            found = any(any(keyword in task_name for keyword in keywords) for task_name in task_names)
 
             if not found:
                 self.findings.append(
@@ -484,15 +542,23 @@ def main():
     parser.add_argument("--hearing-sheet", help="Path to hearing notes (optional)")
     parser.add_argument("--checklist", help="Path to custom checklist YAML (optional)")
     parser.add_argument("--output-dir", default="./wbs_review_output", help="Output directory")
+    parser.add_argument("--extraction-cache-dir", help="PDF/DOCX text extraction cache directory")
+    parser.add_argument("--no-extraction-cache", action="store_true", help="Always re-extract PDF/DOCX text")
 
     args = parser.parse_args()
 
+    # Cache extracted text of PDF/DOCX requirements across runs
+    cache = None
+    if Path(args.requirements).suffix.lower() in (".pdf", ".docx", ".doc"):
+        cache = open_cache(args.extraction_cache_dir, enabled=not args.no_extraction_cache)
+
     # Create reviewer
     reviewer = WBSReviewer(
         wbs_path=args.wbs,
         requirements_path=args.requirements,
         checklist_path=args.checklist,
         hearing_sheet_path=args.hearing_sheet,
+        extraction_cache=cache,
     )
 
     # Run review